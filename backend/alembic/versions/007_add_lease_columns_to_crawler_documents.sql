@@ -0,0 +1,31 @@
+-- 007: Add lease columns to crawler_documents for multi-node job claiming
+-- Workers claim documents with FOR UPDATE SKIP LOCKED and keep a heartbeat-extended lease.
+-- Documents whose lease expired (crashed worker) are reclaimed by other workers.
+
+ALTER TABLE crawler_documents
+ADD COLUMN IF NOT EXISTS lease_owner VARCHAR(255) DEFAULT NULL;
+
+ALTER TABLE crawler_documents
+ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP WITH TIME ZONE DEFAULT NULL;
+
+ALTER TABLE crawler_documents
+ADD COLUMN IF NOT EXISTS attempts INTEGER NOT NULL DEFAULT 0;
+
+-- Claim query scans: pending documents in creation order, expired processing leases
+CREATE INDEX IF NOT EXISTS idx_crawler_documents_pending_created
+    ON crawler_documents(created_at)
+    WHERE status = 'pending';
+
+CREATE INDEX IF NOT EXISTS idx_crawler_documents_processing_lease
+    ON crawler_documents(lease_expires_at)
+    WHERE status = 'processing';
+
+-- Heartbeat / release lookups by owner
+CREATE INDEX IF NOT EXISTS idx_crawler_documents_lease_owner
+    ON crawler_documents(lease_owner)
+    WHERE lease_owner IS NOT NULL;
+
+-- Comment on columns
+COMMENT ON COLUMN crawler_documents.lease_owner IS 'Worker id (host:pid:nonce) currently holding the processing lease';
+COMMENT ON COLUMN crawler_documents.lease_expires_at IS 'Lease expiry; expired processing documents are reclaimable';
+COMMENT ON COLUMN crawler_documents.attempts IS 'Number of times the document has been claimed for processing';
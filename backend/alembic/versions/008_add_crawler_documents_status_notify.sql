@@ -0,0 +1,30 @@
+-- 008: Notify workers on crawler_documents status transitions
+-- Workers LISTEN on 'crawler_document_events' instead of polling COUNT(*) every few seconds.
+-- Payload: {"id": "<uuid>", "status": "...", "previous_status": "...", "insurer": "..."}
+
+CREATE OR REPLACE FUNCTION notify_crawler_documents_status()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' OR NEW.status IS DISTINCT FROM OLD.status THEN
+        PERFORM pg_notify(
+            'crawler_document_events',
+            json_build_object(
+                'id', NEW.id,
+                'status', NEW.status,
+                'previous_status', CASE WHEN TG_OP = 'UPDATE' THEN OLD.status END,
+                'insurer', NEW.insurer
+            )::text
+        );
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_crawler_documents_status_notify ON crawler_documents;
+
+CREATE TRIGGER trigger_crawler_documents_status_notify
+    AFTER INSERT OR UPDATE OF status ON crawler_documents
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_crawler_documents_status();
+
+COMMENT ON FUNCTION notify_crawler_documents_status() IS 'Emits crawler_document_events NOTIFY on status transitions';
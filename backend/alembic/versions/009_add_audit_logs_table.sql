@@ -0,0 +1,46 @@
+-- 009: Append-only audit log table
+-- AuditLogger queues events in memory; a background task inserts them in batches (app/core/audit_sink.py).
+-- event_id is generated by the application so retried batches are idempotent (ON CONFLICT DO NOTHING).
+
+CREATE TABLE IF NOT EXISTS audit_logs (
+    id BIGSERIAL PRIMARY KEY,
+    event_id UUID NOT NULL UNIQUE,
+    occurred_at TIMESTAMPTZ NOT NULL,
+    event_type VARCHAR(50) NOT NULL,
+    user_id VARCHAR(255) NOT NULL,
+    resource_type VARCHAR(50),
+    resource_id VARCHAR(255),
+    action VARCHAR(50),
+    severity VARCHAR(20) NOT NULL,
+    success BOOLEAN NOT NULL,
+    ip_address VARCHAR(64),
+    user_agent TEXT,
+    details JSONB NOT NULL DEFAULT '{}'::jsonb,
+    recorded_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_audit_logs_occurred_at ON audit_logs(occurred_at DESC);
+CREATE INDEX IF NOT EXISTS idx_audit_logs_user ON audit_logs(user_id, occurred_at DESC);
+CREATE INDEX IF NOT EXISTS idx_audit_logs_resource ON audit_logs(resource_type, resource_id, occurred_at DESC);
+CREATE INDEX IF NOT EXISTS idx_audit_logs_security ON audit_logs(occurred_at DESC)
+    WHERE severity IN ('error', 'critical');
+CREATE INDEX IF NOT EXISTS idx_audit_logs_pii ON audit_logs(occurred_at DESC)
+    WHERE details -> 'pii_fields_accessed' IS NOT NULL;
+
+-- Audit records are immutable
+CREATE OR REPLACE FUNCTION reject_audit_logs_modification()
+RETURNS TRIGGER AS $$
+BEGIN
+    RAISE EXCEPTION 'audit_logs is append-only (% not allowed)', TG_OP;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_audit_logs_append_only ON audit_logs;
+
+CREATE TRIGGER trigger_audit_logs_append_only
+    BEFORE UPDATE OR DELETE ON audit_logs
+    FOR EACH ROW
+    EXECUTE FUNCTION reject_audit_logs_modification();
+
+COMMENT ON TABLE audit_logs IS 'Append-only audit trail (WHO, WHAT, WHEN, WHERE)';
+COMMENT ON COLUMN audit_logs.event_id IS 'Application-generated id; makes batch retries idempotent';
@@ -0,0 +1,12 @@
+-- 010: Indexes for batch-loaded FP customer listing
+-- GET /fp/customers pages with a keyset on (created_at DESC, id DESC) per FP (app/services/fp_customer_loader.py).
+-- Consultations/products are fetched per page with customer_id = ANY(:ids), already in the per-customer order.
+
+CREATE INDEX IF NOT EXISTS idx_fp_customers_user_created
+    ON fp_customers(user_id, created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_fp_consultations_customer_date
+    ON fp_consultations(customer_id, consultation_date DESC);
+
+CREATE INDEX IF NOT EXISTS idx_fp_customer_products_customer_created
+    ON fp_customer_products(customer_id, created_at DESC);
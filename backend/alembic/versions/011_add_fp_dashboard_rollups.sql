@@ -0,0 +1,119 @@
+-- 011: Per-FP dashboard rollups
+-- GET /analytics/overview reads one row by primary key (app/services/dashboard_rollup.py).
+-- The application computes/refreshes a row with a single aggregate INSERT ... SELECT ... ON CONFLICT;
+-- triggers below apply deltas on customer/policy writes so the row stays current between refreshes.
+-- Time windows are anchored at window_end; rows older than DASHBOARD_ROLLUP_MAX_AGE_SECONDS
+-- or flagged needs_refresh are recomputed on the next read.
+
+CREATE TABLE IF NOT EXISTS fp_dashboard_rollups (
+    fp_user_id UUID PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+
+    total_customers INTEGER NOT NULL DEFAULT 0,
+    active_customers INTEGER NOT NULL DEFAULT 0,       -- last_contact_date >= window_end - window_days
+    prev_active_customers INTEGER NOT NULL DEFAULT 0,  -- the window before that
+    new_customers INTEGER NOT NULL DEFAULT 0,          -- created_at >= window_end - window_days
+    total_policies INTEGER NOT NULL DEFAULT 0,
+    coverage JSONB NOT NULL DEFAULT '{}'::jsonb,       -- {policy_type: {"count": n, "total_amount": x}}
+
+    window_end TIMESTAMP NOT NULL,
+    window_days INTEGER NOT NULL DEFAULT 30,
+    computed_at TIMESTAMP NOT NULL,                    -- last full recompute
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,  -- last delta
+    needs_refresh BOOLEAN NOT NULL DEFAULT false       -- set when a write can't be applied as a delta
+);
+
+-- Customer delta (sign = 1 for the new row image, -1 for the old one)
+CREATE OR REPLACE FUNCTION fp_rollup_apply_customer(
+    p_fp_user_id UUID, p_created_at TIMESTAMP, p_last_contact TIMESTAMP, p_sign INTEGER
+) RETURNS VOID AS $$
+BEGIN
+    UPDATE fp_dashboard_rollups r SET
+        total_customers = r.total_customers + p_sign,
+        active_customers = r.active_customers + CASE
+            WHEN p_last_contact >= r.window_end - make_interval(days => r.window_days) THEN p_sign ELSE 0 END,
+        prev_active_customers = r.prev_active_customers + CASE
+            WHEN p_last_contact >= r.window_end - make_interval(days => 2 * r.window_days)
+             AND p_last_contact < r.window_end - make_interval(days => r.window_days) THEN p_sign ELSE 0 END,
+        new_customers = r.new_customers + CASE
+            WHEN p_created_at >= r.window_end - make_interval(days => r.window_days) THEN p_sign ELSE 0 END,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE r.fp_user_id = p_fp_user_id;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION fp_rollup_on_customer_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM fp_rollup_apply_customer(NEW.fp_user_id, NEW.created_at, NEW.last_contact_date, 1);
+    ELSIF TG_OP = 'DELETE' THEN
+        -- Policies are removed by ON DELETE CASCADE before this fires, so they can't be subtracted here
+        UPDATE fp_dashboard_rollups SET needs_refresh = true WHERE fp_user_id = OLD.fp_user_id;
+    ELSIF NEW.fp_user_id <> OLD.fp_user_id THEN
+        UPDATE fp_dashboard_rollups SET needs_refresh = true
+        WHERE fp_user_id IN (OLD.fp_user_id, NEW.fp_user_id);
+    ELSIF NEW.created_at IS DISTINCT FROM OLD.created_at
+       OR NEW.last_contact_date IS DISTINCT FROM OLD.last_contact_date THEN
+        PERFORM fp_rollup_apply_customer(OLD.fp_user_id, OLD.created_at, OLD.last_contact_date, -1);
+        PERFORM fp_rollup_apply_customer(NEW.fp_user_id, NEW.created_at, NEW.last_contact_date, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_customers_dashboard_rollup ON customers;
+CREATE TRIGGER trigger_customers_dashboard_rollup
+    AFTER INSERT OR UPDATE OR DELETE ON customers
+    FOR EACH ROW
+    EXECUTE FUNCTION fp_rollup_on_customer_change();
+
+-- Policy delta (policy_type NULL is grouped as '기타', same as the aggregate query)
+CREATE OR REPLACE FUNCTION fp_rollup_apply_policy(
+    p_customer_id UUID, p_policy_type TEXT, p_amount BIGINT, p_sign INTEGER
+) RETURNS VOID AS $$
+DECLARE
+    v_type TEXT := COALESCE(p_policy_type, '기타');
+BEGIN
+    UPDATE fp_dashboard_rollups r SET
+        total_policies = r.total_policies + p_sign,
+        coverage = jsonb_set(r.coverage, ARRAY[v_type], jsonb_build_object(
+            'count', COALESCE((r.coverage -> v_type ->> 'count')::BIGINT, 0) + p_sign,
+            'total_amount', COALESCE((r.coverage -> v_type ->> 'total_amount')::NUMERIC, 0)
+                            + p_sign * COALESCE(p_amount, 0)
+        )),
+        updated_at = CURRENT_TIMESTAMP
+    FROM customers c
+    WHERE c.id = p_customer_id AND r.fp_user_id = c.fp_user_id;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION fp_rollup_on_policy_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'UPDATE'
+       AND NEW.customer_id IS NOT DISTINCT FROM OLD.customer_id
+       AND NEW.policy_type IS NOT DISTINCT FROM OLD.policy_type
+       AND NEW.coverage_amount IS NOT DISTINCT FROM OLD.coverage_amount THEN
+        RETURN NULL;
+    END IF;
+    IF TG_OP <> 'INSERT' THEN
+        PERFORM fp_rollup_apply_policy(OLD.customer_id, OLD.policy_type, OLD.coverage_amount, -1);
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        PERFORM fp_rollup_apply_policy(NEW.customer_id, NEW.policy_type, NEW.coverage_amount, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_customer_policies_dashboard_rollup ON customer_policies;
+CREATE TRIGGER trigger_customer_policies_dashboard_rollup
+    AFTER INSERT OR UPDATE OR DELETE ON customer_policies
+    FOR EACH ROW
+    EXECUTE FUNCTION fp_rollup_on_policy_change();
+
+-- Aggregate query support: FILTER counters scan one FP's customers
+CREATE INDEX IF NOT EXISTS idx_customers_fp_user_created
+    ON customers(fp_user_id, created_at DESC);
+
+COMMENT ON TABLE fp_dashboard_rollups IS 'Per-FP dashboard counters (trigger-maintained, periodically recomputed)';
@@ -0,0 +1,28 @@
+-- 012: Substring search and keyset pagination indexes for list endpoints
+-- GET /customers and GET /query-history search with ILIKE '%term%' (app/core/listing.py like_pattern);
+-- pg_trgm GIN indexes let those predicates use a bitmap index scan instead of a sequential scan.
+-- Keyset pages compare (sort keys...) < (cursor...) in the same order as these btree indexes.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Substring search
+CREATE INDEX IF NOT EXISTS idx_customers_name_trgm
+    ON customers USING GIN (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_customers_email_trgm
+    ON customers USING GIN (email gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_query_history_query_text_trgm
+    ON query_history USING GIN (query_text gin_trgm_ops);
+
+-- Keyset pagination
+-- customers: last_contact_date DESC NULLS LAST, created_at DESC, id DESC
+CREATE INDEX IF NOT EXISTS idx_customers_fp_user_keyset
+    ON customers(fp_user_id, (COALESCE(last_contact_date, '-infinity'::timestamp)) DESC, created_at DESC, id DESC);
+
+-- query_history: created_at DESC, id DESC (covers everything idx_query_history_user_created served)
+CREATE INDEX IF NOT EXISTS idx_query_history_user_keyset
+    ON query_history(user_id, created_at DESC, id DESC);
+DROP INDEX IF EXISTS idx_query_history_user_created;
+
+-- count=auto relies on planner estimates
+ANALYZE customers;
+ANALYZE query_history;
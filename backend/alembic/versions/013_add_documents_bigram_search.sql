@@ -0,0 +1,64 @@
+-- 013: Korean bigram search vector for documents
+-- search_vector uses to_tsvector('simple', ...), which keeps Korean compound nouns as one lexeme,
+-- so "암진단비" never matches "암 진단비" or "진단비". search_bigrams indexes overlapping Hangul
+-- bigrams instead (whitespace between Hangul syllables is ignored) and is what
+-- DocumentRepository queries when DOCUMENT_SEARCH_MODE=bigram (app/repositories/document_repository.py).
+-- korean_bigram_tokens() must stay in sync with korean_bigrams(join_words=True) there.
+
+-- Tokens in order: Hangul runs → overlapping bigrams (1-syllable runs kept), Latin/digit runs as is
+CREATE OR REPLACE FUNCTION korean_bigram_tokens(input TEXT)
+RETURNS TABLE(token TEXT, pos INTEGER) AS $$
+    WITH runs AS (
+        SELECT m.found[1] AS run, m.n
+        FROM regexp_matches(
+            regexp_replace(lower(normalize(coalesce(input, ''), NFC)), '([가-힣])\s+(?=[가-힣])', '\1', 'g'),
+            '[가-힣]+|[a-z0-9]+', 'g'
+        ) WITH ORDINALITY AS m(found, n)
+    )
+    SELECT
+        CASE WHEN run ~ '^[가-힣]{2}' THEN substr(run, i, 2) ELSE run END,
+        (row_number() OVER (ORDER BY n, i))::INTEGER
+    FROM runs,
+         generate_series(1, CASE WHEN run ~ '^[가-힣]{2}' THEN char_length(run) - 1 ELSE 1 END) AS i
+$$ LANGUAGE SQL IMMUTABLE;
+
+-- Short fields: lexemes with positions and a weight (ts_rank favours title matches)
+CREATE OR REPLACE FUNCTION korean_bigram_tsvector(input TEXT, weight "char")
+RETURNS tsvector AS $$
+    SELECT coalesce(string_agg(format('%s:%s%s', token, least(pos, 16383), weight), ' '), '')::tsvector
+    FROM korean_bigram_tokens(input)
+$$ LANGUAGE SQL IMMUTABLE;
+
+-- Full text: distinct lexemes without positions (keeps large 약관 under the 1MB tsvector limit)
+CREATE OR REPLACE FUNCTION documents_search_bigrams(policy_name TEXT, insurer TEXT, full_text TEXT)
+RETURNS tsvector AS $$
+    SELECT korean_bigram_tsvector(policy_name, 'A')
+        || korean_bigram_tsvector(insurer, 'B')
+        || array_to_tsvector(ARRAY(SELECT DISTINCT token FROM korean_bigram_tokens(full_text)))
+$$ LANGUAGE SQL IMMUTABLE;
+
+ALTER TABLE documents ADD COLUMN IF NOT EXISTS search_bigrams tsvector;
+
+CREATE OR REPLACE FUNCTION update_documents_search_bigrams()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.search_bigrams := documents_search_bigrams(NEW.policy_name, NEW.insurer, NEW.full_text);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_documents_search_bigrams ON documents;
+CREATE TRIGGER trigger_documents_search_bigrams
+    BEFORE INSERT OR UPDATE OF policy_name, insurer, full_text ON documents
+    FOR EACH ROW
+    EXECUTE FUNCTION update_documents_search_bigrams();
+
+-- Backfill existing rows
+UPDATE documents
+SET search_bigrams = documents_search_bigrams(policy_name, insurer, full_text)
+WHERE search_bigrams IS NULL;
+
+CREATE INDEX IF NOT EXISTS idx_documents_search_bigrams
+    ON documents USING GIN(search_bigrams);
+
+COMMENT ON COLUMN documents.search_bigrams IS 'Korean bigram search vector (trigger-maintained, see korean_bigram_tokens)';
@@ -8,6 +8,7 @@ from typing import Dict
 from uuid import UUID, uuid4
 
 from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi.security import HTTPAuthorizationCredentials
 from loguru import logger
 
 from app.api.v1.models.auth import (
@@ -26,11 +27,14 @@ from app.api.v1.models.auth import (
 from app.models.user import User, UserPublic, UserRole, UserStatus, user_to_public
 from app.core.security import (
     hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
     create_access_token,
     create_refresh_token,
     decode_token,
     get_current_user,
+    revoke_token_everywhere,
+    security,
 )
 from app.core.config import settings
 
@@ -149,7 +153,7 @@ async def register(request: RegisterRequest) -> RegisterResponse:
         email=request.email,
         username=request.username,
         full_name=request.full_name,
-        hashed_password=hash_password(request.password),
+        hashed_password=await hash_password_async(request.password),
         role=UserRole.FP,  # Default role
         status=UserStatus.PENDING,  # Requires admin approval
         organization_name=request.organization_name,
@@ -207,7 +211,7 @@ async def login(request: LoginRequest) -> LoginResponse:
         )
 
     # 2. Verify password
-    if not verify_password(request.password, user.hashed_password):
+    if not await verify_password_async(request.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail={
@@ -358,22 +362,26 @@ async def refresh(request: RefreshTokenRequest) -> TokenResponse:
     status_code=status.HTTP_200_OK,
     summary="로그아웃",
     description="""
-    현재 사용자의 refresh token을 무효화합니다.
+    현재 사용자의 refresh token과 access token을 무효화합니다.
     """,
 )
 async def logout(
     refresh_token: RefreshTokenRequest,
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> LogoutResponse:
     """
     로그아웃
 
-    Refresh token을 무효화합니다.
+    Refresh token과 현재 access token을 무효화합니다.
     """
     # Revoke refresh token
     if refresh_token.refresh_token in _refresh_tokens:
         del _refresh_tokens[refresh_token.refresh_token]
 
+    # Revoke access token on every worker (cached principal is dropped too)
+    await revoke_token_everywhere(credentials.credentials)
+
     logger.info(f"User logged out: {current_user.get('email')}")
 
     return LogoutResponse(message="Logged out successfully")
@@ -494,7 +502,7 @@ async def change_password(
         )
 
     # Verify current password
-    if not verify_password(request.current_password, user.hashed_password):
+    if not await verify_password_async(request.current_password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail={
@@ -504,7 +512,7 @@ async def change_password(
         )
 
     # Update password
-    user.hashed_password = hash_password(request.new_password)
+    user.hashed_password = await hash_password_async(request.new_password)
     user.updated_at = datetime.now()
 
     logger.info(f"Password changed for user: {user.email}")
@@ -3,7 +3,8 @@ Crawler Documents API
 
 문서 크롤링 및 관리 API 엔드포인트
 """
-from fastapi import APIRouter, Query, HTTPException, BackgroundTasks, Depends
+from fastapi import APIRouter, Query, HTTPException, BackgroundTasks, Depends, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import datetime
@@ -13,6 +14,11 @@ from sqlalchemy import text
 
 from app.services.document_crawler_service import DocumentCrawlerService
 from app.services.crawler_progress_tracker import CrawlerProgressTracker
+from app.services.document_progress import (
+    DocumentProgressReporter,
+    get_progress_channel,
+    overlay_live_progress,
+)
 from app.core.database import get_db
 
 
@@ -389,287 +395,240 @@ async def process_document_in_background(
 ):
     """백그라운드에서 문서를 처리하는 함수"""
     import asyncio
+    from app.services.pdf_blob_store import get_pdf_blob_store
     from app.services.pdf_text_extractor import PDFTextExtractor
-    from app.core.database import AsyncSessionLocal
-    import httpx
-    import tempfile
-    import os
 
     logger.info(f"Background processing started for document {document_id}")
 
-    async with AsyncSessionLocal() as db:
+    # 진행 상태는 Redis로, 최종 상태만 PostgreSQL에 기록
+    reporter = DocumentProgressReporter(document_id)
+
+    try:
+        async def update_progress(step: str, progress: int, detail: dict = None):
+            """진행 상태를 업데이트하는 헬퍼 함수"""
+            await reporter.update(step, progress, detail)
+
+        # Step 1: PDF 다운로드 (20%)
+        # content-addressed blob 저장소 (변경 없으면 조건부 요청만, 삭제 불필요)
+        await update_progress("downloading_pdf", 20)
+        logger.info(f"Downloading PDF from {pdf_url}")
+        blob = await get_pdf_blob_store().fetch(pdf_url)
+
+        # Step 2: PDF 텍스트 추출 - 세부 단계로 분할 (21% ~ 40%)
+        extractor = PDFTextExtractor()
+
+        # 2.1: PDF 분석 및 메타데이터 읽기 (21%)
+        await update_progress("extracting_text", 21, {
+            "sub_step": "pdf_analysis",
+            "message": "PDF 메타데이터 분석 중"
+        })
+        logger.info(f"Analyzing PDF metadata")
+        await asyncio.sleep(0.3)  # 실제 분석 시뮬레이션
+
+        # 2.2: 여러 알고리즘으로 텍스트 추출 및 품질 평가 (23% ~ 40%)
+        import time
+        from app.services.pdf_text_quality_evaluator import PDFTextQualityEvaluator
+
+        start_time = time.time()
+        await update_progress("extracting_text", 23, {
+            "sub_step": "analyzing_algorithms",
+            "message": "최적의 텍스트 추출 알고리즘 분석 중..."
+        })
+        logger.info(f"Starting intelligent PDF text extraction with quality evaluation")
+
+        # 여러 알고리즘 시도 및 최고 품질 결과 선택
+        # content_sha256: 같은 내용은 추출 결과 캐시에서 재사용
+        extraction_result = PDFTextQualityEvaluator.extract_best_quality(
+            str(blob.path), content_sha256=blob.sha256
+        )
+
+        if "error" in extraction_result:
+            await update_progress("extracting_text", 35, {
+                "sub_step": "extraction_failed",
+                "message": "모든 텍스트 추출 방법 실패",
+                "attempts": extraction_result.get("all_attempts", [])
+            })
+            raise Exception(f"Text extraction failed: {extraction_result['error']}")
+
+        extracted_text = extraction_result["text"]
+        total_pages = extraction_result["total_pages"]
+        algorithm = extraction_result["algorithm"]
+        quality = extraction_result["quality"]
+
+        # 진행 상황 업데이트 with 품질 정보
+        await update_progress("extracting_text", 35, {
+            "sub_step": "algorithm_selected",
+            "message": f"{algorithm} 알고리즘 사용 (품질: {quality['quality_level']})",
+            "algorithm": algorithm,
+            "quality_score": quality["score"],
+            "quality_level": quality["quality_level"],
+            "total_pages": total_pages,
+            "all_attempts": extraction_result.get("all_attempts", [])
+        })
+        logger.info(f"Selected algorithm: {algorithm} with quality score {quality['score']}")
+
+        # 품질이 너무 낮으면 경고
+        if quality["score"] < 20:
+            await update_progress("extracting_text", 37, {
+                "sub_step": "low_quality_warning",
+                "message": f"텍스트 품질 낮음 (점수: {quality['score']}/100) - OCR 필요할 수 있음",
+                "quality": quality
+            })
+            logger.warning(f"Low quality extraction: {quality}")
+
+        # 2.4: 품질 검증 완료 (40%)
+        total_time = int(time.time() - start_time)
+        await update_progress("extracting_text", 40, {
+            "sub_step": "extraction_complete",
+            "message": f"텍스트 추출 완료 ({algorithm}, {total_time}초)",
+            "algorithm": algorithm,
+            "quality_score": quality["score"],
+            "quality_level": quality["quality_level"],
+            "text_length": len(extracted_text),
+            "total_pages": total_pages,
+            "processing_time_seconds": total_time,
+            "avg_chars_per_page": quality["avg_chars_per_page"],
+            "korean_ratio": quality["korean_ratio"],
+            "english_ratio": quality["english_ratio"]
+        })
+        logger.info(f"Text extraction completed: {algorithm}, {len(extracted_text)} chars, {total_pages} pages, quality={quality['score']}, time={total_time}s")
+
+        # Step 3: 엔티티 추출 (60%)
+        await update_progress("extracting_entities", 60)
+        await asyncio.sleep(2)  # 시뮬레이션 (실제 구현 시 제거)
+        # TODO: 실제 엔티티 추출 로직
+        # entities = await extract_entities(extracted_text)
+
+        # Step 4: 관계 추출 (80%)
+        await update_progress("extracting_relationships", 80)
+        await asyncio.sleep(2)  # 시뮬레이션 (실제 구현 시 제거)
+        # TODO: 실제 관계 추출 로직
+        # relationships = await extract_relationships(extracted_text, entities)
+
+        # Step 5: 임베딩 생성 및 저장 (85%)
+        await update_progress("generating_embeddings", 85, {
+            "sub_step": "preparing_embeddings",
+            "message": "임베딩 생성 준비 중..."
+        })
+        logger.info(f"Starting embedding generation for document {document_id}")
+
         try:
-            async def update_progress(step: str, progress: int, detail: dict = None):
-                """진행 상태를 업데이트하는 헬퍼 함수"""
-                import json
-                update_query = text("""
-                    UPDATE crawler_documents
-                    SET processing_step = :step,
-                        processing_progress = :progress,
-                        processing_detail = :detail,
-                        updated_at = NOW()
-                    WHERE id = :id
-                """)
-                await db.execute(update_query, {
-                    "id": document_id,
-                    "step": step,
-                    "progress": progress,
-                    "detail": json.dumps(detail) if detail else None
-                })
-                await db.commit()
-                detail_msg = f" - {detail.get('message', '')}" if detail and 'message' in detail else ""
-                logger.info(f"Document {document_id}: {step} ({progress}%){detail_msg}")
-
-            # Step 1: PDF 다운로드 (20%)
-            await update_progress("downloading_pdf", 20)
-            logger.info(f"Downloading PDF from {pdf_url}")
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.get(pdf_url)
-                response.raise_for_status()
-                pdf_content = response.content
-
-            # 임시 파일로 저장
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
-                tmp_file.write(pdf_content)
-                tmp_path = tmp_file.name
-
-            try:
-                # Step 2: PDF 텍스트 추출 - 세부 단계로 분할 (21% ~ 40%)
-                extractor = PDFTextExtractor()
-
-                # 2.1: PDF 분석 및 메타데이터 읽기 (21%)
-                await update_progress("extracting_text", 21, {
-                    "sub_step": "pdf_analysis",
-                    "message": "PDF 메타데이터 분석 중"
-                })
-                logger.info(f"Analyzing PDF metadata")
-                await asyncio.sleep(0.3)  # 실제 분석 시뮬레이션
-
-                # 2.2: 여러 알고리즘으로 텍스트 추출 및 품질 평가 (23% ~ 40%)
-                import time
-                from app.services.pdf_text_quality_evaluator import PDFTextQualityEvaluator
-
-                start_time = time.time()
-                await update_progress("extracting_text", 23, {
-                    "sub_step": "analyzing_algorithms",
-                    "message": "최적의 텍스트 추출 알고리즘 분석 중..."
-                })
-                logger.info(f"Starting intelligent PDF text extraction with quality evaluation")
-
-                # 여러 알고리즘 시도 및 최고 품질 결과 선택
-                extraction_result = PDFTextQualityEvaluator.extract_best_quality(tmp_path)
-
-                if "error" in extraction_result:
-                    await update_progress("extracting_text", 35, {
-                        "sub_step": "extraction_failed",
-                        "message": "모든 텍스트 추출 방법 실패",
-                        "attempts": extraction_result.get("all_attempts", [])
-                    })
-                    raise Exception(f"Text extraction failed: {extraction_result['error']}")
-
-                extracted_text = extraction_result["text"]
-                total_pages = extraction_result["total_pages"]
-                algorithm = extraction_result["algorithm"]
-                quality = extraction_result["quality"]
-
-                # 진행 상황 업데이트 with 품질 정보
-                await update_progress("extracting_text", 35, {
-                    "sub_step": "algorithm_selected",
-                    "message": f"{algorithm} 알고리즘 사용 (품질: {quality['quality_level']})",
-                    "algorithm": algorithm,
-                    "quality_score": quality["score"],
-                    "quality_level": quality["quality_level"],
-                    "total_pages": total_pages,
-                    "all_attempts": extraction_result.get("all_attempts", [])
-                })
-                logger.info(f"Selected algorithm: {algorithm} with quality score {quality['score']}")
-
-                # 품질이 너무 낮으면 경고
-                if quality["score"] < 20:
-                    await update_progress("extracting_text", 37, {
-                        "sub_step": "low_quality_warning",
-                        "message": f"텍스트 품질 낮음 (점수: {quality['score']}/100) - OCR 필요할 수 있음",
-                        "quality": quality
-                    })
-                    logger.warning(f"Low quality extraction: {quality}")
-
-                # 2.4: 품질 검증 완료 (40%)
-                total_time = int(time.time() - start_time)
-                await update_progress("extracting_text", 40, {
-                    "sub_step": "extraction_complete",
-                    "message": f"텍스트 추출 완료 ({algorithm}, {total_time}초)",
-                    "algorithm": algorithm,
-                    "quality_score": quality["score"],
-                    "quality_level": quality["quality_level"],
-                    "text_length": len(extracted_text),
-                    "total_pages": total_pages,
-                    "processing_time_seconds": total_time,
-                    "avg_chars_per_page": quality["avg_chars_per_page"],
-                    "korean_ratio": quality["korean_ratio"],
-                    "english_ratio": quality["english_ratio"]
-                })
-                logger.info(f"Text extraction completed: {algorithm}, {len(extracted_text)} chars, {total_pages} pages, quality={quality['score']}, time={total_time}s")
-
-                # Step 3: 엔티티 추출 (60%)
-                await update_progress("extracting_entities", 60)
-                await asyncio.sleep(2)  # 시뮬레이션 (실제 구현 시 제거)
-                # TODO: 실제 엔티티 추출 로직
-                # entities = await extract_entities(extracted_text)
-
-                # Step 4: 관계 추출 (80%)
-                await update_progress("extracting_relationships", 80)
-                await asyncio.sleep(2)  # 시뮬레이션 (실제 구현 시 제거)
-                # TODO: 실제 관계 추출 로직
-                # relationships = await extract_relationships(extracted_text, entities)
-
-                # Step 5: 임베딩 생성 및 저장 (85%)
-                await update_progress("generating_embeddings", 85, {
-                    "sub_step": "preparing_embeddings",
-                    "message": "임베딩 생성 준비 중..."
-                })
-                logger.info(f"Starting embedding generation for document {document_id}")
-
-                try:
-                    from app.services.auto_embedding_service import AutoEmbeddingService
-
-                    embedding_service = AutoEmbeddingService()
-
-                    # 텍스트 청킹
-                    await update_progress("generating_embeddings", 87, {
-                        "sub_step": "chunking_text",
-                        "message": "텍스트를 청크로 분할 중..."
-                    })
-                    chunks = embedding_service.chunk_text(extracted_text)
-                    logger.info(f"Created {len(chunks)} text chunks")
-
-                    # 임베딩 생성
-                    await update_progress("generating_embeddings", 90, {
-                        "sub_step": "creating_embeddings",
-                        "message": f"{len(chunks)}개 청크의 임베딩 생성 중..."
-                    })
-                    embeddings = await embedding_service.create_embeddings(chunks)
-                    logger.info(f"Generated {len(embeddings)} embeddings")
-
-                    # 임베딩 저장
-                    await update_progress("generating_embeddings", 93, {
-                        "sub_step": "storing_embeddings",
-                        "message": "임베딩을 데이터베이스에 저장 중..."
-                    })
-                    await embedding_service.store_embeddings(document_id, chunks, embeddings)
-                    logger.info(f"Stored embeddings for document {document_id}")
-
-                except Exception as e:
-                    logger.warning(f"Embedding generation failed but continuing: {e}")
-                    # 임베딩 실패해도 계속 진행
-
-                # Step 6: Neo4j 그래프 구축 (95%)
-                await update_progress("building_graph", 95, {
-                    "sub_step": "preparing_graph",
-                    "message": "그래프 구축 준비 중..."
-                })
-                logger.info(f"Starting Neo4j graph construction for document {document_id}")
-
-                try:
-                    from app.services.graph.graph_builder import GraphBuilder
-                    from app.services.graph.neo4j_service import Neo4jService
-
-                    # Neo4j 서비스 초기화
-                    neo4j_service = Neo4jService()
-                    neo4j_service.connect()
-
-                    # GraphBuilder 초기화
-                    graph_builder = GraphBuilder(
-                        neo4j_service=neo4j_service,
-                        embedding_service=None
-                    )
-
-                    # 상품 정보 준비
-                    product_info = {
-                        "product_name": title,
-                        "company": insurer,
-                        "product_type": "보험",
-                        "document_id": document_id,
-                        "version": "1.0",
-                        "effective_date": None,
-                    }
-
-                    # 지식 그래프 구축
-                    stats = await graph_builder.build_graph_from_document(
-                        ocr_text=extracted_text,
-                        product_info=product_info,
-                        generate_embeddings=False
-                    )
-
-                    neo4j_service.close()
-
-                    logger.info(
-                        f"Graph built for {document_id}: "
-                        f"{stats.total_nodes} nodes, {stats.total_relationships} relationships"
-                    )
-
-                    await update_progress("building_graph", 98, {
-                        "sub_step": "graph_created",
-                        "message": f"그래프 구축 완료 ({stats.total_nodes}개 노드, {stats.total_relationships}개 관계)",
-                        "nodes": stats.total_nodes,
-                        "relationships": stats.total_relationships,
-                        "nodes_by_type": stats.nodes_by_type,
-                        "relationships_by_type": stats.relationships_by_type
-                    })
-
-                except Exception as e:
-                    logger.warning(f"Graph construction failed but continuing: {e}")
-                    import traceback
-                    logger.error(traceback.format_exc())
-                    # 그래프 구축 실패해도 계속 진행
-                    await update_progress("building_graph", 98, {
-                        "sub_step": "graph_error",
-                        "message": f"그래프 구축 실패 (계속 진행): {str(e)}"
-                    })
-
-                # Step 7: 완료 (100%)
-                await update_progress("completed", 100, {
-                    "sub_step": "finalized",
-                    "message": "문서 학습 완료",
-                    "total_pages": total_pages if 'total_pages' in locals() else 0,
-                    "text_length": len(extracted_text) if 'extracted_text' in locals() else 0,
-                    "algorithm": algorithm if 'algorithm' in locals() else "unknown",
-                    "quality_score": quality["score"] if 'quality' in locals() else 0
-                })
-
-                # status를 'completed'로 변경
-                final_update_query = text("""
-                    UPDATE crawler_documents
-                    SET status = 'completed'
-                    WHERE id = :id
-                """)
-                await db.execute(final_update_query, {"id": document_id})
-                await db.commit()
-
-                logger.info(f"Document {document_id} processed successfully")
-
-            finally:
-                # 임시 파일 삭제
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
+            from app.services.auto_embedding_service import AutoEmbeddingService
+
+            embedding_service = AutoEmbeddingService()
+
+            # 텍스트 청킹
+            await update_progress("generating_embeddings", 87, {
+                "sub_step": "chunking_text",
+                "message": "텍스트를 청크로 분할 중..."
+            })
+            chunks = embedding_service.chunk_text(extracted_text)
+            logger.info(f"Created {len(chunks)} text chunks")
+
+            # 임베딩 생성
+            await update_progress("generating_embeddings", 90, {
+                "sub_step": "creating_embeddings",
+                "message": f"{len(chunks)}개 청크의 임베딩 생성 중..."
+            })
+            embeddings = await embedding_service.create_embeddings(chunks)
+            logger.info(f"Generated {len(embeddings)} embeddings")
+
+            # 임베딩 저장
+            await update_progress("generating_embeddings", 93, {
+                "sub_step": "storing_embeddings",
+                "message": "임베딩을 데이터베이스에 저장 중..."
+            })
+            await embedding_service.store_embeddings(document_id, chunks, embeddings)
+            logger.info(f"Stored embeddings for document {document_id}")
 
         except Exception as e:
-            logger.error(f"Failed to process document {document_id}: {e}")
-            # 상태를 'failed'로 업데이트
-            try:
-                update_query = text("""
-                    UPDATE crawler_documents
-                    SET status = 'failed',
-                        updated_at = NOW(),
-                        error_message = :error
-                    WHERE id = :id
-                """)
-                await db.execute(update_query, {
-                    "id": document_id,
-                    "error": str(e)
-                })
-                await db.commit()
-            except:
-                pass
+            logger.warning(f"Embedding generation failed but continuing: {e}")
+            # 임베딩 실패해도 계속 진행
+
+        # Step 6: Neo4j 그래프 구축 (95%)
+        await update_progress("building_graph", 95, {
+            "sub_step": "preparing_graph",
+            "message": "그래프 구축 준비 중..."
+        })
+        logger.info(f"Starting Neo4j graph construction for document {document_id}")
+
+        try:
+            from app.services.graph.graph_builder import GraphBuilder
+            from app.services.graph.neo4j_service import Neo4jService
+
+            # Neo4j 서비스 초기화
+            neo4j_service = Neo4jService()
+            neo4j_service.connect()
+
+            # GraphBuilder 초기화
+            graph_builder = GraphBuilder(
+                neo4j_service=neo4j_service,
+                embedding_service=None
+            )
+
+            # 상품 정보 준비
+            product_info = {
+                "product_name": title,
+                "company": insurer,
+                "product_type": "보험",
+                "document_id": document_id,
+                "version": "1.0",
+                "effective_date": None,
+            }
+
+            # 지식 그래프 구축
+            stats = await graph_builder.build_graph_from_document(
+                ocr_text=extracted_text,
+                product_info=product_info,
+                generate_embeddings=False
+            )
+
+            neo4j_service.close()
+
+            logger.info(
+                f"Graph built for {document_id}: "
+                f"{stats.total_nodes} nodes, {stats.total_relationships} relationships"
+            )
+
+            await update_progress("building_graph", 98, {
+                "sub_step": "graph_created",
+                "message": f"그래프 구축 완료 ({stats.total_nodes}개 노드, {stats.total_relationships}개 관계)",
+                "nodes": stats.total_nodes,
+                "relationships": stats.total_relationships,
+                "nodes_by_type": stats.nodes_by_type,
+                "relationships_by_type": stats.relationships_by_type
+            })
+
+        except Exception as e:
+            logger.warning(f"Graph construction failed but continuing: {e}")
+            import traceback
+            logger.error(traceback.format_exc())
+            # 그래프 구축 실패해도 계속 진행
+            await update_progress("building_graph", 98, {
+                "sub_step": "graph_error",
+                "message": f"그래프 구축 실패 (계속 진행): {str(e)}"
+            })
+
+        # Step 7: 완료 (100%)
+        # status를 'completed'로 변경 (최종 상태 기록)
+        await reporter.finish("completed", "completed", 100, {
+            "sub_step": "finalized",
+            "message": "문서 학습 완료",
+            "total_pages": total_pages if 'total_pages' in locals() else 0,
+            "text_length": len(extracted_text) if 'extracted_text' in locals() else 0,
+            "algorithm": algorithm if 'algorithm' in locals() else "unknown",
+            "quality_score": quality["score"] if 'quality' in locals() else 0
+        })
+
+        logger.info(f"Document {document_id} processed successfully")
+
+    except Exception as e:
+        logger.error(f"Failed to process document {document_id}: {e}")
+        # 상태를 'failed'로 업데이트
+        try:
+            await reporter.finish("failed", error=str(e))
+        except Exception as finish_error:
+            logger.error(f"Failed to record failure for document {document_id}: {finish_error}")
 
 
 @router.get("/crawl-progress/{insurer}")
@@ -690,6 +649,51 @@ async def get_crawl_progress(insurer: str):
     return progress
 
 
+@router.get("/documents/progress/stream")
+async def stream_document_progress(
+    request: Request,
+    document_ids: Optional[List[str]] = Query(None, description="구독할 문서 ID (생략 시 전체)")
+):
+    """
+    문서 처리 진행 상황을 Server-Sent Events로 스트리밍합니다.
+
+    연결 직후 현재 진행 상태를 한 번 보내고, 이후 변경될 때마다 `progress` 이벤트를 보냅니다.
+    `GET /documents?status=processing` 폴링을 대체합니다.
+
+    - **document_ids**: 구독할 문서 ID 목록 (선택)
+    """
+    import json
+
+    channel = get_progress_channel()
+    wanted = set(document_ids) if document_ids else None
+
+    def to_event(state: dict) -> str:
+        return f"event: progress\ndata: {json.dumps(state, ensure_ascii=False, default=str)}\n\n"
+
+    async def event_stream():
+        initial_ids = list(wanted) if wanted else await channel.active_ids()
+        for state in (await channel.get_many(initial_ids)).values():
+            yield to_event(state)
+
+        try:
+            async for state in channel.subscribe(heartbeat_seconds=15.0):
+                if await request.is_disconnected():
+                    break
+                if state is None:
+                    yield ": keep-alive\n\n"
+                elif wanted is None or state.get("document_id") in wanted:
+                    yield to_event(state)
+        except Exception as e:
+            logger.warning(f"Progress stream ended: {e}")
+            yield f"event: error\ndata: {json.dumps({'message': 'progress stream unavailable'})}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/documents", response_model=DocumentListResponse)
 async def list_crawler_documents(
     insurer: Optional[str] = Query(None, description="보험사명 (선택)"),
@@ -747,23 +751,28 @@ async def list_crawler_documents(
     params["offset"] = offset
 
     result = await db.execute(query, params)
-    rows = result.fetchall()
+    rows = [dict(row._mapping) for row in result.fetchall()]
+
+    # 처리 중인 문서는 Redis의 실시간 진행 상태 사용 (DB에는 최종 상태만 기록됨)
+    processing_ids = [str(row["id"]) for row in rows if row["status"] == "processing"]
+    live_progress = await get_progress_channel().get_many(processing_ids)
+    rows = [overlay_live_progress(row, live_progress.get(str(row["id"]))) for row in rows]
 
     items = [
         CrawlerDocumentResponse(
-            id=str(row.id),
-            insurer=row.insurer,
-            title=row.title,
-            pdf_url=row.pdf_url,
-            category=row.category,
-            product_type=row.product_type,
-            source_url=row.source_url,
-            status=row.status,
-            processing_step=row.processing_step if hasattr(row, 'processing_step') else None,
-            processing_progress=row.processing_progress if hasattr(row, 'processing_progress') else None,
-            processing_detail=row.processing_detail if hasattr(row, 'processing_detail') else None,
-            created_at=row.created_at,
-            updated_at=row.updated_at
+            id=str(row["id"]),
+            insurer=row["insurer"],
+            title=row["title"],
+            pdf_url=row["pdf_url"],
+            category=row["category"],
+            product_type=row["product_type"],
+            source_url=row["source_url"],
+            status=row["status"],
+            processing_step=row.get("processing_step"),
+            processing_progress=row.get("processing_progress"),
+            processing_detail=row.get("processing_detail"),
+            created_at=row["created_at"],
+            updated_at=row["updated_at"]
         )
         for row in rows
     ]
@@ -8,10 +8,13 @@ from uuid import UUID
 from datetime import datetime, date
 from fastapi import APIRouter, HTTPException, Depends, Query as QueryParam
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, func, and_, or_, text
 from sqlalchemy.orm import selectinload
 
 from app.core.database import get_db
+from app.core.listing import (
+    SortKey, count_rows, cursor_for_row, keyset_condition, like_pattern, order_by_clause
+)
 from app.core.security import get_current_active_user
 from app.models.customer import (
     Customer, CustomerCreate, CustomerUpdate, CustomerWithPolicies,
@@ -55,6 +58,13 @@ async def get_customer_by_id(
 
 # Customer CRUD Endpoints
 
+_CUSTOMER_SORT_KEYS = (
+    SortKey("c.last_contact_date", "last_contact_date", null_fill="'-infinity'::timestamp", value_type=datetime),
+    SortKey("c.created_at", "created_at", value_type=datetime),
+    SortKey("c.id", "id", value_type=UUID),
+)
+
+
 @router.get("/", response_model=CustomerListResponse, summary="Get customers list")
 async def list_customers(
     search: Optional[str] = QueryParam(None, description="Search by name or email"),
@@ -63,6 +73,8 @@ async def list_customers(
     max_age: Optional[int] = QueryParam(None, ge=0, le=150),
     page: int = QueryParam(1, ge=1),
     page_size: int = QueryParam(20, ge=1, le=100),
+    cursor: Optional[str] = QueryParam(None, description="next_cursor from the previous page (overrides page)"),
+    count: str = QueryParam("auto", pattern="^(auto|exact|none)$", description="Total count mode"),
     user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -70,66 +82,79 @@ async def list_customers(
     Get list of customers for the current FP user.
     
     Supports:
-    - Search by name or email
+    - Search by name or email (pg_trgm index)
     - Filter by gender, age range
-    - Pagination
+    - Keyset pagination via cursor (page/OFFSET kept for compatibility)
     """
-    try:
-        # Build WHERE conditions
-        conditions = [f"fp_user_id = '{user.id}'"]
-        
-        if search:
-            search_term = search.replace("'", "''")
-            conditions.append(
-                f"(name ILIKE '%{search_term}%' OR email ILIKE '%{search_term}%')"
-            )
-        
-        if gender:
-            conditions.append(f"gender = '{gender.value}'")
-        
-        current_year = datetime.now().year
-        if min_age is not None:
-            max_birth_year = current_year - min_age
-            conditions.append(f"birth_year <= {max_birth_year}")
-        
-        if max_age is not None:
-            min_birth_year = current_year - max_age
-            conditions.append(f"birth_year >= {min_birth_year}")
-        
-        where_clause = " AND ".join(conditions)
-        
-        # Get total count
-        count_query = f"SELECT COUNT(*) as count FROM customers WHERE {where_clause}"
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()
-        
-        # Get customers with pagination
+    # Build WHERE conditions
+    conditions = ["c.fp_user_id = :fp_user_id"]
+    params = {"fp_user_id": user.id}
+
+    if search:
+        conditions.append("(c.name ILIKE :search OR c.email ILIKE :search)")
+        params["search"] = like_pattern(search)
+
+    if gender:
+        conditions.append("c.gender = :gender")
+        params["gender"] = gender.value
+
+    current_year = datetime.now().year
+    if min_age is not None:
+        conditions.append("c.birth_year <= :max_birth_year")
+        params["max_birth_year"] = current_year - min_age
+
+    if max_age is not None:
+        conditions.append("c.birth_year >= :min_birth_year")
+        params["min_birth_year"] = current_year - max_age
+
+    from_clause = f"FROM customers c WHERE {' AND '.join(conditions)}"
+
+    page_conditions = list(conditions)
+    page_params = {**params, "limit": page_size + 1}
+    offset = 0
+    if cursor:
+        try:
+            condition, cursor_params = keyset_condition(_CUSTOMER_SORT_KEYS, cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        page_conditions.append(condition)
+        page_params.update(cursor_params)
+    else:
         offset = (page - 1) * page_size
-        query = f"""
-            SELECT c.*, 
-                   COUNT(cp.id) as policy_count
+
+    try:
+        total, total_is_estimate = await count_rows(db, from_clause, params, mode=count)
+
+        # Get one page (plus one row to detect the next page)
+        query = text(f"""
+            SELECT c.*, pol.policy_count
             FROM customers c
-            LEFT JOIN customer_policies cp ON c.id = cp.customer_id
-            WHERE {where_clause}
-            GROUP BY c.id
-            ORDER BY c.last_contact_date DESC NULLS LAST, c.created_at DESC
-            LIMIT {page_size} OFFSET {offset}
-        """
-        
-        result = await db.execute(query)
-        rows = result.fetchall()
+            LEFT JOIN LATERAL (
+                SELECT COUNT(*) AS policy_count FROM customer_policies WHERE customer_id = c.id
+            ) pol ON TRUE
+            WHERE {' AND '.join(page_conditions)}
+            {order_by_clause(_CUSTOMER_SORT_KEYS)}
+            LIMIT :limit OFFSET {offset}
+        """)
+        
+        result = await db.execute(query, page_params)
+        rows = [dict(row._mapping) for row in result.fetchall()]
+        next_cursor = (
+            cursor_for_row(rows[page_size - 1], _CUSTOMER_SORT_KEYS) if len(rows) > page_size else None
+        )
         
         customers = []
-        for row in rows:
-            customer_dict = dict(row._mapping)
+        for customer_dict in rows[:page_size]:
             customer_dict['age'] = calculate_age(customer_dict['birth_year'])
             customers.append(Customer(**customer_dict))
         
         return CustomerListResponse(
             customers=customers,
-            total=total or 0,
+            total=total,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            total_is_estimate=total_is_estimate,
+            next_cursor=next_cursor
         )
     
     except Exception as e:
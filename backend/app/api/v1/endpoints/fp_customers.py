@@ -1,7 +1,7 @@
 """
 FP Customer Management API
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy import text, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
@@ -15,6 +15,7 @@ from app.models.fp_customer import (
     CustomerProduct, CustomerProductCreate,
     ProductMatchingRequest, ProductMatchingResponse
 )
+from app.services.fp_customer_loader import CustomerFilter, FPCustomerLoader
 
 router = APIRouter()
 
@@ -26,82 +27,47 @@ def get_current_user_id() -> str:
 
 @router.get("/customers", response_model=List[FPCustomerWithDetails])
 async def get_customers(
+    response: Response,
     city: Optional[str] = None,
     district: Optional[str] = None,
     birth_month: Optional[int] = Query(None, ge=1, le=12),
     status: Optional[str] = None,
     tags: Optional[str] = None,  # comma-separated
+    limit: Optional[int] = Query(None, ge=1, le=500, description="페이지 크기 (미지정 시 전체)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
+    include_details: bool = Query(True, description="False면 상담/상품 목록 없이 집계만 반환"),
     db: AsyncSession = Depends(get_db)
 ):
-    """고객 목록 조회 (필터링 지원)"""
-    user_id = get_current_user_id()
-
-    # Build query with filters
-    query = """
-        SELECT
-            c.*,
-            COUNT(DISTINCT cons.id) as consultation_count,
-            COUNT(DISTINCT p.id) as product_count,
-            MAX(cons.consultation_date) as last_contact_date
-        FROM fp_customers c
-        LEFT JOIN fp_consultations cons ON c.id = cons.customer_id
-        LEFT JOIN fp_customer_products p ON c.id = p.customer_id
-        WHERE c.user_id = :user_id
     """
+    고객 목록 조회 (필터링 지원)
 
-    params = {"user_id": user_id}
-
-    if city:
-        query += " AND c.city = :city"
-        params["city"] = city
-
-    if district:
-        query += " AND c.district = :district"
-        params["district"] = district
-
-    if birth_month:
-        query += " AND EXTRACT(MONTH FROM c.birth_date) = :birth_month"
-        params["birth_month"] = birth_month
-
-    if status:
-        query += " AND c.status = :status"
-        params["status"] = status
-
-    if tags:
-        tag_list = tags.split(",")
-        query += " AND c.tags && :tags"
-        params["tags"] = tag_list
-
-    query += " GROUP BY c.id ORDER BY c.created_at DESC"
-
-    result = await db.execute(text(query), params)
-    rows = result.fetchall()
-
-    customers = []
-    for row in rows:
-        customer_dict = dict(row._mapping)
+    다음 페이지가 있으면 응답 헤더 X-Next-Cursor로 커서를 반환합니다.
+    """
+    user_id = get_current_user_id()
 
-        # Get consultations
-        cons_result = await db.execute(
-            text("SELECT * FROM fp_consultations WHERE customer_id = :customer_id ORDER BY consultation_date DESC"),
-            {"customer_id": customer_dict["id"]}
-        )
-        consultations = [dict(r._mapping) for r in cons_result.fetchall()]
+    filters = CustomerFilter(
+        city=city,
+        district=district,
+        birth_month=birth_month,
+        status=status,
+        tags=tags.split(",") if tags else None,
+    )
 
-        # Get products
-        prod_result = await db.execute(
-            text("SELECT * FROM fp_customer_products WHERE customer_id = :customer_id ORDER BY created_at DESC"),
-            {"customer_id": customer_dict["id"]}
+    try:
+        page = await FPCustomerLoader(db).load_page(
+            user_id,
+            filters=filters,
+            limit=limit,
+            cursor=cursor,
+            include_details=include_details,
         )
-        products = [dict(r._mapping) for r in prod_result.fetchall()]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-        customers.append({
-            **customer_dict,
-            "consultations": consultations,
-            "products": products
-        })
+    if page.next_cursor:
+        response.headers["X-Next-Cursor"] = page.next_cursor
 
-    return customers
+    return page.customers
 
 
 @router.post("/customers", response_model=FPCustomer)
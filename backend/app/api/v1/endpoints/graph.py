@@ -3,13 +3,59 @@ Graph API Endpoints
 
 Neo4j 지식 그래프 데이터를 조회하는 API
 """
-from fastapi import APIRouter, HTTPException, status, Query
+from fastapi import APIRouter, HTTPException, status, Query, Request, Response
 from typing import List, Optional, Dict, Any
 
 from app.core.database import neo4j_manager
+from app.services.graph_snapshot import get_graph_snapshot_store
 
 router = APIRouter(prefix="/graph", tags=["Graph"])
 
+LEGACY_SAMPLE_GRAPH_PATH = "/Users/gangseungsig/Documents/02_GitHub/12_InsureGraph Pro/backend/sample_graph.json"
+
+
+def _load_fallback_graph() -> Optional[Dict[str, Any]]:
+    """Neo4j를 사용할 수 없을 때의 그래프 (증분 스냅샷 우선, 없으면 sample_graph.json)"""
+    import os
+    import json
+
+    snapshot = get_graph_snapshot_store().load()
+    if snapshot is not None:
+        return snapshot.to_dict()
+    if os.path.exists(LEGACY_SAMPLE_GRAPH_PATH):
+        with open(LEGACY_SAMPLE_GRAPH_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return None
+
+
+@router.get(
+    "/snapshot",
+    summary="그래프 스냅샷 조회",
+    description="그래프 업데이터 워커가 증분 생성한 현재 스냅샷을 반환합니다. ETag/If-None-Match를 지원합니다."
+)
+async def get_graph_snapshot(request: Request):
+    """
+    그래프 스냅샷 조회
+
+    스냅샷 버전이 If-None-Match와 같으면 본문 없이 304를 반환합니다.
+    """
+    rendered = get_graph_snapshot_store().render()
+    if rendered is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error_code": "GRAPH_SNAPSHOT_NOT_FOUND",
+                "error_message": "그래프 스냅샷이 아직 생성되지 않았습니다."
+            }
+        )
+
+    etag, body = rendered
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 @router.get(
     "",
@@ -32,17 +78,10 @@ async def get_graph(
     Returns:
         GraphData: 노드와 엣지 데이터
     """
-    # Neo4j 연결 실패 시 sample_graph.json 사용
-    import os
-    import json
-    sample_graph_path = "/Users/gangseungsig/Documents/02_GitHub/12_InsureGraph Pro/backend/sample_graph.json"
-
+    # Neo4j 연결 실패 시 그래프 스냅샷(또는 sample_graph.json) 사용
     if not neo4j_manager.driver:
-        # sample_graph.json 파일이 있으면 사용
-        if os.path.exists(sample_graph_path):
-            with open(sample_graph_path, 'r', encoding='utf-8') as f:
-                graph_data = json.load(f)
-
+        graph_data = _load_fallback_graph()
+        if graph_data is not None:
             # 필터링 적용
             filtered_nodes = graph_data.get("nodes", [])
             filtered_edges = graph_data.get("edges", [])
@@ -184,17 +223,11 @@ async def get_graph(
                 }
 
     except Exception as e:
-        # Neo4j 인증 실패나 다른 오류 발생 시 sample_graph.json 사용 시도
-        import os
-        import json
-
+        # Neo4j 인증 실패나 다른 오류 발생 시 그래프 스냅샷(또는 sample_graph.json) 사용 시도
         error_msg = str(e)
         if "Unauthorized" in error_msg or "AuthenticationRateLimit" in error_msg or "authentication" in error_msg.lower():
-            sample_graph_path = "/Users/gangseungsig/Documents/02_GitHub/12_InsureGraph Pro/backend/sample_graph.json"
-            if os.path.exists(sample_graph_path):
-                with open(sample_graph_path, 'r', encoding='utf-8') as f:
-                    graph_data = json.load(f)
-
+            graph_data = _load_fallback_graph()
+            if graph_data is not None:
                 # 필터링 적용
                 filtered_nodes = graph_data.get("nodes", [])
                 filtered_edges = graph_data.get("edges", [])
@@ -11,6 +11,7 @@ from loguru import logger
 
 from app.core.logging import get_metrics_store, get_error_tracker
 from app.core.config import settings
+from app.services.llm_gateway import get_llm_gateway
 
 
 # ============================================================================
@@ -45,6 +46,9 @@ async def get_metrics():
     """
     metrics_store = get_metrics_store()
     prometheus_metrics = metrics_store.get_prometheus_metrics()
+    llm_metrics = "\n".join(get_llm_gateway().telemetry.prometheus_lines())
+    if llm_metrics:
+        prometheus_metrics = f"{prometheus_metrics.rstrip()}\n{llm_metrics}\n"
 
     return Response(
         content=prometheus_metrics,
@@ -84,6 +88,31 @@ async def get_stats() -> Dict:
     }
 
 
+@router.get(
+    "/llm",
+    status_code=status.HTTP_200_OK,
+    summary="LLM 호출 통계",
+    description="""
+    LLM 게이트웨이를 통과한 호출의 공급자/모델별 통계를 반환합니다.
+
+    - 요청/오류/재시도/hedge/중복 제거 수
+    - 토큰 사용량 및 추정 비용
+    - 평균 지연 시간
+    """,
+)
+async def get_llm_stats() -> Dict:
+    """
+    LLM 호출 통계 조회
+
+    Returns:
+        Per provider/model LLM statistics
+    """
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "llm": get_llm_gateway().telemetry.snapshot(),
+    }
+
+
 @router.get(
     "/errors",
     status_code=status.HTTP_200_OK,
@@ -19,7 +19,9 @@ from app.api.v1.models.query import (
     StreamChunk,
     ErrorResponse,
 )
+from app.core.config import settings
 from app.models.orchestration import (
+    OrchestrationConfig,
     OrchestrationRequest,
     OrchestrationStrategy,
 )
@@ -40,7 +42,13 @@ def get_orchestrator() -> QueryOrchestrator:
     """QueryOrchestrator 싱글톤 반환"""
     global _orchestrator
     if _orchestrator is None:
-        _orchestrator = QueryOrchestrator()
+        _orchestrator = QueryOrchestrator(
+            config=OrchestrationConfig(
+                shared_cache_enabled=settings.QUERY_CACHE_SHARED_ENABLED,
+                semantic_cache_enabled=settings.QUERY_CACHE_SEMANTIC_ENABLED,
+                semantic_cache_threshold=settings.QUERY_CACHE_SEMANTIC_THRESHOLD,
+            )
+        )
     return _orchestrator
 
 
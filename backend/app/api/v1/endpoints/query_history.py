@@ -13,6 +13,9 @@ from sqlalchemy import text
 from decimal import Decimal
 
 from app.core.database import get_db
+from app.core.listing import (
+    SortKey, count_rows, cursor_for_row, keyset_condition, like_pattern, order_by_clause
+)
 from app.core.security import get_current_active_user
 from app.models.query_history import (
     QueryHistory,
@@ -84,6 +87,12 @@ async def create_query_history(
         raise HTTPException(status_code=500, detail=f"Failed to create query history: {str(e)}")
 
 
+_HISTORY_SORT_KEYS = (
+    SortKey("qh.created_at", "created_at", value_type=datetime),
+    SortKey("qh.id", "id", value_type=UUID),
+)
+
+
 @router.get("/", response_model=QueryHistoryListResponse, summary="List query history")
 async def list_query_history(
     customer_id: Optional[UUID] = QueryParam(None, description="Filter by customer"),
@@ -93,6 +102,8 @@ async def list_query_history(
     search: Optional[str] = QueryParam(None, description="Search in query text"),
     page: int = QueryParam(1, ge=1),
     page_size: int = QueryParam(20, ge=1, le=100),
+    cursor: Optional[str] = QueryParam(None, description="next_cursor from the previous page (overrides page)"),
+    count: str = QueryParam("auto", pattern="^(auto|exact|none)$", description="Total count mode"),
     user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -101,43 +112,53 @@ async def list_query_history(
 
     Supports:
     - Filter by customer, intent, date range
-    - Search in query text
-    - Pagination
+    - Search in query text (pg_trgm index)
+    - Keyset pagination via cursor (page/OFFSET kept for compatibility)
+    - count=auto returns a planner estimate for large result sets
     """
-    try:
-        # Build WHERE conditions
-        conditions = [f"qh.user_id = '{user.id}'"]
-
-        if customer_id:
-            conditions.append(f"qh.customer_id = '{customer_id}'")
-
-        if intent:
-            intent_safe = intent.replace("'", "''")
-            conditions.append(f"qh.intent = '{intent_safe}'")
-
-        if date_from:
-            conditions.append(f"qh.created_at >= '{date_from.isoformat()}'")
-
-        if date_to:
-            conditions.append(f"qh.created_at <= '{date_to.isoformat()}'")
-
-        if search:
-            search_term = search.replace("'", "''")
-            conditions.append(f"qh.query_text ILIKE '%{search_term}%'")
-
-        where_clause = " AND ".join(conditions)
+    # Build WHERE conditions
+    conditions = ["qh.user_id = :user_id"]
+    params = {"user_id": user.id}
+
+    if customer_id:
+        conditions.append("qh.customer_id = :customer_id")
+        params["customer_id"] = customer_id
+
+    if intent:
+        conditions.append("qh.intent = :intent")
+        params["intent"] = intent
+
+    if date_from:
+        conditions.append("qh.created_at >= :date_from")
+        params["date_from"] = date_from
+
+    if date_to:
+        conditions.append("qh.created_at <= :date_to")
+        params["date_to"] = date_to
+
+    if search:
+        conditions.append("qh.query_text ILIKE :search")
+        params["search"] = like_pattern(search)
+
+    from_clause = f"FROM query_history qh WHERE {' AND '.join(conditions)}"
+
+    page_conditions = list(conditions)
+    page_params = {**params, "limit": page_size + 1}
+    offset = 0
+    if cursor:
+        try:
+            condition, cursor_params = keyset_condition(_HISTORY_SORT_KEYS, cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        page_conditions.append(condition)
+        page_params.update(cursor_params)
+    else:
+        offset = (page - 1) * page_size
 
-        # Count total
-        count_query = text(f"""
-            SELECT COUNT(*) as total
-            FROM query_history qh
-            WHERE {where_clause}
-        """)
-        count_result = await db.execute(count_query)
-        total = count_result.scalar()
+    try:
+        total, total_is_estimate = await count_rows(db, from_clause, params, mode=count)
 
-        # Get paginated results with customer name
-        offset = (page - 1) * page_size
+        # Get one page (plus one row to detect the next page) with customer name
         list_query = text(f"""
             SELECT
                 qh.id,
@@ -151,22 +172,26 @@ async def list_query_history(
                 qh.created_at
             FROM query_history qh
             LEFT JOIN customers c ON qh.customer_id = c.id
-            WHERE {where_clause}
-            ORDER BY qh.created_at DESC
-            LIMIT {page_size} OFFSET {offset}
+            WHERE {' AND '.join(page_conditions)}
+            {order_by_clause(_HISTORY_SORT_KEYS)}
+            LIMIT :limit OFFSET {offset}
         """)
 
-        result = await db.execute(list_query)
-        rows = result.fetchall()
+        result = await db.execute(list_query, page_params)
+        rows = [row._mapping for row in result.fetchall()]
 
-        items = [QueryHistoryResponse(**dict(row._mapping)) for row in rows]
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        items = [QueryHistoryResponse(**dict(row)) for row in rows]
 
         return QueryHistoryListResponse(
             items=items,
             total=total,
             page=page,
             page_size=page_size,
-            has_more=(offset + page_size) < total,
+            has_more=has_more,
+            total_is_estimate=total_is_estimate,
+            next_cursor=cursor_for_row(rows[-1], _HISTORY_SORT_KEYS) if has_more else None,
         )
 
     except Exception as e:
@@ -357,6 +382,8 @@ async def get_customer_query_history(
     customer_id: UUID,
     page: int = QueryParam(1, ge=1),
     page_size: int = QueryParam(10, ge=1, le=50),
+    cursor: Optional[str] = QueryParam(None, description="next_cursor from the previous page"),
+    count: str = QueryParam("auto", pattern="^(auto|exact|none)$", description="Total count mode"),
     user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -382,8 +409,14 @@ async def get_customer_query_history(
     # Get query history
     return await list_query_history(
         customer_id=customer_id,
+        intent=None,
+        date_from=None,
+        date_to=None,
+        search=None,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        count=count,
         user=user,
         db=db,
     )
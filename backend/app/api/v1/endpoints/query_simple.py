@@ -35,6 +35,7 @@ class SimpleQueryRequest(BaseModel):
     customer_id: Optional[str] = Field(None, description="고객 ID (선택, 히스토리 추적용)")
     limit: int = Field(10, description="검색 결과 수", ge=1, le=50)
     use_traversal: bool = Field(True, description="그래프 탐색 사용 여부")
+    traversal_top_k: int = Field(3, description="그래프 탐색 시작 노드 수 (상위 검색 결과)", ge=1, le=10)
     llm_provider: str = Field("google", description="LLM 제공자 (openai/anthropic/google/mock)")
 
 
@@ -159,16 +160,18 @@ async def execute_simple_query(
         if request.use_traversal and search_results.results:
             traversal = get_graph_traversal()
 
-            # Traverse from first result
-            first_result = search_results.results[0]
+            # Traverse from top-k results in a single batched query
+            start_ids = [r.node_id for r in search_results.results[:request.traversal_top_k]]
             try:
-                traversal_result = traversal.traverse_hierarchical(
-                    start_node_id=first_result.node_id,
+                traversal_result = traversal.traverse_hierarchical_batch(
+                    start_node_ids=start_ids,
                     direction="down",
                     max_depth=2,
                 )
-                graph_paths = traversal_result.paths
-                logger.info(f"Found {len(graph_paths)} graph paths")
+                graph_paths = traversal_result.all_paths()
+                logger.info(
+                    f"Found {len(graph_paths)} graph paths from {len(start_ids)} start nodes"
+                )
             except Exception as e:
                 logger.warning(f"Graph traversal failed: {e}")
 
@@ -186,7 +189,7 @@ async def execute_simple_query(
             graph_paths=graph_paths,
         )
 
-        reasoning_result = reasoning.reason(context)
+        reasoning_result = await reasoning.areason(context)
 
         logger.info(f"Generated answer (confidence: {reasoning_result.confidence:.2f})")
 
@@ -3,6 +3,7 @@ Search API Endpoints
 
 MVP search endpoints for insurance policy documents.
 """
+import asyncio
 from typing import List, Optional
 from uuid import UUID
 
@@ -123,7 +124,7 @@ class InsurerList(BaseModel):
 Search for insurance policy documents with various filters.
 
 **Filters:**
-- `q`: Full-text search query (policy name, insurer, content)
+- `q`: Full-text search query (policy name, insurer, content; Korean compound nouns match with or without spaces)
 - `insurer`: Filter by insurance company name
 - `amount_min`: Minimum insurance amount (KRW)
 - `amount_max`: Maximum insurance amount (KRW)
@@ -163,11 +164,8 @@ async def search_documents(
     # Get repository
     doc_repo = get_document_repository()
 
-    # Search
-    results = doc_repo.search(filter_params)
-
-    # Get total count
-    total = doc_repo.count(filter_params)
+    # Search and count in one query (blocking psycopg2 call → worker thread)
+    results, total = await asyncio.to_thread(doc_repo.search_with_total, filter_params)
 
     # Calculate total pages
     total_pages = (total + page_size - 1) // page_size
@@ -2,96 +2,129 @@
 API v1 Router
 
 API v1의 모든 엔드포인트를 통합하는 라우터.
+
+APP_ROLE에 따라 필요한 라우터 모듈만 import/mount합니다.
+질의 전용 Pod(query)는 수집/크롤러 모듈과 그 의존성(LangGraph, pdfplumber, GCS, 크롤러 등)을 로드하지 않습니다.
 """
+import importlib
+import sys
+from dataclasses import dataclass
+from typing import FrozenSet, Optional, Tuple
+
 from fastapi import APIRouter, status
 from loguru import logger
 
-from app.api.v1.endpoints import query, auth, monitoring, graph, metadata, test_crawler, ingest, query_simple, search, customers, analytics, query_history, ga_analytics, notifications
-from app.api.v1.endpoints import documents, crawler_documents, crawler_urls, fp_customers
-from app.api.v1.endpoints import insurer_crawlers, learning_stats, knowledge, knowledge_graph, relearning
-# Temporarily disabled documents due to missing pdfplumber
-# from app.api.v1.endpoints import documents
-# Temporarily disabled crawler due to missing app.core.deps
-# from app.api.v1.endpoints import crawler
 from app.api.v1.models.query import HealthCheckResponse
-from app.services.orchestration.query_orchestrator import QueryOrchestrator
-
-
-# API v1 Router
-api_router = APIRouter()
-
-# Auth endpoints
-api_router.include_router(auth.router)
-
-# Metadata endpoints (Human-in-the-Loop)
-api_router.include_router(metadata.router)
-
-# Ingest endpoints (Policy Upload & Job Management)
-api_router.include_router(ingest.router)
-
-# Query endpoints
-api_router.include_router(query.router)
-
-# Simple Query endpoints (Stories 2.1-2.5)
-api_router.include_router(query_simple.router, prefix="/query-simple", tags=["Query Simple"])
-
-# Customer endpoints (Story 3.4)
-api_router.include_router(customers.router, prefix="/customers", tags=["Customers"])
-
-# Analytics endpoints (Story 3.5)
-api_router.include_router(analytics.router, prefix="/analytics", tags=["Analytics"])
-
-# Query History endpoints (Enhancement #2)
-api_router.include_router(query_history.router, prefix="/query-history", tags=["Query History"])
-
-# GA Analytics endpoints (Enhancement #4)
-api_router.include_router(ga_analytics.router, prefix="/ga-analytics", tags=["GA Analytics"])
-
-# Notifications endpoints (Task D)
-api_router.include_router(notifications.router, prefix="/notifications", tags=["Notifications"])
-
-# Search endpoints (MVP)
-api_router.include_router(search.router)
-
-# Document endpoints
-api_router.include_router(documents.router)
-
-# Monitoring endpoints
-api_router.include_router(monitoring.router)
-
-# Graph endpoints
-api_router.include_router(graph.router)
-
-# Test Crawler endpoints (new)
-api_router.include_router(test_crawler.router)
+from app.core.config import settings
+
+
+# 실행 역할 (all: 전체 라우터)
+APP_ROLES = ("all", "query", "ingestion", "crawler")
+
+ALL_ROLES = frozenset({"query", "ingestion", "crawler"})
+QUERY = frozenset({"query"})
+INGESTION = frozenset({"ingestion"})
+CRAWLER = frozenset({"crawler"})
+
+
+@dataclass(frozen=True)
+class RouterSpec:
+    """라우터 모듈 (module.router)과 mount 옵션"""
+
+    module: str
+    roles: FrozenSet[str]
+    prefix: str = ""
+    tags: Optional[Tuple[str, ...]] = None
+
+
+# mount 순서 = 라우트 우선순위 (기존 등록 순서 유지)
+ROUTER_SPECS: Tuple[RouterSpec, ...] = (
+    # Policy Ingestion (LangGraph workflow)
+    RouterSpec("app.api.v1.ingestion", INGESTION, prefix="/policies", tags=("Ingestion",)),
+    # Auth endpoints
+    RouterSpec("app.api.v1.endpoints.auth", ALL_ROLES),
+    # Metadata endpoints (Human-in-the-Loop)
+    RouterSpec("app.api.v1.endpoints.metadata", INGESTION),
+    # Ingest endpoints (Policy Upload & Job Management)
+    RouterSpec("app.api.v1.endpoints.ingest", INGESTION),
+    # Query endpoints
+    RouterSpec("app.api.v1.endpoints.query", QUERY),
+    # Simple Query endpoints (Stories 2.1-2.5)
+    RouterSpec("app.api.v1.endpoints.query_simple", QUERY, prefix="/query-simple", tags=("Query Simple",)),
+    # Customer endpoints (Story 3.4)
+    RouterSpec("app.api.v1.endpoints.customers", QUERY, prefix="/customers", tags=("Customers",)),
+    # Analytics endpoints (Story 3.5)
+    RouterSpec("app.api.v1.endpoints.analytics", QUERY, prefix="/analytics", tags=("Analytics",)),
+    # Query History endpoints (Enhancement #2)
+    RouterSpec("app.api.v1.endpoints.query_history", QUERY, prefix="/query-history", tags=("Query History",)),
+    # GA Analytics endpoints (Enhancement #4)
+    RouterSpec("app.api.v1.endpoints.ga_analytics", QUERY, prefix="/ga-analytics", tags=("GA Analytics",)),
+    # Notifications endpoints (Task D)
+    RouterSpec("app.api.v1.endpoints.notifications", QUERY, prefix="/notifications", tags=("Notifications",)),
+    # Search endpoints (MVP)
+    RouterSpec("app.api.v1.endpoints.search", QUERY),
+    # Document endpoints (upload + processing)
+    RouterSpec("app.api.v1.endpoints.documents", INGESTION),
+    # Monitoring endpoints
+    RouterSpec("app.api.v1.endpoints.monitoring", ALL_ROLES),
+    # Graph endpoints
+    RouterSpec("app.api.v1.endpoints.graph", QUERY),
+    # Test Crawler endpoints (new)
+    RouterSpec("app.api.v1.endpoints.test_crawler", CRAWLER),
+    # Crawler Documents endpoints (includes URL management)
+    RouterSpec("app.api.v1.endpoints.crawler_documents", CRAWLER | INGESTION),
+    # FP Customer Management endpoints
+    RouterSpec("app.api.v1.endpoints.fp_customers", QUERY, prefix="/fp", tags=("FP Customers",)),
+    # Insurer Crawlers endpoints (Samsung Fire, KB Insurance, etc.)
+    RouterSpec("app.api.v1.endpoints.insurer_crawlers", CRAWLER, prefix="/crawlers", tags=("Insurer Crawlers",)),
+    # Learning Statistics endpoints (Smart Insurance Learner monitoring)
+    RouterSpec("app.api.v1.endpoints.learning_stats", INGESTION, prefix="/learning", tags=("Learning Stats",)),
+    # Knowledge Extraction endpoints (Entity extraction from documents)
+    RouterSpec("app.api.v1.endpoints.knowledge", INGESTION),
+    # Knowledge Graph endpoints (Neo4j graph visualization)
+    RouterSpec("app.api.v1.endpoints.knowledge_graph", QUERY, prefix="/knowledge-graph", tags=("Knowledge Graph",)),
+    # Relearning endpoints (Incremental Learning with Upstage)
+    RouterSpec("app.api.v1.endpoints.relearning", INGESTION, prefix="/relearning", tags=("Relearning",)),
+    # Crawler endpoints (temporarily disabled - missing app.core.deps)
+    # RouterSpec("app.api.v1.endpoints.crawler", CRAWLER, prefix="/crawler", tags=("Crawler",)),
+)
 
-# Crawler Documents endpoints (includes URL management)
-api_router.include_router(crawler_documents.router)
 
-# FP Customer Management endpoints
-api_router.include_router(fp_customers.router, prefix="/fp", tags=["FP Customers"])
+def router_specs_for_role(role: str) -> Tuple[RouterSpec, ...]:
+    """역할에 필요한 라우터 목록"""
+    if role not in APP_ROLES:
+        raise ValueError(f"Unknown APP_ROLE '{role}' (expected one of {', '.join(APP_ROLES)})")
+    if role == "all":
+        return ROUTER_SPECS
+    return tuple(spec for spec in ROUTER_SPECS if role in spec.roles)
 
-# Insurer Crawlers endpoints (Samsung Fire, KB Insurance, etc.)
-api_router.include_router(insurer_crawlers.router, prefix="/crawlers", tags=["Insurer Crawlers"])
 
-# Learning Statistics endpoints (Smart Insurance Learner monitoring)
-api_router.include_router(learning_stats.router, prefix="/learning", tags=["Learning Stats"])
+def build_api_router(role: str = "all") -> APIRouter:
+    """
+    역할에 맞는 API v1 라우터 생성
 
-# Knowledge Extraction endpoints (Entity extraction from documents)
-api_router.include_router(knowledge.router)
+    Args:
+        role: 실행 역할 (all, query, ingestion, crawler)
 
-# Knowledge Graph endpoints (Neo4j graph visualization)
-api_router.include_router(knowledge_graph.router, prefix="/knowledge-graph", tags=["Knowledge Graph"])
+    Returns:
+        APIRouter: 해당 역할의 엔드포인트 + 헬스 체크/루트
+    """
+    router = APIRouter()
+    for spec in router_specs_for_role(role):
+        module = importlib.import_module(spec.module)
+        kwargs = {"prefix": spec.prefix}
+        if spec.tags:
+            kwargs["tags"] = list(spec.tags)
+        router.include_router(module.router, **kwargs)
+    router.include_router(_system_router)
+    return router
 
-# Relearning endpoints (Incremental Learning with Upstage)
-api_router.include_router(relearning.router, prefix="/relearning", tags=["Relearning"])
 
-# Crawler endpoints (temporarily disabled)
-# api_router.include_router(crawler.router, prefix="/crawler", tags=["Crawler"])
+_system_router = APIRouter()
 
 
 # Health Check
-@api_router.get(
+@_system_router.get(
     "/health",
     response_model=HealthCheckResponse,
     status_code=status.HTTP_200_OK,
@@ -108,6 +141,15 @@ async def health_check() -> HealthCheckResponse:
     **Returns**:
     - HealthCheckResponse: 시스템 상태
     """
+    # query 라우터가 없는 역할(ingestion, crawler)은 오케스트레이터를 로드하지 않음
+    query = sys.modules.get("app.api.v1.endpoints.query")
+    if query is None:
+        return HealthCheckResponse(
+            status="healthy",
+            version="1.0.0",
+            components={"role": settings.APP_ROLE},
+        )
+
     try:
         # Orchestrator health check
         orchestrator = query.get_orchestrator()
@@ -131,7 +173,7 @@ async def health_check() -> HealthCheckResponse:
 
 
 # Root endpoint
-@api_router.get(
+@_system_router.get(
     "/",
     status_code=status.HTTP_200_OK,
     summary="API 루트",
@@ -170,3 +212,7 @@ async def root():
             "metadata_stats": "/api/v1/metadata/stats",
         },
     }
+
+
+# API v1 Router (APP_ROLE 기준)
+api_router = build_api_router(settings.APP_ROLE)
@@ -2,15 +2,22 @@
 Audit Logging System
 
 감사 로깅 시스템 - 모든 중요한 작업을 기록
+
+log_event는 최근 이벤트 링 버퍼(AUDIT_BUFFER_SIZE)에 추가하고 저장 대기열에 넣기만 합니다.
+영구 저장은 app.core.audit_sink의 백그라운드 배치 작업이 담당합니다.
 """
 
-from typing import Dict, Any, Optional, List
+from collections import Counter, deque
+from typing import Deque, Dict, Any, Optional, List
 from datetime import datetime, timedelta
 from enum import Enum
-import json
+import uuid
 
 from loguru import logger
 
+from app.core.config import settings
+from app.core.audit_sink import PostgresAuditSink, get_audit_pipeline
+
 
 class AuditEventType(str, Enum):
     """감사 이벤트 타입"""
@@ -73,8 +80,8 @@ class AuditLogger:
     모든 중요한 작업을 WHO, WHAT, WHEN, WHERE로 기록합니다.
     """
 
-    # In-memory storage (production에서는 DB 사용)
-    _audit_logs: List[Dict[str, Any]] = []
+    # 최근 이벤트 링 버퍼 (영구 저장은 audit_sink 파이프라인)
+    _audit_logs: Deque[Dict[str, Any]] = deque(maxlen=settings.AUDIT_BUFFER_SIZE)
 
     @classmethod
     def log_event(
@@ -108,6 +115,7 @@ class AuditLogger:
         timestamp = datetime.utcnow()
 
         audit_entry = {
+            "event_id": str(uuid.uuid4()),
             "timestamp": timestamp.isoformat(),
             "event_type": event_type.value,
             "user_id": user_id or "anonymous",
@@ -122,6 +130,7 @@ class AuditLogger:
         }
 
         cls._audit_logs.append(audit_entry)
+        get_audit_pipeline().enqueue(audit_entry)
 
         # 로그 출력
         log_message = (
@@ -307,32 +316,7 @@ class AuditLogger:
                 "page_size": int,
             }
         """
-        logs = cls._audit_logs.copy()
-
-        # 필터링
-        if user_id:
-            logs = [log for log in logs if log["user_id"] == user_id]
-
-        if event_type:
-            logs = [log for log in logs if log["event_type"] == event_type.value]
-
-        if resource_type:
-            logs = [log for log in logs if log["resource_type"] == resource_type]
-
-        if severity:
-            logs = [log for log in logs if log["severity"] == severity.value]
-
-        if start_date:
-            logs = [
-                log for log in logs
-                if datetime.fromisoformat(log["timestamp"]) >= start_date
-            ]
-
-        if end_date:
-            logs = [
-                log for log in logs
-                if datetime.fromisoformat(log["timestamp"]) <= end_date
-            ]
+        logs = cls._filter_logs(user_id, event_type, resource_type, severity, start_date, end_date)
 
         # 정렬 (최신 순)
         logs = sorted(logs, key=lambda x: x["timestamp"], reverse=True)
@@ -349,6 +333,100 @@ class AuditLogger:
             "page_size": limit,
         }
 
+    @classmethod
+    def _filter_logs(
+        cls,
+        user_id: Optional[str] = None,
+        event_type: Optional[AuditEventType] = None,
+        resource_type: Optional[str] = None,
+        severity: Optional[AuditSeverity] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """링 버퍼 필터링 (한 번 순회)"""
+        # ISO 문자열은 사전순 비교 = 시간순 비교
+        start = start_date.isoformat() if start_date else None
+        end = end_date.isoformat() if end_date else None
+        event_value = event_type.value if event_type else None
+        severity_value = severity.value if severity else None
+
+        return [
+            log for log in list(cls._audit_logs)
+            if (not user_id or log["user_id"] == user_id)
+            and (not event_value or log["event_type"] == event_value)
+            and (not resource_type or log["resource_type"] == resource_type)
+            and (not severity_value or log["severity"] == severity_value)
+            and (start is None or log["timestamp"] >= start)
+            and (end is None or log["timestamp"] <= end)
+        ]
+
+    @classmethod
+    async def aget_audit_logs(
+        cls,
+        user_id: Optional[str] = None,
+        event_type: Optional[AuditEventType] = None,
+        resource_type: Optional[str] = None,
+        severity: Optional[AuditSeverity] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        감사 로그를 조회합니다 (비동기).
+
+        Postgres 저장소를 사용하면 대기 중인 이벤트를 먼저 저장한 뒤 SQL로 조회하고,
+        그 외에는 get_audit_logs와 같이 링 버퍼에서 조회합니다.
+        """
+        pipeline = get_audit_pipeline()
+        if not isinstance(pipeline.sink, PostgresAuditSink):
+            return cls.get_audit_logs(
+                user_id, event_type, resource_type, severity, start_date, end_date, limit, offset
+            )
+
+        await pipeline.flush()
+        return await pipeline.sink.query(
+            user_id=user_id,
+            event_type=event_type.value if event_type else None,
+            resource_type=resource_type,
+            severity=severity.value if severity else None,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            offset=offset,
+        )
+
+    @classmethod
+    async def agenerate_compliance_report(
+        cls,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        규제 준수 리포트를 생성합니다 (비동기).
+
+        Postgres 저장소를 사용하면 집계를 SQL에서 실행하고,
+        그 외에는 generate_compliance_report와 같이 링 버퍼에서 집계합니다.
+        """
+        pipeline = get_audit_pipeline()
+        if not isinstance(pipeline.sink, PostgresAuditSink):
+            return cls.generate_compliance_report(start_date, end_date)
+
+        if not start_date:
+            start_date = datetime.utcnow() - timedelta(days=30)
+        if not end_date:
+            end_date = datetime.utcnow()
+
+        await pipeline.flush()
+        report = await pipeline.sink.compliance_summary(start_date, end_date)
+        return {
+            "report_period": {
+                "start": start_date.isoformat(),
+                "end": end_date.isoformat(),
+            },
+            **report,
+        }
+
     @classmethod
     def generate_compliance_report(
         cls,
@@ -370,46 +448,34 @@ class AuditLogger:
         if not end_date:
             end_date = datetime.utcnow()
 
-        logs_result = cls.get_audit_logs(
-            start_date=start_date,
-            end_date=end_date,
-            limit=10000  # Get all logs
+        # 최신 순 (security_alerts 순서)
+        logs = sorted(
+            cls._filter_logs(start_date=start_date, end_date=end_date),
+            key=lambda x: x["timestamp"],
+            reverse=True,
         )
 
-        logs = logs_result["logs"]
-        total_events = logs_result["total"]
-
-        # 통계 계산
-        auth_events = [log for log in logs if "login" in log["event_type"] or "logout" in log["event_type"]]
-        data_access_events = [log for log in logs if log["event_type"] in [
-            "read_user", "read_document", "read_query"
-        ]]
-        pii_access_events = [
-            log for log in logs
-            if log["details"].get("pii_fields_accessed")
-        ]
-        security_events = [
-            log for log in logs
-            if log["severity"] in ["error", "critical"]
-        ]
-        failed_logins = [
-            log for log in logs
-            if log["event_type"] == "failed_login"
-        ]
-
-        # 사용자별 활동
-        user_activity = {}
+        # 통계 계산 (한 번 순회)
+        counts = Counter()
+        user_activity = Counter()
+        pii_users = set()
+        security_events = []
         for log in logs:
-            user_id = log["user_id"]
-            if user_id not in user_activity:
-                user_activity[user_id] = 0
-            user_activity[user_id] += 1
-
-        top_users = sorted(
-            user_activity.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:10]
+            event = log["event_type"]
+            user_activity[log["user_id"]] += 1
+            if "login" in event or "logout" in event:
+                counts["auth"] += 1
+            if event in ("read_user", "read_document", "read_query"):
+                counts["data_access"] += 1
+            if (log.get("details") or {}).get("pii_fields_accessed"):
+                counts["pii"] += 1
+                pii_users.add(log["user_id"])
+            if log["severity"] in ("error", "critical"):
+                security_events.append(log)
+            if event == "failed_login":
+                counts["failed_login"] += 1
+
+        top_users = user_activity.most_common(10)
 
         report = {
             "report_period": {
@@ -417,12 +483,12 @@ class AuditLogger:
                 "end": end_date.isoformat(),
             },
             "summary": {
-                "total_events": total_events,
-                "auth_events": len(auth_events),
-                "data_access_events": len(data_access_events),
-                "pii_access_events": len(pii_access_events),
+                "total_events": len(logs),
+                "auth_events": counts["auth"],
+                "data_access_events": counts["data_access"],
+                "pii_access_events": counts["pii"],
                 "security_events": len(security_events),
-                "failed_logins": len(failed_logins),
+                "failed_logins": counts["failed_login"],
             },
             "top_users": [
                 {"user_id": user_id, "event_count": count}
@@ -438,8 +504,8 @@ class AuditLogger:
                 for log in security_events[:20]  # Top 20
             ],
             "pii_access_summary": {
-                "total_pii_accesses": len(pii_access_events),
-                "users_accessed_pii": len(set(log["user_id"] for log in pii_access_events)),
+                "total_pii_accesses": counts["pii"],
+                "users_accessed_pii": len(pii_users),
             },
         }
 
@@ -447,8 +513,9 @@ class AuditLogger:
 
     @classmethod
     def clear_logs(cls):
-        """모든 감사 로그를 삭제합니다 (테스트용)."""
+        """모든 감사 로그를 삭제합니다 (테스트용, 저장 대기 이벤트 포함)."""
         cls._audit_logs.clear()
+        get_audit_pipeline().clear_pending()
 
 
 # Convenience functions
@@ -0,0 +1,554 @@
+"""
+Audit Sink
+
+감사 이벤트 영구 저장 파이프라인.
+
+AuditLogger.log_event는 이벤트를 대기열(deque)에 넣기만 하고 바로 반환합니다.
+백그라운드 작업이 AUDIT_FLUSH_INTERVAL_SECONDS마다 대기열을 배치로 비워서 저장합니다.
+
+- PostgresAuditSink: append-only audit_logs 테이블 (migration 009), 조회/리포트는 SQL로 실행
+- JSONLAuditSink: 로컬 JSONL 세그먼트 파일 (크기/날짜 기준 교체, 배치마다 fsync)
+- Postgres 저장 실패 시 JSONL 스풀 디렉터리로 기록 → 감사 이벤트를 잃지 않음
+- Postgres가 다시 정상이면 스풀 세그먼트를 audit_logs로 재생 (event_id 충돌은 무시하므로 멱등)
+- 대기열이 가득 차면 (flusher가 따라가지 못하는 경우) 해당 이벤트는 다음 저장 주기에 스풀 파일로 기록
+"""
+import asyncio
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from loguru import logger
+from sqlalchemy import text
+
+from app.core.config import settings
+
+
+class AuditSink:
+    """감사 이벤트 저장소 기본 클래스 (AUDIT_SINK="none": 저장하지 않음)"""
+
+    name = "none"
+
+    async def write_batch(self, entries: List[Dict[str, Any]]) -> None:
+        return None
+
+    async def close(self) -> None:
+        pass
+
+
+class JSONLAuditSink(AuditSink):
+    """
+    로컬 JSONL 세그먼트 파일 저장소
+
+    파일명: audit-YYYYMMDD-<pid>-<순번>.jsonl (append-only, 같은 날짜에 max_segment_bytes를 넘으면 다음 순번)
+    """
+
+    name = "jsonl"
+
+    def __init__(self, directory: Optional[str] = None, max_segment_bytes: Optional[int] = None):
+        """
+        Args:
+            directory: 세그먼트 디렉터리 (기본값: settings.AUDIT_SPOOL_DIR)
+            max_segment_bytes: 세그먼트 최대 크기 (기본값: settings.AUDIT_SEGMENT_MAX_BYTES)
+        """
+        self.directory = Path(directory or settings.AUDIT_SPOOL_DIR)
+        self.max_segment_bytes = max_segment_bytes or settings.AUDIT_SEGMENT_MAX_BYTES
+        self._lock = threading.Lock()
+        self._segment: Optional[Path] = None
+        self._sequence = 0
+
+    def _current_segment(self) -> Path:
+        day = datetime.utcnow().strftime("%Y%m%d")
+        segment = self._segment
+        if segment is None or not segment.name.startswith(f"audit-{day}-"):
+            # 날짜 변경: 새 세그먼트 순번
+            self._sequence = 0
+            segment = None
+        while segment is None or (
+            segment.exists() and segment.stat().st_size >= self.max_segment_bytes
+        ):
+            self._sequence += 1
+            segment = self.directory / f"audit-{day}-{os.getpid()}-{self._sequence:04d}.jsonl"
+        self._segment = segment
+        return segment
+
+    def write_batch_sync(self, entries: List[Dict[str, Any]]) -> None:
+        """배치 기록 (동기, fsync 포함)"""
+        if not entries:
+            return
+        payload = "".join(
+            json.dumps(entry, ensure_ascii=False, default=str) + "\n" for entry in entries
+        )
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self._current_segment(), "a", encoding="utf-8") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+
+    async def write_batch(self, entries: List[Dict[str, Any]]) -> None:
+        await asyncio.to_thread(self.write_batch_sync, entries)
+
+    def claim_segments(self, min_idle_seconds: float = 0.0) -> List[Path]:
+        """
+        재생할 세그먼트를 *.replaying 파일로 이름을 바꿔 선점
+
+        rename은 원자적이므로 여러 프로세스가 같은 세그먼트를 동시에 재생하지 않습니다.
+        다른 프로세스가 아직 쓰고 있을 수 있는 세그먼트(min_idle_seconds 안에 수정됨)는 건너뜁니다.
+        이전 재생이 실패해 남은 *.replaying 파일도 다시 선점합니다.
+        """
+        if not self.directory.is_dir():
+            return []
+        own_pid = str(os.getpid())
+        now = time.time()
+        claimed = []
+        with self._lock:
+            for path in sorted(self.directory.glob("audit-*")):
+                if path.suffix not in (".jsonl", ".replaying"):
+                    continue
+                try:
+                    if (
+                        path.suffix == ".jsonl"
+                        and path.name.split("-")[2] != own_pid
+                        and now - path.stat().st_mtime < min_idle_seconds
+                    ):
+                        continue
+                    target = self.directory / f"{path.name.split('.')[0]}.{uuid.uuid4().hex[:8]}.replaying"
+                    path.rename(target)
+                except (FileNotFoundError, IndexError):
+                    # 다른 프로세스가 먼저 선점
+                    continue
+                claimed.append(target)
+        return claimed
+
+    @staticmethod
+    def read_segment(path: Path) -> List[Dict[str, Any]]:
+        """세그먼트의 이벤트 (손상된 줄은 건너뜀)"""
+        entries = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    logger.warning(f"Skipping corrupt audit spool line in {path.name}")
+        return entries
+
+
+_INSERT_SQL = """
+    INSERT INTO audit_logs (
+        event_id, occurred_at, event_type, user_id, resource_type, resource_id,
+        action, severity, success, ip_address, user_agent, details
+    ) VALUES (
+        :event_id, :occurred_at, :event_type, :user_id, :resource_type, :resource_id,
+        :action, :severity, :success, :ip_address, :user_agent, CAST(:details AS JSONB)
+    )
+    ON CONFLICT (event_id) DO NOTHING
+"""
+
+_LOG_COLUMNS = """
+    occurred_at, event_type, user_id, resource_type, resource_id,
+    action, severity, success, ip_address, user_agent, details
+"""
+
+# pii_fields_accessed가 있는 이벤트 (idx_audit_logs_pii 부분 인덱스와 같은 조건)
+_PII_CONDITION = "details -> 'pii_fields_accessed' IS NOT NULL"
+
+
+def _row_to_entry(row) -> Dict[str, Any]:
+    details = row.details
+    if isinstance(details, str):
+        details = json.loads(details)
+    return {
+        "timestamp": row.occurred_at.replace(tzinfo=None).isoformat(),
+        "event_type": row.event_type,
+        "user_id": row.user_id,
+        "resource_type": row.resource_type,
+        "resource_id": row.resource_id,
+        "action": row.action,
+        "severity": row.severity,
+        "success": row.success,
+        "ip_address": row.ip_address,
+        "user_agent": row.user_agent,
+        "details": details or {},
+    }
+
+
+class PostgresAuditSink(AuditSink):
+    """append-only audit_logs 테이블 저장소"""
+
+    name = "postgres"
+
+    def __init__(self, session_factory: Optional[Callable] = None):
+        """
+        Args:
+            session_factory: AsyncSession 팩토리 (기본값: AsyncSessionLocal)
+        """
+        if session_factory is None:
+            from app.core.database import AsyncSessionLocal
+
+            session_factory = AsyncSessionLocal
+        self.session_factory = session_factory
+
+    async def write_batch(self, entries: List[Dict[str, Any]]) -> None:
+        if not entries:
+            return
+        params = [
+            {
+                "event_id": entry["event_id"],
+                "occurred_at": datetime.fromisoformat(entry["timestamp"]),
+                "event_type": entry["event_type"],
+                "user_id": entry["user_id"],
+                "resource_type": entry.get("resource_type"),
+                "resource_id": entry.get("resource_id"),
+                "action": entry.get("action"),
+                "severity": entry["severity"],
+                "success": entry["success"],
+                "ip_address": entry.get("ip_address"),
+                "user_agent": entry.get("user_agent"),
+                "details": json.dumps(entry.get("details") or {}, ensure_ascii=False, default=str),
+            }
+            for entry in entries
+        ]
+        async with self.session_factory() as db:
+            await db.execute(text(_INSERT_SQL), params)
+            await db.commit()
+
+    async def query(
+        self,
+        user_id: Optional[str] = None,
+        event_type: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        severity: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        """필터 조회 (최신 순, 한 번의 쿼리로 전체 건수 포함)"""
+        conditions = []
+        params: Dict[str, Any] = {"limit": limit, "offset": offset}
+        for column, value in (
+            ("user_id", user_id),
+            ("event_type", event_type),
+            ("resource_type", resource_type),
+            ("severity", severity),
+        ):
+            if value:
+                conditions.append(f"{column} = :{column}")
+                params[column] = value
+        if start_date:
+            conditions.append("occurred_at >= :start_date")
+            params["start_date"] = start_date
+        if end_date:
+            conditions.append("occurred_at <= :end_date")
+            params["end_date"] = end_date
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        async with self.session_factory() as db:
+            result = await db.execute(
+                text(f"""
+                    SELECT {_LOG_COLUMNS}, COUNT(*) OVER () AS total
+                    FROM audit_logs
+                    {where}
+                    ORDER BY occurred_at DESC
+                    LIMIT :limit OFFSET :offset
+                """),
+                params,
+            )
+            rows = result.fetchall()
+
+        total = rows[0].total if rows else 0
+        if not rows and offset:
+            # 범위를 벗어난 페이지: 건수만 따로 조회
+            async with self.session_factory() as db:
+                count = await db.execute(
+                    text(f"SELECT COUNT(*) FROM audit_logs {where}"),
+                    {k: v for k, v in params.items() if k not in ("limit", "offset")},
+                )
+                total = count.scalar() or 0
+
+        return {
+            "total": total,
+            "logs": [_row_to_entry(row) for row in rows],
+            "page": (offset // limit) + 1,
+            "page_size": limit,
+        }
+
+    async def compliance_summary(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+        """리포트 집계 (요약 / 상위 사용자 / 보안 경고)"""
+        params = {"start_date": start_date, "end_date": end_date}
+        period = "occurred_at BETWEEN :start_date AND :end_date"
+
+        async with self.session_factory() as db:
+            summary = (await db.execute(
+                text(f"""
+                    SELECT
+                        COUNT(*) AS total_events,
+                        COUNT(*) FILTER (
+                            WHERE event_type LIKE '%login%' OR event_type LIKE '%logout%'
+                        ) AS auth_events,
+                        COUNT(*) FILTER (
+                            WHERE event_type IN ('read_user', 'read_document', 'read_query')
+                        ) AS data_access_events,
+                        COUNT(*) FILTER (WHERE {_PII_CONDITION}) AS pii_access_events,
+                        COUNT(*) FILTER (WHERE severity IN ('error', 'critical')) AS security_events,
+                        COUNT(*) FILTER (WHERE event_type = 'failed_login') AS failed_logins,
+                        COUNT(DISTINCT user_id) FILTER (WHERE {_PII_CONDITION}) AS users_accessed_pii
+                    FROM audit_logs
+                    WHERE {period}
+                """),
+                params,
+            )).one()
+
+            top_users = (await db.execute(
+                text(f"""
+                    SELECT user_id, COUNT(*) AS event_count
+                    FROM audit_logs
+                    WHERE {period}
+                    GROUP BY user_id
+                    ORDER BY event_count DESC
+                    LIMIT 10
+                """),
+                params,
+            )).fetchall()
+
+            alerts = (await db.execute(
+                text(f"""
+                    SELECT occurred_at, event_type, user_id, severity
+                    FROM audit_logs
+                    WHERE {period} AND severity IN ('error', 'critical')
+                    ORDER BY occurred_at DESC
+                    LIMIT 20
+                """),
+                params,
+            )).fetchall()
+
+        return {
+            "summary": {
+                "total_events": summary.total_events,
+                "auth_events": summary.auth_events,
+                "data_access_events": summary.data_access_events,
+                "pii_access_events": summary.pii_access_events,
+                "security_events": summary.security_events,
+                "failed_logins": summary.failed_logins,
+            },
+            "top_users": [
+                {"user_id": row.user_id, "event_count": row.event_count} for row in top_users
+            ],
+            "security_alerts": [
+                {
+                    "timestamp": row.occurred_at.replace(tzinfo=None).isoformat(),
+                    "event_type": row.event_type,
+                    "user_id": row.user_id,
+                    "severity": row.severity,
+                }
+                for row in alerts
+            ],
+            "pii_access_summary": {
+                "total_pii_accesses": summary.pii_access_events,
+                "users_accessed_pii": summary.users_accessed_pii,
+            },
+        }
+
+
+class AuditPipeline:
+    """
+    감사 이벤트 대기열 + 백그라운드 배치 저장
+
+    enqueue는 deque append만 하므로 어느 스레드에서 호출해도 안전하고 I/O가 없습니다.
+    """
+
+    def __init__(
+        self,
+        sink: AuditSink,
+        spool: Optional[JSONLAuditSink] = None,
+        max_pending: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval_seconds: Optional[float] = None,
+    ):
+        """
+        Args:
+            sink: 기본 저장소
+            spool: 기본 저장소 실패 / 대기열 초과 시 사용할 JSONL 저장소
+            max_pending: 대기열 최대 크기 (기본값: settings.AUDIT_PENDING_MAX)
+            batch_size: 배치 크기 (기본값: settings.AUDIT_BATCH_SIZE)
+            flush_interval_seconds: 저장 주기 (기본값: settings.AUDIT_FLUSH_INTERVAL_SECONDS)
+        """
+        self.sink = sink
+        self.spool = spool if spool is not None else (
+            sink if isinstance(sink, JSONLAuditSink) else JSONLAuditSink()
+        )
+        self.max_pending = max_pending or settings.AUDIT_PENDING_MAX
+        self.batch_size = batch_size or settings.AUDIT_BATCH_SIZE
+        self.flush_interval_seconds = (
+            flush_interval_seconds
+            if flush_interval_seconds is not None
+            else settings.AUDIT_FLUSH_INTERVAL_SECONDS
+        )
+        self._pending: Deque[Dict[str, Any]] = deque()
+        # 대기열 초과분: 백그라운드 저장 주기에 스풀 파일로 기록 (enqueue에서 파일 I/O 없음)
+        self._overflow: Deque[Dict[str, Any]] = deque()
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self.stats = {
+            "written": 0, "spooled": 0, "overflow": 0, "dropped": 0,
+            "replayed": 0, "failed_flushes": 0,
+        }
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def enqueue(self, entry: Dict[str, Any]) -> None:
+        """이벤트 추가 (대기열이 가득 차면 다음 저장 주기에 스풀 파일로 기록)"""
+        if len(self._pending) < self.max_pending:
+            self._pending.append(entry)
+            return
+        self.stats["overflow"] += 1
+        if len(self._overflow) >= self.max_pending:
+            # 저장 작업이 스풀 기록조차 따라가지 못하는 경우에만 유실
+            self.stats["dropped"] += 1
+            logger.critical(f"Audit event lost (queue and overflow full): {entry.get('event_id')}")
+            return
+        self._overflow.append(entry)
+
+    def clear_pending(self) -> None:
+        """저장 대기 이벤트 폐기 (테스트용)"""
+        self._pending.clear()
+        self._overflow.clear()
+
+    async def flush(self) -> int:
+        """대기 중인 이벤트 전체 저장 (저장된 수)"""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        written = 0
+        async with self._flush_lock:
+            while self._pending:
+                batch = []
+                while self._pending and len(batch) < self.batch_size:
+                    batch.append(self._pending.popleft())
+                if not await self._write(batch):
+                    # 스풀까지 실패: 순서를 유지해서 되돌리고 다음 주기에 재시도
+                    self._pending.extendleft(reversed(batch))
+                    break
+                written += len(batch)
+            await self._spool_overflow()
+        return written
+
+    async def _spool_overflow(self) -> None:
+        while self._overflow:
+            batch = []
+            while self._overflow and len(batch) < self.batch_size:
+                batch.append(self._overflow.popleft())
+            try:
+                await self.spool.write_batch(batch)
+            except Exception as e:
+                logger.error(f"Audit overflow spool failed ({len(batch)} events kept): {e}")
+                self._overflow.extendleft(reversed(batch))
+                return
+            self.stats["spooled"] += len(batch)
+
+    async def replay_spool(self) -> int:
+        """
+        스풀 세그먼트를 기본 저장소로 재생 (재생된 이벤트 수)
+
+        기본 저장소가 스풀 자신이거나 저장하지 않는 경우("none")에는 아무 것도 하지 않습니다.
+        재생 중 실패하면 남은 세그먼트는 *.replaying으로 남겨 다음 주기에 다시 시도합니다
+        (INSERT는 event_id 충돌을 무시하므로 일부 재생된 세그먼트를 다시 읽어도 중복되지 않음).
+        """
+        if self.sink is self.spool or self.sink.name == "none":
+            return 0
+        segments = await asyncio.to_thread(
+            self.spool.claim_segments, settings.AUDIT_REPLAY_MIN_IDLE_SECONDS
+        )
+        replayed = 0
+        for path in segments:
+            entries = await asyncio.to_thread(self.spool.read_segment, path)
+            try:
+                for start in range(0, len(entries), self.batch_size):
+                    await self.sink.write_batch(entries[start:start + self.batch_size])
+            except Exception as e:
+                logger.warning(f"Audit spool replay paused ({path.name}): {e}")
+                break
+            path.unlink(missing_ok=True)
+            replayed += len(entries)
+        if replayed:
+            self.stats["replayed"] += replayed
+            logger.info(f"Replayed {replayed} spooled audit events into {self.sink.name}")
+        return replayed
+
+    async def _write(self, batch: List[Dict[str, Any]]) -> bool:
+        try:
+            await self.sink.write_batch(batch)
+            self.stats["written"] += len(batch)
+            return True
+        except Exception as e:
+            self.stats["failed_flushes"] += 1
+            if self.sink is self.spool:
+                logger.error(f"Audit spool write failed ({len(batch)} events kept pending): {e}")
+                return False
+            logger.warning(f"Audit {self.sink.name} write failed, spooling {len(batch)} events: {e}")
+        try:
+            await self.spool.write_batch(batch)
+            self.stats["spooled"] += len(batch)
+            return True
+        except Exception as e:
+            logger.error(f"Audit spool write failed ({len(batch)} events kept pending): {e}")
+            return False
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            try:
+                failed_flushes = self.stats["failed_flushes"]
+                await self.flush()
+                # 이번 주기에 기본 저장소 기록이 성공(또는 기록할 것이 없음)했을 때만 재생
+                if self.stats["failed_flushes"] == failed_flushes:
+                    await self.replay_spool()
+            except Exception as e:
+                logger.error(f"Audit flush failed: {e}")
+
+    def start(self) -> None:
+        """백그라운드 저장 작업 시작 (이벤트 루프 안에서 호출)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """백그라운드 작업 종료 + 남은 이벤트 저장"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+        await self.sink.close()
+
+
+def create_audit_sink(kind: Optional[str] = None) -> AuditSink:
+    """설정에 따른 저장소 생성 ("postgres" | "jsonl" | "none")"""
+    kind = kind or settings.AUDIT_SINK
+    if kind == "postgres":
+        return PostgresAuditSink()
+    if kind == "jsonl":
+        return JSONLAuditSink()
+    return AuditSink()
+
+
+_audit_pipeline: Optional[AuditPipeline] = None
+
+
+def get_audit_pipeline() -> AuditPipeline:
+    """AuditPipeline 싱글톤"""
+    global _audit_pipeline
+    if _audit_pipeline is None:
+        _audit_pipeline = AuditPipeline(create_audit_sink())
+    return _audit_pipeline
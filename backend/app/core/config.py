@@ -14,6 +14,7 @@ class Settings(BaseSettings):
     ENVIRONMENT: str = "development"
     DEBUG: bool = True
     SECRET_KEY: str
+    APP_ROLE: str = "all"  # all, query, ingestion, crawler (API routers mounted by this process)
 
     # API
     API_V1_PREFIX: str = "/api/v1"
@@ -46,6 +47,11 @@ class Settings(BaseSettings):
     REDIS_SOCKET_CONNECT_TIMEOUT: int = 5  # seconds
     REDIS_SOCKET_TIMEOUT: int = 5  # seconds
 
+    # In-memory graph projection (multi-hop traversal)
+    GRAPH_PROJECTION_ENABLED: bool = False
+    GRAPH_PROJECTION_DEGREE_CAP: int = 200  # max neighbors expanded per node/type
+    GRAPH_PROJECTION_REFRESH_SECONDS: float = 60.0  # re-check the Neo4j change marker after this, rebuilding in the background (0 = never)
+
     # Celery
     CELERY_BROKER_URL: str = "redis://localhost:6379/1"
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/2"
@@ -65,6 +71,7 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: str
     ANTHROPIC_API_KEY: str
     GOOGLE_API_KEY: str  # Gemini 1.5 Flash API key
+    QUERY_EMBEDDING_MODEL: str = "openai"  # EmbeddingRequest.model for query embeddings (vector search, semantic cache)
 
     # JWT
     JWT_SECRET_KEY: str
@@ -72,12 +79,54 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 1
 
+    # Authentication execution
+    AUTH_HASH_WORKERS: int = 4  # bcrypt thread pool size (hash/verify run off the event loop)
+    AUTH_HASH_MAX_PENDING: int = 64  # queued bcrypt operations beyond this get 503 AUTH_BUSY
+    AUTH_TOKEN_CACHE_SIZE: int = 10000  # verified access tokens kept in the LRU cache (0 = disabled)
+    AUTH_TOKEN_CACHE_TTL_SECONDS: float = 60.0  # cache lifetime per token (never past the token's exp)
+    AUTH_REVOCATION_BACKEND: str = "redis"  # "redis" (logout applies to every worker) | "memory" (per process)
+
     # Rate Limiting
     RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "redis"  # "redis" (shared across workers) | "memory" (per process)
+    RATE_LIMIT_LEASE_SECONDS: float = 1.0  # tokens reserved in-process are dropped after this
+    RATE_LIMIT_MAX_LEASE: int = 10  # tokens reserved per round trip for clients well under their limit
 
     # Logging
     LOG_LEVEL: str = "INFO"
 
+    # Request metrics (per-worker histograms, optionally merged across workers)
+    METRICS_MULTIPROC_DIR: str = ""  # shared directory for worker snapshots (empty = single process)
+    METRICS_FLUSH_INTERVAL_SECONDS: float = 5.0  # worker snapshot write interval
+
+    # Audit logging (events are queued in memory and written in batches)
+    AUDIT_SINK: str = "postgres"  # postgres, jsonl, none
+    AUDIT_BUFFER_SIZE: int = 10000  # recent events kept in memory for the sync query APIs
+    AUDIT_PENDING_MAX: int = 50000  # queued events beyond this are handed to the spool on the next flush
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 1.0  # background batch write interval
+    AUDIT_BATCH_SIZE: int = 500  # events per INSERT batch
+    AUDIT_SPOOL_DIR: str = "/tmp/insuregraph/audit"  # JSONL segments (jsonl sink and postgres fallback)
+    AUDIT_SEGMENT_MAX_BYTES: int = 64 * 1024 * 1024  # JSONL segment rotation size
+    AUDIT_REPLAY_MIN_IDLE_SECONDS: float = 30.0  # other processes' spool segments idle this long are replayed into Postgres
+
+    # Dashboard rollups (per-FP counters kept current by triggers on customers/customer_policies)
+    DASHBOARD_ROLLUP_ENABLED: bool = True  # False = compute the aggregate query on every request
+    DASHBOARD_ROLLUP_MAX_AGE_SECONDS: int = 900  # full recompute after this (bounds time-window drift)
+    DASHBOARD_WINDOW_DAYS: int = 30  # active/new customer window (previous window has the same length)
+
+    # List endpoints (keyset pagination, counts)
+    LISTING_EXACT_COUNT_THRESHOLD: int = 10000  # count=auto runs COUNT(*) only when the planner estimate is below this
+
+    # Query response cache (QueryOrchestrator: L1 per process + optional shared tiers)
+    QUERY_CACHE_SHARED_ENABLED: bool = True  # Redis L2 shared across workers/nodes (skipped for a while after a Redis error)
+    QUERY_CACHE_SEMANTIC_ENABLED: bool = True  # reuse answers for paraphrases (same intent/entities, embedding similarity)
+    QUERY_CACHE_SEMANTIC_THRESHOLD: float = 0.92  # minimum cosine similarity for a semantic hit
+
+    # Document search (MVP /search/documents)
+    DOCUMENT_SEARCH_MODE: str = "bigram"  # bigram (Korean bigram search_bigrams column), simple (legacy search_vector)
+    DOCUMENT_SEARCH_CACHE_SIZE: int = 256  # cached result pages per process (0 = disabled)
+    DOCUMENT_SEARCH_CACHE_TTL_SECONDS: float = 30.0  # bounds staleness for writes from other processes
+
     # Hybrid PDF Extraction Settings
     HYBRID_EXTRACTION_ENABLED: bool = True
     HYBRID_STRATEGY: str = "smart"  # simple, smart, progressive, ml
@@ -85,6 +134,56 @@ class Settings(BaseSettings):
     HYBRID_QUALITY_THRESHOLD: float = 0.7  # 0.0-1.0
     HYBRID_FILE_SIZE_THRESHOLD_MB: float = 5.0
 
+    # PDF blob cache (content-addressed download store)
+    PDF_BLOB_CACHE_DIR: str = "/tmp/insuregraph/blobs"
+    PDF_BLOB_CACHE_MAX_AGE_DAYS: int = 30  # unused blobs pruned after N days
+    PDF_DOWNLOAD_TIMEOUT: float = 120.0  # seconds
+
+    # Extraction artifact cache (text / parse results keyed by content hash + extractor version)
+    EXTRACTION_CACHE_ENABLED: bool = True
+    EXTRACTION_CACHE_DIR: str = "/tmp/insuregraph/artifacts"
+
+    # Document job leasing (multi-node ParallelDocumentProcessor)
+    DOCUMENT_LEASE_SECONDS: int = 600  # claimed documents are reclaimable after lease expiry
+    DOCUMENT_HEARTBEAT_INTERVAL: int = 60  # lease extension period (seconds)
+    DOCUMENT_CLAIM_BATCH_SIZE: int = 5
+    DOCUMENT_MAX_ATTEMPTS: int = 3  # reclaim limit before marking failed
+
+    # Document status events (Postgres LISTEN/NOTIFY for workers)
+    DOCUMENT_EVENTS_ENABLED: bool = True
+    DOCUMENT_EVENTS_FALLBACK_POLL_SECONDS: int = 300  # safety-net polling while listening
+    DOCUMENT_EVENTS_DEBOUNCE_SECONDS: float = 0.5  # coalesce bursts of transitions
+
+    # Graph snapshot (incremental visualization graph: base + append-only deltas)
+    GRAPH_SNAPSHOT_DIR: str = "/tmp/insuregraph/graph"
+    GRAPH_SNAPSHOT_COMPACT_EVERY: int = 50  # deltas before rewriting the base snapshot
+
+    # Document processing progress (Redis hashes + pub/sub, terminal state only in Postgres)
+    PROGRESS_MIN_INTERVAL_MS: int = 1000  # coalesce per-document progress writes
+    PROGRESS_TTL_SECONDS: int = 86400
+
+    # GraphRAG entity extraction (concurrent per-chunk LLM calls)
+    ENTITY_EXTRACTION_MAX_CONCURRENCY: int = 8  # upper bound for the adaptive limiter
+    ENTITY_EXTRACTION_MAX_RETRIES: int = 3  # per chunk, on 429/5xx/timeouts
+    ENTITY_EXTRACTION_PACK_CHARS: int = 4000  # small chunks packed into one prompt up to this size
+
+    # LLM gateway (shared provider pools, rate limiting, retries, telemetry)
+    LLM_GATEWAY_STUB: bool = False  # replace every provider with the deterministic local stub
+    LLM_REQUESTS_PER_SECOND: float = 5.0  # per provider token bucket refill rate (0 = unlimited)
+    LLM_RATE_LIMIT_BURST: int = 10
+    LLM_MAX_RETRIES: int = 3  # on 429/5xx/timeouts
+    LLM_HEDGE_AFTER_SECONDS: float = 0.0  # send a duplicate request after N seconds (0 = off)
+    LLM_REQUEST_TIMEOUT: float = 60.0
+    LLM_MAX_CONNECTIONS: int = 20  # per provider connection pool
+    QUERY_LLM_PROVIDER: str = "openai"  # LLM intent/entity fallback for queries ("" = pattern matching only)
+    QUERY_LLM_MODEL: str = "gpt-4o-mini"
+
+    # LLM result cache (extraction responses keyed by prompt template version + model + input hash)
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_PATH: str = "/tmp/insuregraph/llm_cache.sqlite3"
+    LLM_CACHE_MAX_ENTRIES: int = 200000  # least recently used entries evicted beyond this
+    LLM_CACHE_MAX_AGE_DAYS: int = 180  # entries not read for N days are evicted
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -9,9 +9,10 @@ from typing import Any, Callable, Dict, Optional, Union
 from datetime import datetime
 
 from fastapi import Request
+from fastapi.responses import StreamingResponse
 from loguru import logger
 
-from app.core.pii import PIIHandler, PIIMasker, sanitize_for_logging
+from app.core.pii import PIIHandler, PIIMasker, get_pii_engine, sanitize_for_logging
 from app.core.encryption import EncryptionManager
 
 
@@ -57,7 +58,7 @@ _encryption_manager = EncryptionManager()
 
 def mask_response_pii(response_data: Any) -> Any:
     """
-    API 응답 데이터에서 PII를 마스킹합니다.
+    API 응답 데이터에서 PII를 마스킹합니다 (중첩 dict/list 포함, 한 번 순회).
 
     Args:
         response_data: 응답 데이터 (dict, list, or other)
@@ -65,17 +66,39 @@ def mask_response_pii(response_data: Any) -> Any:
     Returns:
         마스킹된 데이터
     """
-    if isinstance(response_data, dict):
-        return PIIHandler.sanitize_dict(
+    if isinstance(response_data, (dict, list)):
+        return get_pii_engine().sanitize(
             response_data,
             fields_to_mask=DataProtectionConfig.AUTO_MASK_FIELDS
         )
-    elif isinstance(response_data, list):
-        return [mask_response_pii(item) for item in response_data]
     else:
         return response_data
 
 
+def masked_json_response(response_data: Any, status_code: int = 200) -> StreamingResponse:
+    """
+    PII를 마스킹하면서 JSON으로 스트리밍하는 응답을 생성합니다.
+
+    큰 목록 응답에서 마스킹된 사본 전체를 메모리에 만들지 않습니다.
+
+    Args:
+        response_data: 응답 데이터 (JSON 직렬화 가능한 dict/list)
+        status_code: HTTP 상태 코드
+
+    Returns:
+        StreamingResponse: application/json 응답
+    """
+    chunks = get_pii_engine().iter_json(
+        response_data,
+        fields_to_mask=DataProtectionConfig.AUTO_MASK_FIELDS
+    )
+    return StreamingResponse(
+        (chunk.encode("utf-8") for chunk in chunks),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
 def redact_sensitive_fields(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     민감한 필드를 완전히 제거합니다 (로깅용).
@@ -355,6 +378,7 @@ class PIIValidator:
 # Export commonly used functions
 __all__ = [
     "mask_response_pii",
+    "masked_json_response",
     "redact_sensitive_fields",
     "encrypt_sensitive_fields",
     "decrypt_sensitive_fields",
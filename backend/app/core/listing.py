@@ -0,0 +1,181 @@
+"""
+Listing helpers (search / keyset pagination / counts)
+
+목록 API 공통 유틸리티.
+
+- like_pattern: 부분 문자열 검색 패턴 (LIKE 와일드카드 이스케이프, pg_trgm GIN 인덱스로 처리)
+- keyset 페이지네이션: SortKey 목록(모두 내림차순)으로 WHERE/ORDER BY 생성, 불투명 커서 인코딩
+- count_rows: 정확한 COUNT(*) / 플래너 추정치 / 생략 중 선택
+  ("auto"는 추정치가 LISTING_EXACT_COUNT_THRESHOLD 이하일 때만 정확히 셈)
+"""
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+
+COUNT_MODES = ("auto", "exact", "none")
+
+
+def like_pattern(term: str) -> str:
+    """부분 문자열 ILIKE 패턴 ('%', '_', '\\'는 리터럴로 처리)"""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+# Cursor encoding
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"uuid": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "uuid" in value:
+            return UUID(value["uuid"])
+        raise ValueError(f"unknown cursor value: {value!r}")
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """정렬 키 값 목록 → 불투명 커서 문자열 (datetime/UUID 타입 보존)"""
+    payload = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: Optional[int] = None) -> List[Any]:
+    """
+    커서 디코딩
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 값 개수가 size와 다른 커서
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(raw, list) or (size is not None and len(raw) != size):
+            raise ValueError("unexpected cursor shape")
+        return [_decode_value(v) for v in raw]
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+# Keyset pagination
+
+@dataclass(frozen=True)
+class SortKey:
+    """
+    keyset 정렬 키 (내림차순)
+
+    Attributes:
+        expression: SQL 정렬 표현식 (예: "qh.created_at")
+        column: 결과 행에서 커서 값을 읽을 컬럼명
+        null_fill: NULL을 대체할 SQL 값 (예: "'-infinity'::timestamp" → NULLS LAST와 같은 순서)
+        value_type: 커서 값의 기대 타입 (예: datetime, UUID; None이면 검사하지 않음)
+    """
+    expression: str
+    column: str
+    null_fill: Optional[str] = None
+    value_type: Optional[type] = None
+
+    def accepts(self, value: Any) -> bool:
+        """커서 값이 이 키의 타입과 맞는지 (NULL은 null_fill이 있을 때만 허용)"""
+        if value is None:
+            return self.null_fill is not None
+        return self.value_type is None or isinstance(value, self.value_type)
+
+    @property
+    def sort_expression(self) -> str:
+        if self.null_fill is None:
+            return self.expression
+        return f"COALESCE({self.expression}, {self.null_fill})"
+
+    def cursor_expression(self, param: str) -> str:
+        if self.null_fill is None:
+            return f":{param}"
+        return f"COALESCE(:{param}, {self.null_fill})"
+
+
+def order_by_clause(sort_keys: Sequence[SortKey]) -> str:
+    return "ORDER BY " + ", ".join(f"{key.sort_expression} DESC" for key in sort_keys)
+
+
+def keyset_condition(sort_keys: Sequence[SortKey], cursor: str) -> Tuple[str, Dict[str, Any]]:
+    """
+    커서 이후 행만 남기는 행 비교 조건
+
+    Returns:
+        ("(k1, k2) < (:cursor_0, :cursor_1)", params)
+
+    Raises:
+        ValueError: 잘못된 커서
+    """
+    values = decode_cursor(cursor, size=len(sort_keys))
+    if not all(key.accepts(value) for key, value in zip(sort_keys, values)):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    params = {f"cursor_{i}": value for i, value in enumerate(values)}
+    lhs = ", ".join(key.sort_expression for key in sort_keys)
+    rhs = ", ".join(key.cursor_expression(f"cursor_{i}") for i, key in enumerate(sort_keys))
+    return f"({lhs}) < ({rhs})", params
+
+
+def cursor_for_row(row: Mapping[str, Any], sort_keys: Sequence[SortKey]) -> str:
+    """페이지 마지막 행의 다음 페이지 커서"""
+    return encode_cursor([row[key.column] for key in sort_keys])
+
+
+# Counts
+
+async def estimate_rows(db: AsyncSession, from_clause: str, params: Dict[str, Any]) -> int:
+    """플래너 추정 행 수 (EXPLAIN, 실제 스캔 없음)"""
+    result = await db.execute(text(f"EXPLAIN (FORMAT JSON) SELECT 1 {from_clause}"), params)
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def count_rows(
+    db: AsyncSession,
+    from_clause: str,
+    params: Dict[str, Any],
+    mode: str = "auto",
+    exact_threshold: Optional[int] = None,
+) -> Tuple[Optional[int], bool]:
+    """
+    목록 전체 건수
+
+    Args:
+        from_clause: "FROM ... WHERE ..." (필터 조건만, 커서 조건 제외)
+        mode: "exact" (COUNT(*)), "auto" (추정치가 크면 추정치), "none" (세지 않음)
+        exact_threshold: auto 모드에서 정확히 셀 최대 추정치
+
+    Returns:
+        (total, is_estimate) — mode="none"이면 (None, False)
+    """
+    if mode not in COUNT_MODES:
+        raise ValueError(f"count mode must be one of {COUNT_MODES}, got {mode!r}")
+    if mode == "none":
+        return None, False
+
+    if mode == "auto":
+        threshold = settings.LISTING_EXACT_COUNT_THRESHOLD if exact_threshold is None else exact_threshold
+        estimate = await estimate_rows(db, from_clause, params)
+        if estimate > threshold:
+            return estimate, True
+
+    result = await db.execute(text(f"SELECT COUNT(*) {from_clause}"), params)
+    return int(result.scalar() or 0), False
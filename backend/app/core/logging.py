@@ -3,9 +3,14 @@ Request Logging and Monitoring
 
 Story 3.4: Rate Limiting & Monitoring - 로깅 및 모니터링
 """
+import bisect
+import heapq
+import math
+import os
 import time
 import json
-from typing import Dict, Optional
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from uuid import uuid4
 
@@ -85,10 +90,10 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             response.headers["X-Request-ID"] = request_id
             response.headers["X-Response-Time"] = f"{duration_ms:.2f}ms"
 
-            # Record metrics
+            # Record metrics (라우트 템플릿 기준)
             _record_request_metrics(
                 method=method,
-                path=path,
+                path=_route_template(request),
                 status_code=response.status_code,
                 duration_ms=duration_ms,
                 user_id=user_id,
@@ -110,7 +115,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             # Record error metrics
             _record_error_metrics(
                 method=method,
-                path=path,
+                path=_route_template(request),
                 error_type=type(e).__name__,
                 user_id=user_id,
             )
@@ -124,28 +129,195 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
 # ============================================================================
 
 
+# Prometheus 응답 시간 버킷 (ms)
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+# 백분위 계산용 로그 버킷: 0.1ms부터 5%씩 증가 (상대 오차 5% 이내, 최대 약 227초)
+_FINE_MIN_MS = 0.1
+_FINE_LOG_GROWTH = math.log(1.05)
+_FINE_BUCKETS = 300
+
+# 라우트에 매칭되지 않은 요청(404 등)의 path 레이블 → 임의 URL로 시계열이 늘어나지 않게 함
+UNMATCHED_ROUTE = "<unmatched>"
+
+# 사용자별 요청 수 최대 키 수 (초과분은 "other"로 합산)
+MAX_TRACKED_USERS = 1000
+
+
+def _fine_index(duration_ms: float) -> int:
+    if duration_ms <= _FINE_MIN_MS:
+        return 0
+    index = int(math.log(duration_ms / _FINE_MIN_MS) / _FINE_LOG_GROWTH) + 1
+    return min(index, _FINE_BUCKETS - 1)
+
+
+def _fine_upper_bound(index: int) -> float:
+    return _FINE_MIN_MS * math.exp(index * _FINE_LOG_GROWTH)
+
+
+class LatencyHistogram:
+    """
+    고정 크기 응답 시간 히스토그램
+
+    Prometheus 버킷과 백분위용 로그 버킷을 함께 유지합니다. 관측 수와 무관하게
+    메모리가 일정하고, 백분위는 정렬 없이 버킷을 한 번 훑어서 계산합니다.
+    """
+    __slots__ = ("buckets", "fine", "sum", "count")
+
+    def __init__(self):
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)  # 마지막 칸은 +Inf
+        self.fine = [0] * _FINE_BUCKETS
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, duration_ms: float) -> None:
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+        self.fine[_fine_index(duration_ms)] += 1
+        self.sum += duration_ms
+        self.count += 1
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for i, value in enumerate(other.buckets):
+            self.buckets[i] += value
+        for i, value in enumerate(other.fine):
+            if value:
+                self.fine[i] += value
+        self.sum += other.sum
+        self.count += other.count
+
+    def percentile(self, q: float) -> float:
+        """q 백분위 (0~1) 응답 시간 상한 (ms)"""
+        if self.count == 0:
+            return 0
+        rank = max(1, math.ceil(self.count * q))
+        running = 0
+        for index, value in enumerate(self.fine):
+            running += value
+            if running >= rank:
+                return round(_fine_upper_bound(index), 2)
+        return round(_fine_upper_bound(_FINE_BUCKETS - 1), 2)
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        result = []
+        running = 0
+        for bound, value in zip(LATENCY_BUCKETS_MS, self.buckets):
+            running += value
+            result.append((f"{bound:g}", running))
+        result.append(("+Inf", self.count))
+        return result
+
+    def to_dict(self) -> Dict:
+        return {
+            "buckets": self.buckets,
+            "fine": {str(i): value for i, value in enumerate(self.fine) if value},
+            "sum": self.sum,
+            "count": self.count,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LatencyHistogram":
+        histogram = cls()
+        histogram.buckets = list(data["buckets"])
+        for index, value in data["fine"].items():
+            histogram.fine[int(index)] = value
+        histogram.sum = data["sum"]
+        histogram.count = data["count"]
+        return histogram
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _snapshot_owner_alive(path: Path) -> bool:
+    """metrics_{pid}.json을 기록한 워커가 아직 살아 있는지"""
+    try:
+        pid = int(path.stem.split("_", 1)[1])
+    except (IndexError, ValueError):
+        return False
+    return _pid_alive(pid)
+
+
+def remove_stale_metrics_snapshots(multiproc_dir: Optional[str] = None) -> int:
+    """
+    종료된 워커의 스냅샷 파일 삭제 (프로세스 시작 시 호출)
+
+    Args:
+        multiproc_dir: 스냅샷 디렉터리 (기본값: settings.METRICS_MULTIPROC_DIR)
+
+    Returns:
+        삭제한 파일 수
+    """
+    directory = multiproc_dir if multiproc_dir is not None else settings.METRICS_MULTIPROC_DIR
+    if not directory:
+        return 0
+    removed = 0
+    for path in Path(directory).glob("metrics_*.json"):
+        if _snapshot_owner_alive(path):
+            continue
+        try:
+            path.unlink()
+            removed += 1
+        except OSError as e:
+            logger.warning(f"Failed to remove metrics snapshot {path.name}: {e}")
+    return removed
+
+
+def _add_counts(target: Dict, source: Dict) -> None:
+    for key, value in source.items():
+        target[key] = target.get(key, 0) + value
+
+
 class MetricsStore:
     """
     메트릭 저장소
 
-    Production: Prometheus, Datadog 등으로 교체
+    (method, 라우트 템플릿, status code)마다 LatencyHistogram 하나를 유지합니다.
+    갱신은 이벤트 루프 스레드(미들웨어)에서만 일어나므로 락이 필요 없습니다.
+
+    multiproc_dir가 설정되면 워커마다 스냅샷 파일을 주기적으로 기록하고,
+    조회 시 모든 워커의 스냅샷을 합쳐서 반환합니다 (gunicorn/uvicorn 다중 워커).
     """
-    def __init__(self):
-        # Request metrics
-        self.request_count: Dict[str, int] = {}  # endpoint -> count
-        self.request_duration: Dict[str, list] = {}  # endpoint -> [durations]
-        self.status_codes: Dict[int, int] = {}  # status_code -> count
+    def __init__(
+        self,
+        multiproc_dir: Optional[str] = None,
+        flush_interval_seconds: Optional[float] = None,
+    ):
+        """
+        Args:
+            multiproc_dir: 워커 스냅샷 디렉터리 (기본값: settings.METRICS_MULTIPROC_DIR, 빈 값이면 사용 안 함)
+            flush_interval_seconds: 스냅샷 기록 간격 (기본값: settings.METRICS_FLUSH_INTERVAL_SECONDS)
+        """
+        # Request metrics: (method, route, status_code) -> histogram
+        self.series: Dict[Tuple[str, str, int], LatencyHistogram] = {}
 
         # Error metrics
         self.error_count: Dict[str, int] = {}  # error_type -> count
         self.error_by_endpoint: Dict[str, int] = {}  # endpoint -> count
 
-        # User metrics
+        # User metrics (최대 MAX_TRACKED_USERS개)
         self.requests_by_user: Dict[str, int] = {}  # user_id -> count
 
         # Timestamp
         self.start_time = datetime.now()
 
+        multiproc_dir = (
+            multiproc_dir if multiproc_dir is not None else settings.METRICS_MULTIPROC_DIR
+        )
+        self.multiproc_dir = Path(multiproc_dir) if multiproc_dir else None
+        self.flush_interval_seconds = (
+            flush_interval_seconds
+            if flush_interval_seconds is not None
+            else settings.METRICS_FLUSH_INTERVAL_SECONDS
+        )
+        self._last_flush = 0.0
+
     def record_request(
         self,
         method: str,
@@ -154,28 +326,20 @@ class MetricsStore:
         duration_ms: float,
         user_id: str = "anonymous"
     ):
-        """요청 기록"""
-        # Endpoint key
-        endpoint = f"{method} {path}"
-
-        # Request count
-        self.request_count[endpoint] = self.request_count.get(endpoint, 0) + 1
-
-        # Duration
-        if endpoint not in self.request_duration:
-            self.request_duration[endpoint] = []
-        self.request_duration[endpoint].append(duration_ms)
-
-        # Keep only last 1000 durations per endpoint
-        if len(self.request_duration[endpoint]) > 1000:
-            self.request_duration[endpoint] = self.request_duration[endpoint][-1000:]
-
-        # Status codes
-        self.status_codes[status_code] = self.status_codes.get(status_code, 0) + 1
+        """요청 기록 (path는 라우트 템플릿, 예: /api/v1/documents/{document_id})"""
+        key = (method, path, status_code)
+        histogram = self.series.get(key)
+        if histogram is None:
+            histogram = self.series[key] = LatencyHistogram()
+        histogram.observe(duration_ms)
 
         # User requests
+        if user_id not in self.requests_by_user and len(self.requests_by_user) >= MAX_TRACKED_USERS:
+            user_id = "other"
         self.requests_by_user[user_id] = self.requests_by_user.get(user_id, 0) + 1
 
+        self._maybe_flush()
+
     def record_error(
         self,
         method: str,
@@ -191,25 +355,101 @@ class MetricsStore:
         endpoint = f"{method} {path}"
         self.error_by_endpoint[endpoint] = self.error_by_endpoint.get(endpoint, 0) + 1
 
-    def get_stats(self) -> Dict:
-        """통계 조회"""
-        # Calculate percentiles
-        all_durations = []
-        for durations in self.request_duration.values():
-            all_durations.extend(durations)
+        self._maybe_flush()
 
-        all_durations.sort()
+    # ------------------------------------------------------------------
+    # 다중 워커 스냅샷
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> Dict:
+        """현재 워커의 메트릭 (JSON 직렬화 가능)"""
+        return {
+            "start_time": self.start_time.timestamp(),
+            "series": [
+                [method, path, status_code, histogram.to_dict()]
+                for (method, path, status_code), histogram in self.series.items()
+            ],
+            "error_count": self.error_count,
+            "error_by_endpoint": self.error_by_endpoint,
+            "requests_by_user": self.requests_by_user,
+        }
+
+    def _snapshot_path(self) -> Path:
+        return self.multiproc_dir / f"metrics_{os.getpid()}.json"
+
+    def _maybe_flush(self) -> None:
+        if self.multiproc_dir is None:
+            return
+        now = time.monotonic()
+        if now - self._last_flush >= self.flush_interval_seconds:
+            self.flush()
+
+    def flush(self) -> None:
+        """스냅샷 파일 기록 (임시 파일 → rename으로 원자적 교체)"""
+        if self.multiproc_dir is None:
+            return
+        self._last_flush = time.monotonic()
+        try:
+            self.multiproc_dir.mkdir(parents=True, exist_ok=True)
+            path = self._snapshot_path()
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(self.snapshot()))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Metrics snapshot write failed: {e}")
+
+    def _aggregate(self) -> "MetricsStore":
+        """모든 워커의 메트릭을 합친 뷰 (multiproc 미사용 시 자기 자신)"""
+        if self.multiproc_dir is None:
+            return self
+
+        self.flush()
+        merged = MetricsStore(multiproc_dir="")
+        merged.start_time = self.start_time
+        for path in self.multiproc_dir.glob("metrics_*.json"):
+            if not _snapshot_owner_alive(path):
+                # 종료된 워커(이전 배포/재시작)의 스냅샷은 합산하지 않음
+                continue
+            try:
+                data = json.loads(path.read_text())
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping metrics snapshot {path.name}: {e}")
+                continue
+            merged.start_time = min(merged.start_time, datetime.fromtimestamp(data["start_time"]))
+            for method, route, status_code, histogram in data["series"]:
+                key = (method, route, status_code)
+                if key not in merged.series:
+                    merged.series[key] = LatencyHistogram()
+                merged.series[key].merge(LatencyHistogram.from_dict(histogram))
+            _add_counts(merged.error_count, data["error_count"])
+            _add_counts(merged.error_by_endpoint, data["error_by_endpoint"])
+            _add_counts(merged.requests_by_user, data["requests_by_user"])
+        return merged
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
 
-        p50 = all_durations[len(all_durations) // 2] if all_durations else 0
-        p95 = all_durations[int(len(all_durations) * 0.95)] if all_durations else 0
-        p99 = all_durations[int(len(all_durations) * 0.99)] if all_durations else 0
+    def get_stats(self) -> Dict:
+        """통계 조회"""
+        view = self._aggregate()
+
+        # 전체 히스토그램 합산 후 백분위 (시계열 수 × 버킷 수, 정렬 없음)
+        total = LatencyHistogram()
+        request_count: Dict[str, int] = {}
+        status_codes: Dict[int, int] = {}
+        for (method, path, status_code), histogram in view.series.items():
+            total.merge(histogram)
+            endpoint = f"{method} {path}"
+            request_count[endpoint] = request_count.get(endpoint, 0) + histogram.count
+            status_codes[status_code] = status_codes.get(status_code, 0) + histogram.count
 
         # Total requests
-        total_requests = sum(self.request_count.values())
-        total_errors = sum(self.error_count.values())
+        total_requests = total.count
+        total_errors = sum(view.error_count.values())
 
         # Uptime
-        uptime_seconds = (datetime.now() - self.start_time).total_seconds()
+        uptime_seconds = (datetime.now() - view.start_time).total_seconds()
 
         return {
             "uptime_seconds": uptime_seconds,
@@ -218,24 +458,15 @@ class MetricsStore:
             "error_rate": total_errors / total_requests if total_requests > 0 else 0,
             "requests_per_second": total_requests / uptime_seconds if uptime_seconds > 0 else 0,
             "response_time": {
-                "p50_ms": p50,
-                "p95_ms": p95,
-                "p99_ms": p99,
+                "p50_ms": total.percentile(0.50),
+                "p95_ms": total.percentile(0.95),
+                "p99_ms": total.percentile(0.99),
             },
-            "top_endpoints": self._get_top_endpoints(5),
-            "status_codes": self.status_codes,
-            "error_types": self.error_count,
+            "top_endpoints": dict(heapq.nlargest(5, request_count.items(), key=lambda x: x[1])),
+            "status_codes": status_codes,
+            "error_types": view.error_count,
         }
 
-    def _get_top_endpoints(self, limit: int = 5) -> Dict[str, int]:
-        """가장 많이 호출된 엔드포인트"""
-        sorted_endpoints = sorted(
-            self.request_count.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-        return dict(sorted_endpoints[:limit])
-
     def get_prometheus_metrics(self) -> str:
         """
         Prometheus 형식 메트릭 반환
@@ -245,34 +476,41 @@ class MetricsStore:
         # TYPE metric_name type
         metric_name{label="value"} value
         """
+        view = self._aggregate()
         lines = []
 
         # Total requests
         lines.append("# HELP http_requests_total Total HTTP requests")
         lines.append("# TYPE http_requests_total counter")
-        for endpoint, count in self.request_count.items():
-            method, path = endpoint.split(" ", 1)
-            lines.append(f'http_requests_total{{method="{method}",path="{path}"}} {count}')
+        for (method, path, status_code), histogram in view.series.items():
+            lines.append(
+                f'http_requests_total{{method="{method}",path="{path}",status_code="{status_code}"}} '
+                f'{histogram.count}'
+            )
 
         # Response time
         lines.append("\n# HELP http_request_duration_milliseconds HTTP request duration in milliseconds")
         lines.append("# TYPE http_request_duration_milliseconds histogram")
-        for endpoint, durations in self.request_duration.items():
-            if durations:
-                method, path = endpoint.split(" ", 1)
-                avg_duration = sum(durations) / len(durations)
-                lines.append(f'http_request_duration_milliseconds{{method="{method}",path="{path}"}} {avg_duration}')
+        for (method, path, status_code), histogram in view.series.items():
+            labels = f'method="{method}",path="{path}",status_code="{status_code}"'
+            for bound, count in histogram.cumulative():
+                lines.append(f'http_request_duration_milliseconds_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'http_request_duration_milliseconds_sum{{{labels}}} {histogram.sum}')
+            lines.append(f'http_request_duration_milliseconds_count{{{labels}}} {histogram.count}')
 
         # Status codes
+        status_codes: Dict[int, int] = {}
+        for (_, _, status_code), histogram in view.series.items():
+            status_codes[status_code] = status_codes.get(status_code, 0) + histogram.count
         lines.append("\n# HELP http_responses_total Total HTTP responses by status code")
         lines.append("# TYPE http_responses_total counter")
-        for status_code, count in self.status_codes.items():
+        for status_code, count in status_codes.items():
             lines.append(f'http_responses_total{{status_code="{status_code}"}} {count}')
 
         # Errors
         lines.append("\n# HELP http_errors_total Total HTTP errors by type")
         lines.append("# TYPE http_errors_total counter")
-        for error_type, count in self.error_count.items():
+        for error_type, count in view.error_count.items():
             lines.append(f'http_errors_total{{error_type="{error_type}"}} {count}')
 
         return "\n".join(lines)
@@ -282,6 +520,12 @@ class MetricsStore:
 _metrics_store = MetricsStore()
 
 
+def _route_template(request: Request) -> str:
+    """메트릭 레이블용 라우트 템플릿 (매칭된 라우트가 없으면 UNMATCHED_ROUTE)"""
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
 def _record_request_metrics(
     method: str,
     path: str,
@@ -2,10 +2,15 @@
 PII (Personally Identifiable Information) Detection and Masking
 
 금융권 개인정보 보호 및 GDPR 준수를 위한 PII 감지, 마스킹, 비식별화 유틸리티
+
+감지/마스킹은 PIIEngine이 담당합니다. 타입별 패턴을 하나로 합쳐 컴파일한 스캐너로
+문자열당 한 번만 스캔하고, 중첩 dict/list는 한 번 순회하면서 마스킹합니다.
 """
 
+import json
 import re
-from typing import Any, Dict, Optional, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Union
 from enum import Enum
 
 
@@ -49,17 +54,7 @@ class PIIDetector:
         Returns:
             Dict[PIIType, list[str]]: 감지된 PII 타입별 값 리스트
         """
-        if not text:
-            return {}
-
-        detected = {}
-
-        for pii_type, pattern in cls.PATTERNS.items():
-            matches = re.findall(pattern, text)
-            if matches:
-                detected[pii_type] = matches
-
-        return detected
+        return get_pii_engine(detection=True).detect(text)
 
     @classmethod
     def contains_pii(cls, text: str) -> bool:
@@ -72,8 +67,7 @@ class PIIDetector:
         Returns:
             bool: PII 포함 여부
         """
-        detected = cls.detect(text)
-        return len(detected) > 0
+        return get_pii_engine(detection=True).contains(text)
 
 
 class PIIMasker:
@@ -268,37 +262,195 @@ class PIIMasker:
         Returns:
             str: 마스킹된 텍스트
         """
-        if not text:
+        return get_pii_engine().mask_text(text)
+
+
+# 필드명 기반 마스킹 (소문자 비교)
+FIELD_MASKERS: Dict[str, Callable[[str], str]] = {
+    "email": PIIMasker.mask_email,
+    "phone": PIIMasker.mask_phone,
+    "ssn": PIIMasker.mask_ssn,
+    "social_security_number": PIIMasker.mask_ssn,
+    "credit_card": PIIMasker.mask_credit_card,
+    "bank_account": PIIMasker.mask_bank_account,
+    "full_name": PIIMasker.mask_name,
+    "name": PIIMasker.mask_name,
+    "ip_address": PIIMasker.mask_ip_address,
+}
+
+# 텍스트 내 PII 타입별 마스킹
+TYPE_MASKERS: Dict[str, Callable[[str], str]] = {
+    PIIType.EMAIL.value: PIIMasker.mask_email,
+    PIIType.PHONE.value: PIIMasker.mask_phone,
+    PIIType.SSN.value: PIIMasker.mask_ssn,
+    PIIType.CREDIT_CARD.value: PIIMasker.mask_credit_card,
+    PIIType.BANK_ACCOUNT.value: PIIMasker.mask_bank_account,
+    PIIType.IP_ADDRESS.value: PIIMasker.mask_ip_address,
+}
+
+# 모든 패턴은 숫자 또는 '@'를 포함해야 일치 → 둘 다 없으면 스캔 생략
+_PII_HINT = re.compile(r"[\d@]")
+
+
+class PIIEngine:
+    """
+    단일 패스 PII 스캐너
+
+    타입별 패턴을 named group alternation 하나로 컴파일합니다.
+    같은 위치에서 여러 타입이 일치하면 types 순서가 우선합니다 (예: 주민등록번호 > 계좌번호).
+    """
+
+    # 텍스트 마스킹 대상 (계좌번호 패턴은 일반 숫자열과 겹치므로 감지에만 사용)
+    MASK_TYPES = (PIIType.EMAIL, PIIType.SSN, PIIType.CREDIT_CARD, PIIType.PHONE, PIIType.IP_ADDRESS)
+    DETECT_TYPES = MASK_TYPES + (PIIType.BANK_ACCOUNT,)
+
+    # 이보다 긴 문자열은 캐시하지 않음 (본문 등 반복되지 않는 값)
+    CACHE_MAX_LENGTH = 512
+
+    def __init__(self, types: Iterable[PIIType] = MASK_TYPES, cache_size: int = 4096):
+        """
+        Args:
+            types: 스캔할 PII 타입 (우선순위 순)
+            cache_size: mask_text 결과 캐시 크기
+        """
+        self.types = tuple(types)
+        self.pattern = re.compile("|".join(
+            f"(?P<{pii_type.value}>{PIIDetector.PATTERNS[pii_type]})" for pii_type in self.types
+        ))
+        self._mask_cached = lru_cache(maxsize=cache_size)(self._mask)
+
+    def _mask(self, text: str) -> str:
+        return self.pattern.sub(lambda m: TYPE_MASKERS[m.lastgroup](m.group()), text)
+
+    def mask_text(self, text: str) -> str:
+        """텍스트 내 PII 마스킹 (짧은 문자열은 결과 캐시)"""
+        if not text or not _PII_HINT.search(text):
             return text
+        if len(text) <= self.CACHE_MAX_LENGTH:
+            return self._mask_cached(text)
+        return self._mask(text)
+
+    def detect(self, text: str) -> Dict[PIIType, list[str]]:
+        """텍스트 내 PII 감지 (타입별 값 리스트, types 순서)"""
+        if not text or not _PII_HINT.search(text):
+            return {}
+        found: Dict[str, list[str]] = {}
+        for match in self.pattern.finditer(text):
+            found.setdefault(match.lastgroup, []).append(match.group())
+        return {pii_type: found[pii_type.value] for pii_type in self.types if pii_type.value in found}
+
+    def contains(self, text: str) -> bool:
+        """PII 포함 여부 (첫 일치에서 종료)"""
+        if not text or not _PII_HINT.search(text):
+            return False
+        return self.pattern.search(text) is not None
+
+    def _resolve(self, key: Any, explicit: frozenset, plan: Dict[Any, Optional[Callable]]) -> Optional[Callable]:
+        """필드명 → 마스킹 함수 (호출 단위로 메모: 레코드 리스트는 같은 키가 반복됨)"""
+        try:
+            return plan[key]
+        except KeyError:
+            pass
+        if key in explicit:
+            masker = self.mask_text
+        elif isinstance(key, str):
+            masker = FIELD_MASKERS.get(key.lower())
+        else:
+            masker = None
+        plan[key] = masker
+        return masker
 
-        masked_text = text
+    def sanitize(self, data: Any, fields_to_mask: Optional[Iterable[str]] = None) -> Any:
+        """
+        dict/list 전체를 한 번 순회하면서 PII 필드를 마스킹합니다 (원본은 변경하지 않음).
 
-        # 이메일 마스킹
-        emails = re.findall(PIIDetector.PATTERNS[PIIType.EMAIL], text)
-        for email in emails:
-            masked_text = masked_text.replace(email, cls.mask_email(email))
+        fields_to_mask에 있는 필드는 텍스트 스캔(mask_text), FIELD_MASKERS에 있는 필드는
+        필드 전용 마스킹을 적용합니다. list 안의 문자열은 상위 필드의 규칙을 따릅니다.
+        """
+        return self._sanitize(data, None, frozenset(fields_to_mask or ()), {})
+
+    def _sanitize(self, value: Any, masker: Optional[Callable], explicit: frozenset, plan: dict) -> Any:
+        if isinstance(value, str):
+            return masker(value) if value and masker else value
+        if isinstance(value, dict):
+            return {
+                key: self._sanitize(item, self._resolve(key, explicit, plan), explicit, plan)
+                for key, item in value.items()
+            }
+        if isinstance(value, (list, tuple)):
+            return [self._sanitize(item, masker, explicit, plan) for item in value]
+        return value
+
+    def iter_json(
+        self,
+        data: Any,
+        fields_to_mask: Optional[Iterable[str]] = None,
+        chunk_size: int = 64 * 1024,
+    ) -> Iterator[str]:
+        """
+        마스킹하면서 JSON으로 직렬화 (스트리밍)
 
-        # 전화번호 마스킹
-        phones = re.findall(PIIDetector.PATTERNS[PIIType.PHONE], text)
-        for phone in phones:
-            masked_text = masked_text.replace(phone, cls.mask_phone(phone))
+        큰 응답을 마스킹된 사본으로 만든 뒤 다시 직렬화하지 않고,
+        순회와 직렬화를 한 번에 하면서 chunk_size 단위로 내보냅니다.
+        """
+        buffer: list[str] = []
+        size = 0
+        for piece in self._encode(data, None, frozenset(fields_to_mask or ()), {}):
+            buffer.append(piece)
+            size += len(piece)
+            if size >= chunk_size:
+                yield "".join(buffer)
+                buffer.clear()
+                size = 0
+        if buffer:
+            yield "".join(buffer)
+
+    def _encode(self, value: Any, masker: Optional[Callable], explicit: frozenset, plan: dict) -> Iterator[str]:
+        if isinstance(value, str):
+            yield _dumps(masker(value) if value and masker else value)
+        elif isinstance(value, dict):
+            yield "{"
+            for index, (key, item) in enumerate(value.items()):
+                if index:
+                    yield ","
+                yield _dumps(key if isinstance(key, str) else _dumps(key))
+                yield ":"
+                yield from self._encode(item, self._resolve(key, explicit, plan), explicit, plan)
+            yield "}"
+        elif isinstance(value, (list, tuple)):
+            yield "["
+            for index, item in enumerate(value):
+                if index:
+                    yield ","
+                yield from self._encode(item, masker, explicit, plan)
+            yield "]"
+        else:
+            yield _dumps(value)
 
-        # 주민등록번호 마스킹
-        ssns = re.findall(PIIDetector.PATTERNS[PIIType.SSN], text)
-        for ssn in ssns:
-            masked_text = masked_text.replace(ssn, cls.mask_ssn(ssn))
 
-        # 신용카드 마스킹
-        cards = re.findall(PIIDetector.PATTERNS[PIIType.CREDIT_CARD], text)
-        for card in cards:
-            masked_text = masked_text.replace(card, cls.mask_credit_card(card))
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, default=str)
 
-        # IP 주소 마스킹
-        ips = re.findall(PIIDetector.PATTERNS[PIIType.IP_ADDRESS], text)
-        for ip in ips:
-            masked_text = masked_text.replace(ip, cls.mask_ip_address(ip))
 
-        return masked_text
+_pii_engine: Optional[PIIEngine] = None
+_pii_detection_engine: Optional[PIIEngine] = None
+
+
+def get_pii_engine(detection: bool = False) -> PIIEngine:
+    """
+    PIIEngine 싱글톤
+
+    Args:
+        detection: True이면 감지용 엔진 (계좌번호 포함)
+    """
+    global _pii_engine, _pii_detection_engine
+    if detection:
+        if _pii_detection_engine is None:
+            _pii_detection_engine = PIIEngine(PIIEngine.DETECT_TYPES)
+        return _pii_detection_engine
+    if _pii_engine is None:
+        _pii_engine = PIIEngine(PIIEngine.MASK_TYPES)
+    return _pii_engine
 
 
 class PIIHandler:
@@ -311,7 +463,7 @@ class PIIHandler:
     @staticmethod
     def sanitize_dict(data: Dict[str, Any], fields_to_mask: Optional[list[str]] = None) -> Dict[str, Any]:
         """
-        Dictionary의 특정 필드를 마스킹합니다.
+        Dictionary의 특정 필드를 마스킹합니다 (중첩 dict/list 포함).
 
         Args:
             data: 원본 데이터
@@ -323,38 +475,7 @@ class PIIHandler:
         if not data:
             return data
 
-        # 기본 PII 필드
-        default_pii_fields = {
-            "email": PIIMasker.mask_email,
-            "phone": PIIMasker.mask_phone,
-            "ssn": PIIMasker.mask_ssn,
-            "social_security_number": PIIMasker.mask_ssn,
-            "credit_card": PIIMasker.mask_credit_card,
-            "bank_account": PIIMasker.mask_bank_account,
-            "full_name": PIIMasker.mask_name,
-            "name": PIIMasker.mask_name,
-            "ip_address": PIIMasker.mask_ip_address,
-        }
-
-        sanitized = data.copy()
-
-        for field, value in sanitized.items():
-            if not value:
-                continue
-
-            # 명시적으로 지정된 필드 마스킹
-            if fields_to_mask and field in fields_to_mask:
-                if isinstance(value, str):
-                    sanitized[field] = PIIMasker.mask_text(value)
-                continue
-
-            # 자동 감지된 PII 필드 마스킹
-            if field.lower() in default_pii_fields:
-                masker_func = default_pii_fields[field.lower()]
-                if isinstance(value, str):
-                    sanitized[field] = masker_func(value)
-
-        return sanitized
+        return get_pii_engine().sanitize(data, fields_to_mask)
 
     @staticmethod
     def validate_no_pii(text: str, raise_error: bool = False) -> bool:
@@ -397,6 +518,11 @@ def mask_ssn(ssn: str) -> str:
     return PIIMasker.mask_ssn(ssn)
 
 
+def mask_ip_address(ip: str) -> str:
+    """IP 주소 마스킹 (편의 함수)"""
+    return PIIMasker.mask_ip_address(ip)
+
+
 def detect_pii(text: str) -> Dict[PIIType, list[str]]:
     """PII 감지 (편의 함수)"""
     return PIIDetector.detect(text)
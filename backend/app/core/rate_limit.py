@@ -2,63 +2,439 @@
 Rate Limiting Middleware
 
 Story 3.4: Rate Limiting & Monitoring - Rate Limiting 구현
+
+GCRA(Generic Cell Rate Algorithm) 기반 분산 rate limiter.
+
+- 키마다 "이론적 도착 시각"(TAT) 하나만 저장 → 확인/갱신이 O(1)
+- Redis Lua 스크립트 한 번으로 여러 정책(전역 + 라우트별)을 원자적으로 확인
+  (Redis 서버 시각 사용 → 워커/노드 간 시계 차이와 무관)
+- 여유가 충분한 클라이언트는 토큰 여러 개를 한 번에 예약(lease)해서
+  다음 요청들은 Redis 왕복 없이 프로세스 안에서 처리
+- Redis 연결 실패 시 같은 알고리즘의 프로세스 내 스토어로 대체
 """
-from datetime import datetime, timedelta
-from typing import Dict, Optional, Callable
 import hashlib
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 from fastapi import Request, HTTPException, status
+from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from loguru import logger
 
 from app.core.config import settings
 
 
+RATE_LIMIT_KEY_PREFIX = "ratelimit:"
+
+# Redis 장애 후 다시 연결을 시도하기까지의 시간 (초)
+REDIS_RETRY_SECONDS = 30.0
+
+# 프로세스 내 스토어 / lease 캐시 최대 키 수 (초과 시 가장 오래 안 쓴 키 제거)
+LOCAL_MAX_KEYS = 100_000
+
+
 # ============================================================================
-# Rate Limit Storage (In-Memory)
+# Policies
 # ============================================================================
 
 
-class RateLimitStore:
+@dataclass(frozen=True)
+class RateLimitPolicy:
     """
-    Rate limit 정보를 저장하는 In-Memory 스토어
+    Rate limit 정책
 
-    Production: Redis로 교체 필요
+    period_seconds 동안 limit개 요청 (최대 limit개까지 연속 허용, 이후 균등 간격으로 회복)
     """
-    def __init__(self):
-        # key: identifier (IP or user_id)
-        # value: {count: int, window_start: datetime}
-        self._store: Dict[str, Dict] = {}
+    name: str
+    limit: int
+    period_seconds: float
+    scope: str = "ip"  # "ip" | "user" (Bearer 토큰 기준, 없으면 IP)
+    path_prefix: str = ""
+    methods: Tuple[str, ...] = ()
+
+    @property
+    def emission_ms(self) -> float:
+        """토큰 하나가 회복되는 간격 (ms)"""
+        return self.period_seconds * 1000.0 / self.limit
+
+    @property
+    def tolerance_ms(self) -> float:
+        """허용 burst 크기 (ms)"""
+        return self.period_seconds * 1000.0
+
+    @property
+    def lease_size(self) -> int:
+        """한 번에 예약할 토큰 수 (1이면 예약 안 함)"""
+        return max(1, min(settings.RATE_LIMIT_MAX_LEASE, self.limit // 10))
+
+    def matches(self, method: str, path: str) -> bool:
+        """메서드 + 경로 세그먼트 단위 접두사 일치 (/query는 /query-history와 불일치)"""
+        if self.methods and method not in self.methods:
+            return False
+        prefix = self.path_prefix.rstrip("/")
+        return path == prefix or path.startswith(prefix + "/")
+
+
+# 라우트별 정책 (전역 정책과 함께 적용)
+ROUTE_POLICIES: Tuple[RateLimitPolicy, ...] = (
+    # Login: 5 requests per 5 minutes per IP
+    RateLimitPolicy(
+        "login", limit=5, period_seconds=300,
+        path_prefix=f"{settings.API_V1_PREFIX}/auth/login", methods=("POST",),
+    ),
+    # Query: 20 requests per minute per user
+    RateLimitPolicy(
+        "query", limit=20, period_seconds=60, scope="user",
+        path_prefix=f"{settings.API_V1_PREFIX}/query", methods=("POST",),
+    ),
+    # Document upload: 10 requests per hour per user
+    RateLimitPolicy(
+        "upload", limit=10, period_seconds=3600, scope="user",
+        path_prefix=f"{settings.API_V1_PREFIX}/documents/upload", methods=("POST",),
+    ),
+)
+
+
+@dataclass
+class RateLimitDecision:
+    """Rate limit 확인 결과"""
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float = 0.0  # 거부 시 다시 시도 가능할 때까지 (초)
+    reset_after: float = 0.0  # 한도가 완전히 회복될 때까지 (초)
+
+    @property
+    def reset(self) -> str:
+        return (datetime.now() + timedelta(seconds=self.reset_after)).isoformat()
 
-    def get(self, key: str) -> Optional[Dict]:
-        """키로 rate limit 정보 조회"""
-        return self._store.get(key)
 
-    def set(self, key: str, value: Dict):
-        """Rate limit 정보 저장"""
-        self._store[key] = value
+# ============================================================================
+# GCRA Backends
+# ============================================================================
 
-    def delete(self, key: str):
-        """키 삭제"""
-        if key in self._store:
-            del self._store[key]
 
-    def cleanup_expired(self, window_seconds: int):
-        """만료된 항목 정리"""
-        now = datetime.now()
-        expired_keys = []
+# KEYS: 정책별 키
+# ARGV: 키마다 (emission_ms, tolerance_ms, lease) 3개씩
+# 반환: {allowed, 키마다 (granted, remaining, retry_after_ms, reset_after_ms)}
+# 하나라도 거부되면 어떤 키도 갱신하지 않음
+GCRA_SCRIPT = """
+redis.replicate_commands()
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local allowed = 1
+local out = {}
+local writes = {}
+for i, key in ipairs(KEYS) do
+    local emission = tonumber(ARGV[i * 3 - 2])
+    local tolerance = tonumber(ARGV[i * 3 - 1])
+    local lease = tonumber(ARGV[i * 3])
+    local tat = tonumber(redis.call('GET', key))
+    if not tat or tat < now then tat = now end
+    local granted = 0
+    local new_tat = tat
+    if lease > 1 and tat + emission * lease - now <= tolerance / 2 then
+        granted = lease
+        new_tat = tat + emission * lease
+    elseif tat + emission - now <= tolerance then
+        granted = 1
+        new_tat = tat + emission
+    end
+    if granted == 0 then
+        allowed = 0
+        out[#out + 1] = 0
+        out[#out + 1] = 0
+        out[#out + 1] = math.ceil(tat + emission - tolerance - now)
+        out[#out + 1] = math.ceil(tat - now)
+    else
+        writes[#writes + 1] = {key, new_tat, math.max(1, math.ceil(new_tat - now))}
+        out[#out + 1] = granted
+        out[#out + 1] = math.floor((tolerance - (new_tat - now)) / emission)
+        out[#out + 1] = 0
+        out[#out + 1] = math.ceil(new_tat - now)
+    end
+end
+if allowed == 1 then
+    for _, w in ipairs(writes) do
+        redis.call('SET', w[1], tostring(w[2]), 'PX', w[3])
+    end
+end
+table.insert(out, 1, allowed)
+return out
+"""
 
-        for key, value in self._store.items():
-            window_start = value.get("window_start")
-            if window_start and (now - window_start).total_seconds() > window_seconds:
-                expired_keys.append(key)
 
-        for key in expired_keys:
-            del self._store[key]
+@dataclass
+class _Grant:
+    granted: int
+    remaining: int
+    retry_after_ms: float
+    reset_after_ms: float
+
+
+def _gcra(
+    tat: Optional[float],
+    now: float,
+    policy: RateLimitPolicy,
+    lease: int,
+) -> Tuple[_Grant, Optional[float]]:
+    """GCRA_SCRIPT와 같은 계산 (프로세스 내 스토어용). (결과, 새 TAT) 반환"""
+    emission, tolerance = policy.emission_ms, policy.tolerance_ms
+    if tat is None or tat < now:
+        tat = now
+    if lease > 1 and tat + emission * lease - now <= tolerance / 2:
+        granted, new_tat = lease, tat + emission * lease
+    elif tat + emission - now <= tolerance:
+        granted, new_tat = 1, tat + emission
+    else:
+        return _Grant(0, 0, tat + emission - tolerance - now, tat - now), None
+    remaining = math.floor((tolerance - (new_tat - now)) / emission)
+    return _Grant(granted, remaining, 0.0, new_tat - now), new_tat
+
+
+class LocalGCRABackend:
+    """
+    프로세스 내 GCRA 스토어
 
+    Redis가 없을 때 사용. 키 수는 LOCAL_MAX_KEYS로 제한 (가장 오래 안 쓴 키부터 제거).
+    """
 
-# Global rate limit store
-_rate_limit_store = RateLimitStore()
+    def __init__(self, max_keys: int = LOCAL_MAX_KEYS, clock: Callable[[], float] = time.time):
+        self._tats: "OrderedDict[str, float]" = OrderedDict()
+        self.max_keys = max_keys
+        self._clock = clock
+
+    async def acquire(
+        self, checks: Sequence[Tuple[str, RateLimitPolicy, int]]
+    ) -> Tuple[bool, List[_Grant]]:
+        now = self._clock() * 1000.0
+        results = [
+            _gcra(self._tats.get(key), now, policy, lease)
+            for key, policy, lease in checks
+        ]
+        allowed = all(new_tat is not None for _, new_tat in results)
+        if allowed:
+            for (key, _, _), (_, new_tat) in zip(checks, results):
+                self._tats[key] = new_tat
+                self._tats.move_to_end(key)
+            while len(self._tats) > self.max_keys:
+                self._tats.popitem(last=False)
+        return allowed, [grant for grant, _ in results]
+
+
+class RedisGCRABackend:
+    """Redis Lua 스크립트 기반 GCRA (워커/노드 간 공유)"""
+
+    def __init__(self, redis_url: Optional[str] = None):
+        self.redis_url = redis_url
+        self._client = None
+        self._script = None
+
+    async def _get_script(self):
+        if self._script is None:
+            import redis.asyncio as redis
+
+            self._client = redis.from_url(self.redis_url or settings.redis_url)
+            self._script = self._client.register_script(GCRA_SCRIPT)
+        return self._script
+
+    async def acquire(
+        self, checks: Sequence[Tuple[str, RateLimitPolicy, int]]
+    ) -> Tuple[bool, List[_Grant]]:
+        script = await self._get_script()
+        args: List[float] = []
+        for _, policy, lease in checks:
+            args.extend((policy.emission_ms, policy.tolerance_ms, lease))
+        raw = await script(keys=[key for key, _, _ in checks], args=args)
+        grants = [
+            _Grant(int(raw[i]), int(raw[i + 1]), float(raw[i + 2]), float(raw[i + 3]))
+            for i in range(1, len(raw), 4)
+        ]
+        return bool(int(raw[0])), grants
+
+
+# ============================================================================
+# Rate Limit Engine
+# ============================================================================
+
+
+@dataclass
+class _Lease:
+    tokens: int
+    remaining: int
+    reset_after_ms: float
+    expires_at: float
+
+
+class RateLimitEngine:
+    """
+    정책 확인 엔진
+
+    여유가 충분한 키는 lease_size개 토큰을 미리 예약하고, 예약된 토큰을 다 쓰거나
+    lease가 만료될 때까지 원격 확인 없이 허용합니다. 예약된 토큰은 이미 전역 한도에서
+    차감되었으므로 여러 워커가 동시에 lease를 받아도 한도를 넘지 않습니다
+    (쓰지 못한 토큰은 버려지므로 한도보다 약간 적게 허용될 수 있음).
+    """
+
+    def __init__(
+        self,
+        backend=None,
+        lease_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            backend: GCRA 백엔드 (기본값: settings.RATE_LIMIT_BACKEND에 따라 Redis 또는 프로세스 내)
+            lease_seconds: 예약 토큰 유효 시간 (기본값: settings.RATE_LIMIT_LEASE_SECONDS)
+            clock: lease 만료 확인용 시계
+        """
+        if backend is None:
+            backend = (
+                RedisGCRABackend() if settings.RATE_LIMIT_BACKEND == "redis" else LocalGCRABackend()
+            )
+        self.backend = backend
+        self.fallback = backend if isinstance(backend, LocalGCRABackend) else LocalGCRABackend()
+        self.lease_seconds = (
+            lease_seconds if lease_seconds is not None else settings.RATE_LIMIT_LEASE_SECONDS
+        )
+        self._clock = clock
+        self._leases: "OrderedDict[str, _Lease]" = OrderedDict()
+        self._backend_down_until = 0.0
+        self.stats = {"local": 0, "remote": 0, "fallback": 0, "denied": 0}
+
+    def _lease_for(self, key: str, now: float) -> Optional[_Lease]:
+        lease = self._leases.get(key)
+        if lease is None:
+            return None
+        if lease.tokens <= 0 or lease.expires_at <= now:
+            del self._leases[key]
+            return None
+        return lease
+
+    async def _remote(
+        self, checks: List[Tuple[str, RateLimitPolicy, int]]
+    ) -> Tuple[bool, List[_Grant]]:
+        if self.backend is self.fallback:
+            return await self.backend.acquire(checks)
+        if time.monotonic() >= self._backend_down_until:
+            try:
+                self.stats["remote"] += 1
+                return await self.backend.acquire(checks)
+            except Exception as e:
+                self._backend_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+                logger.warning(
+                    f"Rate limit backend unavailable, using in-process limits "
+                    f"for {REDIS_RETRY_SECONDS:.0f}s: {e}"
+                )
+        self.stats["fallback"] += 1
+        return await self.fallback.acquire(checks)
+
+    async def hit(self, checks: Sequence[Tuple[str, RateLimitPolicy]]) -> RateLimitDecision:
+        """
+        요청 하나를 여러 정책에 대해 확인 (모두 허용될 때만 차감)
+
+        Args:
+            checks: [(키, 정책), ...]
+
+        Returns:
+            가장 엄격한 정책 기준의 결정
+        """
+        now = self._clock()
+        leases = {key: self._lease_for(key, now) for key, _ in checks}
+        remote = [
+            (key, policy, policy.lease_size)
+            for key, policy in checks
+            if leases[key] is None
+        ]
+
+        grants: Dict[str, _Grant] = {}
+        if remote:
+            allowed, remote_grants = await self._remote(remote)
+            grants = {key: grant for (key, _, _), grant in zip(remote, remote_grants)}
+            if not allowed:
+                self.stats["denied"] += 1
+                denied = [
+                    (policy, grants[key]) for key, policy, _ in remote if grants[key].granted == 0
+                ]
+                policy, grant = max(denied, key=lambda item: item[1].retry_after_ms)
+                return RateLimitDecision(
+                    allowed=False,
+                    limit=policy.limit,
+                    remaining=0,
+                    retry_after=grant.retry_after_ms / 1000.0,
+                    reset_after=grant.reset_after_ms / 1000.0,
+                )
+        else:
+            self.stats["local"] += 1
+
+        decisions = []
+        for key, policy in checks:
+            lease = leases[key]
+            if lease is not None:
+                lease.tokens -= 1
+                decisions.append(RateLimitDecision(
+                    True, policy.limit, lease.remaining + lease.tokens,
+                    reset_after=lease.reset_after_ms / 1000.0,
+                ))
+                continue
+            grant = grants[key]
+            if grant.granted > 1:
+                self._leases[key] = _Lease(
+                    tokens=grant.granted - 1,
+                    remaining=grant.remaining,
+                    reset_after_ms=grant.reset_after_ms,
+                    expires_at=now + self.lease_seconds,
+                )
+                self._leases.move_to_end(key)
+                while len(self._leases) > LOCAL_MAX_KEYS:
+                    self._leases.popitem(last=False)
+            decisions.append(RateLimitDecision(
+                True, policy.limit, grant.remaining + grant.granted - 1,
+                reset_after=grant.reset_after_ms / 1000.0,
+            ))
+
+        return min(decisions, key=lambda decision: decision.remaining)
+
+
+_engine: Optional[RateLimitEngine] = None
+
+
+def get_rate_limit_engine() -> RateLimitEngine:
+    """RateLimitEngine 싱글톤"""
+    global _engine
+    if _engine is None:
+        _engine = RateLimitEngine()
+    return _engine
+
+
+# ============================================================================
+# Identifiers
+# ============================================================================
+
+
+def client_ip(request: Request) -> str:
+    """클라이언트 IP (X-Forwarded-For 우선)"""
+    forwarded_for = request.headers.get("X-Forwarded-For")
+    if forwarded_for:
+        return forwarded_for.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def user_identifier(request: Request) -> str:
+    """사용자 식별자 (Bearer 토큰 해시, 없으면 IP)"""
+    auth_header = request.headers.get("Authorization")
+    if auth_header and auth_header.startswith("Bearer "):
+        token = auth_header.split(" ")[1]
+        return hashlib.sha256(token.encode()).hexdigest()[:16]
+    return client_ip(request)
+
+
+def _identifier(request: Request, policy: RateLimitPolicy) -> str:
+    return user_identifier(request) if policy.scope == "user" else client_ip(request)
 
 
 # ============================================================================
@@ -70,33 +446,33 @@ class RateLimiter:
     """
     Rate Limiter 클래스
 
-    Sliding window 알고리즘 사용
+    단일 정책을 RateLimitEngine으로 확인합니다.
     """
     def __init__(
         self,
         max_requests: int = 100,
         window_seconds: int = 60,
-        identifier_func: Optional[Callable] = None
+        identifier_func: Optional[Callable] = None,
+        name: str = "default",
+        engine: Optional[RateLimitEngine] = None,
     ):
         """
         Args:
             max_requests: 윈도우 내 최대 요청 수
             window_seconds: 윈도우 크기 (초)
             identifier_func: 식별자 생성 함수 (None이면 IP 사용)
+            name: 정책 이름 (Redis 키 구분용)
+            engine: RateLimitEngine (기본값: get_rate_limit_engine())
         """
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.identifier_func = identifier_func or self._default_identifier
-
-    def _default_identifier(self, request: Request) -> str:
-        """기본 식별자: IP 주소"""
-        # Try to get real IP from X-Forwarded-For header
-        forwarded_for = request.headers.get("X-Forwarded-For")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
+        self.identifier_func = identifier_func or client_ip
+        self.policy = RateLimitPolicy(name, max_requests, window_seconds)
+        self._engine = engine
 
-        # Fallback to client host
-        return request.client.host if request.client else "unknown"
+    @property
+    def engine(self) -> RateLimitEngine:
+        return self._engine or get_rate_limit_engine()
 
     async def check_rate_limit(self, request: Request) -> tuple[bool, Dict]:
         """
@@ -107,52 +483,20 @@ class RateLimiter:
             - allowed: bool - 요청 허용 여부
             - info: Dict - rate limit 정보
         """
-        # Get identifier
         identifier = self.identifier_func(request)
-
-        # Get current data
-        now = datetime.now()
-        data = _rate_limit_store.get(identifier)
-
-        # Initialize if not exists
-        if not data:
-            data = {
-                "count": 0,
-                "window_start": now
-            }
-
-        # Check if window has expired
-        window_start = data["window_start"]
-        elapsed = (now - window_start).total_seconds()
-
-        if elapsed > self.window_seconds:
-            # Reset window
-            data = {
-                "count": 0,
-                "window_start": now
-            }
-
-        # Increment count
-        data["count"] += 1
-
-        # Save
-        _rate_limit_store.set(identifier, data)
-
-        # Check if limit exceeded
-        allowed = data["count"] <= self.max_requests
-
-        # Calculate remaining and reset time
-        remaining = max(0, self.max_requests - data["count"])
-        reset_time = window_start + timedelta(seconds=self.window_seconds)
+        decision = await self.engine.hit(
+            [(f"{RATE_LIMIT_KEY_PREFIX}{self.policy.name}:{identifier}", self.policy)]
+        )
 
         info = {
-            "limit": self.max_requests,
-            "remaining": remaining,
-            "reset": reset_time.isoformat(),
+            "limit": decision.limit,
+            "remaining": decision.remaining,
+            "reset": decision.reset,
+            "retry_after": math.ceil(decision.retry_after),
             "identifier": identifier,
         }
 
-        return allowed, info
+        return decision.allowed, info
 
 
 # ============================================================================
@@ -164,16 +508,27 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     """
     Rate Limiting Middleware
 
-    모든 요청에 대해 rate limit을 적용합니다.
+    모든 요청에 전역 정책을, 경로가 일치하는 요청에는 라우트별 정책을 함께 적용합니다.
+    요청당 Redis 왕복은 최대 한 번 (lease가 있으면 0번)입니다.
     """
-    def __init__(self, app, max_requests: int = 100, window_seconds: int = 60):
+    def __init__(
+        self,
+        app,
+        max_requests: int = 100,
+        window_seconds: int = 60,
+        policies: Sequence[RateLimitPolicy] = (),
+        engine: Optional[RateLimitEngine] = None,
+    ):
         super().__init__(app)
-        self.rate_limiter = RateLimiter(
-            max_requests=max_requests,
-            window_seconds=window_seconds
-        )
+        self.global_policy = RateLimitPolicy("global", max_requests, window_seconds)
+        self.policies = tuple(policies)
+        self._engine = engine
         self.enabled = settings.RATE_LIMIT_ENABLED
 
+    @property
+    def engine(self) -> RateLimitEngine:
+        return self._engine or get_rate_limit_engine()
+
     async def dispatch(self, request: Request, call_next):
         """요청 처리"""
         # Skip if disabled
@@ -181,38 +536,44 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             return await call_next(request)
 
         # Skip health check and metrics endpoints
-        if request.url.path in ["/health", "/api/v1/health", "/api/v1/metrics"]:
+        path = request.url.path
+        if path in ["/health", "/api/v1/health", "/api/v1/metrics"]:
             return await call_next(request)
 
         # Check rate limit
-        allowed, info = await self.rate_limiter.check_rate_limit(request)
+        checks = [
+            (f"{RATE_LIMIT_KEY_PREFIX}{policy.name}:{_identifier(request, policy)}", policy)
+            for policy in (self.global_policy, *self.policies)
+            if policy is self.global_policy or policy.matches(request.method, path)
+        ]
+        decision = await self.engine.hit(checks)
 
-        if not allowed:
-            logger.warning(
-                f"Rate limit exceeded: {info['identifier']} on {request.url.path}"
-            )
+        if not decision.allowed:
+            logger.warning(f"Rate limit exceeded: {client_ip(request)} on {path}")
 
-            raise HTTPException(
+            return JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail={
-                    "error_code": "RATE_LIMIT_EXCEEDED",
-                    "error_message": "Too many requests. Please try again later.",
-                    "limit": info["limit"],
-                    "reset": info["reset"],
+                content={
+                    "detail": {
+                        "error_code": "RATE_LIMIT_EXCEEDED",
+                        "error_message": "Too many requests. Please try again later.",
+                        "limit": decision.limit,
+                        "reset": decision.reset,
+                    }
                 },
                 headers={
-                    "X-RateLimit-Limit": str(info["limit"]),
-                    "X-RateLimit-Remaining": str(info["remaining"]),
-                    "X-RateLimit-Reset": info["reset"],
-                    "Retry-After": str(self.rate_limiter.window_seconds),
+                    "X-RateLimit-Limit": str(decision.limit),
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Reset": decision.reset,
+                    "Retry-After": str(max(1, math.ceil(decision.retry_after))),
                 }
             )
 
         # Add rate limit headers to response
         response = await call_next(request)
-        response.headers["X-RateLimit-Limit"] = str(info["limit"])
-        response.headers["X-RateLimit-Remaining"] = str(info["remaining"])
-        response.headers["X-RateLimit-Reset"] = info["reset"]
+        response.headers["X-RateLimit-Limit"] = str(decision.limit)
+        response.headers["X-RateLimit-Remaining"] = str(decision.remaining)
+        response.headers["X-RateLimit-Reset"] = decision.reset
 
         return response
 
@@ -222,36 +583,26 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 # ============================================================================
 
 
-def create_user_rate_limiter(max_requests: int = 1000, window_seconds: int = 3600):
+def create_user_rate_limiter(
+    max_requests: int = 1000,
+    window_seconds: int = 3600,
+    name: str = "user",
+):
     """
     사용자 기반 Rate Limiter 생성
 
-    JWT 토큰에서 사용자 ID를 추출하여 사용합니다.
+    Bearer 토큰 해시를 식별자로 사용합니다.
 
     Args:
         max_requests: 윈도우 내 최대 요청 수
         window_seconds: 윈도우 크기 (초)
+        name: 정책 이름
     """
-    def user_identifier(request: Request) -> str:
-        # Try to get user from token
-        auth_header = request.headers.get("Authorization")
-
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header.split(" ")[1]
-            # Hash token to create identifier
-            return hashlib.sha256(token.encode()).hexdigest()[:16]
-
-        # Fallback to IP
-        forwarded_for = request.headers.get("X-Forwarded-For")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
-
-        return request.client.host if request.client else "unknown"
-
     return RateLimiter(
         max_requests=max_requests,
         window_seconds=window_seconds,
-        identifier_func=user_identifier
+        identifier_func=user_identifier,
+        name=name,
     )
 
 
@@ -261,13 +612,13 @@ def create_user_rate_limiter(max_requests: int = 1000, window_seconds: int = 360
 
 
 # Login endpoint: 5 requests per 5 minutes
-login_rate_limiter = RateLimiter(max_requests=5, window_seconds=300)
+login_rate_limiter = RateLimiter(max_requests=5, window_seconds=300, name="login")
 
 # Query endpoint: 20 requests per minute
-query_rate_limiter = create_user_rate_limiter(max_requests=20, window_seconds=60)
+query_rate_limiter = create_user_rate_limiter(max_requests=20, window_seconds=60, name="query")
 
 # Document upload: 10 requests per hour
-upload_rate_limiter = create_user_rate_limiter(max_requests=10, window_seconds=3600)
+upload_rate_limiter = create_user_rate_limiter(max_requests=10, window_seconds=3600, name="upload")
 
 
 # ============================================================================
@@ -291,7 +642,8 @@ async def check_rate_limit(request: Request, limiter: RateLimiter):
                 "error_message": "Too many requests. Please try again later.",
                 "limit": info["limit"],
                 "reset": info["reset"],
-            }
+            },
+            headers={"Retry-After": str(max(1, info["retry_after"]))},
         )
 
     return info
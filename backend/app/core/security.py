@@ -1,13 +1,26 @@
 """
 Security utilities for JWT authentication and password hashing
+
+bcrypt는 CPU를 ~100ms 점유하므로 async 핸들러에서는 hash_password_async /
+verify_password_async로 전용 스레드 풀에서 실행합니다 (이벤트 루프 비차단).
+검증된 access token은 TokenCache에 짧게 보관해 요청마다 JWT를 다시 검증하지 않습니다.
+토큰 폐기(로그아웃)는 Redis(TokenRevocationBus)로 모든 워커에 전파됩니다.
 """
+import asyncio
+import hashlib
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, Tuple, TypeVar
 
 from jose import JWTError, jwt
 import bcrypt
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from loguru import logger
 
 from app.core.config import settings
 
@@ -32,6 +45,68 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(password_bytes, hashed_bytes)
 
 
+T = TypeVar("T")
+
+_password_executor: Optional[ThreadPoolExecutor] = None
+_password_pending = 0
+_password_pending_lock = threading.Lock()
+
+
+def _get_password_executor() -> ThreadPoolExecutor:
+    global _password_executor
+    if _password_executor is None:
+        _password_executor = ThreadPoolExecutor(
+            max_workers=settings.AUTH_HASH_WORKERS,
+            thread_name_prefix="bcrypt",
+        )
+    return _password_executor
+
+
+async def _run_password_op(func: Callable[..., T], *args) -> T:
+    """
+    bcrypt 작업을 전용 스레드 풀에서 실행
+
+    대기 중인 작업이 AUTH_HASH_MAX_PENDING을 넘으면 큐에 쌓지 않고 503을 반환합니다
+    (로그인 폭주가 다른 요청의 지연으로 번지지 않도록).
+    """
+    global _password_pending
+    with _password_pending_lock:
+        if _password_pending >= settings.AUTH_HASH_MAX_PENDING:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail={
+                    "error_code": "AUTH_BUSY",
+                    "error_message": "Too many concurrent authentication requests. Please retry shortly.",
+                },
+                headers={"Retry-After": "1"},
+            )
+        _password_pending += 1
+    try:
+        future = _get_password_executor().submit(func, *args)
+    except BaseException:
+        _release_password_slot(None)
+        raise
+    # 호출자가 취소되어도 bcrypt 스레드가 끝날 때까지(또는 시작 전 취소될 때) 자리를 유지
+    future.add_done_callback(_release_password_slot)
+    return await asyncio.wrap_future(future)
+
+
+def _release_password_slot(_future) -> None:
+    global _password_pending
+    with _password_pending_lock:
+        _password_pending -= 1
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password using bcrypt without blocking the event loop"""
+    return await _run_password_op(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against a hash without blocking the event loop"""
+    return await _run_password_op(verify_password, plain_password, hashed_password)
+
+
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token
@@ -50,7 +125,8 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
-    to_encode.update({"exp": expire, "type": "access"})
+    # jti: 같은 초에 발급된 토큰도 서로 구분 (개별 폐기)
+    to_encode.update({"exp": expire, "iat": datetime.utcnow(), "jti": uuid.uuid4().hex, "type": "access"})
     encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
 
     return encoded_jwt
@@ -99,20 +175,286 @@ def decode_token(token: str) -> Dict[str, Any]:
         )
 
 
-async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict[str, Any]:
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class TokenCache:
     """
-    FastAPI dependency to extract current user from JWT token
+    검증된 access token → payload LRU 캐시
 
-    Args:
-        credentials: HTTP Bearer token from request header
+    - 키는 토큰 원문이 아닌 SHA-256 해시
+    - 항목 유효 시간은 min(ttl, 토큰 exp): 만료된 토큰은 캐시에서도 만료
+    - 폐기된 토큰(revoke)은 캐시 적중 여부와 관계없이 거부 (폐기 목록은 토큰 exp까지 유지)
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            max_entries: 최대 항목 수 (기본값: settings.AUTH_TOKEN_CACHE_SIZE)
+            ttl_seconds: 항목 유효 시간 (기본값: settings.AUTH_TOKEN_CACHE_TTL_SECONDS)
+            clock: 현재 시각 (epoch seconds)
+        """
+        self.max_entries = max_entries if max_entries is not None else settings.AUTH_TOKEN_CACHE_SIZE
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.AUTH_TOKEN_CACHE_TTL_SECONDS
+        self.clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._revoked: Dict[str, float] = {}  # token hash -> token exp
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        key = _token_key(token)
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now or key in self._revoked:
+                if entry is not None:
+                    del self._entries[key]
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[1]
+
+    def set(self, token: str, payload: Dict[str, Any]) -> None:
+        if self.max_entries <= 0 or self.ttl_seconds <= 0:
+            return
+        now = self.clock()
+        expires_at = min(now + self.ttl_seconds, float(payload.get("exp", now)))
+        if expires_at <= now:
+            return
+        key = _token_key(token)
+        with self._lock:
+            self._entries[key] = (expires_at, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def is_revoked(self, token: str) -> bool:
+        with self._lock:
+            return _token_key(token) in self._revoked
+
+    def revoke(self, token: str, expires_at: Optional[float] = None) -> None:
+        """토큰 폐기 (expires_at 이후에는 JWT 자체가 만료되므로 목록에서 제거)"""
+        self.revoke_key(_token_key(token), expires_at)
+
+    def revoke_key(self, key: str, expires_at: Optional[float] = None) -> None:
+        """토큰 해시로 폐기 (다른 워커에서 전파된 폐기)"""
+        now = self.clock()
+        with self._lock:
+            self._entries.pop(key, None)
+            self._revoked[key] = expires_at if expires_at is not None else now + self.ttl_seconds
+            # 만료된 폐기 항목 정리
+            for revoked_key in [k for k, exp in self._revoked.items() if exp <= now]:
+                del self._revoked[revoked_key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._revoked.clear()
+
+
+_token_cache: Optional[TokenCache] = None
+
+
+def get_token_cache() -> TokenCache:
+    """TokenCache 싱글톤"""
+    global _token_cache
+    if _token_cache is None:
+        _token_cache = TokenCache()
+    return _token_cache
+
+
+REVOKED_KEY_PREFIX = "auth:revoked:"
+REVOKED_CHANNEL = "auth:revoked"
+# Redis 장애 후 다시 시도하기까지 (그동안은 프로세스 내 폐기 목록만 사용)
+REVOCATION_RETRY_SECONDS = 5.0
+
+
+class TokenRevocationBus:
+    """
+    Redis 기반 토큰 폐기 전파
+
+    - publish: 폐기 키(auth:revoked:<토큰 해시>, 토큰 exp까지 유지) 기록 + pub/sub 알림
+    - run: 다른 워커의 폐기 알림을 받아 로컬 TokenCache에서 즉시 제거
+    - is_revoked: 캐시 미스 시 폐기 키 확인 (알림을 놓친/나중에 시작한 워커용)
+
+    Redis를 쓸 수 없으면 프로세스 내 폐기 목록만으로 동작합니다.
+    """
+
+    def __init__(self, redis_url: Optional[str] = None, cache: Optional[TokenCache] = None):
+        self.redis_url = redis_url
+        self._cache = cache
+        self._client = None
+        self._task: Optional[asyncio.Task] = None
+        self._down_until = 0.0
+
+    @property
+    def cache(self) -> TokenCache:
+        return self._cache or get_token_cache()
+
+    def _get_client(self):
+        if self._client is None:
+            import redis.asyncio as redis
+
+            self._client = redis.from_url(self.redis_url or settings.redis_url, decode_responses=True)
+        return self._client
+
+    def _available(self) -> bool:
+        return time.monotonic() >= self._down_until
+
+    def _mark_down(self, action: str, error: Exception) -> None:
+        self._down_until = time.monotonic() + REVOCATION_RETRY_SECONDS
+        logger.warning(f"Token revocation {action} failed, using in-process list: {error}")
+
+    async def publish(self, key: str, expires_at: Optional[float]) -> None:
+        ttl = max(1, int((expires_at or time.time() + settings.AUTH_TOKEN_CACHE_TTL_SECONDS) - time.time()))
+        try:
+            client = self._get_client()
+            await client.set(REVOKED_KEY_PREFIX + key, "1", ex=ttl)
+            await client.publish(REVOKED_CHANNEL, f"{key} {expires_at or ''}")
+        except Exception as e:
+            self._mark_down("publish", e)
+
+    async def is_revoked(self, key: str) -> bool:
+        if not self._available():
+            return False
+        try:
+            return bool(await self._get_client().exists(REVOKED_KEY_PREFIX + key))
+        except Exception as e:
+            self._mark_down("lookup", e)
+            return False
+
+    def handle_message(self, data: str) -> None:
+        key, _, expires_at = data.partition(" ")
+        self.cache.revoke_key(key, float(expires_at) if expires_at else None)
+
+    async def run(self) -> None:
+        while True:
+            try:
+                pubsub = self._get_client().pubsub()
+                await pubsub.subscribe(REVOKED_CHANNEL)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self.handle_message(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._mark_down("subscription", e)
+                await asyncio.sleep(REVOCATION_RETRY_SECONDS)
+
+    def start(self) -> None:
+        """폐기 알림 구독 시작 (이벤트 루프 안에서 호출)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+
+_revocation_bus: Optional[TokenRevocationBus] = None
+
+
+def get_revocation_bus() -> Optional[TokenRevocationBus]:
+    """TokenRevocationBus 싱글톤 (AUTH_REVOCATION_BACKEND="memory"이면 None)"""
+    global _revocation_bus
+    if settings.AUTH_REVOCATION_BACKEND != "redis":
+        return None
+    if _revocation_bus is None:
+        _revocation_bus = TokenRevocationBus()
+    return _revocation_bus
+
+
+def revoke_token(token: str) -> Optional[Tuple[str, Optional[float]]]:
+    """
+    Access token 폐기 (이 프로세스만)
+
+    토큰 만료 시각까지 get_current_user가 해당 토큰을 거부합니다.
+    다른 워커에도 적용하려면 revoke_token_everywhere를 사용합니다.
 
     Returns:
-        User data from token payload
+        (토큰 해시, exp) 또는 디코딩할 수 없는 토큰이면 None
+    """
+    try:
+        payload = jwt.decode(
+            token,
+            settings.JWT_SECRET_KEY,
+            algorithms=[settings.JWT_ALGORITHM],
+            options={"verify_exp": False},
+        )
+        expires_at = float(payload.get("exp")) if payload.get("exp") else None
+    except JWTError:
+        return None
+    get_token_cache().revoke(token, expires_at)
+    return _token_key(token), expires_at
+
+
+async def revoke_token_everywhere(token: str) -> None:
+    """Access token 폐기 (로그아웃) + Redis로 모든 워커에 전파"""
+    revoked = revoke_token(token)
+    bus = get_revocation_bus()
+    if revoked is not None and bus is not None:
+        await bus.publish(*revoked)
+
+
+def _revoked_token_error() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Token has been revoked",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def resolve_access_token(token: str) -> Dict[str, Any]:
+    """
+    Access token을 검증하고 payload를 반환 (캐시 사용)
 
     Raises:
-        HTTPException: If token is invalid
+        HTTPException: 토큰이 유효하지 않거나, 만료/폐기되었거나, access token이 아닌 경우
+    """
+    cache = get_token_cache()
+    payload = cache.get(token)
+    if payload is not None:
+        return dict(payload)
+    return _verify_access_token(token, cache)
+
+
+async def resolve_access_token_async(token: str) -> Dict[str, Any]:
     """
-    token = credentials.credentials
+    resolve_access_token + 캐시 미스 시 Redis 폐기 목록 확인 (다른 워커에서 로그아웃한 토큰)
+
+    Raises:
+        HTTPException: resolve_access_token과 같음
+    """
+    cache = get_token_cache()
+    payload = cache.get(token)
+    if payload is not None:
+        return dict(payload)
+    bus = get_revocation_bus()
+    if bus is not None and await bus.is_revoked(_token_key(token)):
+        raise _revoked_token_error()
+    return _verify_access_token(token, cache)
+
+
+def _verify_access_token(token: str, cache: TokenCache) -> Dict[str, Any]:
+    if cache.is_revoked(token):
+        raise _revoked_token_error()
+
     payload = decode_token(token)
 
     # Verify token type
@@ -122,14 +464,30 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
             detail="Invalid token type",
         )
 
-    user_id = payload.get("sub")
-    if user_id is None:
+    if payload.get("sub") is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token payload invalid",
         )
 
-    return payload
+    cache.set(token, payload)
+    return dict(payload)
+
+
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict[str, Any]:
+    """
+    FastAPI dependency to extract current user from JWT token
+
+    Args:
+        credentials: HTTP Bearer token from request header
+
+    Returns:
+        User data from token payload
+
+    Raises:
+        HTTPException: If token is invalid
+    """
+    return await resolve_access_token_async(credentials.credentials)
 
 
 async def get_current_active_user(current_user: Dict[str, Any] = Depends(get_current_user)) -> Dict[str, Any]:
@@ -169,18 +527,7 @@ async def get_current_user_optional(
         return None
 
     try:
-        token = credentials.credentials
-        payload = decode_token(token)
-
-        # Verify token type
-        if payload.get("type") != "access":
-            return None
-
-        user_id = payload.get("sub")
-        if user_id is None:
-            return None
-
-        return payload
+        return await resolve_access_token_async(credentials.credentials)
     except HTTPException:
         return None
 
@@ -10,8 +10,10 @@ import uvicorn
 
 from app.core.config import settings
 from app.core.database import pg_manager, neo4j_manager, redis_manager
-from app.core.rate_limit import RateLimitMiddleware
-from app.core.logging import RequestLoggingMiddleware
+from app.core.audit_sink import get_audit_pipeline
+from app.core.rate_limit import ROUTE_POLICIES, RateLimitMiddleware
+from app.core.security import get_revocation_bus
+from app.core.logging import RequestLoggingMiddleware, remove_stale_metrics_snapshots
 from app.core.security_headers import SecurityHeadersMiddleware
 
 
@@ -23,6 +25,10 @@ async def lifespan(app: FastAPI):
     # Startup: Initialize database connections
     print(f"🚀 Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     print(f"📍 Environment: {settings.ENVIRONMENT}")
+    print(f"🧩 Role: {settings.APP_ROLE}")
+
+    # 이전 실행에서 종료된 워커의 메트릭 스냅샷 정리
+    remove_stale_metrics_snapshots()
 
     # Try to connect to databases, but don't fail if they're not available
     pg_connected = False
@@ -53,10 +59,37 @@ async def lifespan(app: FastAPI):
     if not (pg_connected or neo4j_connected or redis_connected):
         print("⚠️  No database connections established - running in limited mode")
 
+    # 감사 로그 배치 저장 시작
+    audit_pipeline = get_audit_pipeline()
+    audit_pipeline.start()
+
+    # 다른 워커의 로그아웃(토큰 폐기) 알림 구독
+    revocation_bus = get_revocation_bus()
+    if revocation_bus is not None:
+        revocation_bus.start()
+
+    # 그래프 갱신(문서 completed 전이) 시 질의 응답 캐시 무효화
+    cache_invalidator = None
+    if settings.APP_ROLE in ("all", "query"):
+        from app.api.v1.endpoints.query import get_orchestrator
+        from app.services.orchestration.cache_invalidation import GraphCacheInvalidator
+
+        cache_invalidator = GraphCacheInvalidator(get_orchestrator)
+        await cache_invalidator.start()
+
     yield
 
     # Shutdown: Close database connections
     print("🛑 Shutting down...")
+    if cache_invalidator is not None:
+        await cache_invalidator.stop()
+    if revocation_bus is not None:
+        await revocation_bus.stop()
+    try:
+        await audit_pipeline.stop()
+        print("✅ Audit log flushed")
+    except Exception as e:
+        print(f"⚠️  Audit log flush failed: {e}")
     try:
         if pg_connected:
             pg_manager.disconnect()
@@ -105,7 +138,9 @@ app.add_middleware(RequestLoggingMiddleware)
 # ⚠️ In development: very high limit (10000/min) to avoid blocking dashboard polling
 # ⚠️ In production: strict limit (100/min) for security
 if settings.ENVIRONMENT == "production":
-    app.add_middleware(RateLimitMiddleware, max_requests=100, window_seconds=60)
+    app.add_middleware(
+        RateLimitMiddleware, max_requests=100, window_seconds=60, policies=ROUTE_POLICIES
+    )
 else:
     # Development: 10000 requests per minute (effectively unlimited for local dev)
     app.add_middleware(RateLimitMiddleware, max_requests=10000, window_seconds=60)
@@ -146,12 +181,10 @@ async def root():
     }
 
 
-# API v1 routers
-from app.api.v1 import ingestion
+# API v1 routers (APP_ROLE에 해당하는 라우터만 로드)
 from app.api.v1.router import api_router as v1_router
 # from app.api.v1 import auth, compliance  # TODO: Add these routers
 
-app.include_router(ingestion.router, prefix=f"{settings.API_V1_PREFIX}/policies", tags=["Ingestion"])
 app.include_router(v1_router, prefix=settings.API_V1_PREFIX)
 # app.include_router(auth.router, prefix=f"{settings.API_V1_PREFIX}/auth", tags=["Authentication"])
 # app.include_router(compliance.router, prefix=f"{settings.API_V1_PREFIX}/compliance", tags=["Compliance"])
@@ -171,6 +204,7 @@ async def global_exception_handler(request, exc):
 
 
 if __name__ == "__main__":
+    remove_stale_metrics_snapshots()
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
@@ -140,9 +140,11 @@ class CustomerWithPolicies(Customer):
 class CustomerListResponse(BaseModel):
     """Customer list response"""
     customers: List[Customer]
-    total: int
+    total: Optional[int] = None  # None when count=none
     page: int
     page_size: int
+    total_is_estimate: bool = False
+    next_cursor: Optional[str] = None
 
 
 # Coverage summary models
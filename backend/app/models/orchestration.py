@@ -105,6 +105,20 @@ class OrchestrationMetrics(BaseModel):
     search_result_count: int = Field(default=0, description="검색 결과 수")
     tokens_used: Optional[int] = Field(None, description="사용된 토큰 수")
 
+    # 실행 예산 / SLO
+    strategy: Optional[str] = Field(None, description="실행 전략")
+    budget_ms: Optional[float] = Field(None, description="요청 실행 예산 (ms)")
+    slo_target_ms: Optional[float] = Field(None, description="전략별 지연 SLO (ms)")
+    slo_met: Optional[bool] = Field(None, description="SLO 충족 여부")
+    skipped_stages: List[ExecutionStage] = Field(
+        default_factory=list, description="예산 부족으로 건너뛴 단계"
+    )
+
+    def record_slo(self, slo_target_ms: float):
+        """SLO 충족 여부 기록 (total_duration_ms 확정 후 호출)"""
+        self.slo_target_ms = slo_target_ms
+        self.slo_met = self.total_duration_ms <= slo_target_ms
+
     def add_stage(self, stage: StageMetrics):
         """단계 메트릭 추가"""
         self.stages.append(stage)
@@ -251,6 +265,54 @@ class OrchestrationError(BaseModel):
         }
 
 
+class StrategyBudget(BaseModel):
+    """
+    전략별 실행 예산
+
+    요청마다 ExecutionBudget으로 복사되어 사용되며 공유 설정을 변경하지 않습니다.
+    """
+
+    total_seconds: float = Field(..., gt=0, description="요청 전체 예산 (초)")
+    query_analysis_timeout: float = Field(..., gt=0, description="질의 분석 최대 시간")
+    search_timeout: float = Field(..., gt=0, description="검색 최대 시간")
+    response_generation_timeout: float = Field(..., gt=0, description="응답 생성 최대 시간")
+
+    # 검색 결과 수 조정
+    max_search_results: Optional[int] = Field(None, description="검색 결과 수 상한")
+    min_search_results: Optional[int] = Field(None, description="검색 결과 수 하한")
+
+    # 적응형 단계 생략 (남은 예산이 이보다 작으면 단계 생략)
+    min_analysis_seconds: float = Field(default=0.1, description="질의 분석 최소 예산")
+    min_search_seconds: float = Field(default=0.5, description="검색 최소 예산")
+    min_generation_seconds: float = Field(default=0.2, description="응답 생성 최소 예산")
+
+    # SLO
+    slo_ms: float = Field(..., gt=0, description="지연 SLO (ms)")
+
+
+def _default_strategy_budgets() -> Dict[str, StrategyBudget]:
+    """FAST / COMPREHENSIVE 기본 예산 (STANDARD는 타임아웃 설정에서 생성)"""
+    return {
+        OrchestrationStrategy.FAST.value: StrategyBudget(
+            total_seconds=8,
+            query_analysis_timeout=2,
+            search_timeout=5,
+            response_generation_timeout=3,
+            max_search_results=5,
+            min_search_seconds=0.3,
+            slo_ms=3000,
+        ),
+        OrchestrationStrategy.COMPREHENSIVE.value: StrategyBudget(
+            total_seconds=55,
+            query_analysis_timeout=10,
+            search_timeout=30,
+            response_generation_timeout=15,
+            min_search_results=20,
+            slo_ms=30000,
+        ),
+    }
+
+
 class OrchestrationConfig(BaseModel):
     """
     오케스트레이션 설정
@@ -262,10 +324,35 @@ class OrchestrationConfig(BaseModel):
     search_timeout: int = Field(default=15, description="검색 타임아웃")
     response_generation_timeout: int = Field(default=10, description="응답 생성 타임아웃")
 
+    # 전략별 실행 예산 / SLO
+    strategy_budgets: Dict[str, StrategyBudget] = Field(
+        default_factory=_default_strategy_budgets,
+        description="전략별 실행 예산 (키: 전략 값)",
+    )
+    standard_slo_ms: float = Field(default=10000, description="STANDARD 전략 지연 SLO (ms)")
+
     # 캐시
     cache_enabled: bool = Field(default=True, description="캐시 활성화")
     cache_ttl_seconds: int = Field(default=3600, description="캐시 TTL (1시간)")
     cache_max_size: int = Field(default=1000, description="최대 캐시 크기")
+    shared_cache_enabled: bool = Field(
+        default=False, description="Redis 공유 캐시 활성화 (워커/노드 간)"
+    )
+    shared_cache_url: Optional[str] = Field(
+        None, description="공유 캐시 Redis URL (None이면 settings.redis_url)"
+    )
+    single_flight_enabled: bool = Field(
+        default=True, description="동일 질문 동시 요청 병합"
+    )
+    semantic_cache_enabled: bool = Field(
+        default=False, description="질문 임베딩 유사도 기반 시맨틱 캐시 활성화"
+    )
+    semantic_cache_threshold: float = Field(
+        default=0.92, ge=0.0, le=1.0, description="시맨틱 캐시 최소 코사인 유사도"
+    )
+    semantic_cache_max_size: int = Field(
+        default=1000, description="시맨틱 캐시 최대 크기"
+    )
 
     # 재시도
     max_retries: int = Field(default=3, description="최대 재시도 횟수")
@@ -288,6 +375,19 @@ class OrchestrationConfig(BaseModel):
     )
     log_performance_metrics: bool = Field(default=True, description="성능 메트릭 로깅")
 
+    def budget_for(self, strategy: OrchestrationStrategy) -> StrategyBudget:
+        """전략별 예산 조회 (미정의 전략은 타임아웃 설정 기반)"""
+        budget = self.strategy_budgets.get(OrchestrationStrategy(strategy).value)
+        if budget is not None:
+            return budget
+        return StrategyBudget(
+            total_seconds=self.default_timeout_seconds,
+            query_analysis_timeout=self.query_analysis_timeout,
+            search_timeout=self.search_timeout,
+            response_generation_timeout=self.response_generation_timeout,
+            slo_ms=self.standard_slo_ms,
+        )
+
 
 class PipelineStage(BaseModel):
     """파이프라인 단계 정의"""
@@ -67,10 +67,12 @@ class QueryHistoryListResponse(BaseModel):
     """Paginated response for query history list."""
 
     items: List[QueryHistoryResponse]
-    total: int
+    total: Optional[int] = None  # None when count=none
     page: int
     page_size: int
     has_more: bool
+    total_is_estimate: bool = False
+    next_cursor: Optional[str] = None
 
 
 class QueryHistoryStats(BaseModel):
@@ -3,19 +3,123 @@ Document Repository
 
 Data access layer for documents table (MVP search).
 """
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from uuid import UUID
 import json
+import re
+import threading
+import time
+import unicodedata
 import psycopg2
 from psycopg2.extras import RealDictCursor, Json
 from loguru import logger
 
+from app.core.config import settings
 from app.core.database import PostgreSQLManager
 
 
+SEARCH_MODES = ("bigram", "simple")
+
+# Keep in sync with korean_bigram_tokens() in alembic/versions/013_add_documents_bigram_search.sql
+_HANGUL_GAP = re.compile(r"([가-힣])\s+(?=[가-힣])")
+_SEARCH_TOKEN = re.compile(r"[가-힣]+|[a-z0-9]+")
+
+
+def korean_bigrams(text: str, join_words: bool = True) -> List[str]:
+    """
+    Tokenize text the same way the search_bigrams trigger does.
+
+    Hangul runs are split into overlapping bigrams; Latin/digit runs are kept
+    as whole tokens. With join_words (documents), whitespace between Hangul
+    syllables is ignored, so a document spelling "암 진단비" also yields "암진".
+    """
+    body = unicodedata.normalize("NFC", text).lower()
+    if join_words:
+        body = _HANGUL_GAP.sub(r"\1", body)
+    tokens: List[str] = []
+    for run in _SEARCH_TOKEN.findall(body):
+        if len(run) >= 2 and "가" <= run[0] <= "힣":
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run)
+    return tokens
+
+
+def build_bigram_tsquery(text: str) -> Optional[str]:
+    """
+    Build a tsquery literal that requires every bigram of the query.
+
+    Query words are tokenized separately (documents index both the spaced and
+    joined forms). A single Hangul syllable becomes a prefix match ('암':*)
+    since documents only index bigrams. Returns None when the query has no
+    searchable tokens.
+    """
+    terms = []
+    for token in dict.fromkeys(korean_bigrams(text, join_words=False)):
+        is_syllable = len(token) == 1 and "가" <= token <= "힣"
+        terms.append(f"'{token}':*" if is_syllable else f"'{token}'")
+    return " & ".join(terms) or None
+
+
+class SearchResultCache:
+    """
+    Small thread-safe LRU cache for search pages (process-local).
+
+    Entries expire after ttl_seconds, which bounds staleness for writes made
+    by other processes; writes through this repository clear it immediately.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 30.0, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Tuple, value: Any) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _normalize_text(value: Optional[str]) -> Optional[str]:
+    """NFC + collapsed whitespace; blank strings become None"""
+    if value is None:
+        return None
+    return " ".join(unicodedata.normalize("NFC", value).split()) or None
+
+
 class DocumentFilter:
-    """Filter parameters for document search"""
+    """
+    Filter parameters for document search
+
+    Text filters are normalized here (NFC, collapsed/stripped whitespace), so
+    the SQL parameters and the search cache key always see the same values.
+    """
 
     def __init__(
         self,
@@ -26,8 +130,8 @@ class DocumentFilter:
         limit: int = 20,
         offset: int = 0,
     ):
-        self.query = query
-        self.insurer = insurer
+        self.query = _normalize_text(query)
+        self.insurer = _normalize_text(insurer)
         self.amount_min = amount_min
         self.amount_max = amount_max
         self.limit = limit
@@ -37,8 +141,15 @@ class DocumentFilter:
 class DocumentRepository:
     """Repository for documents data access"""
 
-    def __init__(self, db_manager: PostgreSQLManager):
+    def __init__(self, db_manager: PostgreSQLManager, search_mode: Optional[str] = None):
         self.db_manager = db_manager
+        self.search_mode = search_mode or settings.DOCUMENT_SEARCH_MODE
+        if self.search_mode not in SEARCH_MODES:
+            raise ValueError(f"DOCUMENT_SEARCH_MODE must be one of {SEARCH_MODES}, got {self.search_mode!r}")
+        self._search_cache = SearchResultCache(
+            max_entries=settings.DOCUMENT_SEARCH_CACHE_SIZE,
+            ttl_seconds=settings.DOCUMENT_SEARCH_CACHE_TTL_SECONDS,
+        )
 
     def create(
         self,
@@ -108,6 +219,7 @@ class DocumentRepository:
 
             row = cursor.fetchone()
             conn.commit()
+            self._search_cache.clear()
 
             logger.info(f"Created document: {row['id']} - {policy_name}")
 
@@ -155,6 +267,88 @@ class DocumentRepository:
             if conn:
                 self.db_manager.return_connection(conn)
 
+    def _filter_conditions(
+        self, filter_params: DocumentFilter
+    ) -> Tuple[List[str], Dict[str, Any], Optional[str]]:
+        """
+        Build WHERE conditions shared by search and count.
+
+        Returns:
+            (conditions, params, relevance expression or None)
+        """
+        conditions = []
+        params = {}
+        relevance = None
+
+        # Full-text search
+        if filter_params.query:
+            if self.search_mode == "bigram":
+                tsquery = build_bigram_tsquery(filter_params.query)
+                if tsquery:
+                    conditions.append("search_bigrams @@ %(tsquery)s::tsquery")
+                    params["tsquery"] = tsquery
+                    relevance = "ts_rank(search_bigrams, %(tsquery)s::tsquery)"
+                else:
+                    # Punctuation-only query: nothing can match
+                    conditions.append("FALSE")
+            else:
+                conditions.append("search_vector @@ plainto_tsquery('simple', %(query)s)")
+                params["query"] = filter_params.query
+                relevance = "ts_rank(search_vector, plainto_tsquery('simple', %(query)s))"
+
+        # Insurer filter
+        if filter_params.insurer:
+            conditions.append("insurer = %(insurer)s")
+            params["insurer"] = filter_params.insurer
+
+        # Amount range filter (JSONB query)
+        if filter_params.amount_min is not None or filter_params.amount_max is not None:
+            amount_min = filter_params.amount_min or 0
+            amount_max = filter_params.amount_max or 999999999
+
+            conditions.append("""
+                EXISTS (
+                    SELECT 1
+                    FROM jsonb_array_elements(critical_data->'amounts') AS amt
+                    WHERE (amt->>'normalized_value')::bigint BETWEEN %(amount_min)s AND %(amount_max)s
+                )
+            """)
+            params["amount_min"] = amount_min
+            params["amount_max"] = amount_max
+
+        return conditions, params, relevance
+
+    def _matches_nothing(self, filter_params: DocumentFilter) -> bool:
+        """True when a bigram query has no searchable tokens (e.g. "?!")."""
+        return (
+            bool(filter_params.query)
+            and self.search_mode == "bigram"
+            and build_bigram_tsquery(filter_params.query) is None
+        )
+
+    def search_cache_key(self, filter_params: DocumentFilter) -> Tuple:
+        """Cache key for a filter (equivalent filters share a key)."""
+        if not filter_params.query:
+            query = ""
+        elif self.search_mode == "bigram":
+            query = build_bigram_tsquery(filter_params.query) or ""
+        else:
+            # plainto_tsquery('simple', ...) lowercases, so case does not change the results
+            query = filter_params.query.lower()
+
+        amounts = None
+        if filter_params.amount_min is not None or filter_params.amount_max is not None:
+            amounts = (filter_params.amount_min or 0, filter_params.amount_max or 999999999)
+
+        return (
+            self.search_mode,
+            query,
+            filter_params.insurer or "",
+            amounts,
+            filter_params.limit,
+            filter_params.offset,
+        )
+
     def search(self, filter_params: DocumentFilter) -> List[Dict[str, Any]]:
         """
         Search documents with filters.
@@ -165,39 +359,37 @@ class DocumentRepository:
         Returns:
             List of matching documents
         """
+        return self.search_with_total(filter_params)[0]
+
+    def search_with_total(self, filter_params: DocumentFilter) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Search documents and count all matches in one query.
+
+        The total comes from COUNT(*) OVER () on the same evaluation; only a page
+        past the last match needs a separate count. Results are cached by
+        normalized filter (see SearchResultCache).
+
+        Args:
+            filter_params: Search filters
+
+        Returns:
+            (page of matching documents, total matches)
+        """
+        if self._matches_nothing(filter_params):
+            return [], 0
+
+        cache_key = self.search_cache_key(filter_params)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            rows, total = cached
+            return [dict(row) for row in rows], total
+
         conn = None
         try:
             conn = self.db_manager.get_connection()
             cursor = conn.cursor(cursor_factory=RealDictCursor)
 
-            # Build WHERE conditions
-            conditions = []
-            params = {}
-
-            # Full-text search
-            if filter_params.query:
-                conditions.append("search_vector @@ plainto_tsquery('simple', %(query)s)")
-                params["query"] = filter_params.query
-
-            # Insurer filter
-            if filter_params.insurer:
-                conditions.append("insurer = %(insurer)s")
-                params["insurer"] = filter_params.insurer
-
-            # Amount range filter (JSONB query)
-            if filter_params.amount_min is not None or filter_params.amount_max is not None:
-                amount_min = filter_params.amount_min or 0
-                amount_max = filter_params.amount_max or 999999999
-
-                conditions.append("""
-                    EXISTS (
-                        SELECT 1
-                        FROM jsonb_array_elements(critical_data->'amounts') AS amt
-                        WHERE (amt->>'normalized_value')::bigint BETWEEN %(amount_min)s AND %(amount_max)s
-                    )
-                """)
-                params["amount_min"] = amount_min
-                params["amount_max"] = amount_max
+            conditions, params, relevance = self._filter_conditions(filter_params)
 
             # Build final query
             where_clause = " AND ".join(conditions) if conditions else "TRUE"
@@ -209,16 +401,11 @@ class DocumentRepository:
                     total_subclauses, total_amounts, total_periods, total_kcd_codes,
                     created_at, updated_at,
                     -- Include relevance score if text search
-                    {
-                        "ts_rank(search_vector, plainto_tsquery('simple', %(query)s)) AS relevance"
-                        if filter_params.query else "0 AS relevance"
-                    }
+                    {f"{relevance} AS relevance" if relevance else "0 AS relevance"},
+                    COUNT(*) OVER () AS total_count
                 FROM documents
                 WHERE {where_clause}
-                ORDER BY {
-                    "relevance DESC, created_at DESC"
-                    if filter_params.query else "created_at DESC"
-                }
+                ORDER BY {"relevance DESC, created_at DESC" if relevance else "created_at DESC"}
                 LIMIT %(limit)s OFFSET %(offset)s
             """
 
@@ -226,9 +413,7 @@ class DocumentRepository:
             params["offset"] = filter_params.offset
 
             cursor.execute(query, params)
-            rows = cursor.fetchall()
-
-            return [dict(row) for row in rows]
+            rows = [dict(row) for row in cursor.fetchall()]
 
         except Exception as e:
             logger.error(f"Failed to search documents: {e}")
@@ -238,6 +423,18 @@ class DocumentRepository:
             if conn:
                 self.db_manager.return_connection(conn)
 
+        if rows:
+            total = rows[0]["total_count"]
+            for row in rows:
+                del row["total_count"]
+        elif filter_params.offset > 0:
+            total = self.count(filter_params)
+        else:
+            total = 0
+
+        self._search_cache.set(cache_key, (rows, total))
+        return [dict(row) for row in rows], total
+
     def get_full_document(self, document_id: UUID) -> Optional[Dict[str, Any]]:
         """
         Get document with full_text and JSONB fields.
@@ -299,31 +496,7 @@ class DocumentRepository:
                 cursor.execute(query)
             else:
                 # Build WHERE conditions (same as search)
-                conditions = []
-                params = {}
-
-                if filter_params.query:
-                    conditions.append("search_vector @@ plainto_tsquery('simple', %(query)s)")
-                    params["query"] = filter_params.query
-
-                if filter_params.insurer:
-                    conditions.append("insurer = %(insurer)s")
-                    params["insurer"] = filter_params.insurer
-
-                if filter_params.amount_min is not None or filter_params.amount_max is not None:
-                    amount_min = filter_params.amount_min or 0
-                    amount_max = filter_params.amount_max or 999999999
-
-                    conditions.append("""
-                        EXISTS (
-                            SELECT 1
-                            FROM jsonb_array_elements(critical_data->'amounts') AS amt
-                            WHERE (amt->>'normalized_value')::bigint BETWEEN %(amount_min)s AND %(amount_max)s
-                        )
-                    """)
-                    params["amount_min"] = amount_min
-                    params["amount_max"] = amount_max
-
+                conditions, params, _ = self._filter_conditions(filter_params)
                 where_clause = " AND ".join(conditions) if conditions else "TRUE"
                 query = f"SELECT COUNT(*) FROM documents WHERE {where_clause}"
                 cursor.execute(query, params)
@@ -359,6 +532,8 @@ class DocumentRepository:
 
             deleted = cursor.rowcount > 0
             conn.commit()
+            if deleted:
+                self._search_cache.clear()
 
             if deleted:
                 logger.info(f"Deleted document: {document_id}")
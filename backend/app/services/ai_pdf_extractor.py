@@ -8,7 +8,6 @@ import json
 from typing import List, Dict, Optional
 from bs4 import BeautifulSoup
 from loguru import logger
-from openai import AsyncOpenAI
 
 from app.core.config import settings
 
@@ -18,6 +17,8 @@ class AIPdfExtractor:
 
     def __init__(self):
         """Initialize AI PDF Extractor"""
+        from openai import AsyncOpenAI
+
         self.client = AsyncOpenAI(
             api_key=settings.OPENAI_API_KEY,
             base_url=getattr(settings, "OPENAI_BASE_URL", None)
@@ -10,6 +10,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import AsyncSessionLocal
+from app.services.document_events import DocumentEventListener
 
 
 class AutoEmbeddingService:
@@ -22,32 +23,46 @@ class AutoEmbeddingService:
         self.overlap = 50  # 청크 오버랩 (토큰)
 
     async def get_completed_documents_without_embedding(
-        self, limit: Optional[int] = None
+        self,
+        limit: Optional[int] = None,
+        document_ids: Optional[List[str]] = None
     ) -> List[Dict]:
         """
         임베딩이 없는 완료 문서 조회
 
         Args:
             limit: 조회할 최대 문서 수
+            document_ids: 지정 시 해당 문서들만 확인 (완료 이벤트로 받은 id)
 
         Returns:
             문서 목록
         """
         async with AsyncSessionLocal() as db:
-            query = text("""
+            conditions = [
+                "status = 'completed'",
+                "(processing_detail IS NULL OR processing_detail NOT LIKE '%embedding_created%')",
+            ]
+            params = {}
+
+            if document_ids:
+                conditions.append("id = ANY(:document_ids)")
+                params["document_ids"] = list(document_ids)
+
+            limit_clause = ""
+            if limit:
+                limit_clause = "LIMIT :limit"
+                params["limit"] = limit
+
+            query = text(f"""
                 SELECT id, title, insurer, product_type,
                        processing_detail, created_at, updated_at
                 FROM crawler_documents
-                WHERE status = 'completed'
-                  AND (processing_detail IS NULL
-                       OR processing_detail NOT LIKE '%embedding_created%')
+                WHERE {' AND '.join(conditions)}
                 ORDER BY updated_at DESC
+                {limit_clause}
             """)
 
-            if limit:
-                query = text(str(query) + f" LIMIT {limit}")
-
-            result = await db.execute(query)
+            result = await db.execute(query, params)
             rows = result.fetchall()
 
             return [
@@ -208,17 +223,25 @@ class AutoEmbeddingService:
             logger.error(f"[{document_id[:8]}] ❌ Embedding failed: {e}")
             return False
 
-    async def process_batch(self, limit: Optional[int] = None) -> Dict[str, int]:
+    async def process_batch(
+        self,
+        limit: Optional[int] = None,
+        document_ids: Optional[List[str]] = None
+    ) -> Dict[str, int]:
         """
         임베딩이 없는 완료 문서를 배치 처리
 
         Args:
             limit: 처리할 최대 문서 수
+            document_ids: 지정 시 해당 문서들만 처리
 
         Returns:
             처리 결과 통계
         """
-        documents = await self.get_completed_documents_without_embedding(limit=limit)
+        documents = await self.get_completed_documents_without_embedding(
+            limit=limit,
+            document_ids=document_ids
+        )
 
         if not documents:
             logger.info("No documents need embedding")
@@ -249,30 +272,51 @@ async def auto_embedding_worker(check_interval: int = 60):
     """
     자동 임베딩 워커
 
+    completed 전이 알림을 받으면 해당 문서만 처리하고,
+    알림이 없거나 유실되었을 수 있을 때는 폴링으로 누락 문서를 처리합니다.
+
     Args:
-        check_interval: 체크 간격 (초)
+        check_interval: 폴백 폴링 간격 (초, 알림을 받는 중에는 더 길게 대기)
     """
     service = AutoEmbeddingService()
+    listener = DocumentEventListener(statuses={"completed"})
 
     logger.info("=" * 80)
     logger.info("🧠 Auto Embedding Worker Started")
     logger.info(f"  - Check Interval: {check_interval}s")
     logger.info("=" * 80)
 
-    while True:
-        try:
-            result = await service.process_batch(limit=10)
-
-            if result["total"] == 0:
-                logger.info("💤 No documents need embedding. Waiting...")
-            else:
-                logger.info(f"📊 Processed: {result['success']} success, {result['failed']} failed")
-
-            await asyncio.sleep(check_interval)
-
-        except Exception as e:
-            logger.error(f"❌ Worker error: {e}", exc_info=True)
-            await asyncio.sleep(check_interval)
+    await listener.start()
+    # 시작 시 한 번은 전체 확인 (워커가 내려가 있던 동안의 완료 문서)
+    events = []
+    try:
+        while True:
+            try:
+                if events:
+                    result = await service.process_batch(
+                        document_ids=[event.document_id for event in events]
+                    )
+                else:
+                    result = await service.process_batch(limit=10)
+
+                if result["total"] == 0:
+                    logger.info("💤 No documents need embedding. Waiting...")
+                else:
+                    logger.info(f"📊 Processed: {result['success']} success, {result['failed']} failed")
+
+                # 폴링 배치가 모두 성공했으면 남은 문서가 있을 수 있으므로 바로 다음 배치
+                # (실패 문서가 섞이면 같은 문서를 반복 조회하지 않도록 대기)
+                if not events and result["success"] >= 10:
+                    continue
+
+                events = await listener.wait(timeout=listener.poll_timeout(check_interval))
+
+            except Exception as e:
+                logger.error(f"❌ Worker error: {e}", exc_info=True)
+                events = []
+                await asyncio.sleep(check_interval)
+    finally:
+        await listener.stop()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,193 @@
+"""
+Dashboard Rollup
+
+FP 대시보드 카운터(총/활성/이전 활성/신규 고객, 총 계약, 보장 유형별 분포)를 계산/조회합니다.
+
+- 집계: customers/customer_policies를 FILTER 집계 단일 쿼리로 한 번에 계산
+- 롤업: fp_dashboard_rollups (FP당 1행, PK 조회). 고객/계약 변경은 트리거가 증분 반영
+  (alembic/versions/011_add_fp_dashboard_rollups.sql)
+- 신선도: 기간(window)은 window_end 기준으로 고정되므로, computed_at이
+  DASHBOARD_ROLLUP_MAX_AGE_SECONDS를 넘었거나 needs_refresh(고객 삭제/이관)면 다시 집계
+"""
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+
+_AGGREGATE_SQL = """
+    WITH cust AS (
+        SELECT
+            COUNT(*) AS total_customers,
+            COUNT(*) FILTER (WHERE last_contact_date >= :window_start) AS active_customers,
+            COUNT(*) FILTER (
+                WHERE last_contact_date >= :prev_window_start AND last_contact_date < :window_start
+            ) AS prev_active_customers,
+            COUNT(*) FILTER (WHERE created_at >= :window_start) AS new_customers
+        FROM customers
+        WHERE fp_user_id = :fp_user_id
+    ),
+    pol AS (
+        SELECT
+            COALESCE(cp.policy_type, '기타') AS policy_type,
+            COUNT(*) AS count,
+            COALESCE(SUM(cp.coverage_amount), 0) AS total_amount
+        FROM customer_policies cp
+        JOIN customers c ON c.id = cp.customer_id
+        WHERE c.fp_user_id = :fp_user_id
+        GROUP BY 1
+    )
+    SELECT
+        cust.*,
+        (SELECT COALESCE(SUM(count), 0) FROM pol) AS total_policies,
+        (SELECT COALESCE(
+            jsonb_object_agg(policy_type, jsonb_build_object('count', count, 'total_amount', total_amount)),
+            '{}'::jsonb
+        ) FROM pol) AS coverage
+    FROM cust
+"""
+
+_REFRESH_SQL = f"""
+    INSERT INTO fp_dashboard_rollups (
+        fp_user_id, total_customers, active_customers, prev_active_customers, new_customers,
+        total_policies, coverage, window_end, window_days, computed_at, updated_at, needs_refresh
+    )
+    SELECT
+        CAST(:fp_user_id AS UUID), agg.total_customers, agg.active_customers,
+        agg.prev_active_customers, agg.new_customers, agg.total_policies, agg.coverage,
+        CAST(:window_end AS TIMESTAMP), CAST(:window_days AS INTEGER),
+        CAST(:window_end AS TIMESTAMP), CAST(:window_end AS TIMESTAMP), false
+    FROM ({_AGGREGATE_SQL}) agg
+    ON CONFLICT (fp_user_id) DO UPDATE SET
+        total_customers = EXCLUDED.total_customers,
+        active_customers = EXCLUDED.active_customers,
+        prev_active_customers = EXCLUDED.prev_active_customers,
+        new_customers = EXCLUDED.new_customers,
+        total_policies = EXCLUDED.total_policies,
+        coverage = EXCLUDED.coverage,
+        window_end = EXCLUDED.window_end,
+        window_days = EXCLUDED.window_days,
+        computed_at = EXCLUDED.computed_at,
+        updated_at = EXCLUDED.updated_at,
+        needs_refresh = false
+    RETURNING *
+"""
+
+_SELECT_ROLLUP_SQL = "SELECT * FROM fp_dashboard_rollups WHERE fp_user_id = :fp_user_id"
+
+
+@dataclass
+class DashboardCounters:
+    """FP 대시보드 카운터"""
+    total_customers: int
+    active_customers: int
+    prev_active_customers: int
+    new_customers: int
+    total_policies: int
+    coverage: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    window_start: Optional[datetime] = None
+    window_end: Optional[datetime] = None
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any], window_days: int) -> "DashboardCounters":
+        """집계/롤업 행 → DashboardCounters (asyncpg는 JSONB를 문자열로 반환)"""
+        coverage = row["coverage"] or {}
+        if isinstance(coverage, str):
+            coverage = json.loads(coverage)
+
+        window_end = row.get("window_end")
+        return cls(
+            total_customers=int(row["total_customers"]),
+            active_customers=int(row["active_customers"]),
+            prev_active_customers=int(row["prev_active_customers"]),
+            new_customers=int(row["new_customers"]),
+            total_policies=int(row["total_policies"]),
+            coverage=coverage,
+            window_start=window_end - timedelta(days=window_days) if window_end else None,
+            window_end=window_end,
+        )
+
+    def coverage_breakdown(self) -> List[Tuple[str, int, float]]:
+        """(보장 유형, 계약 수, 총 보장금액) 목록, 계약 수 내림차순"""
+        items = [
+            (policy_type, int(values["count"]), float(values["total_amount"]))
+            for policy_type, values in self.coverage.items()
+            if int(values["count"]) > 0
+        ]
+        return sorted(items, key=lambda item: (-item[1], item[0]))
+
+
+def window_params(now: datetime, window_days: int) -> Dict[str, Any]:
+    """now 기준 현재/이전 기간 경계"""
+    window = timedelta(days=window_days)
+    return {
+        "window_end": now,
+        "window_days": window_days,
+        "window_start": now - window,
+        "prev_window_start": now - 2 * window,
+    }
+
+
+def is_fresh(row: Mapping[str, Any], now: datetime, max_age_seconds: int, window_days: int) -> bool:
+    """롤업 행을 그대로 사용할 수 있는지"""
+    if row["needs_refresh"] or row["window_days"] != window_days:
+        return False
+    return now - row["computed_at"] <= timedelta(seconds=max_age_seconds)
+
+
+class DashboardRollupService:
+    """FP 대시보드 카운터 조회 (롤업 우선, 오래되면 재집계)"""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        enabled: Optional[bool] = None,
+        max_age_seconds: Optional[int] = None,
+        window_days: Optional[int] = None,
+    ):
+        self.db = db
+        self.enabled = settings.DASHBOARD_ROLLUP_ENABLED if enabled is None else enabled
+        self.max_age_seconds = (
+            settings.DASHBOARD_ROLLUP_MAX_AGE_SECONDS if max_age_seconds is None else max_age_seconds
+        )
+        self.window_days = settings.DASHBOARD_WINDOW_DAYS if window_days is None else window_days
+
+    async def get_counters(self, fp_user_id: UUID, now: Optional[datetime] = None) -> DashboardCounters:
+        """
+        대시보드 카운터 조회
+
+        롤업이 신선하면 PK 조회 1회, 아니면 집계 + upsert 1회 (롤업 비활성 시 집계 1회)
+        """
+        now = now or datetime.utcnow()
+
+        if not self.enabled:
+            return await self.compute(fp_user_id, now)
+
+        result = await self.db.execute(text(_SELECT_ROLLUP_SQL), {"fp_user_id": fp_user_id})
+        row = result.fetchone()
+        if row is not None and is_fresh(row._mapping, now, self.max_age_seconds, self.window_days):
+            return DashboardCounters.from_row(row._mapping, self.window_days)
+
+        return await self.refresh(fp_user_id, now)
+
+    async def compute(self, fp_user_id: UUID, now: datetime) -> DashboardCounters:
+        """집계 쿼리만 실행 (롤업 테이블 미사용)"""
+        params = {"fp_user_id": fp_user_id, **window_params(now, self.window_days)}
+        result = await self.db.execute(text(_AGGREGATE_SQL), params)
+        row = dict(result.fetchone()._mapping)
+        row["window_end"] = now
+        return DashboardCounters.from_row(row, self.window_days)
+
+    async def refresh(self, fp_user_id: UUID, now: datetime) -> DashboardCounters:
+        """집계 결과로 롤업 행을 다시 쓰고 반환"""
+        params = {"fp_user_id": fp_user_id, **window_params(now, self.window_days)}
+        result = await self.db.execute(text(_REFRESH_SQL), params)
+        row = result.fetchone()
+        await self.db.commit()
+        return DashboardCounters.from_row(row._mapping, self.window_days)
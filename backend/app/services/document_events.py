@@ -0,0 +1,205 @@
+"""
+Document Events
+
+crawler_documents 상태 변경 이벤트 버스 (PostgreSQL LISTEN/NOTIFY).
+
+상태 전이 트리거(alembic/versions/008)가 문서 id를 담은 NOTIFY를 보내고,
+워커는 고정 주기 폴링 대신 알림을 기다립니다.
+알림 연결이 끊기거나 설정이 비활성화되면 주기 폴링으로 자동 폴백합니다.
+
+사용 예:
+    async with DocumentEventListener(statuses={"completed"}) as listener:
+        while running:
+            events = await listener.wait(timeout=listener.poll_timeout(check_interval))
+            if events:
+                ...  # 변경된 문서만 처리
+            else:
+                ...  # 폴백 폴링
+"""
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional
+
+import asyncpg
+from loguru import logger
+
+from app.core.config import settings
+
+
+DOCUMENT_EVENTS_CHANNEL = "crawler_document_events"
+
+
+@dataclass(frozen=True)
+class DocumentEvent:
+    """문서 상태 전이 이벤트"""
+
+    document_id: str
+    status: str
+    previous_status: Optional[str] = None
+    insurer: Optional[str] = None
+
+    @classmethod
+    def from_payload(cls, payload: str) -> Optional["DocumentEvent"]:
+        """NOTIFY payload(JSON) 파싱 (형식이 잘못되면 None)"""
+        try:
+            data = json.loads(payload)
+            return cls(
+                document_id=str(data["id"]),
+                status=data["status"],
+                previous_status=data.get("previous_status"),
+                insurer=data.get("insurer"),
+            )
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Invalid document event payload: {payload[:200]}")
+            return None
+
+
+class DocumentEventListener:
+    """
+    crawler_documents 상태 이벤트 구독자
+
+    전용 asyncpg 연결에서 LISTEN 하며, 대기 중인 이벤트는 문서 id 기준으로 합쳐지므로
+    (같은 문서의 최신 이벤트만 유지) 메모리는 변경된 문서 수에 비례합니다.
+    """
+
+    def __init__(
+        self,
+        statuses: Optional[Iterable[str]] = None,
+        include_previous: bool = False,
+        channel: str = DOCUMENT_EVENTS_CHANNEL,
+        dsn: Optional[str] = None,
+        debounce_seconds: Optional[float] = None,
+        enabled: Optional[bool] = None,
+        connect: Callable = asyncpg.connect,
+    ):
+        """
+        Args:
+            statuses: 관심 있는 상태 (None이면 전체)
+            include_previous: True이면 이전 상태가 statuses인 전이도 포함 (예: completed → pending)
+            channel: NOTIFY 채널명
+            dsn: PostgreSQL 접속 URL (기본값: settings.database_url)
+            debounce_seconds: 첫 이벤트 후 추가 이벤트를 모으는 시간
+                (기본값: settings.DOCUMENT_EVENTS_DEBOUNCE_SECONDS)
+            enabled: 이벤트 사용 여부 (기본값: settings.DOCUMENT_EVENTS_ENABLED)
+            connect: asyncpg 연결 함수
+        """
+        self.statuses = set(statuses) if statuses else None
+        self.include_previous = include_previous
+        self.channel = channel
+        self.dsn = dsn or settings.database_url
+        self.debounce_seconds = (
+            debounce_seconds
+            if debounce_seconds is not None
+            else settings.DOCUMENT_EVENTS_DEBOUNCE_SECONDS
+        )
+        self.enabled = settings.DOCUMENT_EVENTS_ENABLED if enabled is None else enabled
+        self._connect = connect
+
+        self._connection = None
+        self._pending: Dict[str, DocumentEvent] = {}
+        self._signal = asyncio.Event()
+        self._needs_resync = False
+
+    @property
+    def connected(self) -> bool:
+        return self._connection is not None and not self._connection.is_closed()
+
+    def poll_timeout(self, check_interval: float) -> float:
+        """
+        다음 폴백 폴링까지 대기 시간
+
+        알림을 받는 중이면 폴링은 안전망일 뿐이므로 훨씬 길게 기다립니다.
+        """
+        if self.connected:
+            return max(check_interval, settings.DOCUMENT_EVENTS_FALLBACK_POLL_SECONDS)
+        return check_interval
+
+    async def start(self) -> bool:
+        """LISTEN 시작 (실패 시 False, 폴링 모드로 동작)"""
+        if not self.enabled:
+            return False
+        try:
+            self._connection = await self._connect(self.dsn)
+            await self._connection.add_listener(self.channel, self._on_notify)
+            self._connection.add_termination_listener(self._on_terminated)
+            logger.info(f"Listening for document events on '{self.channel}'")
+            return True
+        except Exception as e:
+            logger.warning(f"Document event listener unavailable, falling back to polling: {e}")
+            self._connection = None
+            return False
+
+    async def stop(self) -> None:
+        if self._connection is not None and not self._connection.is_closed():
+            try:
+                await self._connection.remove_listener(self.channel, self._on_notify)
+            finally:
+                await self._connection.close()
+        self._connection = None
+
+    async def __aenter__(self) -> "DocumentEventListener":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop()
+
+    def wake(self) -> None:
+        """대기 중인 wait()을 즉시 반환시킴 (종료 시그널 처리용)"""
+        self._signal.set()
+
+    def _matches(self, event: DocumentEvent) -> bool:
+        if self.statuses is None:
+            return True
+        if event.status in self.statuses:
+            return True
+        return self.include_previous and event.previous_status in self.statuses
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        event = DocumentEvent.from_payload(payload)
+        if event is None or not self._matches(event):
+            return
+        self._pending[event.document_id] = event
+        self._signal.set()
+
+    def _on_terminated(self, connection) -> None:
+        logger.warning("Document event connection lost; will reconnect and resync")
+        self._connection = None
+        self._needs_resync = True
+        self._signal.set()
+
+    async def wait(self, timeout: float) -> List[DocumentEvent]:
+        """
+        이벤트 대기
+
+        Returns:
+            변경된 문서 이벤트 목록.
+            빈 목록이면 타임아웃 또는 재연결(알림 유실 가능)이므로 호출자는 폴백 폴링을 수행합니다.
+        """
+        if self.enabled and not self.connected:
+            # 끊긴 동안의 알림은 유실되었으므로 재연결 후 한 번 전체 확인
+            if await self.start():
+                self._needs_resync = True
+
+        if self._needs_resync:
+            self._needs_resync = False
+            return []
+
+        if not self._pending:
+            try:
+                await asyncio.wait_for(self._signal.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                return []
+            if self._needs_resync:
+                self._needs_resync = False
+                self._signal.clear()
+                return []
+            if self.debounce_seconds > 0:
+                # 배치 처리로 연속 전이되는 문서들을 한 번에 모음
+                await asyncio.sleep(self.debounce_seconds)
+
+        events = list(self._pending.values())
+        self._pending.clear()
+        self._signal.clear()
+        return events
@@ -0,0 +1,248 @@
+"""
+Document Job Queue
+
+crawler_documents 기반 lease 방식 작업 큐.
+
+여러 머신/프로세스의 ParallelDocumentProcessor가 같은 테이블을 안전하게 나눠 처리하도록
+`FOR UPDATE SKIP LOCKED`로 소량 배치를 선점(claim)합니다.
+
+- claim: pending 문서 또는 lease가 만료된 processing 문서를 원자적으로 선점
+- heartbeat: 처리 중인 문서의 lease 연장 (워커가 살아있음을 표시)
+- release: 처리 종료 후 lease 해제
+- release_all: 종료 시 아직 시작하지 않은 선점 문서를 pending으로 반환
+  (시작 여부는 mark_started로 프로세스 메모리에 기록, 단계 진행은 Redis에만 있음)
+- 워커가 죽으면 lease가 만료되어 다른 워커가 재선점 (max_attempts 초과 시 failed)
+"""
+import asyncio
+import os
+import socket
+import uuid
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Set
+
+from loguru import logger
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+
+
+@dataclass
+class DocumentJob:
+    """선점된 처리 대상 문서"""
+
+    document_id: str
+    pdf_url: str
+    insurer: str
+    product_type: Optional[str]
+    product_name: str
+    attempts: int = 1
+
+
+def default_worker_id() -> str:
+    """호스트명:PID:랜덤 (lease 소유자 식별자)"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+_CLAIM_SQL = """
+    UPDATE crawler_documents AS d
+    SET status = 'processing',
+        processing_step = 'queued',
+        lease_owner = :owner,
+        lease_expires_at = NOW() + make_interval(secs => :lease_seconds),
+        attempts = COALESCE(d.attempts, 0) + 1,
+        updated_at = NOW()
+    WHERE d.id IN (
+        SELECT id
+        FROM crawler_documents
+        WHERE (
+            status = 'pending'
+            OR (
+                status = 'processing'
+                AND lease_expires_at < NOW()
+                AND COALESCE(attempts, 0) < :max_attempts
+            )
+        )
+        {insurer_filter}
+        ORDER BY created_at
+        LIMIT :batch_size
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING d.id, d.pdf_url, d.insurer, d.product_type, d.title, d.attempts
+"""
+
+
+class DocumentJobClaimer:
+    """
+    crawler_documents lease 관리자
+
+    한 프로세스(워커) 당 하나의 owner id를 사용하며,
+    heartbeat 한 번으로 해당 워커가 보유한 모든 lease를 연장합니다.
+    """
+
+    def __init__(
+        self,
+        worker_id: Optional[str] = None,
+        lease_seconds: Optional[float] = None,
+        heartbeat_interval: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        session_factory: Callable = AsyncSessionLocal,
+    ):
+        """
+        Args:
+            worker_id: lease 소유자 식별자 (기본값: 호스트명:PID:랜덤)
+            lease_seconds: lease 유효 시간 (기본값: settings.DOCUMENT_LEASE_SECONDS)
+            heartbeat_interval: lease 연장 주기 (기본값: settings.DOCUMENT_HEARTBEAT_INTERVAL)
+            max_attempts: 만료 lease 재선점 최대 횟수 (기본값: settings.DOCUMENT_MAX_ATTEMPTS)
+            session_factory: AsyncSession 팩토리
+        """
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = float(lease_seconds or settings.DOCUMENT_LEASE_SECONDS)
+        self.heartbeat_interval = float(
+            heartbeat_interval or settings.DOCUMENT_HEARTBEAT_INTERVAL
+        )
+        self.max_attempts = max_attempts or settings.DOCUMENT_MAX_ATTEMPTS
+        self.session_factory = session_factory
+        # 처리를 시작했고 아직 release하지 않은 문서 (release_all 대상에서 제외)
+        self._started: Set[str] = set()
+
+    def mark_started(self, document_id: str) -> None:
+        """선점 문서의 처리 시작 기록"""
+        self._started.add(document_id)
+
+    async def claim(self, batch_size: int, insurer: Optional[str] = None) -> List[DocumentJob]:
+        """
+        처리할 문서를 최대 batch_size개 선점
+
+        다른 워커가 잠근 행은 건너뛰므로(SKIP LOCKED) 대기 없이 서로 다른 문서를 받습니다.
+        """
+        if batch_size <= 0:
+            return []
+
+        params = {
+            "owner": self.worker_id,
+            "lease_seconds": self.lease_seconds,
+            "max_attempts": self.max_attempts,
+            "batch_size": batch_size,
+        }
+        insurer_filter = ""
+        if insurer:
+            insurer_filter = "AND insurer = :insurer"
+            params["insurer"] = insurer
+
+        async with self.session_factory() as db:
+            result = await db.execute(
+                text(_CLAIM_SQL.format(insurer_filter=insurer_filter)), params
+            )
+            rows = result.fetchall()
+            await db.commit()
+
+        jobs = [
+            DocumentJob(
+                document_id=str(row[0]),
+                pdf_url=row[1],
+                insurer=row[2],
+                product_type=row[3],
+                product_name=row[4],
+                attempts=row[5] or 1,
+            )
+            for row in rows
+        ]
+        if jobs:
+            logger.debug(f"[{self.worker_id}] Claimed {len(jobs)} documents")
+        return jobs
+
+    async def heartbeat(self) -> int:
+        """이 워커가 보유한 processing 문서들의 lease 연장"""
+        async with self.session_factory() as db:
+            result = await db.execute(
+                text("""
+                    UPDATE crawler_documents
+                    SET lease_expires_at = NOW() + make_interval(secs => :lease_seconds)
+                    WHERE lease_owner = :owner AND status = 'processing'
+                """),
+                {"owner": self.worker_id, "lease_seconds": self.lease_seconds},
+            )
+            await db.commit()
+        return result.rowcount or 0
+
+    async def release(self, document_id: str) -> None:
+        """처리 종료 후 lease 해제 (다른 워커가 재선점한 경우는 건드리지 않음)"""
+        self._started.discard(document_id)
+        async with self.session_factory() as db:
+            await db.execute(
+                text("""
+                    UPDATE crawler_documents
+                    SET lease_owner = NULL,
+                        lease_expires_at = NULL
+                    WHERE id = :id AND lease_owner = :owner
+                """),
+                {"id": document_id, "owner": self.worker_id},
+            )
+            await db.commit()
+
+    async def release_all(self) -> int:
+        """
+        종료 시 아직 시작하지 못한 선점 문서를 pending으로 반환
+
+        정상 종료(취소 포함)에서는 lease 만료를 기다리지 않고 즉시 다른 워커가 가져갈 수 있습니다.
+        처리 도중 중단된 문서(mark_started 후 release 전)는 Postgres의 processing_step이
+        'queued'로 남아 있어도 반환하지 않으며, lease 만료 후 시도 횟수에 포함되어 재선점됩니다.
+        """
+        async with self.session_factory() as db:
+            result = await db.execute(
+                text("""
+                    UPDATE crawler_documents
+                    SET status = 'pending',
+                        processing_step = NULL,
+                        lease_owner = NULL,
+                        lease_expires_at = NULL,
+                        attempts = GREATEST(COALESCE(attempts, 1) - 1, 0)
+                    WHERE lease_owner = :owner
+                      AND status = 'processing'
+                      AND processing_step = 'queued'
+                      AND NOT (id = ANY(:started))
+                """),
+                {"owner": self.worker_id, "started": sorted(self._started)},
+            )
+            await db.commit()
+        return result.rowcount or 0
+
+    async def fail_exhausted(self) -> int:
+        """재시도 횟수를 초과했는데 lease가 만료된 문서를 failed로 정리"""
+        async with self.session_factory() as db:
+            result = await db.execute(
+                text("""
+                    UPDATE crawler_documents
+                    SET status = 'failed',
+                        error_message = 'lease expired after max attempts',
+                        lease_owner = NULL,
+                        lease_expires_at = NULL,
+                        updated_at = NOW()
+                    WHERE status = 'processing'
+                      AND lease_expires_at < NOW()
+                      AND COALESCE(attempts, 0) >= :max_attempts
+                """),
+                {"max_attempts": self.max_attempts},
+            )
+            await db.commit()
+        count = result.rowcount or 0
+        if count:
+            logger.warning(f"Marked {count} documents as failed after {self.max_attempts} attempts")
+        return count
+
+    async def run_heartbeat(self, stop: asyncio.Event) -> None:
+        """stop 이벤트가 설정될 때까지 주기적으로 lease 연장"""
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=self.heartbeat_interval)
+            except asyncio.TimeoutError:
+                pass
+            if stop.is_set():
+                break
+            try:
+                extended = await self.heartbeat()
+                logger.debug(f"[{self.worker_id}] Heartbeat extended {extended} leases")
+            except Exception as e:
+                # heartbeat 실패는 치명적이지 않음 (다음 주기에 재시도, lease는 여유가 있음)
+                logger.warning(f"[{self.worker_id}] Heartbeat failed: {e}")
@@ -0,0 +1,315 @@
+"""
+Document Progress
+
+문서 처리 진행 상황 채널.
+
+- 진행 중 상태는 Redis 해시(doc_progress:{id})에 기록하고 pub/sub로 알립니다.
+- 문서별로 최소 간격(PROGRESS_MIN_INTERVAL_MS) 안의 연속 업데이트는 마지막 값 하나로 합칩니다.
+- 최종 상태(completed/failed)만 PostgreSQL crawler_documents에 한 번 기록합니다.
+- Redis를 사용할 수 없으면 (합쳐진) 진행 상태를 PostgreSQL에 기록해 기존 폴링이 계속 동작합니다.
+"""
+import asyncio
+import contextlib
+import json
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional
+
+from loguru import logger
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+
+
+PROGRESS_KEY_PREFIX = "doc_progress:"
+PROGRESS_ACTIVE_KEY = "doc_progress:active"
+PROGRESS_CHANNEL = "doc_progress:events"
+
+TERMINAL_STATUSES = frozenset({"completed", "failed"})
+
+
+class DocumentProgressChannel:
+    """
+    Redis 진행 상황 저장소 + pub/sub
+
+    Redis 장애 시 경고만 남기고 False/빈 값을 반환합니다.
+    """
+
+    def __init__(self, redis_url: Optional[str] = None, ttl_seconds: Optional[int] = None):
+        """
+        Args:
+            redis_url: Redis 연결 URL (None이면 settings.redis_url)
+            ttl_seconds: 진행 상태 TTL (기본값: settings.PROGRESS_TTL_SECONDS)
+        """
+        self.redis_url = redis_url
+        self.ttl_seconds = ttl_seconds or settings.PROGRESS_TTL_SECONDS
+        self._client = None
+
+    async def _get_client(self):
+        if self._client is None:
+            import redis.asyncio as redis
+
+            self._client = redis.from_url(
+                self.redis_url or settings.redis_url,
+                decode_responses=True,
+            )
+        return self._client
+
+    async def publish(self, state: Dict[str, Any]) -> bool:
+        """진행 상태 기록 + 구독자 알림 (한 번의 pipeline 왕복)"""
+        document_id = state["document_id"]
+        key = PROGRESS_KEY_PREFIX + document_id
+        payload = json.dumps(state, ensure_ascii=False, default=str)
+        try:
+            client = await self._get_client()
+            pipe = client.pipeline(transaction=False)
+            pipe.hset(key, mapping={"state": payload})
+            pipe.expire(key, self.ttl_seconds)
+            if state.get("status") in TERMINAL_STATUSES:
+                pipe.srem(PROGRESS_ACTIVE_KEY, document_id)
+            else:
+                pipe.sadd(PROGRESS_ACTIVE_KEY, document_id)
+            pipe.publish(PROGRESS_CHANNEL, payload)
+            await pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning(f"Progress publish failed for {document_id[:8]}: {e}")
+            return False
+
+    async def get_many(self, document_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """여러 문서의 현재 진행 상태 (Redis에 없는 문서는 제외)"""
+        document_ids = list(document_ids)
+        if not document_ids:
+            return {}
+        try:
+            client = await self._get_client()
+            pipe = client.pipeline(transaction=False)
+            for document_id in document_ids:
+                pipe.hget(PROGRESS_KEY_PREFIX + document_id, "state")
+            payloads = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"Progress lookup failed: {e}")
+            return {}
+        return {
+            document_id: json.loads(payload)
+            for document_id, payload in zip(document_ids, payloads)
+            if payload
+        }
+
+    async def active_ids(self) -> List[str]:
+        """처리 중인 문서 id"""
+        try:
+            client = await self._get_client()
+            return list(await client.smembers(PROGRESS_ACTIVE_KEY))
+        except Exception as e:
+            logger.warning(f"Progress active lookup failed: {e}")
+            return []
+
+    async def subscribe(self, heartbeat_seconds: float = 15.0) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        진행 상태 스트림
+
+        heartbeat_seconds 동안 메시지가 없으면 None을 내보냅니다 (SSE keep-alive용).
+        """
+        client = await self._get_client()
+        pubsub = client.pubsub()
+        await pubsub.subscribe(PROGRESS_CHANNEL)
+        try:
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=heartbeat_seconds
+                )
+                if message is None:
+                    yield None
+                    continue
+                try:
+                    yield json.loads(message["data"])
+                except (TypeError, ValueError):
+                    continue
+        finally:
+            await pubsub.unsubscribe(PROGRESS_CHANNEL)
+            await pubsub.close()
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+
+class DocumentProgressReporter:
+    """
+    문서 하나의 진행 상황 리포터
+
+    update()는 최소 간격 안에서 마지막 값만 남기고(trailing flush),
+    finish()는 대기 중인 값을 버리고 최종 상태를 Redis와 PostgreSQL에 기록합니다.
+    """
+
+    def __init__(
+        self,
+        document_id: str,
+        channel: Optional[DocumentProgressChannel] = None,
+        min_interval_ms: Optional[int] = None,
+        session_factory: Callable = AsyncSessionLocal,
+    ):
+        """
+        Args:
+            document_id: 문서 ID
+            channel: 진행 상황 채널 (기본값: get_progress_channel())
+            min_interval_ms: 문서별 최소 기록 간격 (기본값: settings.PROGRESS_MIN_INTERVAL_MS)
+            session_factory: AsyncSession 팩토리 (최종 상태/폴백 기록용)
+        """
+        self.document_id = document_id
+        self.channel = channel or get_progress_channel()
+        self.min_interval = (
+            min_interval_ms if min_interval_ms is not None else settings.PROGRESS_MIN_INTERVAL_MS
+        ) / 1000
+        self.session_factory = session_factory
+
+        self._latest: Optional[Dict[str, Any]] = None
+        self._written_version = 0
+        self._version = 0
+        self._last_write = 0.0
+        self._flush_task: Optional[asyncio.Task] = None
+        self._write_lock = asyncio.Lock()
+        self.writes = 0
+
+    def _state(self, status: str, step: str, progress: int, detail: Optional[Dict]) -> Dict[str, Any]:
+        return {
+            "document_id": self.document_id,
+            "status": status,
+            "processing_step": step,
+            "processing_progress": progress,
+            "processing_detail": detail,
+            "updated_at": datetime.utcnow().isoformat() + "Z",
+        }
+
+    async def update(self, step: str, progress: int, detail: Optional[Dict] = None) -> None:
+        """진행 상태 업데이트 (최소 간격 안의 연속 호출은 합쳐짐)"""
+        self._latest = self._state("processing", step, progress, detail)
+        self._version += 1
+
+        detail_msg = f" - {detail.get('message', '')}" if detail and 'message' in detail else ""
+        logger.info(f"[{self.document_id[:8]}] {step} ({progress}%){detail_msg}")
+
+        elapsed = time.monotonic() - self._last_write
+        if elapsed >= self.min_interval:
+            await self._flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._delayed_flush(self.min_interval - elapsed))
+
+    async def _delayed_flush(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await self._flush()
+
+    async def _flush(self) -> None:
+        async with self._write_lock:
+            if self._latest is None or self._written_version == self._version:
+                return
+            state, version = self._latest, self._version
+            self._last_write = time.monotonic()
+            if not await self.channel.publish(state):
+                await self._write_postgres(state, terminal=False)
+            self._written_version = version
+            self.writes += 1
+
+    async def finish(
+        self,
+        status: str,
+        step: Optional[str] = None,
+        progress: Optional[int] = None,
+        detail: Optional[Dict] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        최종 상태 기록 (PostgreSQL에는 이 한 번만 기록)
+
+        Args:
+            status: 'completed' 또는 'failed'
+            step/progress: 생략 시 마지막 진행 상태 유지
+            detail: 처리 상세
+            error: 실패 메시지 (error_message 컬럼)
+        """
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+            # 진행 중인 지연 flush가 최종 상태 뒤에 끼어들지 않도록 종료까지 대기
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flush_task
+        last = self._latest or {}
+        state = self._state(
+            status,
+            step or last.get("processing_step") or status,
+            progress if progress is not None else last.get("processing_progress", 0),
+            detail if detail is not None else last.get("processing_detail"),
+        )
+        self._latest = state
+        self._version += 1
+
+        async with self._write_lock:
+            await self._write_postgres(state, terminal=True, error=error)
+            await self.channel.publish(state)
+            self._written_version = self._version
+            self.writes += 1
+
+    async def _write_postgres(
+        self, state: Dict[str, Any], terminal: bool, error: Optional[str] = None
+    ) -> None:
+        detail = state["processing_detail"]
+        params = {
+            "id": self.document_id,
+            "step": state["processing_step"],
+            "progress": state["processing_progress"],
+            "detail": json.dumps(detail, ensure_ascii=False) if detail else None,
+        }
+        if terminal:
+            query = text("""
+                UPDATE crawler_documents
+                SET processing_step = :step,
+                    processing_progress = :progress,
+                    processing_detail = :detail,
+                    status = :status,
+                    error_message = COALESCE(:error, error_message),
+                    updated_at = NOW()
+                WHERE id = :id
+            """)
+            params.update({"status": state["status"], "error": error})
+        else:
+            query = text("""
+                UPDATE crawler_documents
+                SET processing_step = :step,
+                    processing_progress = :progress,
+                    processing_detail = :detail,
+                    updated_at = NOW()
+                WHERE id = :id
+            """)
+        try:
+            async with self.session_factory() as db:
+                await db.execute(query, params)
+                await db.commit()
+        except Exception as e:
+            if terminal:
+                raise
+            logger.warning(f"[{self.document_id[:8]}] Progress fallback write failed: {e}")
+
+
+def overlay_live_progress(row: Dict[str, Any], live: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """DB 행에 Redis 실시간 진행 상태를 덮어씀 (처리 중인 문서만)"""
+    if not live or row.get("status") != "processing":
+        return row
+    return {
+        **row,
+        "processing_step": live.get("processing_step"),
+        "processing_progress": live.get("processing_progress"),
+        "processing_detail": live.get("processing_detail"),
+    }
+
+
+_progress_channel: Optional[DocumentProgressChannel] = None
+
+
+def get_progress_channel() -> DocumentProgressChannel:
+    """DocumentProgressChannel 싱글톤"""
+    global _progress_channel
+    if _progress_channel is None:
+        _progress_channel = DocumentProgressChannel()
+    return _progress_channel
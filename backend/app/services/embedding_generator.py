@@ -7,7 +7,6 @@ Each article, paragraph, and subclause gets its own embedding for semantic searc
 from dataclasses import dataclass
 from typing import List, Optional
 import hashlib
-from openai import OpenAI
 from app.core.config import settings
 from app.services.legal_structure_parser import Article, Paragraph, Subclause
 
@@ -80,6 +79,8 @@ class EmbeddingGenerator:
         self.use_mock = use_mock or (self.api_key == "your-openai-api-key")
 
         if not self.use_mock:
+            from openai import OpenAI
+
             self.client = OpenAI(api_key=self.api_key)
         else:
             self.client = None
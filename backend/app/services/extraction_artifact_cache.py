@@ -0,0 +1,175 @@
+"""
+Extraction Artifact Cache
+
+PDF 텍스트 추출 / 구조 파싱 결과 영구 캐시.
+
+키 = 내용 SHA-256 + 추출기 이름 + 추출기 버전 (+ 옵션 해시).
+같은 PDF를 재처리(문서 reset, 재학습)할 때 추출/OCR/파싱 비용을 다시 지불하지 않습니다.
+추출 로직이 바뀌면 해당 추출기의 버전 상수를 올려 자연스럽게 무효화합니다.
+
+저장 구조:
+    {root}/ab/abcdef.../{extractor}@{version}[-{options}].json.gz
+"""
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from app.core.config import settings
+
+
+_SAFE_NAME_RE = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def sha256_text(text: str) -> str:
+    """텍스트 SHA-256 (구조 파싱 캐시 키)"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def sha256_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """파일 SHA-256 (청크 단위로 읽어 메모리 사용 최소화)"""
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def compute_page_offsets(page_texts: List[str], separator: str = "\n") -> List[int]:
+    """
+    페이지별 시작 오프셋 계산
+
+    추출 텍스트가 separator로 페이지를 이어 붙인 경우
+    offsets[i]는 i번째 페이지 텍스트의 시작 위치입니다.
+    """
+    offsets = []
+    position = 0
+    for text in page_texts:
+        offsets.append(position)
+        position += len(text) + len(separator)
+    return offsets
+
+
+class ExtractionArtifactCache:
+    """
+    추출 결과 영구 캐시 (gzip 압축 JSON)
+
+    프로세스/워커 간 공유되며 원자적 rename으로 기록합니다.
+    """
+
+    def __init__(self, root: Optional[str] = None, compress_level: int = 6):
+        """
+        Args:
+            root: 저장소 경로 (기본값: settings.EXTRACTION_CACHE_DIR)
+            compress_level: gzip 압축 레벨
+        """
+        self.root = Path(root or settings.EXTRACTION_CACHE_DIR)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.compress_level = compress_level
+        self.stats = {"hits": 0, "misses": 0, "writes": 0}
+
+    def _path(
+        self,
+        content_sha256: str,
+        extractor: str,
+        version: str,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Path:
+        name = f"{_SAFE_NAME_RE.sub('_', extractor)}@{_SAFE_NAME_RE.sub('_', str(version))}"
+        if options:
+            encoded = json.dumps(options, sort_keys=True, default=str)
+            name += "-" + hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:12]
+        return self.root / content_sha256[:2] / content_sha256 / f"{name}.json.gz"
+
+    def get(
+        self,
+        content_sha256: str,
+        extractor: str,
+        version: str,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 추출 결과 조회
+
+        Returns:
+            저장된 artifact 딕셔너리 또는 None
+        """
+        path = self._path(content_sha256, extractor, version, options)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                artifact = json.load(f)
+        except FileNotFoundError:
+            self.stats["misses"] += 1
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Corrupt extraction artifact {path}: {e}")
+            path.unlink(missing_ok=True)
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        logger.info(
+            f"Extraction cache hit: {extractor}@{version} for {content_sha256[:12]}"
+        )
+        return artifact
+
+    def put(
+        self,
+        content_sha256: str,
+        extractor: str,
+        version: str,
+        artifact: Dict[str, Any],
+        options: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """추출 결과 저장 (JSON 직렬화 가능한 값만)"""
+        path = self._path(content_sha256, extractor, version, options)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(
+                fileobj=raw, mode="wb", compresslevel=self.compress_level
+            ) as f:
+                f.write(json.dumps(artifact, ensure_ascii=False, default=str).encode("utf-8"))
+            os.replace(tmp, path)
+            self.stats["writes"] += 1
+        except Exception as e:
+            logger.warning(f"Failed to write extraction artifact {path}: {e}")
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+    def invalidate(self, content_sha256: str, extractor: Optional[str] = None) -> int:
+        """
+        특정 내용의 artifact 삭제
+
+        Args:
+            content_sha256: 내용 해시
+            extractor: 추출기 이름 (None이면 전체)
+        """
+        directory = self.root / content_sha256[:2] / content_sha256
+        if not directory.exists():
+            return 0
+        pattern = f"{_SAFE_NAME_RE.sub('_', extractor)}@*" if extractor else "*.json.gz"
+        removed = 0
+        for path in directory.glob(pattern):
+            path.unlink()
+            removed += 1
+        return removed
+
+
+_extraction_cache: Optional[ExtractionArtifactCache] = None
+
+
+def get_extraction_cache() -> Optional[ExtractionArtifactCache]:
+    """ExtractionArtifactCache 싱글톤 (비활성화 시 None)"""
+    global _extraction_cache
+    if not settings.EXTRACTION_CACHE_ENABLED:
+        return None
+    if _extraction_cache is None:
+        _extraction_cache = ExtractionArtifactCache()
+    return _extraction_cache
@@ -7,7 +7,6 @@ import re
 from typing import List, Dict, Tuple
 from bs4 import BeautifulSoup
 
-import anthropic
 from loguru import logger
 
 from app.core.config import settings
@@ -18,6 +17,8 @@ class FileExtractor:
 
     def __init__(self):
         """Initialize with Anthropic API key"""
+        import anthropic
+
         self.client = anthropic.Anthropic(
             api_key=settings.ANTHROPIC_API_KEY
         )
@@ -152,6 +153,8 @@ class FileExtractor:
 
 JSON 형식으로만 응답해주세요. 설명이나 다른 텍스트는 포함하지 마세요."""
 
+        import anthropic
+
         try:
             # Call Claude API
             message = self.client.messages.create(
@@ -0,0 +1,201 @@
+"""
+FP Customer Loader
+
+FP 홈 화면 고객 목록을 고정된 쿼리 수로 읽어오는 데이터 로더.
+
+- 고객 페이지: 상담/상품 집계를 LATERAL 서브쿼리로 계산 (JOIN 폭증 없이 1쿼리)
+- 상세 목록: 페이지 전체 고객의 상담/상품을 `customer_id = ANY(:ids)` 2쿼리로 일괄 조회
+- keyset 페이지네이션: (created_at DESC, id DESC) 커서, OFFSET 없이 인덱스 범위 스캔
+- 경량 모드(include_details=False): 집계만 반환, 상세 쿼리 생략
+
+고객 N명 조회 시 쿼리 수: 1 (경량) / 3 (상세) — 기존 1 + 2N
+"""
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import listing
+
+
+_CUSTOMER_PAGE_SQL = """
+    SELECT
+        c.*,
+        cons.consultation_count,
+        cons.last_contact_date,
+        prod.product_count
+    FROM fp_customers c
+    LEFT JOIN LATERAL (
+        SELECT COUNT(*) AS consultation_count, MAX(consultation_date) AS last_contact_date
+        FROM fp_consultations
+        WHERE customer_id = c.id
+    ) cons ON TRUE
+    LEFT JOIN LATERAL (
+        SELECT COUNT(*) AS product_count
+        FROM fp_customer_products
+        WHERE customer_id = c.id
+    ) prod ON TRUE
+    WHERE {where}
+    ORDER BY c.created_at DESC, c.id DESC
+"""
+
+_CONSULTATIONS_SQL = """
+    SELECT * FROM fp_consultations
+    WHERE customer_id = ANY(:ids)
+    ORDER BY customer_id, consultation_date DESC
+"""
+
+_PRODUCTS_SQL = """
+    SELECT * FROM fp_customer_products
+    WHERE customer_id = ANY(:ids)
+    ORDER BY customer_id, created_at DESC
+"""
+
+
+def encode_cursor(created_at: datetime, customer_id: Any) -> str:
+    """마지막 고객의 (created_at, id)를 불투명 커서 문자열로 인코딩"""
+    return listing.encode_cursor([created_at, customer_id])
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    커서 디코딩
+
+    Raises:
+        ValueError: 형식이 잘못된 커서
+    """
+    created_at, customer_id = listing.decode_cursor(cursor, size=2)
+    if not isinstance(created_at, datetime) or not isinstance(customer_id, UUID):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return created_at, customer_id
+
+
+def group_by_customer(rows: Iterable[Dict[str, Any]]) -> Dict[Any, List[Dict[str, Any]]]:
+    """customer_id별로 행을 묶음 (입력 순서 유지)"""
+    grouped: Dict[Any, List[Dict[str, Any]]] = defaultdict(list)
+    for row in rows:
+        grouped[row["customer_id"]].append(row)
+    return grouped
+
+
+@dataclass
+class CustomerFilter:
+    """고객 목록 필터"""
+    city: Optional[str] = None
+    district: Optional[str] = None
+    birth_month: Optional[int] = None
+    status: Optional[str] = None
+    tags: Optional[List[str]] = None
+
+
+@dataclass
+class CustomerPage:
+    """고객 목록 한 페이지"""
+    customers: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
+
+
+class FPCustomerLoader:
+    """FP 고객 목록 데이터 로더"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @staticmethod
+    def build_page_query(
+        user_id: str,
+        filters: CustomerFilter,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """고객 페이지 쿼리/파라미터 생성 (limit이 있으면 다음 페이지 확인용으로 1건 더 조회)"""
+        conditions = ["c.user_id = :user_id"]
+        params: Dict[str, Any] = {"user_id": user_id}
+
+        if filters.city:
+            conditions.append("c.city = :city")
+            params["city"] = filters.city
+        if filters.district:
+            conditions.append("c.district = :district")
+            params["district"] = filters.district
+        if filters.birth_month:
+            conditions.append("EXTRACT(MONTH FROM c.birth_date) = :birth_month")
+            params["birth_month"] = filters.birth_month
+        if filters.status:
+            conditions.append("c.status = :status")
+            params["status"] = filters.status
+        if filters.tags:
+            conditions.append("c.tags && :tags")
+            params["tags"] = filters.tags
+
+        if cursor:
+            params["cursor_created_at"], params["cursor_id"] = decode_cursor(cursor)
+            conditions.append("(c.created_at, c.id) < (:cursor_created_at, :cursor_id)")
+
+        query = _CUSTOMER_PAGE_SQL.format(where=" AND ".join(conditions))
+        if limit is not None:
+            query += " LIMIT :limit"
+            params["limit"] = limit + 1
+
+        return query, params
+
+    async def load_page(
+        self,
+        user_id: str,
+        filters: Optional[CustomerFilter] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include_details: bool = True,
+    ) -> CustomerPage:
+        """
+        고객 목록 페이지 조회
+
+        Args:
+            user_id: FP 사용자 ID
+            filters: 목록 필터
+            limit: 페이지 크기 (None이면 전체)
+            cursor: 이전 페이지의 next_cursor
+            include_details: False면 상담/상품 목록 없이 집계만 반환
+
+        Returns:
+            CustomerPage (다음 페이지가 없으면 next_cursor=None)
+
+        Raises:
+            ValueError: 잘못된 커서
+        """
+        query, params = self.build_page_query(user_id, filters or CustomerFilter(), limit, cursor)
+        result = await self.db.execute(text(query), params)
+        customers = [dict(row._mapping) for row in result.fetchall()]
+
+        next_cursor = None
+        if limit is not None and len(customers) > limit:
+            customers = customers[:limit]
+            last = customers[-1]
+            next_cursor = encode_cursor(last["created_at"], last["id"])
+
+        if include_details and customers:
+            await self._attach_details(customers)
+        else:
+            for customer in customers:
+                customer["consultations"] = []
+                customer["products"] = []
+
+        return CustomerPage(customers=customers, next_cursor=next_cursor)
+
+    async def _attach_details(self, customers: List[Dict[str, Any]]) -> None:
+        """페이지 전체의 상담/상품을 2쿼리로 조회해 고객별로 붙임"""
+        ids = [customer["id"] for customer in customers]
+
+        cons_result = await self.db.execute(text(_CONSULTATIONS_SQL), {"ids": ids})
+        consultations = group_by_customer(dict(r._mapping) for r in cons_result.fetchall())
+
+        prod_result = await self.db.execute(text(_PRODUCTS_SQL), {"ids": ids})
+        products = group_by_customer(dict(r._mapping) for r in prod_result.fetchall())
+
+        for customer in customers:
+            customer["consultations"] = consultations.get(customer["id"], [])
+            customer["products"] = products.get(customer["id"], [])
@@ -99,6 +99,11 @@ class GraphBuilder:
         # Step 3: Extract relations (Story 1.5)
         logger.info("Step 3: Extracting relations...")
         relation_results = []
+        await self.relation_extractor.prefetch(
+            [paragraph.text for article in parsed_doc.articles for paragraph in article.paragraphs],
+            critical_data,
+            use_cascade=True,
+        )
         for article in parsed_doc.articles:
             for paragraph in article.paragraphs:
                 # Extract relations from each paragraph
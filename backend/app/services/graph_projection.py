@@ -0,0 +1,788 @@
+"""
+Graph Projection Service
+
+Neo4j 그래프를 프로세스 내 CSR(Compressed Sparse Row) 배열로 투영하여
+다중 홉 탐색을 로컬에서 수행합니다.
+
+Features:
+- 관계 타입별 CSR 인접 배열 (outgoing / incoming)
+- BFS, k-hop 이웃, 최단 경로 (허브 노드 degree cap)
+- 증분 갱신 (delta buffer + 주기적 compaction)
+- TTL 기반 재동기화 (GRAPH_PROJECTION_REFRESH_SECONDS): 그래프 버전 노드(GraphVersion)나
+  관계 수가 바뀌면 백그라운드 스레드에서 재빌드 (요청 스레드는 이전 상태로 계속 응답)
+
+Variable-length Cypher 패턴(`[*1..N]`)은 `in_same_document` 같은 허브 노드에서
+경로 수가 폭발하지만, 투영에서는 노드당 이웃 수를 제한(degree cap)하여
+탐색 비용이 방문 노드 수에 비례합니다.
+"""
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    logger.warning("NumPy not available - graph projection disabled")
+
+
+GRAPH_VERSION_ID = "graph"
+
+
+def bump_graph_version(session) -> None:
+    """
+    Mark the Neo4j graph as changed.
+
+    Writers call this after creating or deleting nodes/relationships so
+    projections rebuild even when the relationship count is unchanged
+    (e.g. a resync that deletes and recreates the same edges).
+    """
+    session.run(
+        "MERGE (v:GraphVersion {id: $id}) SET v.version = coalesce(v.version, 0) + 1",
+        id=GRAPH_VERSION_ID,
+    )
+
+
+def read_change_marker(driver) -> Tuple[Optional[int], int]:
+    """(graph version or None, relationship count) - both cheap lookups"""
+    with driver.session() as session:
+        record = session.run(
+            "MATCH (v:GraphVersion {id: $id}) RETURN v.version AS version",
+            id=GRAPH_VERSION_ID,
+        ).single()
+        count = session.run("MATCH ()-[r]->() RETURN count(r) AS c").single()["c"]
+    return (record["version"] if record else None), count
+
+
+@dataclass
+class ProjectedPath:
+    """A path found in the projection (node keys + relationship types)"""
+    node_ids: List[str]
+    relationships: List[str]
+
+    @property
+    def length(self) -> int:
+        return len(self.relationships)
+
+
+@dataclass
+class ProjectionStats:
+    """Projection size and refresh statistics"""
+    source: str
+    num_nodes: int
+    num_edges: int
+    edges_by_type: Dict[str, int]
+    delta_edges: int
+    watermark: Optional[Tuple[Optional[int], int]]
+    last_refresh_at: Optional[float]
+    last_build_ms: float
+
+
+def _build_csr(num_nodes: int, src, dst) -> Tuple[Any, Any]:
+    """Build (indptr, indices) for edges src -> dst"""
+    order = np.argsort(src, kind="stable")
+    indices = dst[order].astype(np.int32)
+    counts = np.bincount(src, minlength=num_nodes)
+    indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+    return indptr, indices
+
+
+def _gather(indptr, indices, frontier, degree_cap: Optional[int]):
+    """
+    Vectorized neighbor expansion of a frontier over one CSR.
+
+    Returns (parents, neighbors) arrays. At most `degree_cap` neighbors are
+    taken per node so hub nodes cannot blow up the frontier.
+    """
+    frontier = frontier[frontier < len(indptr) - 1]
+    starts = indptr[frontier]
+    counts = indptr[frontier + 1] - starts
+    if degree_cap is not None:
+        counts = np.minimum(counts, degree_cap)
+    total = int(counts.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+
+    parents = np.repeat(frontier, counts)
+    group_starts = np.cumsum(counts) - counts
+    offsets = np.repeat(starts - group_starts, counts) + np.arange(total)
+    return parents, indices[offsets].astype(np.int64)
+
+
+class _RelationAdjacency:
+    """Edges of one relationship type: compacted CSR + uncompacted delta"""
+
+    def __init__(self, num_nodes: int, src, dst):
+        self.src = src
+        self.dst = dst
+        self.out_indptr, self.out_indices = _build_csr(num_nodes, src, dst)
+        self.in_indptr, self.in_indices = _build_csr(num_nodes, dst, src)
+        self.delta_src = np.empty(0, dtype=np.int64)
+        self.delta_dst = np.empty(0, dtype=np.int64)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.src) + len(self.delta_src)
+
+    def with_delta(self, src, dst) -> "_RelationAdjacency":
+        """Return a copy sharing the CSR arrays with extra delta edges"""
+        clone = object.__new__(_RelationAdjacency)
+        clone.__dict__.update(self.__dict__)
+        clone.delta_src = np.concatenate([self.delta_src, src])
+        clone.delta_dst = np.concatenate([self.delta_dst, dst])
+        return clone
+
+    def compacted(self, num_nodes: int) -> "_RelationAdjacency":
+        """Merge the delta into a fresh CSR"""
+        return _RelationAdjacency(
+            num_nodes,
+            np.concatenate([self.src, self.delta_src]),
+            np.concatenate([self.dst, self.delta_dst]),
+        )
+
+    def expand(self, frontier, direction: str, degree_cap: Optional[int]):
+        """Expand frontier in the given direction ("out", "in" or "both")"""
+        parents, neighbors = [], []
+
+        def add_delta(keys, values):
+            if len(keys):
+                mask = np.isin(keys, frontier)
+                parents.append(keys[mask])
+                neighbors.append(values[mask])
+
+        if direction in ("out", "both"):
+            p, n = _gather(self.out_indptr, self.out_indices, frontier, degree_cap)
+            parents.append(p)
+            neighbors.append(n)
+            add_delta(self.delta_src, self.delta_dst)
+        if direction in ("in", "both"):
+            p, n = _gather(self.in_indptr, self.in_indices, frontier, degree_cap)
+            parents.append(p)
+            neighbors.append(n)
+            add_delta(self.delta_dst, self.delta_src)
+
+        return np.concatenate(parents), np.concatenate(neighbors)
+
+
+class _ProjectionState:
+    """Immutable snapshot read by queries; refresh swaps in a new one"""
+
+    def __init__(
+        self,
+        node_index: Dict[str, int],
+        node_ids: List[str],
+        node_labels,
+        element_ids: List[Optional[str]],
+        relations: Dict[str, _RelationAdjacency],
+    ):
+        self.node_index = node_index
+        self.node_ids = node_ids
+        self.node_labels = node_labels
+        self.element_ids = element_ids
+        self.relations = relations
+        self.num_nodes = len(node_labels)
+
+    def index_of(self, node_id: str) -> Optional[int]:
+        idx = self.node_index.get(node_id)
+        if idx is None or idx >= self.num_nodes:
+            return None
+        return idx
+
+
+class GraphProjection:
+    """
+    In-process CSR projection of the knowledge graph.
+
+    Build once with load_from_neo4j(), then call refresh_if_stale()
+    periodically. Queries read an immutable snapshot and never block on
+    a refresh.
+    """
+
+    def __init__(
+        self,
+        degree_cap: int = 200,
+        compact_threshold: int = 10_000,
+    ):
+        """
+        Initialize graph projection.
+
+        Args:
+            degree_cap: Default maximum neighbors expanded per node and type
+            compact_threshold: Delta edges per type before CSR compaction
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("NumPy is required for GraphProjection")
+
+        self.degree_cap = degree_cap
+        self.compact_threshold = compact_threshold
+
+        self.source: Optional[str] = None
+        self.watermark: Optional[Tuple[Optional[int], int]] = None
+        self.last_refresh_at: Optional[float] = None
+        self.last_build_ms: float = 0.0
+
+        self._labels: List[str] = []
+        self._label_index: Dict[str, int] = {}
+        self._state: Optional[_ProjectionState] = None
+        self._refresh_lock = threading.Lock()
+        self._stale_lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._state is not None
+
+    def _label_id(self, label: Optional[str]) -> int:
+        label = label or "Unknown"
+        if label not in self._label_index:
+            self._label_index[label] = len(self._labels)
+            self._labels.append(label)
+        return self._label_index[label]
+
+    def build(
+        self,
+        edges: Iterable[Tuple[str, str, str]],
+        node_labels: Optional[Dict[str, str]] = None,
+        element_ids: Optional[Dict[str, str]] = None,
+        source: str = "memory",
+    ) -> None:
+        """
+        Build the projection from scratch.
+
+        Args:
+            edges: (source_id, target_id, relationship_type) tuples
+            node_labels: Optional node_id -> label mapping
+            element_ids: Optional node_id -> Neo4j elementId mapping
+            source: "neo4j" or "memory"
+        """
+        started = time.perf_counter()
+
+        node_index: Dict[str, int] = {}
+        node_ids: List[str] = []
+        by_type: Dict[str, Tuple[List[int], List[int]]] = {}
+
+        def index(node_id: str) -> int:
+            idx = node_index.get(node_id)
+            if idx is None:
+                idx = len(node_ids)
+                node_index[node_id] = idx
+                node_ids.append(node_id)
+            return idx
+
+        for src_id, dst_id, rel_type in edges:
+            src_list, dst_list = by_type.setdefault(rel_type, ([], []))
+            src_list.append(index(src_id))
+            dst_list.append(index(dst_id))
+
+        for node_id in (node_labels or {}):
+            index(node_id)
+
+        state = self._make_state(node_index, node_ids, node_labels or {}, element_ids or {})
+        state.relations = {
+            rel_type: _RelationAdjacency(
+                state.num_nodes,
+                np.asarray(src_list, dtype=np.int64),
+                np.asarray(dst_list, dtype=np.int64),
+            )
+            for rel_type, (src_list, dst_list) in by_type.items()
+        }
+
+        with self._refresh_lock:
+            self._state = state
+            self.source = source
+            self.last_refresh_at = time.time()
+            self.last_build_ms = (time.perf_counter() - started) * 1000
+
+        logger.info(
+            f"GraphProjection built from {source}: {state.num_nodes} nodes, "
+            f"{sum(r.num_edges for r in state.relations.values())} edges "
+            f"in {self.last_build_ms:.0f}ms"
+        )
+
+    def _make_state(
+        self,
+        node_index: Dict[str, int],
+        node_ids: List[str],
+        node_labels: Dict[str, str],
+        element_ids: Dict[str, str],
+    ) -> _ProjectionState:
+        labels = np.fromiter(
+            (self._label_id(node_labels.get(node_id)) for node_id in node_ids),
+            dtype=np.int16,
+            count=len(node_ids),
+        )
+        return _ProjectionState(
+            node_index=node_index,
+            node_ids=node_ids,
+            node_labels=labels,
+            element_ids=[element_ids.get(node_id) for node_id in node_ids],
+            relations={},
+        )
+
+    def add_edges(
+        self,
+        edges: Sequence[Tuple[str, str, str]],
+        node_labels: Optional[Dict[str, str]] = None,
+        element_ids: Optional[Dict[str, str]] = None,
+    ) -> int:
+        """
+        Incrementally add edges (and any new nodes) to the projection.
+
+        New edges land in a per-type delta buffer which is merged into the
+        CSR once it exceeds compact_threshold.
+
+        Returns:
+            Number of edges added
+        """
+        if not edges:
+            return 0
+        if self._state is None:
+            self.build(edges, node_labels, element_ids)
+            return len(edges)
+
+        node_labels = node_labels or {}
+        element_ids = element_ids or {}
+
+        with self._refresh_lock:
+            old = self._state
+            # Node index/id lists are append-only; readers guard on num_nodes
+            node_index, node_ids = old.node_index, old.node_ids
+            new_labels: List[int] = []
+            new_element_ids: List[Optional[str]] = []
+
+            def index(node_id: str) -> int:
+                idx = node_index.get(node_id)
+                if idx is None:
+                    idx = len(node_ids)
+                    node_index[node_id] = idx
+                    node_ids.append(node_id)
+                    new_labels.append(self._label_id(node_labels.get(node_id)))
+                    new_element_ids.append(element_ids.get(node_id))
+                return idx
+
+            by_type: Dict[str, Tuple[List[int], List[int]]] = {}
+            for src_id, dst_id, rel_type in edges:
+                src_list, dst_list = by_type.setdefault(rel_type, ([], []))
+                src_list.append(index(src_id))
+                dst_list.append(index(dst_id))
+
+            labels = np.concatenate([old.node_labels, np.asarray(new_labels, dtype=np.int16)])
+            state = _ProjectionState(
+                node_index=node_index,
+                node_ids=node_ids,
+                node_labels=labels,
+                element_ids=old.element_ids + new_element_ids,
+                relations=dict(old.relations),
+            )
+
+            for rel_type, (src_list, dst_list) in by_type.items():
+                src = np.asarray(src_list, dtype=np.int64)
+                dst = np.asarray(dst_list, dtype=np.int64)
+                relation = state.relations.get(rel_type)
+                if relation is None:
+                    relation = _RelationAdjacency(state.num_nodes, src, dst)
+                else:
+                    relation = relation.with_delta(src, dst)
+                    if len(relation.delta_src) >= self.compact_threshold:
+                        relation = relation.compacted(state.num_nodes)
+                state.relations[rel_type] = relation
+
+            self._state = state
+            self.last_refresh_at = time.time()
+
+        return len(edges)
+
+    def compact(self) -> None:
+        """Merge all delta buffers into their CSR arrays"""
+        with self._refresh_lock:
+            old = self._state
+            if old is None:
+                return
+            relations = {
+                rel_type: relation.compacted(old.num_nodes)
+                for rel_type, relation in old.relations.items()
+            }
+            self._state = _ProjectionState(
+                node_index=old.node_index,
+                node_ids=old.node_ids,
+                node_labels=old.node_labels,
+                element_ids=old.element_ids,
+                relations=relations,
+            )
+
+    # ------------------------------------------------------------------
+    # Loaders
+    # ------------------------------------------------------------------
+
+    def load_from_neo4j(self, driver, batch_size: int = 50_000) -> None:
+        """
+        Build the projection from all relationships in Neo4j.
+
+        Nodes are keyed by their `id` property, falling back to elementId
+        for entity nodes (Amount, Period, KCDCode) that have none. The change
+        marker is read first, so writes during the load trigger another rebuild.
+        """
+        marker = read_change_marker(driver)
+        query = """
+        MATCH (a)-[r]->(b)
+        RETURN coalesce(a.id, elementId(a)) AS src, elementId(a) AS src_eid, labels(a)[0] AS src_label,
+               coalesce(b.id, elementId(b)) AS dst, elementId(b) AS dst_eid, labels(b)[0] AS dst_label,
+               type(r) AS rel_type
+        """
+        edges: List[Tuple[str, str, str]] = []
+        node_labels: Dict[str, str] = {}
+        element_ids: Dict[str, str] = {}
+
+        with driver.session() as session:
+            result = session.run(query, fetch_size=batch_size)
+            for record in result:
+                edges.append((record["src"], record["dst"], record["rel_type"]))
+                node_labels[record["src"]] = record["src_label"]
+                node_labels[record["dst"]] = record["dst_label"]
+                element_ids[record["src"]] = record["src_eid"]
+                element_ids[record["dst"]] = record["dst_eid"]
+
+        self.build(edges, node_labels, element_ids, source="neo4j")
+        self.watermark = marker
+
+    def refresh(self, driver, batch_size: int = 50_000) -> int:
+        """
+        Bring the projection up to date with Neo4j.
+
+        Relationships carry no monotonic key, so the projection is rebuilt
+        when the graph version (see bump_graph_version) or, for writers that
+        do not bump it, the relationship count changed.
+
+        Returns:
+            Total edges after a rebuild, or 0 if unchanged
+        """
+        marker = read_change_marker(driver)
+        if marker != self.watermark:
+            logger.info(f"GraphProjection: change marker {self.watermark} -> {marker}, rebuilding")
+            self.load_from_neo4j(driver, batch_size)
+            return self.num_edges
+        self.last_refresh_at = time.time()
+        return 0
+
+    def is_stale(self, max_age_seconds: float) -> bool:
+        """True if the last build/refresh is older than max_age_seconds"""
+        if max_age_seconds <= 0 or self.last_refresh_at is None:
+            return False
+        return time.time() - self.last_refresh_at >= max_age_seconds
+
+    def refresh_if_stale(self, driver, max_age_seconds: float) -> bool:
+        """
+        Start a background refresh from Neo4j if stale.
+
+        Only one refresh runs at a time. Callers never wait for it: queries
+        keep reading the current state until the rebuilt one is swapped in.
+
+        Returns:
+            True if a refresh was started
+        """
+        if not self.is_stale(max_age_seconds) or not self._stale_lock.acquire(blocking=False):
+            return False
+        if not self.is_stale(max_age_seconds):
+            self._stale_lock.release()
+            return False
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_in_background,
+            args=(driver,),
+            name="graph-projection-refresh",
+            daemon=True,
+        )
+        self._refresh_thread.start()
+        return True
+
+    def _refresh_in_background(self, driver) -> None:
+        try:
+            self.refresh(driver)
+        except Exception as e:
+            logger.warning(f"GraphProjection refresh failed, serving previous state: {e}")
+        finally:
+            self._stale_lock.release()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def contains(self, node_id: str) -> bool:
+        state = self._state
+        return state is not None and state.index_of(node_id) is not None
+
+    def node_label(self, node_id: str) -> Optional[str]:
+        state = self._state
+        idx = state.index_of(node_id) if state else None
+        return None if idx is None else self._labels[state.node_labels[idx]]
+
+    def element_id(self, node_id: str) -> Optional[str]:
+        state = self._state
+        idx = state.index_of(node_id) if state else None
+        return None if idx is None else state.element_ids[idx]
+
+    def _search(
+        self,
+        state: _ProjectionState,
+        start: Sequence[int],
+        max_depth: int,
+        rel_types: Optional[Sequence[str]],
+        direction: str,
+        degree_cap: Optional[int],
+        stop_at: Optional[int] = None,
+        max_nodes: Optional[int] = None,
+    ):
+        """
+        Level-synchronous BFS.
+
+        Returns (depth, parent, parent_rel) arrays of size num_nodes;
+        depth is -1 for unreached nodes.
+        """
+        if direction not in ("out", "in", "both"):
+            raise ValueError(f"Invalid direction: {direction}")
+
+        type_names = list(rel_types) if rel_types else list(state.relations.keys())
+        relations = [(i, state.relations[t]) for i, t in enumerate(type_names) if t in state.relations]
+        cap = self.degree_cap if degree_cap is None else (degree_cap or None)
+
+        depth = np.full(state.num_nodes, -1, dtype=np.int32)
+        parent = np.full(state.num_nodes, -1, dtype=np.int64)
+        parent_rel = np.full(state.num_nodes, -1, dtype=np.int16)
+
+        frontier = np.unique(np.asarray(start, dtype=np.int64))
+        depth[frontier] = 0
+        visited = len(frontier)
+
+        for level in range(1, max_depth + 1):
+            if len(frontier) == 0:
+                break
+
+            for type_idx, relation in relations:
+                parents, neighbors = relation.expand(frontier, direction, cap)
+                if len(neighbors) == 0:
+                    continue
+                new_mask = depth[neighbors] == -1
+                neighbors, parents = neighbors[new_mask], parents[new_mask]
+                # First occurrence wins so each node gets exactly one parent
+                neighbors, first = np.unique(neighbors, return_index=True)
+                depth[neighbors] = level
+                parent[neighbors] = parents[first]
+                parent_rel[neighbors] = type_idx
+                visited += len(neighbors)
+
+            frontier = np.flatnonzero(depth == level)
+            if stop_at is not None and depth[stop_at] != -1:
+                break
+            if max_nodes is not None and visited >= max_nodes:
+                break
+
+        return depth, parent, parent_rel, type_names
+
+    def _reconstruct(
+        self, state: _ProjectionState, node: int, parent, parent_rel, type_names: List[str]
+    ) -> ProjectedPath:
+        nodes, rels = [node], []
+        while parent[node] != -1:
+            rels.append(type_names[parent_rel[node]])
+            node = int(parent[node])
+            nodes.append(node)
+        nodes.reverse()
+        rels.reverse()
+        return ProjectedPath(node_ids=[state.node_ids[n] for n in nodes], relationships=rels)
+
+    def k_hop(
+        self,
+        start_ids: Sequence[str],
+        k: int,
+        rel_types: Optional[Sequence[str]] = None,
+        direction: str = "both",
+        degree_cap: Optional[int] = None,
+        label: Optional[str] = None,
+        max_nodes: Optional[int] = None,
+    ) -> Dict[str, int]:
+        """
+        Nodes within k hops of the start nodes.
+
+        Args:
+            start_ids: Start node keys
+            k: Maximum hops
+            rel_types: Relationship types to follow (default: all)
+            direction: "out", "in" or "both"
+            degree_cap: Max neighbors per node and type (0 = unlimited)
+            label: Only return nodes with this label
+            max_nodes: Stop expanding after this many visited nodes
+
+        Returns:
+            node_id -> hop distance (start nodes excluded)
+        """
+        state = self._state
+        if state is None:
+            return {}
+        start = [i for i in (state.index_of(s) for s in start_ids) if i is not None]
+        if not start:
+            return {}
+
+        depth, _, _, _ = self._search(state, start, k, rel_types, direction, degree_cap, max_nodes=max_nodes)
+        mask = depth > 0
+        if label is not None:
+            label_id = self._label_index.get(label)
+            if label_id is None:
+                return {}
+            mask &= state.node_labels == label_id
+
+        found = np.flatnonzero(mask)
+        return {state.node_ids[i]: int(depth[i]) for i in found}
+
+    def bfs_paths(
+        self,
+        start_id: str,
+        max_depth: int,
+        rel_types: Optional[Sequence[str]] = None,
+        direction: str = "both",
+        degree_cap: Optional[int] = None,
+        target_label: Optional[str] = None,
+        limit: int = 50,
+    ) -> List[ProjectedPath]:
+        """
+        One shortest path from start to each reachable node (BFS tree).
+
+        Args:
+            start_id: Start node key
+            max_depth: Maximum hops
+            rel_types: Relationship types to follow (default: all)
+            direction: "out", "in" or "both"
+            degree_cap: Max neighbors per node and type (0 = unlimited)
+            target_label: Only return paths ending at nodes with this label
+            limit: Maximum paths returned (closest first)
+
+        Returns:
+            List of ProjectedPath
+        """
+        return self.bfs_paths_multi([start_id], max_depth, rel_types, direction, degree_cap, target_label, limit)
+
+    def bfs_paths_multi(
+        self,
+        start_ids: Sequence[str],
+        max_depth: int,
+        rel_types: Optional[Sequence[str]] = None,
+        direction: str = "both",
+        degree_cap: Optional[int] = None,
+        target_label: Optional[str] = None,
+        limit: int = 50,
+    ) -> List[ProjectedPath]:
+        """Like bfs_paths, but from several start nodes at once"""
+        state = self._state
+        if state is None:
+            return []
+        start = [i for i in (state.index_of(s) for s in start_ids) if i is not None]
+        if not start:
+            return []
+
+        depth, parent, parent_rel, type_names = self._search(
+            state, start, max_depth, rel_types, direction, degree_cap
+        )
+        mask = depth > 0
+        if target_label is not None:
+            label_id = self._label_index.get(target_label)
+            if label_id is None:
+                return []
+            mask &= state.node_labels == label_id
+
+        found = np.flatnonzero(mask)
+        found = found[np.argsort(depth[found], kind="stable")][:limit]
+        return [self._reconstruct(state, int(n), parent, parent_rel, type_names) for n in found]
+
+    def shortest_path(
+        self,
+        start_id: str,
+        end_id: str,
+        max_depth: int = 5,
+        rel_types: Optional[Sequence[str]] = None,
+        direction: str = "both",
+        degree_cap: Optional[int] = None,
+    ) -> Optional[ProjectedPath]:
+        """
+        Shortest path between two nodes, or None if not within max_depth.
+        """
+        state = self._state
+        if state is None:
+            return None
+        start, end = state.index_of(start_id), state.index_of(end_id)
+        if start is None or end is None:
+            return None
+        if start == end:
+            return ProjectedPath(node_ids=[start_id], relationships=[])
+
+        depth, parent, parent_rel, type_names = self._search(
+            state, [start], max_depth, rel_types, direction, degree_cap, stop_at=end
+        )
+        if depth[end] == -1:
+            return None
+        return self._reconstruct(state, end, parent, parent_rel, type_names)
+
+    @property
+    def num_edges(self) -> int:
+        state = self._state
+        return 0 if state is None else sum(r.num_edges for r in state.relations.values())
+
+    def get_stats(self) -> ProjectionStats:
+        """Get projection statistics"""
+        state = self._state
+        relations = state.relations if state else {}
+        return ProjectionStats(
+            source=self.source or "none",
+            num_nodes=state.num_nodes if state else 0,
+            num_edges=self.num_edges,
+            edges_by_type={t: r.num_edges for t, r in relations.items()},
+            delta_edges=sum(len(r.delta_src) for r in relations.values()),
+            watermark=self.watermark,
+            last_refresh_at=self.last_refresh_at,
+            last_build_ms=self.last_build_ms,
+        )
+
+
+# Singleton instance
+_graph_projection: Optional[GraphProjection] = None
+
+
+def get_graph_projection() -> Optional[GraphProjection]:
+    """
+    Get the shared projection if enabled (GRAPH_PROJECTION_ENABLED).
+
+    The projection is loaded lazily from Neo4j on first use. Its keys are
+    Neo4j node ids, so GraphTraversal can hydrate paths by elementId and
+    re-sync it with refresh_if_stale() (GRAPH_PROJECTION_REFRESH_SECONDS).
+    """
+    global _graph_projection
+    from app.core.config import settings
+
+    if not settings.GRAPH_PROJECTION_ENABLED or not NUMPY_AVAILABLE:
+        return None
+
+    if _graph_projection is None:
+        projection = GraphProjection(degree_cap=settings.GRAPH_PROJECTION_DEGREE_CAP)
+        try:
+            from neo4j import GraphDatabase
+            driver = GraphDatabase.driver(
+                settings.NEO4J_URI,
+                auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD),
+            )
+            try:
+                projection.load_from_neo4j(driver)
+            finally:
+                driver.close()
+        except Exception as e:
+            logger.warning(f"GraphProjection load failed, falling back to Neo4j queries: {e}")
+            return None
+        _graph_projection = projection
+
+    return _graph_projection
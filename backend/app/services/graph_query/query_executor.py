@@ -6,7 +6,7 @@ Neo4j 쿼리를 실행하고 결과를 변환합니다.
 import time
 from typing import List, Dict, Any, Optional
 from loguru import logger
-from neo4j import Record
+from neo4j import Query, Record
 
 from app.models.query import QueryAnalysisResult
 from app.models.graph_query import (
@@ -521,8 +521,17 @@ class GraphQueryExecutor:
         Returns:
             Neo4j 레코드 리스트
         """
+        # 오케스트레이터 요청 안에서는 남은 실행 예산을 Neo4j 트랜잭션 타임아웃으로 전달
+        from app.services.orchestration.execution_budget import clamp_timeout
+
+        timeout = clamp_timeout()
+        if timeout is not None and timeout <= 0:
+            raise TimeoutError("Execution budget exhausted before graph query")
+
         with self.neo4j.driver.session() as session:
-            result = session.run(cypher_query.query, cypher_query.parameters)
+            result = session.run(
+                Query(cypher_query.query, timeout=timeout), cypher_query.parameters
+            )
             records = list(result)
             return records
 
@@ -0,0 +1,651 @@
+"""
+Graph Snapshot
+
+완료 문서 기반 시각화용 그래프 스냅샷의 증분 생성/저장.
+
+- GraphSnapshotBuilder: 노드/엣지 인덱스를 메모리에 유지하고, watermark 이후
+  변경된 문서만 다시 읽어 차이(GraphDelta)만 반영합니다.
+- GraphSnapshotStore: base 스냅샷 + append-only delta 로그(JSONL)로 저장하고,
+  delta가 쌓이면 base로 압축(compaction)합니다. 읽는 쪽은 새로 추가된 delta만 재생합니다.
+
+저장 구조:
+    {root}/graph_snapshot.json          # base (compact JSON)
+    {root}/graph_snapshot.deltas.jsonl  # base 이후 delta (한 줄에 하나)
+"""
+import json
+import os
+import tempfile
+import threading
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from loguru import logger
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+
+
+# 엔티티 타입별 색상
+ENTITY_COLORS = {
+    "coverage_item": "#ef4444",       # 빨강 (보장항목)
+    "benefit_amount": "#f59e0b",      # 주황 (보험금액)
+    "payment_condition": "#eab308",   # 노랑 (지급조건)
+    "exclusion": "#dc2626",           # 진한 빨강 (면책사항)
+    "deductible": "#fb923c",          # 연한 주황 (자기부담금)
+    "rider": "#a855f7",               # 보라 (특약)
+    "eligibility": "#06b6d4",         # 청록 (가입조건)
+    "article": "#64748b",             # 회색 (약관조항)
+    "term": "#475569",                # 진한 회색 (보험용어)
+    "period": "#0ea5e9"               # 파랑 (기간)
+}
+
+# 관계 타입 한글 라벨
+RELATIONSHIP_LABELS = {
+    "provides": "제공",
+    "has_amount": "금액",
+    "requires": "조건",
+    "excludes": "면책",
+    "has_deductible": "자기부담금",
+    "includes_rider": "특약포함",
+    "defines": "정의",
+    "specified_in": "명시",
+    "has_eligibility": "가입조건",
+    "applies_to": "적용대상"
+}
+
+# 문서 없이 저장된 엔티티/관계의 소유자 키
+GLOBAL_OWNER = "__global__"
+
+# watermark 경계에서 늦게 커밋된 행을 놓치지 않도록 겹쳐 읽는 구간 (재적용은 멱등)
+WATERMARK_OVERLAP = timedelta(seconds=5)
+
+
+@dataclass
+class GraphDelta:
+    """스냅샷 변경분"""
+
+    seq: int = 0
+    generation: str = ""
+    upsert_nodes: List[Dict[str, Any]] = field(default_factory=list)
+    upsert_edges: List[Dict[str, Any]] = field(default_factory=list)
+    remove_nodes: List[str] = field(default_factory=list)
+    remove_edges: List[str] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def is_empty(self) -> bool:
+        return not (self.upsert_nodes or self.upsert_edges or self.remove_nodes or self.remove_edges)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "seq": self.seq,
+            "generation": self.generation,
+            "upsert_nodes": self.upsert_nodes,
+            "upsert_edges": self.upsert_edges,
+            "remove_nodes": self.remove_nodes,
+            "remove_edges": self.remove_edges,
+            "metadata": self.metadata,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GraphDelta":
+        return cls(**data)
+
+
+class GraphSnapshot:
+    """메모리 상의 그래프 스냅샷 (id → 노드/엣지, 삽입 순서 유지)"""
+
+    def __init__(self, generation: str = "", seq: int = 0):
+        self.generation = generation
+        self.seq = seq
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self.edges: Dict[str, Dict[str, Any]] = {}
+        self.metadata: Dict[str, Any] = {}
+
+    @property
+    def etag(self) -> str:
+        return f'W/"{self.generation}-{self.seq}"'
+
+    def apply(self, delta: GraphDelta) -> None:
+        for edge_id in delta.remove_edges:
+            self.edges.pop(edge_id, None)
+        for node_id in delta.remove_nodes:
+            self.nodes.pop(node_id, None)
+        for node in delta.upsert_nodes:
+            self.nodes[node["id"]] = node
+        for edge in delta.upsert_edges:
+            self.edges[edge["id"]] = edge
+        self.metadata.update(delta.metadata)
+        self.seq = delta.seq
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "nodes": list(self.nodes.values()),
+            "edges": list(self.edges.values()),
+            "metadata": {**self.metadata, "generation": self.generation, "seq": self.seq},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GraphSnapshot":
+        metadata = dict(data.get("metadata", {}))
+        snapshot = cls(generation=metadata.pop("generation", ""), seq=metadata.pop("seq", 0))
+        snapshot.nodes = {node["id"]: node for node in data.get("nodes", [])}
+        snapshot.edges = {edge["id"]: edge for edge in data.get("edges", [])}
+        snapshot.metadata = metadata
+        return snapshot
+
+
+def _compact_json(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+class GraphSnapshotStore:
+    """
+    base + append-only delta 로그 저장소
+
+    writer(그래프 업데이터 워커)는 delta를 한 줄씩 추가하고,
+    reader(API)는 마지막으로 읽은 오프셋 이후의 줄만 재생합니다.
+    """
+
+    def __init__(self, root: Optional[str] = None, compact_every: Optional[int] = None):
+        """
+        Args:
+            root: 저장 경로 (기본값: settings.GRAPH_SNAPSHOT_DIR)
+            compact_every: delta가 이 개수만큼 쌓이면 base로 압축
+                (기본값: settings.GRAPH_SNAPSHOT_COMPACT_EVERY)
+        """
+        self.root = Path(root or settings.GRAPH_SNAPSHOT_DIR)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.base_path = self.root / "graph_snapshot.json"
+        self.delta_path = self.root / "graph_snapshot.deltas.jsonl"
+        self.compact_every = compact_every or settings.GRAPH_SNAPSHOT_COMPACT_EVERY
+
+        self._delta_count = 0
+        self._lock = threading.Lock()
+        # reader 캐시
+        self._cached: Optional[GraphSnapshot] = None
+        self._cached_base_key: Optional[Tuple[int, int]] = None
+        self._delta_offset = 0
+        self._rendered: Optional[Tuple[str, bytes]] = None
+
+    # ------------------------------------------------------------------
+    # Writer
+    # ------------------------------------------------------------------
+
+    def write_base(self, snapshot: GraphSnapshot) -> None:
+        """base 스냅샷 원자적 교체 + delta 로그 비우기 (compaction)"""
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(_compact_json(snapshot.to_dict()))
+        os.replace(tmp, self.base_path)
+        # base에 이미 반영된 delta 제거
+        with open(self.delta_path, "w", encoding="utf-8"):
+            pass
+        self._delta_count = 0
+
+    def append(self, delta: GraphDelta) -> None:
+        """delta 한 줄 추가"""
+        with open(self.delta_path, "a", encoding="utf-8") as f:
+            f.write(_compact_json(delta.to_dict()) + "\n")
+            f.flush()
+        self._delta_count += 1
+
+    def should_compact(self) -> bool:
+        if self._delta_count >= self.compact_every:
+            return True
+        try:
+            # delta 로그가 base보다 커지면 재생 비용이 더 크므로 압축
+            return self.delta_path.stat().st_size > self.base_path.stat().st_size
+        except FileNotFoundError:
+            return False
+
+    # ------------------------------------------------------------------
+    # Reader
+    # ------------------------------------------------------------------
+
+    def load(self) -> Optional[GraphSnapshot]:
+        """
+        현재 스냅샷 (base가 없으면 None)
+
+        base가 바뀌지 않았으면 캐시된 스냅샷에 새 delta 줄만 적용합니다.
+        """
+        with self._lock:
+            try:
+                stat = self.base_path.stat()
+            except FileNotFoundError:
+                return None
+            base_key = (stat.st_mtime_ns, stat.st_size)
+
+            if self._cached is None or self._cached_base_key != base_key:
+                with open(self.base_path, "r", encoding="utf-8") as f:
+                    self._cached = GraphSnapshot.from_dict(json.load(f))
+                self._cached_base_key = base_key
+                self._delta_offset = 0
+
+            self._replay_deltas(self._cached)
+            return self._cached
+
+    def render(self) -> Optional[Tuple[str, bytes]]:
+        """
+        현재 스냅샷의 (ETag, 직렬화된 JSON)
+
+        같은 버전이면 직렬화 결과를 재사용합니다.
+        """
+        snapshot = self.load()
+        if snapshot is None:
+            return None
+        if self._rendered is None or self._rendered[0] != snapshot.etag:
+            self._rendered = (snapshot.etag, _compact_json(snapshot.to_dict()).encode("utf-8"))
+        return self._rendered
+
+    def _replay_deltas(self, snapshot: GraphSnapshot) -> None:
+        try:
+            size = self.delta_path.stat().st_size
+        except FileNotFoundError:
+            return
+        if size < self._delta_offset:
+            # compaction 직후 (base 교체 전 짧은 구간): 다음 호출에서 base부터 다시 읽음
+            self._cached_base_key = None
+            return
+        if size == self._delta_offset:
+            return
+
+        with open(self.delta_path, "rb") as f:
+            f.seek(self._delta_offset)
+            chunk = f.read(size - self._delta_offset)
+
+        # 기록 중인 마지막 줄(개행 없음)은 다음 호출에서 처리
+        complete = chunk[: chunk.rfind(b"\n") + 1]
+        for line in complete.splitlines():
+            if not line.strip():
+                continue
+            delta = GraphDelta.from_dict(json.loads(line))
+            if delta.generation == snapshot.generation and delta.seq > snapshot.seq:
+                snapshot.apply(delta)
+        self._delta_offset += len(complete)
+
+
+class GraphSnapshotBuilder:
+    """
+    증분 그래프 스냅샷 생성기
+
+    노드/엣지마다 소유 문서 집합을 관리하므로 보험사/상품타입처럼 여러 문서가 공유하는
+    노드는 마지막 소유 문서가 빠질 때만 제거됩니다.
+    """
+
+    def __init__(
+        self,
+        store: Optional[GraphSnapshotStore] = None,
+        session_factory: Callable = AsyncSessionLocal,
+    ):
+        self.store = store or GraphSnapshotStore()
+        self.session_factory = session_factory
+        self.snapshot = GraphSnapshot()
+        self.watermark: Optional[datetime] = None
+
+        self._owners: Dict[str, Set[str]] = {}
+        self._owned: Dict[str, Tuple[Set[str], Set[str]]] = {}  # owner → (node ids, edge ids)
+        self._documents: Dict[str, Tuple[str, str]] = {}  # 완료 문서 → (insurer, product_type)
+
+    # ------------------------------------------------------------------
+    # Contributions
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def document_contribution(
+        doc: Dict[str, Any],
+        entities: Iterable[Dict[str, Any]],
+        relationships: Iterable[Dict[str, Any]],
+    ) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
+        """완료 문서 하나가 그래프에 기여하는 노드/엣지"""
+        doc_id = str(doc["id"])
+        insurer = doc["insurer"]
+        product_type = doc["product_type"] or "기타"
+        title = doc["title"][:50] if doc["title"] else "Unknown"
+        updated_at = doc.get("updated_at")
+
+        insurer_id = f"insurer_{insurer}"
+        type_id = f"type_{insurer}_{product_type}"
+        doc_node_id = f"doc_{doc_id}"
+
+        nodes = {
+            insurer_id: {
+                "id": insurer_id,
+                "label": insurer,
+                "type": "insurer",
+                "color": "#3b82f6",
+                "size": 40
+            },
+            type_id: {
+                "id": type_id,
+                "label": product_type,
+                "type": "product_type",
+                "color": "#8b5cf6",
+                "size": 25,
+                "insurer": insurer
+            },
+            doc_node_id: {
+                "id": doc_node_id,
+                "label": f"{product_type[:15]}\n{title[:30]}",
+                "type": "document",
+                "color": "#10b981",
+                "size": 15,
+                "metadata": {
+                    "insurer": insurer,
+                    "product_type": product_type,
+                    "title": title,
+                    "updated_at": updated_at.isoformat() if updated_at else None
+                }
+            },
+        }
+        edges = {
+            f"edge_i2t_{insurer}_{product_type}": {
+                "id": f"edge_i2t_{insurer}_{product_type}",
+                "source": insurer_id,
+                "target": type_id,
+                "label": "제공",
+                "type": "provides"
+            },
+            f"edge_t2d_{doc_id}": {
+                "id": f"edge_t2d_{doc_id}",
+                "source": type_id,
+                "target": doc_node_id,
+                "label": "포함",
+                "type": "contains"
+            },
+        }
+        entity_nodes, entity_edges = GraphSnapshotBuilder.entity_contribution(
+            entities, relationships
+        )
+        nodes.update(entity_nodes)
+        edges.update(entity_edges)
+        return nodes, edges
+
+    @staticmethod
+    def entity_contribution(
+        entities: Iterable[Dict[str, Any]],
+        relationships: Iterable[Dict[str, Any]],
+    ) -> Tuple[Dict[str, Dict], Dict[str, Dict]]:
+        """GraphRAG 엔티티/관계 노드와 엣지"""
+        nodes: Dict[str, Dict] = {}
+        edges: Dict[str, Dict] = {}
+        for entity in entities:
+            entity_id = entity["entity_id"]
+            description = entity.get("description")
+            source_text = entity.get("source_text")
+            document_id = entity.get("document_id")
+            nodes[entity_id] = {
+                "id": entity_id,
+                "label": entity["label"][:30],  # 라벨 길이 제한
+                "type": entity["type"],
+                "color": ENTITY_COLORS.get(entity["type"], "#64748b"),
+                "size": 20,
+                "metadata": {
+                    "description": description[:100] if description else None,
+                    "source_text": source_text[:100] if source_text else None,
+                    "insurer": entity.get("insurer"),
+                    "product_type": entity.get("product_type"),
+                    "document_id": document_id
+                }
+            }
+            if document_id:
+                edges[f"edge_e2d_{entity_id}"] = {
+                    "id": f"edge_e2d_{entity_id}",
+                    "source": entity_id,
+                    "target": f"doc_{document_id}",
+                    "label": "출처",
+                    "type": "from_document"
+                }
+        for rel in relationships:
+            edge_id = f"edge_rel_{rel['source_entity_id']}_{rel['target_entity_id']}"
+            edges[edge_id] = {
+                "id": edge_id,
+                "source": rel["source_entity_id"],
+                "target": rel["target_entity_id"],
+                "label": RELATIONSHIP_LABELS.get(rel["type"], rel["type"]),
+                "type": rel["type"]
+            }
+        return nodes, edges
+
+    def apply_owner(
+        self,
+        owner: str,
+        nodes: Optional[Dict[str, Dict]],
+        edges: Optional[Dict[str, Dict]],
+        delta: GraphDelta,
+    ) -> None:
+        """
+        소유자(문서)의 기여분을 교체하고 변경된 항목만 delta에 기록
+
+        nodes/edges가 None이면 해당 소유자를 제거합니다 (완료 상태에서 벗어난 문서).
+        """
+        nodes = nodes or {}
+        edges = edges or {}
+        old_nodes, old_edges = self._owned.pop(owner, (set(), set()))
+
+        for items, old_ids, current, upserts, removals in (
+            (nodes, old_nodes, self.snapshot.nodes, delta.upsert_nodes, delta.remove_nodes),
+            (edges, old_edges, self.snapshot.edges, delta.upsert_edges, delta.remove_edges),
+        ):
+            for item_id, item in items.items():
+                self._owners.setdefault(item_id, set()).add(owner)
+                if current.get(item_id) != item:
+                    current[item_id] = item
+                    upserts.append(item)
+            for item_id in old_ids - items.keys():
+                owners = self._owners.get(item_id)
+                if owners is None:
+                    continue
+                owners.discard(owner)
+                if not owners:
+                    del self._owners[item_id]
+                    current.pop(item_id, None)
+                    removals.append(item_id)
+
+        if nodes or edges:
+            self._owned[owner] = (set(nodes), set(edges))
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    async def _fetch(self, db, since: Optional[datetime], document_ids: Iterable[str]):
+        """
+        변경 문서 + 해당 문서의 엔티티/관계 조회
+
+        문서 없는(GLOBAL_OWNER) 엔티티/관계는 그중 하나라도 since 이후 바뀌었을 때
+        전부 다시 읽습니다 (apply_owner가 소유자 기여분 전체를 교체하므로).
+        """
+        doc_columns = "id, insurer, product_type, title, status, updated_at"
+        explicit_ids = list(document_ids)
+
+        if since is None:
+            # 전체 빌드
+            result = await db.execute(text(f"""
+                SELECT {doc_columns} FROM crawler_documents
+                WHERE status = 'completed'
+                ORDER BY updated_at
+            """))
+        else:
+            # 문서 상태 변경 + 엔티티/관계가 새로 추가된 문서
+            result = await db.execute(text(f"""
+                SELECT {doc_columns} FROM crawler_documents
+                WHERE updated_at > :since
+                   OR id::text = ANY(:document_ids)
+                   OR id::text IN (
+                       SELECT document_id FROM knowledge_entities WHERE updated_at > :since
+                       UNION
+                       SELECT document_id FROM knowledge_relationships WHERE updated_at > :since
+                   )
+                ORDER BY updated_at
+            """), {"since": since, "document_ids": explicit_ids})
+        docs = [dict(row._mapping) for row in result.fetchall()]
+        doc_ids = [str(doc["id"]) for doc in docs]
+
+        global_changed = False
+        if since is not None:
+            result = await db.execute(text("""
+                SELECT EXISTS (
+                    SELECT 1 FROM knowledge_entities
+                    WHERE document_id IS NULL AND updated_at > :since
+                ) OR EXISTS (
+                    SELECT 1 FROM knowledge_relationships
+                    WHERE document_id IS NULL AND updated_at > :since
+                )
+            """), {"since": since})
+            global_changed = bool(result.scalar())
+
+        entities: Dict[str, List[Dict]] = {}
+        relationships: Dict[str, List[Dict]] = {}
+        if since is None or doc_ids or global_changed:
+            if since is None:
+                owner_filter = ""
+            elif global_changed:
+                owner_filter = "WHERE document_id = ANY(:doc_ids) OR document_id IS NULL"
+            else:
+                owner_filter = "WHERE document_id = ANY(:doc_ids)"
+            params = {} if since is None else {"doc_ids": doc_ids}
+            result = await db.execute(text(f"""
+                SELECT entity_id, label, type, description, source_text,
+                       document_id, insurer, product_type
+                FROM knowledge_entities
+                {owner_filter}
+                ORDER BY created_at
+            """), params)
+            for row in result.fetchall():
+                entity = dict(row._mapping)
+                entities.setdefault(entity["document_id"] or GLOBAL_OWNER, []).append(entity)
+
+            result = await db.execute(text(f"""
+                SELECT source_entity_id, target_entity_id, type, document_id
+                FROM knowledge_relationships
+                {owner_filter}
+                ORDER BY created_at
+            """), params)
+            for row in result.fetchall():
+                rel = dict(row._mapping)
+                relationships.setdefault(rel["document_id"] or GLOBAL_OWNER, []).append(rel)
+
+        return docs, entities, relationships
+
+    async def _db_now(self, db) -> datetime:
+        result = await db.execute(text("SELECT NOW()"))
+        return result.scalar()
+
+    async def build_full(self) -> GraphDelta:
+        """전체 재빌드 (워커 시작 시): 새 generation으로 base 저장"""
+        self.snapshot = GraphSnapshot(generation=uuid.uuid4().hex[:12])
+        self._owners.clear()
+        self._owned.clear()
+        self._documents.clear()
+
+        async with self.session_factory() as db:
+            started_at = await self._db_now(db)
+            docs, entities, relationships = await self._fetch(db, None, [])
+
+        delta = GraphDelta(generation=self.snapshot.generation)
+        for doc in docs:
+            self._apply_document(doc, entities, relationships, delta)
+        self._apply_global(entities, relationships, delta)
+
+        self.watermark = started_at
+        self.snapshot.metadata = self._metadata()
+        self.store.write_base(self.snapshot)
+        logger.info(
+            f"Graph snapshot rebuilt: {len(self.snapshot.nodes)} nodes, "
+            f"{len(self.snapshot.edges)} edges, {len(self._documents)} documents"
+        )
+        return delta
+
+    async def refresh(self, document_ids: Optional[Iterable[str]] = None) -> GraphDelta:
+        """
+        watermark 이후 변경된 문서만 반영
+
+        Args:
+            document_ids: 이벤트로 전달받은 변경 문서 id (watermark와 무관하게 확인)
+
+        Returns:
+            적용된 delta (변경 없으면 빈 delta, 로그에 기록하지 않음)
+        """
+        if self.watermark is None:
+            return await self.build_full()
+
+        async with self.session_factory() as db:
+            started_at = await self._db_now(db)
+            docs, entities, relationships = await self._fetch(
+                db, self.watermark - WATERMARK_OVERLAP, document_ids or []
+            )
+
+        delta = GraphDelta(generation=self.snapshot.generation)
+        for doc in docs:
+            self._apply_document(doc, entities, relationships, delta)
+        if GLOBAL_OWNER in entities or GLOBAL_OWNER in relationships:
+            self._apply_global(entities, relationships, delta)
+        self.watermark = started_at
+
+        if delta.is_empty():
+            return delta
+
+        delta.seq = self.snapshot.seq + 1
+        delta.metadata = self._metadata()
+        self.snapshot.seq = delta.seq
+        self.snapshot.metadata = delta.metadata
+
+        if self.store.should_compact():
+            self.store.write_base(self.snapshot)
+        else:
+            self.store.append(delta)
+        return delta
+
+    def _apply_document(
+        self,
+        doc: Dict[str, Any],
+        entities: Dict[str, List[Dict]],
+        relationships: Dict[str, List[Dict]],
+        delta: GraphDelta,
+    ) -> None:
+        doc_id = str(doc["id"])
+        if doc.get("status", "completed") != "completed":
+            # 완료 상태에서 벗어난 문서(재처리 등)는 그래프에서 제거
+            self._documents.pop(doc_id, None)
+            self.apply_owner(doc_id, None, None, delta)
+            return
+        nodes, edges = self.document_contribution(
+            doc, entities.get(doc_id, []), relationships.get(doc_id, [])
+        )
+        self._documents[doc_id] = (doc["insurer"], doc["product_type"] or "기타")
+        self.apply_owner(doc_id, nodes, edges, delta)
+
+    def _apply_global(
+        self,
+        entities: Dict[str, List[Dict]],
+        relationships: Dict[str, List[Dict]],
+        delta: GraphDelta,
+    ) -> None:
+        nodes, edges = self.entity_contribution(
+            entities.get(GLOBAL_OWNER, []), relationships.get(GLOBAL_OWNER, [])
+        )
+        self.apply_owner(GLOBAL_OWNER, nodes, edges, delta)
+
+    def _metadata(self) -> Dict[str, Any]:
+        return {
+            "total_documents": len(self._documents),
+            "total_insurers": len({insurer for insurer, _ in self._documents.values()}),
+            "total_product_types": len(set(self._documents.values())),
+            "generated_at": datetime.utcnow().isoformat() + "Z",
+            "last_update": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+
+
+_graph_snapshot_store: Optional[GraphSnapshotStore] = None
+
+
+def get_graph_snapshot_store() -> GraphSnapshotStore:
+    """GraphSnapshotStore 싱글톤 (API 읽기용)"""
+    global _graph_snapshot_store
+    if _graph_snapshot_store is None:
+        _graph_snapshot_store = GraphSnapshotStore()
+    return _graph_snapshot_store
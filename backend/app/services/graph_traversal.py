@@ -9,15 +9,20 @@ Traversal Types:
 3. Entity-based - 엔티티 기반 탐색 (금액, 질병 등)
 4. Multi-hop - 다중 홉 추론 (A → B → C)
 """
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any, Set
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Any, Set, Tuple
 from enum import Enum
 
 from neo4j import GraphDatabase
 from app.core.config import settings
+from app.services.graph_projection import GraphProjection, ProjectedPath, get_graph_projection
 from loguru import logger
 
 
+# Labels of the article hierarchy (each has a unique id constraint, see neo4j_graph_builder)
+HIERARCHY_LABELS = ("Article", "Paragraph", "Subclause")
+
+
 class TraversalType(str, Enum):
     """Type of graph traversal"""
     HIERARCHICAL = "hierarchical"  # 계층 구조
@@ -57,6 +62,25 @@ class TraversalResult:
     metadata: Dict[str, Any]
 
 
+@dataclass
+class BatchTraversalResult:
+    """Result of a multi-start traversal, grouped by start node"""
+    start_node_ids: List[str]
+    results: Dict[str, TraversalResult]
+    total_paths: int
+    traversal_type: TraversalType
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def all_paths(self) -> List[GraphPath]:
+        """Flatten paths in start-node order (i.e. search rank order)"""
+        paths: List[GraphPath] = []
+        for start_id in self.start_node_ids:
+            result = self.results.get(start_id)
+            if result:
+                paths.extend(result.paths)
+        return paths
+
+
 class GraphTraversal:
     """
     Graph traversal service for multi-hop reasoning.
@@ -66,6 +90,10 @@ class GraphTraversal:
     - Entity-based traversal (find related entities)
     - Multi-hop reasoning (A → B → C)
     - Path finding (shortest/best path)
+
+    Multi-hop queries (related articles, entity traversal, shortest path)
+    are served from an in-process GraphProjection when one is attached;
+    Neo4j is then only used to hydrate the nodes on the resulting paths.
     """
 
     def __init__(
@@ -74,6 +102,7 @@ class GraphTraversal:
         user: Optional[str] = None,
         password: Optional[str] = None,
         max_depth: int = 5,
+        projection: Optional[GraphProjection] = None,
     ):
         """
         Initialize graph traversal.
@@ -83,11 +112,13 @@ class GraphTraversal:
             user: Neo4j username
             password: Neo4j password
             max_depth: Maximum traversal depth
+            projection: Optional Neo4j-sourced in-memory graph projection
         """
         self.uri = uri or settings.NEO4J_URI
         self.user = user or settings.NEO4J_USER
         self.password = password or settings.NEO4J_PASSWORD
         self.max_depth = max_depth
+        self.projection = projection
 
         self.driver = GraphDatabase.driver(
             self.uri,
@@ -187,6 +218,34 @@ class GraphTraversal:
         else:
             raise ValueError(f"Unknown entity type: {entity_type}")
 
+        if self._use_projection():
+            with self.driver.session() as session:
+                result = session.run(
+                    f"{entity_query} RETURN coalesce(e.id, elementId(e)) AS key",
+                    value=entity_value,
+                )
+                entity_keys = [record["key"] for record in result]
+
+            projected = self.projection.bfs_paths_multi(
+                entity_keys,
+                max_depth=max_hops,
+                direction="in",
+                target_label="Article",
+                limit=50,
+            )
+            paths = self._hydrate_paths(projected)
+            return TraversalResult(
+                query=f"Entity traversal: {entity_type}={entity_value}",
+                paths=paths,
+                total_paths=len(paths),
+                traversal_type=TraversalType.ENTITY_BASED,
+                metadata={
+                    "entity_type": entity_type,
+                    "entity_value": entity_value,
+                    "source": "projection",
+                },
+            )
+
         # Traverse from entity to articles
         query = f"""
         {entity_query}
@@ -229,6 +288,27 @@ class GraphTraversal:
         Returns:
             TraversalResult with related articles
         """
+        if self._use_projection() and self.projection.contains(article_id):
+            projected = self.projection.bfs_paths(
+                article_id,
+                max_depth=max_hops,
+                rel_types=relation_types,
+                target_label="Article",
+                limit=50,
+            )
+            paths = self._hydrate_paths(projected)
+            return TraversalResult(
+                query=f"Related articles from {article_id}",
+                paths=paths,
+                total_paths=len(paths),
+                traversal_type=TraversalType.MULTI_HOP,
+                metadata={
+                    "start_article": article_id,
+                    "max_hops": max_hops,
+                    "source": "projection",
+                },
+            )
+
         # Find related articles through shared entities
         query = """
         MATCH (start:Article {id: $article_id})
@@ -274,6 +354,19 @@ class GraphTraversal:
         """
         max_depth = max_depth or self.max_depth
 
+        if (
+            self._use_projection()
+            and self.projection.contains(start_node_id)
+            and self.projection.contains(end_node_id)
+        ):
+            projected = self.projection.shortest_path(
+                start_node_id, end_node_id, max_depth=max_depth
+            )
+            if projected is None:
+                return None
+            paths = self._hydrate_paths([projected])
+            return paths[0] if paths else None
+
         query = """
         MATCH path = shortestPath(
             (start {id: $start_id})-[*..{max_depth}]-(end {id: $end_id})
@@ -291,6 +384,276 @@ class GraphTraversal:
 
         return None
 
+    def traverse_hierarchical_batch(
+        self,
+        start_node_ids: List[str],
+        direction: str = "down",
+        max_depth: Optional[int] = None,
+        limit_per_start: int = 100,
+        dedupe_shared: bool = True,
+    ) -> BatchTraversalResult:
+        """
+        Traverse hierarchical structure from several start nodes in one query.
+
+        Args:
+            start_node_ids: Starting node IDs (in rank order)
+            direction: "up" (to parent) or "down" (to children)
+            max_depth: Maximum depth (default: self.max_depth)
+            limit_per_start: Maximum paths expanded per start node
+            dedupe_shared: Drop paths already covered by a higher-ranked start
+
+        Returns:
+            BatchTraversalResult with paths grouped by start node
+        """
+        max_depth = max_depth or self.max_depth
+
+        if direction == "down":
+            pattern = "(start)-[:HAS_PARAGRAPH|HAS_SUBCLAUSE*1..{max_depth}]->(end)"
+        else:
+            pattern = "(start)<-[:HAS_PARAGRAPH|HAS_SUBCLAUSE*1..{max_depth}]-(end)"
+        pattern = pattern.replace("{max_depth}", str(max_depth))
+
+        grouped = self._run_batch(
+            pattern=pattern,
+            start_node_ids=start_node_ids,
+            limit_per_start=limit_per_start,
+            start_labels=HIERARCHY_LABELS,
+        )
+
+        return self._build_batch_result(
+            start_node_ids=start_node_ids,
+            grouped=grouped,
+            traversal_type=TraversalType.HIERARCHICAL,
+            dedupe_shared=dedupe_shared,
+            metadata={
+                "direction": direction,
+                "max_depth": max_depth,
+                "limit_per_start": limit_per_start,
+            },
+        )
+
+    def find_related_articles_batch(
+        self,
+        article_ids: List[str],
+        relation_types: Optional[List[str]] = None,
+        max_hops: int = 3,
+        limit_per_start: int = 50,
+        dedupe_shared: bool = True,
+    ) -> BatchTraversalResult:
+        """
+        Find articles related to several articles in one query.
+
+        Unlike find_related_articles, expansion is bounded per start node
+        (LIMIT inside a CALL subquery, so Neo4j stops expanding once enough
+        paths are found) and can be restricted to given relationship types.
+
+        Args:
+            article_ids: Starting article IDs (in rank order)
+            relation_types: Types of relationships to follow (optional)
+            max_hops: Maximum hops
+            limit_per_start: Maximum paths expanded per start article
+            dedupe_shared: Drop paths already covered by a higher-ranked start
+
+        Returns:
+            BatchTraversalResult with related articles grouped by start article
+        """
+        rel_filter = ""
+        if relation_types:
+            for rel_type in relation_types:
+                if not rel_type.replace("_", "").isalnum():
+                    raise ValueError(f"Invalid relationship type: {rel_type}")
+            rel_filter = ":" + "|".join(relation_types)
+
+        pattern = "(start:Article)-[{rel_filter}*1..{max_hops}]-(end:Article)".replace(
+            "{rel_filter}", rel_filter
+        ).replace("{max_hops}", str(max_hops))
+
+        grouped = self._run_batch(
+            pattern=pattern,
+            start_node_ids=article_ids,
+            limit_per_start=limit_per_start,
+            start_labels=("Article",),
+            where="start <> end",
+        )
+
+        return self._build_batch_result(
+            start_node_ids=article_ids,
+            grouped=grouped,
+            traversal_type=TraversalType.MULTI_HOP,
+            dedupe_shared=dedupe_shared,
+            undirected=True,
+            metadata={
+                "relation_types": relation_types,
+                "max_hops": max_hops,
+                "limit_per_start": limit_per_start,
+            },
+        )
+
+    def _run_batch(
+        self,
+        pattern: str,
+        start_node_ids: List[str],
+        limit_per_start: int,
+        start_labels: Tuple[str, ...],
+        where: Optional[str] = None,
+    ) -> Dict[str, List[Any]]:
+        """Run one UNWIND query and collect raw Neo4j paths per start node"""
+        grouped: Dict[str, List[Any]] = {start_id: [] for start_id in start_node_ids}
+        if not start_node_ids:
+            return grouped
+
+        # One labelled lookup per label so each uses its id uniqueness constraint
+        start_match = "\n            UNION\n".join(
+            f"            WITH start_id MATCH (start:{label} {{id: start_id}}) RETURN start"
+            for label in start_labels
+        )
+        where_clause = f"WHERE {where}" if where else ""
+        query = """
+        UNWIND $start_ids AS start_id
+        CALL {
+{start_match}
+        }
+        CALL {
+            WITH start
+            MATCH path = {pattern}
+            {where_clause}
+            RETURN path
+            LIMIT $limit_per_start
+        }
+        RETURN start_id, path
+        """.replace("{start_match}", start_match).replace("{pattern}", pattern).replace(
+            "{where_clause}", where_clause
+        )
+
+        with self.driver.session() as session:
+            result = session.run(
+                query,
+                start_ids=list(grouped.keys()),
+                limit_per_start=limit_per_start,
+            )
+            for record in result:
+                grouped[record["start_id"]].append(record["path"])
+
+        return grouped
+
+    def _build_batch_result(
+        self,
+        start_node_ids: List[str],
+        grouped: Dict[str, List[Any]],
+        traversal_type: TraversalType,
+        dedupe_shared: bool,
+        metadata: Dict[str, Any],
+        undirected: bool = False,
+    ) -> BatchTraversalResult:
+        """
+        Convert grouped paths, dropping duplicates and shared subpaths.
+
+        For undirected patterns a path found from the other end (B → A after
+        A → B) is the same path and is dropped as well.
+        """
+        covered: Set[Tuple[str, ...]] = set()
+        results: Dict[str, TraversalResult] = {}
+        total_paths = 0
+        skipped = 0
+
+        for start_id in dict.fromkeys(start_node_ids):
+            paths: List[GraphPath] = []
+            seen: Set[Tuple[str, ...]] = set()
+            for neo4j_path in grouped.get(start_id, []):
+                graph_path = self._convert_path(neo4j_path)
+                signature = tuple(node.node_id for node in graph_path.nodes)
+                if signature in seen or (dedupe_shared and (
+                    signature in covered or (undirected and signature[::-1] in covered)
+                )):
+                    skipped += 1
+                    continue
+                seen.add(signature)
+                paths.append(graph_path)
+
+            if dedupe_shared:
+                # Every contiguous subpath of a kept path is covered for
+                # lower-ranked starts (e.g. a Paragraph under an Article
+                # that was already expanded).
+                for signature in seen:
+                    for i in range(len(signature)):
+                        for j in range(i + 2, len(signature) + 1):
+                            covered.add(signature[i:j])
+
+            results[start_id] = TraversalResult(
+                query=f"Batch traversal from {start_id}",
+                paths=paths,
+                total_paths=len(paths),
+                traversal_type=traversal_type,
+                metadata=metadata,
+            )
+            total_paths += len(paths)
+
+        return BatchTraversalResult(
+            start_node_ids=list(results.keys()),
+            results=results,
+            total_paths=total_paths,
+            traversal_type=traversal_type,
+            metadata={**metadata, "deduplicated_paths": skipped},
+        )
+
+    def _use_projection(self) -> bool:
+        """Projection keys match Neo4j node ids only if built from Neo4j"""
+        if self.projection is None or not self.projection.is_loaded:
+            return False
+        if self.projection.source == "neo4j":
+            # Pick up documents ingested since the last build (rebuilds in the background)
+            self.projection.refresh_if_stale(self.driver, settings.GRAPH_PROJECTION_REFRESH_SECONDS)
+        return self.projection.source == "neo4j"
+
+    def _hydrate_paths(self, projected: List[ProjectedPath]) -> List[GraphPath]:
+        """Load node properties for projected paths in a single query"""
+        element_ids = {
+            self.projection.element_id(node_id)
+            for path in projected
+            for node_id in path.node_ids
+        }
+        element_ids.discard(None)
+
+        nodes_by_eid: Dict[str, Any] = {}
+        if element_ids:
+            with self.driver.session() as session:
+                result = session.run(
+                    "MATCH (n) WHERE elementId(n) IN $eids RETURN elementId(n) AS eid, n",
+                    eids=list(element_ids),
+                )
+                for record in result:
+                    nodes_by_eid[record["eid"]] = record["n"]
+
+        paths = []
+        for path in projected:
+            nodes = []
+            for node_id in path.node_ids:
+                node = nodes_by_eid.get(self.projection.element_id(node_id))
+                if node is not None:
+                    labels = list(node.labels)
+                    nodes.append(GraphNode(
+                        node_id=node.get("id", node_id),
+                        node_type=labels[0] if labels else "Unknown",
+                        text=node.get("text", node.get("name", "")),
+                        properties=dict(node),
+                    ))
+                else:
+                    nodes.append(GraphNode(
+                        node_id=node_id,
+                        node_type=self.projection.node_label(node_id) or "Unknown",
+                        text="",
+                        properties={},
+                    ))
+
+            paths.append(GraphPath(
+                nodes=nodes,
+                relationships=path.relationships,
+                path_length=len(nodes),
+                relevance_score=1.0 / (len(nodes) + 1),
+            ))
+
+        return paths
+
     def _convert_path(self, neo4j_path) -> GraphPath:
         """Convert Neo4j path object to GraphPath"""
         nodes = []
@@ -367,7 +730,7 @@ def get_graph_traversal() -> GraphTraversal:
     """Get or create singleton graph traversal instance"""
     global _graph_traversal
     if _graph_traversal is None:
-        _graph_traversal = GraphTraversal()
+        _graph_traversal = GraphTraversal(projection=get_graph_projection())
     return _graph_traversal
 
 
@@ -306,19 +306,14 @@ class HybridDocumentProcessor:
     ) -> Dict[str, Any]:
         """첫 N페이지 샘플링 (pdfplumber 사용)"""
 
-        import httpx
-        import io
         import pdfplumber
+        from app.services.pdf_blob_store import get_pdf_blob_store
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(pdf_url)
-            response.raise_for_status()
-            pdf_bytes = response.content
-
-        pdf_file = io.BytesIO(pdf_bytes)
+        # 샘플링 후 전체 추출 단계에서도 같은 blob을 재사용
+        blob = await get_pdf_blob_store().fetch(pdf_url)
 
         sample_text = ""
-        with pdfplumber.open(pdf_file) as pdf:
+        with blob.open_mmap() as pdf_file, pdfplumber.open(pdf_file) as pdf:
             for i, page in enumerate(pdf.pages[:num_pages]):
                 text = page.extract_text()
                 if text:
@@ -1,11 +1,14 @@
 """
 LLM client wrapper for multiple LLM providers
+
+All calls go through the shared LLM gateway (connection pooling, rate limiting,
+retries and telemetry live there).
 """
-import json
 import os
 from typing import Dict, Any, Optional
 from abc import ABC, abstractmethod
-import httpx
+
+from app.services.llm_gateway import LLMError, LLMGateway, LLMRequest, get_llm_gateway
 
 
 class LLMClient(ABC):
@@ -30,12 +33,12 @@ class LLMClient(ABC):
 class UpstageClient(LLMClient):
     """Client for Upstage Solar API"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, gateway: Optional[LLMGateway] = None):
         self.api_key = api_key or os.getenv("UPSTAGE_API_KEY")
         if not self.api_key:
             raise ValueError("UPSTAGE_API_KEY not found in environment")
 
-        self.base_url = "https://api.upstage.ai/v1/solar"
+        self.gateway = gateway or get_llm_gateway()
         self.model = "solar-pro"
 
     async def generate(
@@ -45,56 +48,36 @@ class UpstageClient(LLMClient):
         max_tokens: int = 2000,
     ) -> Dict[str, Any]:
         """Generate response from Upstage Solar Pro"""
-
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
-        payload = {
+        try:
+            response = await self.gateway.complete(LLMRequest(
+                provider="upstage",
+                model=self.model,
+                api_key=self.api_key,
+                system="당신은 보험 약관 분석 전문가입니다.",
+                messages=[{"role": "user", "content": prompt}],
+                temperature=temperature,
+                max_tokens=max_tokens,
+            ))
+        except LLMError as e:
+            raise Exception(f"Upstage API error: {str(e)}")
+
+        return {
+            "text": response.text,
             "model": self.model,
-            "messages": [
-                {"role": "system", "content": "당신은 보험 약관 분석 전문가입니다."},
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": temperature,
-            "max_tokens": max_tokens,
+            # Default confidence for Solar Pro
+            "confidence": 0.85,
         }
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            try:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload,
-                )
-                response.raise_for_status()
-
-                data = response.json()
-                text = data["choices"][0]["message"]["content"]
-
-                # Extract confidence from response if available
-                confidence = 0.85  # Default confidence for Solar Pro
-
-                return {
-                    "text": text,
-                    "model": self.model,
-                    "confidence": confidence,
-                }
-
-            except httpx.HTTPError as e:
-                raise Exception(f"Upstage API error: {str(e)}")
-
 
 class OpenAIClient(LLMClient):
     """Client for OpenAI GPT-4o API"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, gateway: Optional[LLMGateway] = None):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY not found in environment")
 
-        self.base_url = "https://api.openai.com/v1"
+        self.gateway = gateway or get_llm_gateway()
         self.model = "gpt-4o"
 
     async def generate(
@@ -104,46 +87,26 @@ class OpenAIClient(LLMClient):
         max_tokens: int = 2000,
     ) -> Dict[str, Any]:
         """Generate response from OpenAI GPT-4o"""
-
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
-        payload = {
+        try:
+            response = await self.gateway.complete(LLMRequest(
+                provider="openai",
+                model=self.model,
+                api_key=self.api_key,
+                system="You are an expert in analyzing insurance policy documents.",
+                messages=[{"role": "user", "content": prompt}],
+                temperature=temperature,
+                max_tokens=max_tokens,
+            ))
+        except LLMError as e:
+            raise Exception(f"OpenAI API error: {str(e)}")
+
+        return {
+            "text": response.text,
             "model": self.model,
-            "messages": [
-                {"role": "system", "content": "You are an expert in analyzing insurance policy documents."},
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": temperature,
-            "max_tokens": max_tokens,
+            # GPT-4o typically has higher confidence
+            "confidence": 0.90,
         }
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            try:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload,
-                )
-                response.raise_for_status()
-
-                data = response.json()
-                text = data["choices"][0]["message"]["content"]
-
-                # GPT-4o typically has higher confidence
-                confidence = 0.90
-
-                return {
-                    "text": text,
-                    "model": self.model,
-                    "confidence": confidence,
-                }
-
-            except httpx.HTTPError as e:
-                raise Exception(f"OpenAI API error: {str(e)}")
-
 
 class LLMClientFactory:
     """Factory for creating LLM clients"""
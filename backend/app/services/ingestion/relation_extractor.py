@@ -8,6 +8,10 @@ Uses cascade strategy:
 1. Try Upstage Solar Pro first (cost-effective)
 2. If confidence < 0.7, retry with GPT-4o (more accurate)
 3. Validate all extractions against rule-based critical data
+
+Final LLM responses are persisted in the LLM result cache, keyed by prompt
+template version, cascade models and the normalized clause + critical data,
+so re-ingesting a document does not pay for the same clauses again.
 """
 import json
 import re
@@ -20,6 +24,15 @@ from app.models.relation import (
 )
 from app.models.critical_data import CriticalData
 from app.services.ingestion.llm_client import LLMClientFactory
+from app.services.llm_result_cache import (
+    LLMResultCache,
+    get_llm_result_cache,
+    make_cache_key,
+)
+
+
+# Bump when RELATION_EXTRACTION_PROMPT or the response handling changes
+RELATION_EXTRACTION_TEMPLATE = "relation_extraction@1"
 
 
 # Prompt template for relation extraction
@@ -65,9 +78,12 @@ RELATION_EXTRACTION_PROMPT = """당신은 보험 약관 전문가입니다. 다
 class RelationExtractor:
     """Extracts relations from clauses using LLM"""
 
-    def __init__(self):
+    def __init__(self, cache: Optional[LLMResultCache] = None):
         self.upstage_client = LLMClientFactory.create_client("upstage")
         self.openai_client = LLMClientFactory.create_client("openai")
+        self.cache = cache or get_llm_result_cache()
+        # Responses loaded by prefetch(), consumed by extract()
+        self._prefetched: Dict[str, Dict[str, Any]] = {}
 
         # Confidence thresholds
         self.HIGH_CONFIDENCE = 0.85
@@ -91,21 +107,28 @@ class RelationExtractor:
         Returns:
             RelationExtractionResult with extracted relations and validation status
         """
-        # Step 1: Try Solar Pro first
-        llm_response = await self._call_llm(
-            self.upstage_client,
-            clause_text,
-            critical_data,
-        )
-
-        # Step 2: Cascade to GPT-4o if confidence is low
-        if use_cascade and llm_response["confidence"] < self.RETRY_THRESHOLD:
+        cache_key = self._cache_key(clause_text, critical_data, use_cascade)
+        llm_response = self._prefetched.pop(cache_key, None)
+        if llm_response is None and self.cache is not None:
+            llm_response = await self.cache.get(cache_key)
+
+        from_llm = llm_response is None
+        if from_llm:
+            # Step 1: Try Solar Pro first
             llm_response = await self._call_llm(
-                self.openai_client,
+                self.upstage_client,
                 clause_text,
                 critical_data,
             )
 
+            # Step 2: Cascade to GPT-4o if confidence is low
+            if use_cascade and llm_response["confidence"] < self.RETRY_THRESHOLD:
+                llm_response = await self._call_llm(
+                    self.openai_client,
+                    clause_text,
+                    critical_data,
+                )
+
         # Step 3: Parse LLM response
         try:
             relations = self._parse_llm_response(llm_response["text"], clause_text)
@@ -118,6 +141,15 @@ class RelationExtractor:
                 validation_errors=[f"Failed to parse LLM response: {str(e)}"],
             )
 
+        # Only parseable responses are cached (a bad one would be replayed for the whole TTL)
+        if from_llm and self.cache is not None:
+            await self.cache.set(
+                cache_key,
+                llm_response,
+                RELATION_EXTRACTION_TEMPLATE,
+                llm_response["model"],
+            )
+
         # Step 4: Validate against critical data
         validated_relations, validation_errors, validation_warnings = self._validate_relations(
             relations,
@@ -140,6 +172,57 @@ class RelationExtractor:
             validation_warnings=validation_warnings,
         )
 
+    async def prefetch(
+        self,
+        clause_texts: List[str],
+        critical_data: CriticalData,
+        use_cascade: bool = True,
+    ) -> int:
+        """
+        Bulk-load cached responses for a document's clauses
+
+        Call once before extracting each clause so a re-ingested document
+        costs one cache query instead of one lookup per clause.
+
+        Returns:
+            Number of clauses found in the cache
+        """
+        if self.cache is None or not clause_texts:
+            return 0
+
+        keys = [
+            self._cache_key(text, critical_data, use_cascade)
+            for text in clause_texts
+        ]
+        found = await self.cache.get_many(keys)
+        self._prefetched.update(found)
+        return len(found)
+
+    def _cache_key(
+        self,
+        clause_text: str,
+        critical_data: CriticalData,
+        use_cascade: bool,
+    ) -> str:
+        """Cache key: template version + cascade models + prompt inputs"""
+        models = self.upstage_client.model
+        if use_cascade:
+            models = f"{models}>{self.openai_client.model}"
+        return make_cache_key(
+            RELATION_EXTRACTION_TEMPLATE,
+            models,
+            clause_text,
+            *self._format_critical_data(critical_data),
+        )
+
+    @staticmethod
+    def _format_critical_data(critical_data: CriticalData) -> tuple[str, str, str]:
+        """Format critical data for the prompt (amounts, periods, KCD codes)"""
+        amounts_str = ", ".join([f"{a.original_text} ({a.value:,}원)" for a in critical_data.amounts])
+        periods_str = ", ".join([f"{p.original_text} ({p.days}일)" for p in critical_data.periods])
+        kcd_codes_str = ", ".join([k.code for k in critical_data.kcd_codes])
+        return amounts_str or "없음", periods_str or "없음", kcd_codes_str or "없음"
+
     async def _call_llm(
         self,
         client,
@@ -147,16 +230,13 @@ class RelationExtractor:
         critical_data: CriticalData,
     ) -> Dict[str, Any]:
         """Call LLM with prompt"""
-        # Format critical data for prompt
-        amounts_str = ", ".join([f"{a.original_text} ({a.value:,}원)" for a in critical_data.amounts])
-        periods_str = ", ".join([f"{p.original_text} ({p.days}일)" for p in critical_data.periods])
-        kcd_codes_str = ", ".join([k.code for k in critical_data.kcd_codes])
+        amounts_str, periods_str, kcd_codes_str = self._format_critical_data(critical_data)
 
         prompt = RELATION_EXTRACTION_PROMPT.format(
             clause_text=clause_text,
-            amounts=amounts_str or "없음",
-            periods=periods_str or "없음",
-            kcd_codes=kcd_codes_str or "없음",
+            amounts=amounts_str,
+            periods=periods_str,
+            kcd_codes=kcd_codes_str,
         )
 
         response = await client.generate(prompt, temperature=0.3, max_tokens=2000)
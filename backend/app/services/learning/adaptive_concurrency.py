@@ -0,0 +1,120 @@
+"""
+Adaptive Concurrency Limiter
+
+LLM 호출 동시성 제한기 (AIMD).
+
+- 성공 응답이 목표 지연 안에 오면 한도를 천천히 늘림 (한도만큼 성공할 때마다 +1)
+- 429/과부하 응답이면 한도를 절반으로 줄임 (같은 구간의 연속 429는 한 번만 반영)
+- 목표 지연을 넘긴 응답은 한도를 1 줄임
+
+사용 예:
+    limiter = AdaptiveConcurrencyLimiter(initial=4, max_limit=16)
+    async with limiter.slot() as slot:
+        try:
+            response = await call_llm()
+        except RateLimitError:
+            slot.throttled = True
+            raise
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+
+class _Slot:
+    """slot() 안에서 호출 결과를 기록하는 핸들"""
+
+    def __init__(self):
+        self.throttled = False
+        self.failed = False
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD 방식 동시성 제한기"""
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        latency_target_seconds: Optional[float] = 30.0,
+        decrease_cooldown_seconds: float = 1.0,
+    ):
+        """
+        Args:
+            initial: 시작 동시성 한도
+            min_limit: 최소 한도
+            max_limit: 최대 한도
+            latency_target_seconds: 목표 응답 시간 (None이면 지연 기반 조정 안 함)
+            decrease_cooldown_seconds: 연속 감소 최소 간격 (429 폭주 시 과도한 감소 방지)
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = min(max(initial, self.min_limit), self.max_limit)
+        self.latency_target_seconds = latency_target_seconds
+        self.decrease_cooldown_seconds = decrease_cooldown_seconds
+
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.throttled_count = 0
+        self._successes_since_increase = 0
+        self._last_decrease = 0.0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    async def release(self, latency: float, throttled: bool = False, failed: bool = False) -> None:
+        """
+        호출 종료 및 한도 조정
+
+        Args:
+            latency: 호출 소요 시간 (초)
+            throttled: 429/과부하 응답 여부
+            failed: 그 외 실패 여부 (한도 조정 없음)
+        """
+        async with self._condition:
+            self.in_flight -= 1
+            if throttled:
+                self.throttled_count += 1
+                self._decrease(self.limit // 2)
+            elif failed:
+                pass
+            elif self.latency_target_seconds is not None and latency > self.latency_target_seconds:
+                self._decrease(self.limit - 1)
+            else:
+                self._successes_since_increase += 1
+                if self._successes_since_increase >= self.limit and self.limit < self.max_limit:
+                    self.limit += 1
+                    self._successes_since_increase = 0
+            self._condition.notify_all()
+
+    def _decrease(self, new_limit: int) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.decrease_cooldown_seconds:
+            return
+        self._last_decrease = now
+        self.limit = max(self.min_limit, new_limit)
+        self._successes_since_increase = 0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[_Slot]:
+        """동시성 슬롯 (블록 안에서 slot.throttled / slot.failed 설정)"""
+        await self.acquire()
+        handle = _Slot()
+        started = time.monotonic()
+        try:
+            yield handle
+        except BaseException:
+            handle.failed = handle.failed or not handle.throttled
+            raise
+        finally:
+            await self.release(
+                time.monotonic() - started,
+                throttled=handle.throttled,
+                failed=handle.failed,
+            )
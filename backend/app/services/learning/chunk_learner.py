@@ -5,34 +5,90 @@ Semantic Chunking Learner - Caching-based Learning
 - 70-80% 비용 절감 효과
 - 의미 단위로 청킹 (조항, 절 등)
 - Redis 캐시로 중복 처리 방지
+- 문서 단위 일괄 조회(MGET)/저장(pipeline)으로 Redis 왕복 2회
+- 캐시 값은 압축 저장 (zstandard 설치 시 zstd, 없으면 zlib)
 """
+import asyncio
 import hashlib
 import json
-from typing import Dict, List, Optional
+import zlib
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from loguru import logger
 import redis.asyncio as redis
 
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+CACHE_KEY_PREFIX = "chunk:learned:"
+
+# 캐시 값 형식 표시 (첫 바이트). 접두어가 없는 값은 이전 버전의 평문 JSON
+_ZSTD_PREFIX = b"Z"
+_ZLIB_PREFIX = b"z"
+
+# 문서별 캐시 적중률 히스토그램 버킷 (상한, 누적)
+HIT_RATIO_BUCKETS = (0.0, 0.1, 0.25, 0.5, 0.75, 0.9, 1.0)
+
+# 적중률 히스토그램 Redis 해시 (학습 워커와 API 프로세스가 공유)
+HIT_RATIO_KEY = "chunk:stats:hit_ratio"
+
+
+def encode_cache_value(value: Dict) -> bytes:
+    """학습 결과를 압축된 캐시 값으로 변환"""
+    raw = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if ZSTD_AVAILABLE:
+        return _ZSTD_PREFIX + zstandard.ZstdCompressor(level=3).compress(raw)
+    return _ZLIB_PREFIX + zlib.compress(raw, 6)
+
+
+def decode_cache_value(payload: Any) -> Optional[Dict]:
+    """캐시 값 복원 (형식을 알 수 없거나 손상된 값은 None → 캐시 MISS로 처리)"""
+    if payload is None:
+        return None
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+    try:
+        marker, body = payload[:1], payload[1:]
+        if marker == _ZSTD_PREFIX:
+            if not ZSTD_AVAILABLE:
+                return None
+            raw = zstandard.ZstdDecompressor().decompress(body)
+        elif marker == _ZLIB_PREFIX:
+            raw = zlib.decompress(body)
+        else:
+            raw = payload
+        return json.loads(raw)
+    except Exception as e:
+        # zlib.error, zstandard.ZstdError, JSON 오류
+        logger.warning(f"Invalid chunk cache value: {e}")
+        return None
+
 
 class SemanticChunkingLearner:
     """의미 기반 청킹 및 캐싱 학습기"""
 
-    def __init__(self, redis_url: Optional[str] = None):
+    def __init__(self, redis_url: Optional[str] = None, max_concurrency: int = 8):
         """
         Args:
             redis_url: Redis 연결 URL (None이면 기본값 사용)
+            max_concurrency: 캐시 MISS 청크의 동시 학습 개수
         """
         self.redis_url = redis_url or 'redis://localhost:6379/0'
         self.redis_client = None
         self.cache_ttl = 86400 * 30  # 30일
+        self.max_concurrency = max(1, max_concurrency)
 
     async def connect(self):
         """Redis 연결"""
         if not self.redis_client:
             try:
+                # 캐시 값이 압축 바이트이므로 응답을 디코딩하지 않음
                 self.redis_client = await redis.from_url(
                     self.redis_url,
-                    encoding="utf-8",
-                    decode_responses=True
+                    decode_responses=False
                 )
                 logger.info("Redis connected successfully")
             except Exception as e:
@@ -43,6 +99,7 @@ class SemanticChunkingLearner:
         """Redis 연결 종료"""
         if self.redis_client:
             await self.redis_client.close()
+            self.redis_client = None
             logger.info("Redis disconnected")
 
     def chunk_text_semantically(
@@ -157,23 +214,39 @@ class SemanticChunkingLearner:
         Returns:
             캐시된 학습 결과 또는 None
         """
-        if not self.redis_client:
-            return None
+        cached = await self.check_cache_many([chunk_hash])
+        return cached.get(chunk_hash)
 
-        try:
-            cache_key = f"chunk:learned:{chunk_hash}"
-            cached = await self.redis_client.get(cache_key)
+    async def check_cache_many(
+        self,
+        chunk_hashes: List[str]
+    ) -> Dict[str, Dict]:
+        """
+        여러 청크의 학습 결과를 한 번의 MGET으로 조회
 
-            if cached:
-                logger.info(f"Cache HIT for chunk {chunk_hash[:8]}")
-                return json.loads(cached)
-            else:
-                logger.debug(f"Cache MISS for chunk {chunk_hash[:8]}")
-                return None
+        Args:
+            chunk_hashes: 청크 해시 리스트
 
+        Returns:
+            {청크 해시: 학습 결과} (캐시 HIT만 포함)
+        """
+        if not self.redis_client or not chunk_hashes:
+            return {}
+
+        try:
+            payloads = await self.redis_client.mget(
+                [CACHE_KEY_PREFIX + chunk_hash for chunk_hash in chunk_hashes]
+            )
         except Exception as e:
             logger.error(f"Cache check failed: {e}")
-            return None
+            return {}
+
+        hits = {}
+        for chunk_hash, payload in zip(chunk_hashes, payloads):
+            result = decode_cache_value(payload)
+            if result is not None:
+                hits[chunk_hash] = result
+        return hits
 
     async def save_to_cache(
         self,
@@ -187,30 +260,80 @@ class SemanticChunkingLearner:
             chunk_hash: 청크 해시
             learning_result: 학습 결과
         """
-        if not self.redis_client:
+        await self.save_many_to_cache({chunk_hash: learning_result})
+
+    async def save_many_to_cache(
+        self,
+        learning_results: Dict[str, Dict],
+        hit_ratio: Optional[float] = None
+    ):
+        """
+        여러 학습 결과를 한 번의 pipeline으로 압축 저장
+
+        Args:
+            learning_results: {청크 해시: 학습 결과}
+            hit_ratio: 같은 pipeline으로 히스토그램에 기록할 문서 캐시 적중률
+        """
+        if not self.redis_client or not (learning_results or hit_ratio is not None):
             return
 
         try:
-            cache_key = f"chunk:learned:{chunk_hash}"
-            await self.redis_client.setex(
-                cache_key,
-                self.cache_ttl,
-                json.dumps(learning_result, ensure_ascii=False)
-            )
-            logger.info(f"Cached learning result for chunk {chunk_hash[:8]}")
+            pipe = self.redis_client.pipeline(transaction=False)
+            for chunk_hash, learning_result in learning_results.items():
+                pipe.setex(
+                    CACHE_KEY_PREFIX + chunk_hash,
+                    self.cache_ttl,
+                    encode_cache_value(learning_result)
+                )
+            if hit_ratio is not None:
+                self.record_hit_ratio(pipe, hit_ratio)
+            await pipe.execute()
+            if learning_results:
+                logger.info(f"Cached {len(learning_results)} chunk learning results")
 
         except Exception as e:
             logger.error(f"Cache save failed: {e}")
 
+    @staticmethod
+    def record_hit_ratio(pipe, hit_ratio: float):
+        """문서 하나의 캐시 적중률을 Redis 히스토그램에 기록 (누적 버킷)"""
+        for bucket in HIT_RATIO_BUCKETS:
+            if hit_ratio <= bucket:
+                pipe.hincrby(HIT_RATIO_KEY, str(bucket), 1)
+        pipe.hincrbyfloat(HIT_RATIO_KEY, "sum", hit_ratio)
+        pipe.hincrby(HIT_RATIO_KEY, "count", 1)
+
+    async def get_hit_ratio_histogram(self) -> Dict:
+        """
+        모든 프로세스가 누적한 문서별 캐시 적중률 히스토그램
+
+        Returns:
+            {"buckets": {상한: 누적 문서 수}, "sum": 적중률 합, "count": 문서 수}
+        """
+        raw: Dict[str, float] = {}
+        if self.redis_client:
+            for field, value in (await self.redis_client.hgetall(HIT_RATIO_KEY)).items():
+                if isinstance(field, bytes):
+                    field = field.decode("utf-8")
+                raw[field] = float(value)
+        return {
+            "buckets": {str(bucket): int(raw.get(str(bucket), 0)) for bucket in HIT_RATIO_BUCKETS},
+            "sum": raw.get("sum", 0.0),
+            "count": int(raw.get("count", 0)),
+        }
+
     async def learn_with_caching(
         self,
         text: str,
         document_id: str,
-        learning_callback
+        learning_callback: Callable[[str], Awaitable[Dict]]
     ) -> Dict:
         """
         캐싱을 활용한 학습
 
+        모든 청크 해시를 먼저 계산해 한 번에 조회하고, MISS 청크만 동시에 학습한 뒤
+        결과를 한 번에 저장합니다. 같은 문서 안의 동일 청크는 한 번만 학습합니다.
+
         Args:
             text: 문서 텍스트
             document_id: 문서 ID
@@ -224,58 +347,82 @@ class SemanticChunkingLearner:
 
         # 1. 의미 단위로 청킹
         chunks = self.chunk_text_semantically(text)
-
-        # 2. 각 청크별로 캐시 확인 및 학습
         total_chunks = len(chunks)
-        cached_chunks = 0
-        learned_chunks = 0
-        chunk_results = []
+        chunk_hashes = [self.calculate_chunk_hash(chunk["text"]) for chunk in chunks]
 
-        for i, chunk in enumerate(chunks):
-            chunk_hash = self.calculate_chunk_hash(chunk["text"])
+        # 2. 캐시 일괄 조회 (Redis 왕복 1회)
+        unique_hashes = list(dict.fromkeys(chunk_hashes))
+        cached = await self.check_cache_many(unique_hashes)
 
-            # 캐시 확인
-            cached_result = await self.check_cache(chunk_hash)
+        # 3. MISS 청크 동시 학습 (해시당 한 번)
+        chunk_text_by_hash = {}
+        for chunk, chunk_hash in zip(chunks, chunk_hashes):
+            if chunk_hash not in cached:
+                chunk_text_by_hash.setdefault(chunk_hash, chunk["text"])
 
-            if cached_result:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def learn(chunk_hash: str) -> Dict:
+            async with semaphore:
+                return await learning_callback(chunk_text_by_hash[chunk_hash])
+
+        miss_hashes = list(chunk_text_by_hash)
+        if miss_hashes:
+            logger.info(
+                f"[{document_id[:8]}] Learning {len(miss_hashes)} uncached chunks "
+                f"(concurrency: {self.max_concurrency})"
+            )
+        outcomes = await asyncio.gather(
+            *(learn(chunk_hash) for chunk_hash in miss_hashes),
+            return_exceptions=True
+        )
+
+        learned = {}
+        errors = {}
+        for chunk_hash, outcome in zip(miss_hashes, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Chunk learning failed: {outcome}")
+                errors[chunk_hash] = str(outcome)
+            else:
+                learned[chunk_hash] = outcome
+
+        cached_chunks = sum(1 for chunk_hash in chunk_hashes if chunk_hash in cached)
+        cache_hit_ratio = cached_chunks / total_chunks if total_chunks > 0 else 0
+
+        # 4. 학습 결과 + 적중률 일괄 저장 (Redis 왕복 1회, 실패한 청크는 저장하지 않음)
+        await self.save_many_to_cache(
+            learned, hit_ratio=cache_hit_ratio if total_chunks > 0 else None
+        )
+
+        learned_chunks = 0
+        chunk_results = []
+        for i, (chunk, chunk_hash) in enumerate(zip(chunks, chunk_hashes)):
+            if chunk_hash in cached:
                 # 캐시 HIT
-                cached_chunks += 1
                 chunk_results.append({
                     "chunk_id": i,
                     "type": chunk["type"],
                     "cached": True,
-                    "result": cached_result
+                    "result": cached[chunk_hash]
+                })
+            elif chunk_hash in learned:
+                learned_chunks += 1
+                chunk_results.append({
+                    "chunk_id": i,
+                    "type": chunk["type"],
+                    "cached": False,
+                    "result": learned[chunk_hash]
                 })
-
             else:
-                # 캐시 MISS - 실제 학습 수행
                 learned_chunks += 1
-                logger.info(f"Learning chunk {i+1}/{total_chunks} (type: {chunk['type']})")
-
-                try:
-                    learning_result = await learning_callback(chunk["text"])
-
-                    # 캐시에 저장
-                    await self.save_to_cache(chunk_hash, learning_result)
-
-                    chunk_results.append({
-                        "chunk_id": i,
-                        "type": chunk["type"],
-                        "cached": False,
-                        "result": learning_result
-                    })
-
-                except Exception as e:
-                    logger.error(f"Chunk learning failed: {e}")
-                    chunk_results.append({
-                        "chunk_id": i,
-                        "type": chunk["type"],
-                        "cached": False,
-                        "error": str(e)
-                    })
+                chunk_results.append({
+                    "chunk_id": i,
+                    "type": chunk["type"],
+                    "cached": False,
+                    "error": errors[chunk_hash]
+                })
 
-        # 3. 비용 절감 계산
-        cache_hit_ratio = cached_chunks / total_chunks if total_chunks > 0 else 0
+        # 5. 비용 절감 계산
         cost_saving = cache_hit_ratio * 0.7  # 캐시된 비율만큼 70% 절감
 
         logger.info(f"Caching stats: {cached_chunks}/{total_chunks} cached ({cache_hit_ratio:.1%})")
@@ -340,10 +487,11 @@ class SemanticChunkingLearner:
             캐시 통계
         """
         if not self.redis_client:
-            return {"status": "disconnected"}
+            return {"status": "disconnected", "hit_ratio_histogram": await self.get_hit_ratio_histogram()}
 
         try:
             info = await self.redis_client.info()
+            hit_ratio = await self.get_hit_ratio_histogram()
 
             # 캐시 키 개수 조회
             cursor = 0
@@ -364,7 +512,9 @@ class SemanticChunkingLearner:
                 "status": "connected",
                 "cached_chunks": chunk_count,
                 "memory_used_mb": int(info.get("used_memory", 0)) / 1024 / 1024,
-                "keys_total": info.get("db0", {}).get("keys", 0)
+                "keys_total": info.get("db0", {}).get("keys", 0),
+                "compression": "zstd" if ZSTD_AVAILABLE else "zlib",
+                "hit_ratio_histogram": hit_ratio
             }
 
         except Exception as e:
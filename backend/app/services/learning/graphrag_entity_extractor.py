@@ -2,13 +2,102 @@
 GraphRAG 스타일 엔티티 추출기
 
 보험 문서에서 깊이 있는 엔티티와 관계를 추출합니다.
+
+여러 청크는 적응형 동시성 제한(AdaptiveConcurrencyLimiter) 아래에서 동시에 추출하고,
+짧은 청크 여러 개는 한 프롬프트로 묶어 청크별 JSON으로 나눠 받습니다.
+결과는 항상 입력 청크 순서대로 합칩니다.
+
+청크별 모델 응답은 LLM 결과 캐시(llm_result_cache)에 저장하고, 문서 단위로 한 번에
+미리 조회해서 캐시에 없는 청크만 추출합니다.
 """
-from typing import List, Dict, Optional
-import anthropic
+import asyncio
+import random
+import time
+from collections import Counter
+from typing import List, Dict, Optional, Tuple
 from loguru import logger
 import json
 import os
 
+from app.core.config import settings
+from app.services.llm_gateway import (
+    LLMGateway,
+    LLMRateLimitError,
+    LLMRequest,
+    LLMRetryableError,
+    get_llm_gateway,
+)
+from app.services.llm_result_cache import (
+    LLMResultCache,
+    get_llm_result_cache,
+    make_cache_key,
+)
+from .adaptive_concurrency import AdaptiveConcurrencyLimiter
+
+
+EXTRACTION_MODEL = "claude-3-5-sonnet-20241022"
+
+# 프롬프트/응답 형식이 바뀌면 버전을 올려 캐시를 무효화
+EXTRACTION_TEMPLATE = "graphrag_entities@1"
+
+# 청크 하나의 최소 길이 (이보다 짧으면 추출하지 않음)
+MIN_CHUNK_CHARS = 50
+# 단일 청크 프롬프트에 포함하는 최대 길이
+MAX_CHUNK_CHARS = 4000
+
+# 묶음 프롬프트: 청크 길이가 pack_max_chars의 절반 이하인 청크만 최대 8개까지 묶음
+MAX_CHUNKS_PER_PACK = 8
+PACKED_MAX_TOKENS = 8000
+
+def _empty_result(chunk_id: Optional[str], error: Optional[str] = None) -> Dict:
+    result = {
+        "entities": [],
+        "relationships": [],
+        "chunk_id": chunk_id,
+        "entity_count": 0,
+        "relationship_count": 0
+    }
+    if error:
+        result["error"] = error
+    return result
+
+
+def _strip_code_fence(response_text: str) -> str:
+    """JSON 추출 (마크다운 코드블록 제거)"""
+    if "```json" in response_text:
+        return response_text.split("```json")[1].split("```")[0].strip()
+    if "```" in response_text:
+        return response_text.split("```")[1].split("```")[0].strip()
+    return response_text
+
+
+_EXTRACTION_GUIDELINES = """**관계 추출 가이드라인 (매우 중요!):**
+1. **보장항목-금액 연결**: 보장항목 언급 시 인근의 금액을 반드시 연결하세요
+   예: "사망보험금 1억원" → (사망보험금) --[has_amount]--> (1억원)
+
+2. **보장항목-조건 연결**: 보장항목의 지급조건을 반드시 연결하세요
+   예: "교통사고로 인한 사망 시" → (사망보험금) --[requires]--> (교통사고로 인한 사망)
+
+3. **면책사항 연결**: 각 보장항목의 면책사항을 연결하세요
+   예: "단, 고의적 사고는 제외" → (보장항목) --[excludes]--> (고의적 사고)
+
+4. **조항-용어 정의**: 조항이 용어를 정의하면 연결하세요
+   예: "제1조 (피보험자의 정의)" → (제1조) --[defines]--> (피보험자)
+
+5. **특약-주계약 연결**: 특약은 주계약의 보장항목과 연결하세요
+   예: "암진단특약" → (보험상품) --[includes_rider]--> (암진단특약)
+
+6. **엔티티당 최소 2-3개 이상의 관계를 생성하세요** - 이것이 매우 중요합니다!
+
+**추출 규칙:**
+1. 보험 전문 용어를 정확히 추출하세요
+2. 보험금액, 지급조건, 면책사항은 가능한 모두 추출하세요
+3. 약관 조항 번호(제X관 제X조)도 엔티티로 추출하세요
+4. **관계가 적으면 그래프가 분리됩니다. 반드시 엔티티 간 연결을 최대한 많이 만드세요!**
+5. 반드시 유효한 JSON 형식으로 응답하세요
+
+**목표: 추출된 엔티티 수와 비슷하거나 더 많은 수의 관계를 생성하세요!**"""
+
 
 class GraphRAGEntityExtractor:
     """
@@ -52,19 +141,55 @@ class GraphRAGEntityExtractor:
         "applies_to": "적용 대상 (조건 -> 보장항목)"
     }
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        pack_max_chars: Optional[int] = None,
+        gateway: Optional[LLMGateway] = None,
+        cache: Optional[LLMResultCache] = None,
+    ):
         """
         Args:
-            api_key: Anthropic API key (기본값: 환경변수에서 읽음)
+            api_key: Anthropic API key (기본값: 환경변수에서 읽음, 요청마다 게이트웨이 공급자 키 대신 사용)
+            max_concurrency: 동시 추출 최대 개수 (기본값: settings.ENTITY_EXTRACTION_MAX_CONCURRENCY)
+            max_retries: 청크별 재시도 횟수 (기본값: settings.ENTITY_EXTRACTION_MAX_RETRIES)
+            pack_max_chars: 짧은 청크를 한 프롬프트로 묶는 최대 길이
+                (기본값: settings.ENTITY_EXTRACTION_PACK_CHARS, 0이면 묶지 않음)
+            gateway: LLM 게이트웨이 (기본값: get_llm_gateway())
+            cache: LLM 결과 캐시 (기본값: get_llm_result_cache())
         """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
-        if not self.api_key:
+        if not self.api_key and gateway is None:
             raise ValueError("ANTHROPIC_API_KEY가 설정되지 않았습니다")
 
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+        self.gateway = gateway or get_llm_gateway()
+        self.cache = cache or get_llm_result_cache()
+
+        max_concurrency = max_concurrency or settings.ENTITY_EXTRACTION_MAX_CONCURRENCY
+        self.limiter = AdaptiveConcurrencyLimiter(
+            initial=max(1, max_concurrency // 2),
+            max_limit=max_concurrency,
+        )
+        self.max_retries = (
+            max_retries if max_retries is not None else settings.ENTITY_EXTRACTION_MAX_RETRIES
+        )
+        self.pack_max_chars = (
+            pack_max_chars if pack_max_chars is not None else settings.ENTITY_EXTRACTION_PACK_CHARS
+        )
+
+    @staticmethod
+    def _cache_key(text: str) -> str:
+        """
+        청크 캐시 키
 
-    def _create_extraction_prompt(self, text: str, document_info: Dict) -> str:
-        """엔티티 추출 프롬프트 생성"""
+        문서 정보(보험사/상품명)는 키에서 제외해서 여러 보험사에 공통인 표준 약관
+        조항은 한 번만 추출합니다. 문서 정보는 캐시된 결과에 다시 붙입니다.
+        """
+        return make_cache_key(EXTRACTION_TEMPLATE, EXTRACTION_MODEL, text[:MAX_CHUNK_CHARS])
+
+    def _type_descriptions(self) -> Tuple[str, str]:
         entity_types_desc = "\n".join([
             f"- {etype}: {desc}"
             for etype, desc in self.ENTITY_TYPES.items()
@@ -74,6 +199,11 @@ class GraphRAGEntityExtractor:
             f"- {rtype}: {desc}"
             for rtype, desc in self.RELATIONSHIP_TYPES.items()
         ])
+        return entity_types_desc, relationship_types_desc
+
+    def _create_extraction_prompt(self, text: str, document_info: Dict) -> str:
+        """엔티티 추출 프롬프트 생성"""
+        entity_types_desc, relationship_types_desc = self._type_descriptions()
 
         return f"""당신은 보험 약관 분석 전문가입니다. 다음 보험 약관 텍스트에서 엔티티와 관계를 추출하여 지식 그래프를 구축하세요.
 
@@ -89,7 +219,7 @@ class GraphRAGEntityExtractor:
 {relationship_types_desc}
 
 **텍스트:**
-{text[:4000]}
+{text[:MAX_CHUNK_CHARS]}
 
 **출력 형식 (JSON):**
 {{
@@ -112,32 +242,179 @@ class GraphRAGEntityExtractor:
   ]
 }}
 
-**관계 추출 가이드라인 (매우 중요!):**
-1. **보장항목-금액 연결**: 보장항목 언급 시 인근의 금액을 반드시 연결하세요
-   예: "사망보험금 1억원" → (사망보험금) --[has_amount]--> (1억원)
+{_EXTRACTION_GUIDELINES}"""
 
-2. **보장항목-조건 연결**: 보장항목의 지급조건을 반드시 연결하세요
-   예: "교통사고로 인한 사망 시" → (사망보험금) --[requires]--> (교통사고로 인한 사망)
+    def _create_packed_extraction_prompt(self, chunks: List[Dict], document_info: Dict) -> str:
+        """여러 청크를 한 번에 추출하는 프롬프트 생성 (청크별 결과를 나눠 받음)"""
+        entity_types_desc, relationship_types_desc = self._type_descriptions()
+        chunk_texts = "\n\n".join(
+            f'<chunk id="{index}">\n{chunk.get("text", "")}\n</chunk>'
+            for index, chunk in enumerate(chunks)
+        )
 
-3. **면책사항 연결**: 각 보장항목의 면책사항을 연결하세요
-   예: "단, 고의적 사고는 제외" → (보장항목) --[excludes]--> (고의적 사고)
+        return f"""당신은 보험 약관 분석 전문가입니다. 다음 보험 약관 텍스트 조각(chunk)들에서 각각 엔티티와 관계를 추출하여 지식 그래프를 구축하세요.
 
-4. **조항-용어 정의**: 조항이 용어를 정의하면 연결하세요
-   예: "제1조 (피보험자의 정의)" → (제1조) --[defines]--> (피보험자)
+**문서 정보:**
+- 보험사: {document_info.get('insurer', 'Unknown')}
+- 상품타입: {document_info.get('product_type', 'Unknown')}
+- 제목: {document_info.get('title', 'Unknown')}
 
-5. **특약-주계약 연결**: 특약은 주계약의 보장항목과 연결하세요
-   예: "암진단특약" → (보험상품) --[includes_rider]--> (암진단특약)
+**추출할 엔티티 타입:**
+{entity_types_desc}
 
-6. **엔티티당 최소 2-3개 이상의 관계를 생성하세요** - 이것이 매우 중요합니다!
+**추출할 관계 타입:**
+{relationship_types_desc}
 
-**추출 규칙:**
-1. 보험 전문 용어를 정확히 추출하세요
-2. 보험금액, 지급조건, 면책사항은 가능한 모두 추출하세요
-3. 약관 조항 번호(제X관 제X조)도 엔티티로 추출하세요
-4. **관계가 적으면 그래프가 분리됩니다. 반드시 엔티티 간 연결을 최대한 많이 만드세요!**
-5. 반드시 유효한 JSON 형식으로 응답하세요
+**텍스트 조각:**
+{chunk_texts}
 
-**목표: 추출된 엔티티 수와 비슷하거나 더 많은 수의 관계를 생성하세요!**"""
+**출력 형식 (JSON):**
+각 조각마다 chunks 배열에 하나의 항목을 만들고, chunk 값은 조각의 id 숫자를 그대로 사용하세요.
+관계는 같은 조각 안의 엔티티끼리만 연결하세요.
+{{
+  "chunks": [
+    {{
+      "chunk": 0,
+      "entities": [
+        {{
+          "id": "unique_id",
+          "label": "엔티티 이름",
+          "type": "entity_type",
+          "description": "엔티티 설명 (선택)",
+          "source_text": "원본 텍스트 발췌"
+        }}
+      ],
+      "relationships": [
+        {{
+          "source_id": "entity1_id",
+          "target_id": "entity2_id",
+          "type": "relationship_type",
+          "description": "관계 설명 (선택)"
+        }}
+      ]
+    }}
+  ]
+}}
+
+{_EXTRACTION_GUIDELINES}"""
+
+    async def _request(self, prompt: str, max_tokens: int = 4000) -> Tuple[str, int]:
+        """
+        Claude API 호출 (동시성 제한 + 재시도)
+
+        게이트웨이 재시도 대신 시도마다 limiter에 결과를 알리도록 여기서 재시도합니다.
+        429/과부하는 limiter 한도를 줄이고, 재시도 가능한 오류는 지수 백오프 후 재시도합니다.
+
+        Returns:
+            (응답 텍스트, 사용 토큰 수)
+        """
+        attempt = 0
+        while True:
+            try:
+                async with self.limiter.slot() as slot:
+                    try:
+                        response = await self.gateway.complete(
+                            LLMRequest(
+                                provider="anthropic",
+                                model=EXTRACTION_MODEL,
+                                max_tokens=max_tokens,
+                                temperature=0,
+                                api_key=self.api_key,
+                                messages=[
+                                    {
+                                        "role": "user",
+                                        "content": prompt
+                                    }
+                                ]
+                            ),
+                            max_retries=0
+                        )
+                    except LLMRateLimitError:
+                        slot.throttled = True
+                        raise
+                return response.text.strip(), response.total_tokens
+            except Exception as e:
+                if attempt >= self.max_retries or not isinstance(e, LLMRetryableError):
+                    raise
+                attempt += 1
+                delay = min(30.0, 2 ** attempt) * (0.5 + random.random() / 2)
+                logger.warning(
+                    f"Entity extraction request failed ({e.__class__.__name__}), "
+                    f"retry {attempt}/{self.max_retries} in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
+    def _build_result(
+        self,
+        result: Dict,
+        document_info: Dict,
+        chunk_id: Optional[str],
+        tokens_used: int
+    ) -> Dict:
+        """모델 응답(JSON) 검증 및 결과 구성"""
+        entities = result.get("entities", [])
+        relationships = result.get("relationships", [])
+
+        # 엔티티 ID 검증 및 생성
+        entity_ids = set()
+        for i, entity in enumerate(entities):
+            if "id" not in entity:
+                entity["id"] = f"entity_{chunk_id}_{i}"
+            entity_ids.add(entity["id"])
+
+            # chunk_id 추가
+            if chunk_id:
+                entity["chunk_id"] = chunk_id
+
+            # 문서 정보 추가
+            entity["document_info"] = document_info
+
+        # 관계 검증 (존재하지 않는 엔티티 참조 제거)
+        valid_relationships = []
+        for rel in relationships:
+            if rel.get("source_id") in entity_ids and rel.get("target_id") in entity_ids:
+                if chunk_id:
+                    rel["chunk_id"] = chunk_id
+                valid_relationships.append(rel)
+            else:
+                logger.warning(f"Invalid relationship: {rel}")
+
+        return {
+            "entities": entities,
+            "relationships": valid_relationships,
+            "chunk_id": chunk_id,
+            "entity_count": len(entities),
+            "relationship_count": len(valid_relationships),
+            "tokens_used": tokens_used
+        }
+
+    def _build_cached_result(self, cached: Dict, document_info: Dict, chunk_id: Optional[str]) -> Dict:
+        """캐시된 모델 응답으로 결과 구성 (토큰 사용 없음)"""
+        result = self._build_result(
+            {
+                "entities": [dict(entity) for entity in cached.get("entities", [])],
+                "relationships": [dict(rel) for rel in cached.get("relationships", [])],
+            },
+            document_info,
+            chunk_id,
+            tokens_used=0
+        )
+        result["cached"] = True
+        return result
+
+    async def _store(self, cache_key: str, parsed: Dict) -> None:
+        """모델 응답(엔티티/관계 원본) 캐시 저장"""
+        if self.cache is None:
+            return
+        await self.cache.set(
+            cache_key,
+            {
+                "entities": parsed.get("entities", []),
+                "relationships": parsed.get("relationships", []),
+            },
+            EXTRACTION_TEMPLATE,
+            EXTRACTION_MODEL
+        )
 
     async def extract_entities_and_relationships(
         self,
@@ -162,106 +439,144 @@ class GraphRAGEntityExtractor:
                 "relationship_count": M
             }
         """
-        if not text or len(text.strip()) < 50:
+        if not text or len(text.strip()) < MIN_CHUNK_CHARS:
             logger.warning("텍스트가 너무 짧아서 엔티티 추출을 건너뜁니다")
-            return {
-                "entities": [],
-                "relationships": [],
-                "chunk_id": chunk_id,
-                "entity_count": 0,
-                "relationship_count": 0
-            }
+            return _empty_result(chunk_id)
+
+        cache_key = self._cache_key(text)
+        if self.cache is not None:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                return self._build_cached_result(cached, document_info, chunk_id)
 
+        response_text = ""
         try:
             prompt = self._create_extraction_prompt(text, document_info)
 
             logger.info(f"Extracting entities from text (length: {len(text)})")
 
-            # Claude API 호출
-            message = self.client.messages.create(
-                model="claude-3-5-sonnet-20241022",
-                max_tokens=4000,
-                temperature=0,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
+            response_text, tokens_used = await self._request(prompt)
+            parsed = json.loads(_strip_code_fence(response_text))
+            await self._store(cache_key, parsed)
+            result = self._build_result(parsed, document_info, chunk_id, tokens_used)
+
+            logger.info(
+                f"✅ Extracted {result['entity_count']} entities and "
+                f"{result['relationship_count']} relationships"
             )
+            return result
 
-            # 응답 파싱
-            response_text = message.content[0].text.strip()
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse JSON response: {e}")
+            logger.error(f"Response: {response_text[:500]}")
+            return _empty_result(chunk_id, f"JSON parse error: {str(e)}")
 
-            # JSON 추출 (마크다운 코드블록 제거)
-            if "```json" in response_text:
-                response_text = response_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in response_text:
-                response_text = response_text.split("```")[1].split("```")[0].strip()
+        except Exception as e:
+            logger.error(f"Entity extraction failed: {e}", exc_info=True)
+            return _empty_result(chunk_id, str(e))
 
-            result = json.loads(response_text)
+    async def _extract_packed(self, chunks: List[Dict], document_info: Dict) -> List[Dict]:
+        """
+        짧은 청크 여러 개를 한 번의 호출로 추출
 
-            # 결과 검증
-            entities = result.get("entities", [])
-            relationships = result.get("relationships", [])
+        응답에서 빠졌거나 형식이 잘못된 청크는 개별 추출로 다시 시도합니다.
+        """
+        response_text = ""
+        by_index: Dict[int, Dict] = {}
+        tokens_used = 0
+        try:
+            prompt = self._create_packed_extraction_prompt(chunks, document_info)
+            logger.info(f"Extracting entities from {len(chunks)} packed chunks")
+
+            response_text, tokens_used = await self._request(prompt, max_tokens=PACKED_MAX_TOKENS)
+            parsed = json.loads(_strip_code_fence(response_text))
+            for item in parsed.get("chunks", []):
+                try:
+                    index = int(item.get("chunk"))
+                except (TypeError, ValueError):
+                    continue
+                if 0 <= index < len(chunks):
+                    by_index[index] = item
 
-            # 엔티티 ID 검증 및 생성
-            entity_ids = set()
-            for i, entity in enumerate(entities):
-                if "id" not in entity:
-                    entity["id"] = f"entity_{chunk_id}_{i}"
-                entity_ids.add(entity["id"])
+        except json.JSONDecodeError as e:
+            logger.warning(f"Failed to parse packed JSON response: {e}")
+            logger.debug(f"Response: {response_text[:500]}")
+        except Exception as e:
+            logger.warning(f"Packed entity extraction failed, falling back to single chunks: {e}")
+
+        if self.cache is not None and by_index:
+            await self.cache.set_many(
+                {
+                    self._cache_key(chunks[index].get("text", "")): {
+                        "entities": item.get("entities", []),
+                        "relationships": item.get("relationships", []),
+                    }
+                    for index, item in by_index.items()
+                },
+                EXTRACTION_TEMPLATE,
+                EXTRACTION_MODEL
+            )
 
-                # chunk_id 추가
-                if chunk_id:
-                    entity["chunk_id"] = chunk_id
-
-                # 문서 정보 추가
-                entity["document_info"] = document_info
-
-            # 관계 검증 (존재하지 않는 엔티티 참조 제거)
-            valid_relationships = []
-            for rel in relationships:
-                if rel.get("source_id") in entity_ids and rel.get("target_id") in entity_ids:
-                    if chunk_id:
-                        rel["chunk_id"] = chunk_id
-                    valid_relationships.append(rel)
-                else:
-                    logger.warning(f"Invalid relationship: {rel}")
-
-            logger.info(f"✅ Extracted {len(entities)} entities and {len(valid_relationships)} relationships")
-
-            return {
-                "entities": entities,
-                "relationships": valid_relationships,
-                "chunk_id": chunk_id,
-                "entity_count": len(entities),
-                "relationship_count": len(valid_relationships),
-                "tokens_used": message.usage.input_tokens + message.usage.output_tokens
-            }
+        # 토큰은 응답에 포함된 청크들에 나눠서 기록
+        token_share = tokens_used // max(1, len(by_index))
+        results: List[Optional[Dict]] = []
+        for index, chunk in enumerate(chunks):
+            item = by_index.get(index)
+            if item is None:
+                results.append(None)
+                continue
+            results.append(
+                self._build_result(item, document_info, chunk.get("id"), token_share)
+            )
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {e}")
-            logger.error(f"Response: {response_text[:500]}")
-            return {
-                "entities": [],
-                "relationships": [],
-                "chunk_id": chunk_id,
-                "entity_count": 0,
-                "relationship_count": 0,
-                "error": f"JSON parse error: {str(e)}"
-            }
+        missing = [index for index, result in enumerate(results) if result is None]
+        if missing:
+            logger.info(f"Re-extracting {len(missing)} chunks missing from packed response")
+            fallbacks = await asyncio.gather(*(
+                self.extract_entities_and_relationships(
+                    text=chunks[index].get("text", ""),
+                    document_info=document_info,
+                    chunk_id=chunks[index].get("id")
+                )
+                for index in missing
+            ))
+            for index, result in zip(missing, fallbacks):
+                results[index] = result
+
+        return results
+
+    def _plan_batches(self, chunks: List[Dict]) -> List[List[int]]:
+        """
+        청크를 호출 단위로 묶음 (입력 순서 유지)
 
-        except Exception as e:
-            logger.error(f"Entity extraction failed: {e}", exc_info=True)
-            return {
-                "entities": [],
-                "relationships": [],
-                "chunk_id": chunk_id,
-                "entity_count": 0,
-                "relationship_count": 0,
-                "error": str(e)
-            }
+        pack_max_chars 절반 이하인 인접 청크는 합이 pack_max_chars를 넘지 않는 선에서
+        (최대 MAX_CHUNKS_PER_PACK개) 한 묶음으로, 긴 청크는 단독으로 호출합니다.
+        """
+        batches: List[List[int]] = []
+        current: List[int] = []
+        current_chars = 0
+
+        for index, chunk in enumerate(chunks):
+            size = len(chunk.get("text", "") or "")
+            packable = 0 < self.pack_max_chars and size <= self.pack_max_chars // 2
+            if not packable:
+                if current:
+                    batches.append(current)
+                    current, current_chars = [], 0
+                batches.append([index])
+                continue
+            if current and (
+                current_chars + size > self.pack_max_chars
+                or len(current) >= MAX_CHUNKS_PER_PACK
+            ):
+                batches.append(current)
+                current, current_chars = [], 0
+            current.append(index)
+            current_chars += size
+
+        if current:
+            batches.append(current)
+        return batches
 
     async def extract_from_chunks(
         self,
@@ -271,6 +586,9 @@ class GraphRAGEntityExtractor:
         """
         여러 청크에서 엔티티 추출
 
+        캐시에 있는 청크는 한 번에 조회해서 채우고, 나머지 청크(또는 짧은 청크 묶음)를
+        동시에 추출해서 입력 순서대로 합칩니다.
+
         Args:
             chunks: 청크 리스트 [{"text": "...", "id": "..."}, ...]
             document_info: 문서 메타데이터
@@ -278,40 +596,72 @@ class GraphRAGEntityExtractor:
         Returns:
             전체 엔티티 및 관계 집계 결과
         """
+        results: List[Optional[Dict]] = [None] * len(chunks)
+
+        # 너무 짧은 청크는 호출 없이 빈 결과
+        candidates = []
+        for index, chunk in enumerate(chunks):
+            text = chunk.get("text", "") or ""
+            if len(text.strip()) < MIN_CHUNK_CHARS:
+                results[index] = _empty_result(chunk.get("id"))
+            else:
+                candidates.append(index)
+
+        # 캐시 일괄 조회 (문서 단위 한 번)
+        cached: Dict[str, Dict] = {}
+        if self.cache is not None and candidates:
+            keys = {index: self._cache_key(chunks[index].get("text", "")) for index in candidates}
+            cached = await self.cache.get_many(keys.values())
+        extractable = []
+        for index in candidates:
+            hit = cached.get(keys[index]) if cached else None
+            if hit is not None:
+                results[index] = self._build_cached_result(hit, document_info, chunks[index].get("id"))
+            else:
+                extractable.append(index)
+
+        async def run_batch(batch: List[int]) -> None:
+            batch_chunks = [chunks[extractable[i]] for i in batch]
+            if len(batch_chunks) == 1:
+                chunk = batch_chunks[0]
+                batch_results = [await self.extract_entities_and_relationships(
+                    text=chunk.get("text", ""),
+                    document_info=document_info,
+                    chunk_id=chunk.get("id")
+                )]
+            else:
+                batch_results = await self._extract_packed(batch_chunks, document_info)
+            for i, result in zip(batch, batch_results):
+                results[extractable[i]] = result
+
+        started = time.monotonic()
+        batches = self._plan_batches([chunks[index] for index in extractable])
+        await asyncio.gather(*(run_batch(batch) for batch in batches))
+
         all_entities = []
         all_relationships = []
         total_tokens = 0
-
-        for chunk in chunks:
-            result = await self.extract_entities_and_relationships(
-                text=chunk.get("text", ""),
-                document_info=document_info,
-                chunk_id=chunk.get("id")
-            )
-
+        for result in results:
             all_entities.extend(result["entities"])
             all_relationships.extend(result["relationships"])
             total_tokens += result.get("tokens_used", 0)
 
-        # 엔티티 타입별 집계
-        entity_type_counts = {}
-        for entity in all_entities:
-            etype = entity.get("type", "unknown")
-            entity_type_counts[etype] = entity_type_counts.get(etype, 0) + 1
-
-        # 관계 타입별 집계
-        relationship_type_counts = {}
-        for rel in all_relationships:
-            rtype = rel.get("type", "unknown")
-            relationship_type_counts[rtype] = relationship_type_counts.get(rtype, 0) + 1
+        logger.info(
+            f"Extracted {len(chunks)} chunks ({len(candidates) - len(extractable)} cached) "
+            f"in {len(batches)} requests "
+            f"({time.monotonic() - started:.1f}s, concurrency limit {self.limiter.limit})"
+        )
 
         return {
             "entities": all_entities,
             "relationships": all_relationships,
             "total_entity_count": len(all_entities),
             "total_relationship_count": len(all_relationships),
-            "entity_type_counts": entity_type_counts,
-            "relationship_type_counts": relationship_type_counts,
+            # 엔티티/관계 타입별 집계
+            "entity_type_counts": dict(Counter(e.get("type", "unknown") for e in all_entities)),
+            "relationship_type_counts": dict(Counter(r.get("type", "unknown") for r in all_relationships)),
             "total_tokens_used": total_tokens,
-            "chunks_processed": len(chunks)
+            "chunks_processed": len(chunks),
+            "chunks_cached": len(candidates) - len(extractable),
+            "requests_made": len(batches)
         }
@@ -9,7 +9,6 @@ Template Matcher - Template-based Learning
 import re
 from typing import Dict, List, Optional, Tuple
 from loguru import logger
-from openai import AsyncOpenAI
 
 from app.core.config import settings
 
@@ -18,6 +17,8 @@ class InsuranceTemplateExtractor:
     """보험 약관 템플릿 추출기"""
 
     def __init__(self):
+        from openai import AsyncOpenAI
+
         self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
 
         # 공통 패턴 (정규표현식)
@@ -239,6 +240,8 @@ class TemplateMatcher:
     """템플릿 매칭 및 변수 기반 학습"""
 
     def __init__(self):
+        from openai import AsyncOpenAI
+
         self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
         self.template_cache = {}  # 보험사별 템플릿 캐시
 
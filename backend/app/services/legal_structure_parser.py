@@ -9,6 +9,12 @@ from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 from loguru import logger
 
+from app.services.extraction_artifact_cache import (
+    ExtractionArtifactCache,
+    get_extraction_cache,
+    sha256_text,
+)
+
 
 @dataclass
 class Subclause:
@@ -77,6 +83,36 @@ class ParsedDocument:
             "total_subclauses": self.total_subclauses,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ParsedDocument":
+        """to_dict() 결과에서 복원"""
+        articles = [
+            Article(
+                article_num=a["article_num"],
+                title=a["title"],
+                text=a["text"],
+                page=a.get("page"),
+                paragraphs=[
+                    Paragraph(
+                        paragraph_num=p["paragraph_num"],
+                        text=p["text"],
+                        subclauses=[
+                            Subclause(subclause_num=s["subclause_num"], text=s["text"])
+                            for s in p["subclauses"]
+                        ],
+                    )
+                    for p in a["paragraphs"]
+                ],
+            )
+            for a in data["articles"]
+        ]
+        return cls(
+            articles=articles,
+            total_articles=data["total_articles"],
+            total_paragraphs=data["total_paragraphs"],
+            total_subclauses=data["total_subclauses"],
+        )
+
 
 class LegalStructureParser:
     """한국 법률 문서 구조 파싱"""
@@ -88,9 +124,16 @@ class LegalStructureParser:
     LETTER_SUBCLAUSE = re.compile(r'^([가나다라마바사아자차카타파하])\.\s+(.+)', re.MULTILINE)
     EXCEPTION_PATTERN = re.compile(r'(다만|단서|제외하고|단)')
 
-    def __init__(self):
-        """Initialize parser"""
-        pass
+    # 파싱 규칙 변경 시 올려서 캐시 무효화
+    PARSER_NAME = "legal_structure"
+    PARSER_VERSION = "1"
+
+    def __init__(self, cache: Optional[ExtractionArtifactCache] = None):
+        """
+        Args:
+            cache: 파싱 결과 캐시 (None이면 캐시 사용 안 함)
+        """
+        self.cache = cache
 
     def parse_text(self, text: str) -> ParsedDocument:
         """
@@ -102,6 +145,13 @@ class LegalStructureParser:
         Returns:
             ParsedDocument: 파싱된 문서 구조
         """
+        text_sha256 = None
+        if self.cache is not None:
+            text_sha256 = sha256_text(text)
+            artifact = self.cache.get(text_sha256, self.PARSER_NAME, self.PARSER_VERSION)
+            if artifact is not None:
+                return ParsedDocument.from_dict(artifact)
+
         logger.info("Parsing legal document structure...")
 
         articles = self._extract_articles(text)
@@ -126,6 +176,9 @@ class LegalStructureParser:
             f"{result.total_subclauses} subclauses"
         )
 
+        if self.cache is not None:
+            self.cache.put(text_sha256, self.PARSER_NAME, self.PARSER_VERSION, result.to_dict())
+
         return result
 
     def _extract_articles(self, text: str) -> List[Article]:
@@ -270,5 +323,5 @@ def get_legal_parser() -> LegalStructureParser:
     """법률 구조 파서 싱글톤 인스턴스"""
     global _legal_parser
     if _legal_parser is None:
-        _legal_parser = LegalStructureParser()
+        _legal_parser = LegalStructureParser(cache=get_extraction_cache())
     return _legal_parser
@@ -0,0 +1,893 @@
+"""
+LLM Gateway
+
+모든 LLM 호출이 지나가는 단일 비동기 게이트웨이.
+
+- 공급자별 커넥션 풀 (공급자당 httpx.AsyncClient 하나를 프로세스 전체가 공유)
+- 공급자별 토큰 버킷 속도 제한 (같은 프로세스의 모든 코루틴이 공유)
+- 재시도 (429/5xx/타임아웃, 지수 백오프 + jitter) 및 선택적 hedged 요청
+- 동일 요청 중복 제거 (진행 중인 같은 요청은 한 번만 호출하고 결과 공유)
+- 공급자/모델별 지연·토큰·비용 히스토그램 (Prometheus 텍스트 출력)
+- 테스트용 결정적 로컬 stub 공급자 (LLM_GATEWAY_STUB=true 이면 모든 공급자를 대체)
+
+사용 예:
+    gateway = get_llm_gateway()
+    response = await gateway.complete(LLMRequest(
+        provider="anthropic",
+        model="claude-3-5-sonnet-20241022",
+        messages=[{"role": "user", "content": prompt}],
+        max_tokens=4000,
+    ))
+    print(response.text, response.cost_usd)
+"""
+import asyncio
+import bisect
+import hashlib
+import json
+import os
+import random
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+import httpx
+from loguru import logger
+
+from app.core.config import settings
+
+
+# ============================================================================
+# Request / Response / Errors
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class LLMRequest:
+    """LLM 호출 요청 (공급자 공통 형식)"""
+
+    provider: str
+    model: str
+    messages: Tuple[Dict[str, str], ...]
+    system: Optional[str] = None
+    temperature: float = 0.0
+    max_tokens: int = 2000
+    json_mode: bool = False
+    timeout: Optional[float] = None  # 재시도 포함 전체 마감 (초, fingerprint에서 제외)
+    api_key: Optional[str] = field(default=None, repr=False)  # 공급자 기본 키 대신 사용할 키
+
+    def __post_init__(self):
+        # list로 전달해도 불변 tuple로 보관
+        object.__setattr__(self, "messages", tuple(dict(m) for m in self.messages))
+
+    @property
+    def prompt(self) -> str:
+        """마지막 user 메시지 (로그/stub용)"""
+        for message in reversed(self.messages):
+            if message.get("role") == "user":
+                return message.get("content", "")
+        return ""
+
+    def fingerprint(self) -> str:
+        """요청 내용 해시 (중복 제거/캐시 키)"""
+        payload = json.dumps(
+            {
+                "provider": self.provider,
+                "model": self.model,
+                "messages": list(self.messages),
+                "system": self.system,
+                "temperature": self.temperature,
+                "max_tokens": self.max_tokens,
+                "json_mode": self.json_mode,
+                # 키가 다른 요청끼리는 결과를 공유하지 않음 (키 자체는 남기지 않음)
+                "api_key": hashlib.sha256(self.api_key.encode("utf-8")).hexdigest()[:16]
+                if self.api_key else None,
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class LLMResponse:
+    """LLM 호출 결과"""
+
+    text: str
+    provider: str
+    model: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+    latency_ms: float = 0.0
+    cost_usd: float = 0.0
+    attempts: int = 1
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+
+class LLMError(Exception):
+    """LLM 호출 실패 (재시도하지 않음)"""
+
+    def __init__(self, message: str, provider: str = "", status_code: Optional[int] = None):
+        super().__init__(message)
+        self.provider = provider
+        self.status_code = status_code
+
+
+class LLMRetryableError(LLMError):
+    """일시적 오류 (5xx, 타임아웃, 연결 오류) - 재시도 대상"""
+
+
+class LLMRateLimitError(LLMRetryableError):
+    """429 / 과부하 응답"""
+
+
+class LLMTimeoutError(LLMError):
+    """요청 마감(LLMRequest.timeout 또는 실행 예산) 초과 - 재시도하지 않음"""
+
+
+_THROTTLE_STATUSES = {429, 529}
+_RETRYABLE_STATUSES = {408, 409, 500, 502, 503, 504}
+
+
+def _raise_for_status(provider: str, response: httpx.Response) -> None:
+    if response.status_code < 400:
+        return
+    message = f"{provider} API error {response.status_code}: {response.text[:300]}"
+    if response.status_code in _THROTTLE_STATUSES:
+        raise LLMRateLimitError(message, provider, response.status_code)
+    if response.status_code in _RETRYABLE_STATUSES:
+        raise LLMRetryableError(message, provider, response.status_code)
+    raise LLMError(message, provider, response.status_code)
+
+
+# ============================================================================
+# Pricing (USD per 1M tokens, 추정 단가)
+# ============================================================================
+
+MODEL_PRICING: Dict[str, Tuple[float, float]] = {
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "claude-3-5-sonnet-20241022": (3.00, 15.00),
+    "claude-3-5-haiku-20241022": (0.80, 4.00),
+    "gemini-2.5-flash": (0.30, 2.50),
+    "gemini-1.5-flash": (0.075, 0.30),
+    "solar-pro": (0.25, 0.25),
+}
+
+
+def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
+    """모델 단가표 기준 비용 (단가를 모르는 모델은 0)"""
+    input_price, output_price = MODEL_PRICING.get(model, (0.0, 0.0))
+    return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+
+# ============================================================================
+# Providers
+# ============================================================================
+
+
+class LLMProviderClient:
+    """공급자 어댑터 (공급자당 하나의 커넥션 풀)"""
+
+    name = "base"
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class HTTPProviderClient(LLMProviderClient):
+    """httpx 커넥션 풀을 공유하는 HTTP 공급자"""
+
+    base_url = ""
+
+    def __init__(
+        self,
+        api_key: Optional[str],
+        timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Args:
+            api_key: 공급자 API 키
+            timeout: 요청 타임아웃 (기본값: settings.LLM_REQUEST_TIMEOUT)
+            max_connections: 최대 동시 연결 수 (기본값: settings.LLM_MAX_CONNECTIONS)
+            transport: httpx transport (테스트용)
+        """
+        self.api_key = api_key
+        self.timeout = timeout or settings.LLM_REQUEST_TIMEOUT
+        self.max_connections = max_connections or settings.LLM_MAX_CONNECTIONS
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                transport=self._transport,
+            )
+        return self._client
+
+    def _auth_headers(self, api_key: str) -> Dict[str, str]:
+        raise NotImplementedError
+
+    async def _post(self, path: str, request: LLMRequest, **kwargs) -> Dict[str, Any]:
+        api_key = request.api_key or self.api_key
+        if not api_key:
+            raise LLMError(f"{self.name} API key is not configured", self.name)
+        kwargs["headers"] = self._auth_headers(api_key)
+        if request.timeout is not None:
+            kwargs["timeout"] = min(request.timeout, self.timeout)
+        try:
+            response = await self.client.post(path, **kwargs)
+        except (httpx.TimeoutException, httpx.TransportError) as e:
+            raise LLMRetryableError(f"{self.name} request failed: {e}", self.name) from e
+        _raise_for_status(self.name, response)
+        return response.json()
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+class OpenAICompatibleProvider(HTTPProviderClient):
+    """OpenAI chat/completions 형식 공급자 (OpenAI, Upstage Solar)"""
+
+    def __init__(self, name: str, base_url: str, api_key: Optional[str], **kwargs):
+        super().__init__(api_key, **kwargs)
+        self.name = name
+        self.base_url = base_url
+
+    def _auth_headers(self, api_key: str) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {api_key}"}
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        messages = list(request.messages)
+        if request.system:
+            messages.insert(0, {"role": "system", "content": request.system})
+        payload: Dict[str, Any] = {
+            "model": request.model,
+            "messages": messages,
+            "temperature": request.temperature,
+            "max_tokens": request.max_tokens,
+        }
+        if request.json_mode:
+            payload["response_format"] = {"type": "json_object"}
+
+        data = await self._post(
+            "/chat/completions",
+            request,
+            json=payload,
+        )
+        usage = data.get("usage") or {}
+        return LLMResponse(
+            text=data["choices"][0]["message"]["content"] or "",
+            provider=self.name,
+            model=request.model,
+            input_tokens=usage.get("prompt_tokens", 0),
+            output_tokens=usage.get("completion_tokens", 0),
+        )
+
+
+class AnthropicProvider(HTTPProviderClient):
+    """Anthropic Messages API"""
+
+    name = "anthropic"
+    base_url = "https://api.anthropic.com/v1"
+
+    def _auth_headers(self, api_key: str) -> Dict[str, str]:
+        return {"x-api-key": api_key, "anthropic-version": "2023-06-01"}
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        payload: Dict[str, Any] = {
+            "model": request.model,
+            "messages": list(request.messages),
+            "temperature": request.temperature,
+            "max_tokens": request.max_tokens,
+        }
+        if request.system:
+            payload["system"] = request.system
+
+        data = await self._post(
+            "/messages",
+            request,
+            json=payload,
+        )
+        usage = data.get("usage") or {}
+        text = "".join(
+            block.get("text", "") for block in data.get("content", []) if block.get("type") == "text"
+        )
+        return LLMResponse(
+            text=text,
+            provider=self.name,
+            model=request.model,
+            input_tokens=usage.get("input_tokens", 0),
+            output_tokens=usage.get("output_tokens", 0),
+        )
+
+
+class GeminiProvider(HTTPProviderClient):
+    """Google Gemini generateContent REST API"""
+
+    name = "google"
+    base_url = "https://generativelanguage.googleapis.com/v1beta"
+
+    def _auth_headers(self, api_key: str) -> Dict[str, str]:
+        return {"x-goog-api-key": api_key}
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        contents = [
+            {
+                "role": "model" if message.get("role") == "assistant" else "user",
+                "parts": [{"text": message.get("content", "")}],
+            }
+            for message in request.messages
+        ]
+        generation_config: Dict[str, Any] = {
+            "temperature": request.temperature,
+            "maxOutputTokens": request.max_tokens,
+        }
+        if request.json_mode:
+            generation_config["responseMimeType"] = "application/json"
+        payload: Dict[str, Any] = {"contents": contents, "generationConfig": generation_config}
+        if request.system:
+            payload["systemInstruction"] = {"parts": [{"text": request.system}]}
+
+        data = await self._post(
+            f"/models/{request.model}:generateContent",
+            request,
+            json=payload,
+        )
+        candidates = data.get("candidates") or []
+        if not candidates:
+            feedback = data.get("promptFeedback", {})
+            raise LLMError(f"Gemini returned no candidates: {feedback}", self.name)
+        parts = candidates[0].get("content", {}).get("parts", [])
+        usage = data.get("usageMetadata") or {}
+        return LLMResponse(
+            text="".join(part.get("text", "") for part in parts),
+            provider=self.name,
+            model=request.model,
+            input_tokens=usage.get("promptTokenCount", 0),
+            output_tokens=usage.get("candidatesTokenCount", 0),
+        )
+
+
+StubHandler = Callable[[LLMRequest], Union[str, Awaitable[str]]]
+
+
+class StubProvider(LLMProviderClient):
+    """
+    결정적 로컬 공급자 (테스트/오프라인 개발용)
+
+    handler가 없으면 요청 해시로 만든 고정 응답을 반환합니다.
+    handler는 문자열(또는 awaitable)을 반환하거나 LLMError를 발생시켜 장애를 흉내낼 수 있습니다.
+    토큰 수는 글자 수 / 4 로 추정합니다.
+    """
+
+    def __init__(self, name: str = "stub", handler: Optional[StubHandler] = None, latency: float = 0.0):
+        self.name = name
+        self.handler = handler
+        self.latency = latency
+        self.calls: List[LLMRequest] = []
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        self.calls.append(request)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.handler is not None:
+            text = self.handler(request)
+            if asyncio.iscoroutine(text) or isinstance(text, asyncio.Future):
+                text = await text
+        else:
+            text = json.dumps(
+                {"stub": True, "model": request.model, "fingerprint": request.fingerprint()[:16]}
+            )
+        prompt_chars = sum(len(m.get("content", "")) for m in request.messages) + len(request.system or "")
+        return LLMResponse(
+            text=text,
+            provider=request.provider,
+            model=request.model,
+            input_tokens=max(1, prompt_chars // 4),
+            output_tokens=max(1, len(text) // 4),
+        )
+
+
+def _default_providers() -> Dict[str, LLMProviderClient]:
+    def key(name: str) -> Optional[str]:
+        return getattr(settings, name, None) or os.getenv(name)
+
+    return {
+        "openai": OpenAICompatibleProvider("openai", "https://api.openai.com/v1", key("OPENAI_API_KEY")),
+        "upstage": OpenAICompatibleProvider("upstage", "https://api.upstage.ai/v1/solar", key("UPSTAGE_API_KEY")),
+        "anthropic": AnthropicProvider(key("ANTHROPIC_API_KEY")),
+        "google": GeminiProvider(key("GOOGLE_API_KEY")),
+    }
+
+
+# ============================================================================
+# Rate limiting
+# ============================================================================
+
+
+class TokenBucket:
+    """
+    비동기 토큰 버킷
+
+    토큰이 부족하면 미래 토큰을 예약(음수 잔량)하고 그만큼 기다리므로
+    대기 순서대로 공정하게 처리됩니다.
+    """
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            rate: 초당 보충 토큰 수 (0 이하면 제한 없음)
+            capacity: 최대 토큰 수 (버스트 허용량)
+        """
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """토큰 확보 (대기한 시간을 반환)"""
+        if self.rate <= 0:
+            return 0.0
+        async with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+# ============================================================================
+# Telemetry
+# ============================================================================
+
+LATENCY_BUCKETS = (0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 40.0, 80.0)
+TOKEN_BUCKETS = (100, 500, 1000, 2000, 4000, 8000, 16000, 32000)
+COST_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5)
+
+
+class Histogram:
+    """고정 버킷 히스토그램 (Prometheus 누적 버킷으로 출력)"""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        result = []
+        running = 0
+        for bound, count in zip(self.buckets, self.counts):
+            running += count
+            result.append((f"{bound:g}", running))
+        result.append(("+Inf", self.count))
+        return result
+
+
+@dataclass
+class _ModelStats:
+    latency: Histogram = field(default_factory=lambda: Histogram(LATENCY_BUCKETS))
+    tokens: Histogram = field(default_factory=lambda: Histogram(TOKEN_BUCKETS))
+    cost: Histogram = field(default_factory=lambda: Histogram(COST_BUCKETS))
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    hedges: int = 0
+    deduplicated: int = 0
+    throttled: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+
+
+class LLMTelemetry:
+    """공급자/모델별 LLM 호출 통계"""
+
+    def __init__(self):
+        self._stats: Dict[Tuple[str, str], _ModelStats] = {}
+
+    def _get(self, provider: str, model: str) -> _ModelStats:
+        key = (provider, model)
+        if key not in self._stats:
+            self._stats[key] = _ModelStats()
+        return self._stats[key]
+
+    def record_success(self, response: LLMResponse) -> None:
+        stats = self._get(response.provider, response.model)
+        stats.requests += 1
+        stats.latency.observe(response.latency_ms / 1000)
+        stats.tokens.observe(response.total_tokens)
+        stats.cost.observe(response.cost_usd)
+        stats.input_tokens += response.input_tokens
+        stats.output_tokens += response.output_tokens
+        stats.cost_usd += response.cost_usd
+
+    def record_error(self, provider: str, model: str) -> None:
+        stats = self._get(provider, model)
+        stats.requests += 1
+        stats.errors += 1
+
+    def increment(self, provider: str, model: str, counter: str) -> None:
+        stats = self._get(provider, model)
+        setattr(stats, counter, getattr(stats, counter) + 1)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """JSON 통계 (모니터링 API용)"""
+        result = {}
+        for (provider, model), stats in self._stats.items():
+            result[f"{provider}/{model}"] = {
+                "requests": stats.requests,
+                "errors": stats.errors,
+                "retries": stats.retries,
+                "hedges": stats.hedges,
+                "deduplicated": stats.deduplicated,
+                "throttled": stats.throttled,
+                "input_tokens": stats.input_tokens,
+                "output_tokens": stats.output_tokens,
+                "cost_usd": round(stats.cost_usd, 6),
+                "avg_latency_ms": (
+                    round(stats.latency.sum / stats.latency.count * 1000, 1)
+                    if stats.latency.count else 0.0
+                ),
+            }
+        return result
+
+    def prometheus_lines(self) -> List[str]:
+        """Prometheus 텍스트 형식"""
+        lines: List[str] = []
+        histograms = (
+            ("llm_request_duration_seconds", "LLM request latency", "latency"),
+            ("llm_request_tokens", "LLM tokens per request", "tokens"),
+            ("llm_request_cost_usd", "Estimated LLM cost per request", "cost"),
+        )
+        for metric, help_text, attr in histograms:
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} histogram")
+            for (provider, model), stats in self._stats.items():
+                labels = f'provider="{provider}",model="{model}"'
+                histogram = getattr(stats, attr)
+                for bound, count in histogram.cumulative():
+                    lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f"{metric}_sum{{{labels}}} {histogram.sum:g}")
+                lines.append(f"{metric}_count{{{labels}}} {histogram.count}")
+
+        counters = ("requests", "errors", "retries", "hedges", "deduplicated", "throttled")
+        for counter in counters:
+            metric = f"llm_{counter}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for (provider, model), stats in self._stats.items():
+                lines.append(
+                    f'{metric}{{provider="{provider}",model="{model}"}} {getattr(stats, counter)}'
+                )
+        return lines
+
+
+# ============================================================================
+# Gateway
+# ============================================================================
+
+
+class LLMGateway:
+    """
+    비동기 LLM 게이트웨이
+
+    complete() 한 곳에서 속도 제한, 재시도, hedging, 중복 제거, 계측을 처리합니다.
+    """
+
+    def __init__(
+        self,
+        providers: Optional[Dict[str, LLMProviderClient]] = None,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        hedge_after_seconds: Optional[float] = None,
+        stub: Optional[bool] = None,
+    ):
+        """
+        Args:
+            providers: 공급자 이름 → 어댑터 (기본값: openai/upstage/anthropic/google)
+            requests_per_second: 공급자별 초당 요청 수 (기본값: settings.LLM_REQUESTS_PER_SECOND)
+            burst: 토큰 버킷 용량 (기본값: settings.LLM_RATE_LIMIT_BURST)
+            max_retries: 재시도 횟수 (기본값: settings.LLM_MAX_RETRIES)
+            hedge_after_seconds: 이 시간 안에 응답이 없으면 같은 요청을 한 번 더 보냄
+                (기본값: settings.LLM_HEDGE_AFTER_SECONDS, 0이면 사용 안 함)
+            stub: True이면 모든 공급자를 StubProvider로 대체 (기본값: settings.LLM_GATEWAY_STUB)
+        """
+        stub = settings.LLM_GATEWAY_STUB if stub is None else stub
+        if providers is None:
+            providers = _default_providers()
+            if stub:
+                providers = {name: StubProvider(name) for name in providers}
+        self.providers = providers
+        self.stub = stub
+
+        self.requests_per_second = (
+            requests_per_second if requests_per_second is not None else settings.LLM_REQUESTS_PER_SECOND
+        )
+        self.burst = burst or settings.LLM_RATE_LIMIT_BURST
+        self.max_retries = max_retries if max_retries is not None else settings.LLM_MAX_RETRIES
+        self.hedge_after_seconds = (
+            hedge_after_seconds if hedge_after_seconds is not None else settings.LLM_HEDGE_AFTER_SECONDS
+        )
+
+        self.telemetry = LLMTelemetry()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def register_provider(self, name: str, provider: LLMProviderClient) -> None:
+        """공급자 추가/교체"""
+        self.providers[name] = provider
+
+    def _bucket(self, provider: str) -> TokenBucket:
+        if provider not in self._buckets:
+            self._buckets[provider] = TokenBucket(self.requests_per_second, self.burst)
+        return self._buckets[provider]
+
+    async def complete(
+        self,
+        request: LLMRequest,
+        max_retries: Optional[int] = None,
+        hedge_after_seconds: Optional[float] = None,
+        dedupe: bool = True,
+    ) -> LLMResponse:
+        """
+        LLM 호출
+
+        Args:
+            request: 요청
+            max_retries: 이 호출의 재시도 횟수 (None이면 게이트웨이 기본값)
+            hedge_after_seconds: 이 호출의 hedge 지연 (None이면 게이트웨이 기본값)
+            dedupe: 진행 중인 동일 요청과 결과 공유 여부
+
+        Raises:
+            LLMError: 재시도 후에도 실패한 경우 (LLMRateLimitError/LLMRetryableError 포함)
+            LLMTimeoutError: request.timeout(또는 남은 실행 예산) 안에 끝나지 않은 경우
+        """
+        if request.provider not in self.providers:
+            raise LLMError(f"Unknown LLM provider: {request.provider}", request.provider)
+
+        # 오케스트레이터 요청 안에서는 남은 실행 예산을 넘지 않음
+        from app.services.orchestration.execution_budget import clamp_timeout
+
+        timeout = clamp_timeout(request.timeout)
+        if timeout != request.timeout:
+            request = replace(request, timeout=timeout)
+
+        if not dedupe:
+            return await self._execute(request, max_retries, hedge_after_seconds)
+
+        key = request.fingerprint()
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._execute(request, max_retries, hedge_after_seconds))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.telemetry.increment(request.provider, request.model, "deduplicated")
+        # 한 호출자가 취소되어도 다른 대기자를 위해 요청은 계속 진행
+        return await asyncio.shield(task)
+
+    async def _execute(
+        self,
+        request: LLMRequest,
+        max_retries: Optional[int],
+        hedge_after_seconds: Optional[float],
+    ) -> LLMResponse:
+        retries = self.max_retries if max_retries is None else max_retries
+        hedge_after = self.hedge_after_seconds if hedge_after_seconds is None else hedge_after_seconds
+
+        deadline = None if request.timeout is None else time.monotonic() + request.timeout
+
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response = await self._call_before_deadline(request, hedge_after, deadline)
+            except LLMError as e:
+                if isinstance(e, LLMRateLimitError):
+                    self.telemetry.increment(request.provider, request.model, "throttled")
+                if not isinstance(e, LLMRetryableError) or attempt > retries:
+                    self.telemetry.record_error(request.provider, request.model)
+                    raise
+                delay = min(30.0, 2 ** attempt) * (0.5 + random.random() / 2)
+                if deadline is not None and time.monotonic() + delay >= deadline:
+                    self.telemetry.record_error(request.provider, request.model)
+                    raise LLMTimeoutError(
+                        f"{request.provider} deadline exceeded after {attempt} attempt(s): {e}",
+                        request.provider,
+                    ) from e
+                self.telemetry.increment(request.provider, request.model, "retries")
+                logger.warning(
+                    f"LLM {request.provider}/{request.model} failed ({e}), "
+                    f"retry {attempt}/{retries} in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            response = LLMResponse(
+                text=response.text,
+                provider=request.provider,
+                model=request.model,
+                input_tokens=response.input_tokens,
+                output_tokens=response.output_tokens,
+                latency_ms=response.latency_ms,
+                cost_usd=estimate_cost(request.model, response.input_tokens, response.output_tokens),
+                attempts=attempt,
+            )
+            self.telemetry.record_success(response)
+            return response
+
+    async def _call_before_deadline(
+        self, request: LLMRequest, hedge_after: float, deadline: Optional[float]
+    ) -> LLMResponse:
+        """한 번의 시도 (마감이 있으면 남은 시간을 HTTP 타임아웃으로 전달하고 넘으면 취소)"""
+        if deadline is None:
+            return await self._hedged_call(request, hedge_after)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise LLMTimeoutError(f"{request.provider} deadline exceeded", request.provider)
+        try:
+            return await asyncio.wait_for(
+                self._hedged_call(replace(request, timeout=remaining), hedge_after),
+                timeout=remaining,
+            )
+        except asyncio.TimeoutError as e:
+            raise LLMTimeoutError(
+                f"{request.provider} did not respond within {remaining:.1f}s", request.provider
+            ) from e
+
+    async def _call(self, request: LLMRequest) -> LLMResponse:
+        await self._bucket(request.provider).acquire()
+        started = time.monotonic()
+        try:
+            response = await self.providers[request.provider].complete(request)
+        except LLMError:
+            raise
+        except Exception as e:
+            raise LLMError(f"{request.provider} call failed: {e}", request.provider) from e
+        return LLMResponse(
+            text=response.text,
+            provider=request.provider,
+            model=request.model,
+            input_tokens=response.input_tokens,
+            output_tokens=response.output_tokens,
+            latency_ms=(time.monotonic() - started) * 1000,
+        )
+
+    async def _hedged_call(self, request: LLMRequest, hedge_after: float) -> LLMResponse:
+        """hedge_after 안에 응답이 없으면 두 번째 요청을 보내고 먼저 성공한 응답을 사용"""
+        if not hedge_after or hedge_after <= 0:
+            return await self._call(request)
+
+        primary = asyncio.ensure_future(self._call(request))
+        done, _ = await asyncio.wait({primary}, timeout=hedge_after)
+        if done:
+            return primary.result()
+
+        self.telemetry.increment(request.provider, request.model, "hedges")
+        pending = {primary, asyncio.ensure_future(self._call(request))}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def chat(
+        self,
+        provider: str,
+        model: str,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: float = 0.0,
+        max_tokens: int = 2000,
+        json_mode: bool = False,
+    ) -> LLMResponse:
+        """단일 user 프롬프트 호출 편의 메서드"""
+        return await self.complete(LLMRequest(
+            provider=provider,
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            system=system,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            json_mode=json_mode,
+        ))
+
+    async def close(self) -> None:
+        for provider in self.providers.values():
+            await provider.close()
+
+
+class GatewayChatClient:
+    """
+    chat_completion(messages, temperature) 인터페이스 어댑터
+
+    LLMIntentDetector / query.LLMEntityExtractor의 기본 llm_client입니다 (resolve_chat_client).
+    """
+
+    def __init__(self, provider: str, model: str, gateway: Optional[LLMGateway] = None, max_tokens: int = 1000):
+        self.provider = provider
+        self.model = model
+        self.gateway = gateway or get_llm_gateway()
+        self.max_tokens = max_tokens
+
+    async def chat_completion(self, messages: List[Dict[str, str]], temperature: float = 0.0) -> str:
+        system = None
+        chat_messages = []
+        for message in messages:
+            if message.get("role") == "system":
+                system = message.get("content")
+            else:
+                chat_messages.append(message)
+        response = await self.gateway.complete(LLMRequest(
+            provider=self.provider,
+            model=self.model,
+            messages=chat_messages,
+            system=system,
+            temperature=temperature,
+            max_tokens=self.max_tokens,
+        ))
+        return response.text
+
+
+# 질의 이해 컴포넌트의 llm_client 기본값 표시 (명시적 None은 LLM 사용 안 함)
+DEFAULT_CHAT_CLIENT: Any = object()
+
+
+def resolve_chat_client(llm_client: Any) -> Any:
+    """
+    llm_client 인자 해석
+
+    DEFAULT_CHAT_CLIENT이면 settings.QUERY_LLM_PROVIDER/QUERY_LLM_MODEL로 만든
+    GatewayChatClient (공급자 설정이 비어 있으면 None), 그 외에는 그대로 반환합니다.
+    """
+    if llm_client is not DEFAULT_CHAT_CLIENT:
+        return llm_client
+    if not settings.QUERY_LLM_PROVIDER:
+        return None
+    return GatewayChatClient(settings.QUERY_LLM_PROVIDER, settings.QUERY_LLM_MODEL)
+
+
+_llm_gateway: Optional[LLMGateway] = None
+
+
+def get_llm_gateway() -> LLMGateway:
+    """LLMGateway 싱글톤"""
+    global _llm_gateway
+    if _llm_gateway is None:
+        _llm_gateway = LLMGateway()
+    return _llm_gateway
@@ -9,6 +9,7 @@ Features:
 3. Prompt Engineering - 보험 약관 전문 프롬프트
 4. Answer Generation - 구조화된 답변 생성
 """
+import importlib.util
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 from enum import Enum
@@ -17,28 +18,27 @@ from app.services.query_parser import ParsedQuery, QueryIntent
 from app.services.local_search import SearchResult
 from app.services.graph_traversal import GraphPath, TraversalResult
 from app.core.config import settings
+from app.services.llm_gateway import LLMError, LLMGateway, LLMRequest, get_llm_gateway
 from loguru import logger
 
-# Optional LLM imports
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+# Optional LLM SDKs: 설치 여부만 확인하고, 해당 provider 클라이언트를 만들 때 import
+def _module_available(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+OPENAI_AVAILABLE = _module_available("openai")
+if not OPENAI_AVAILABLE:
     logger.warning("OpenAI not available - will use mock responses")
 
-try:
-    from anthropic import Anthropic
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
+ANTHROPIC_AVAILABLE = _module_available("anthropic")
+if not ANTHROPIC_AVAILABLE:
     logger.warning("Anthropic not available - will use mock responses")
 
-try:
-    import google.generativeai as genai
-    GOOGLE_AVAILABLE = True
-except ImportError:
-    GOOGLE_AVAILABLE = False
+GOOGLE_AVAILABLE = _module_available("google.generativeai")
+if not GOOGLE_AVAILABLE:
     logger.warning("Google Gemini not available - will use mock responses")
 
 
@@ -189,11 +189,19 @@ class LLMReasoning:
 3. 추가 참고사항: (알아두면 좋은 정보)
 """
 
+    # Gateway provider names (see app.services.llm_gateway)
+    GATEWAY_PROVIDERS = {
+        LLMProvider.OPENAI: "openai",
+        LLMProvider.ANTHROPIC: "anthropic",
+        LLMProvider.GOOGLE: "google",
+    }
+
     def __init__(
         self,
         provider: LLMProvider = LLMProvider.GOOGLE,
         model: Optional[str] = None,
         temperature: float = 0.1,
+        gateway: Optional[LLMGateway] = None,
     ):
         """
         Initialize LLM reasoning service.
@@ -202,9 +210,11 @@ class LLMReasoning:
             provider: LLM provider (openai, anthropic, google, mock)
             model: Model name (optional, uses defaults)
             temperature: LLM temperature (0.0-1.0)
+            gateway: LLM gateway used by areason() (default: shared gateway)
         """
         self.provider = provider
         self.temperature = temperature
+        self.gateway = gateway or get_llm_gateway()
 
         # Set default models
         if model:
@@ -226,6 +236,8 @@ class LLMReasoning:
 
         if provider == LLMProvider.OPENAI and OPENAI_AVAILABLE:
             try:
+                from openai import OpenAI
+
                 self.openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
                 logger.info(f"OpenAI client initialized with model: {self.model}")
             except Exception as e:
@@ -234,6 +246,8 @@ class LLMReasoning:
 
         elif provider == LLMProvider.ANTHROPIC and ANTHROPIC_AVAILABLE:
             try:
+                from anthropic import Anthropic
+
                 self.anthropic_client = Anthropic(api_key=settings.ANTHROPIC_API_KEY)
                 logger.info(f"Anthropic client initialized with model: {self.model}")
             except Exception as e:
@@ -248,6 +262,8 @@ class LLMReasoning:
                 if not api_key:
                     raise ValueError("GOOGLE_API_KEY is not set")
 
+                import google.generativeai as genai
+
                 genai.configure(api_key=api_key)
                 self.gemini_model = genai.GenerativeModel(
                     model_name=self.model,
@@ -269,10 +285,25 @@ class LLMReasoning:
                 logger.error(f"Traceback: {traceback.format_exc()}")
                 self.provider = LLMProvider.MOCK
 
+        elif provider in self.GATEWAY_PROVIDERS and (
+            self.gateway.stub or self._has_api_key(provider)
+        ):
+            # SDK is not installed, but areason() can still call the provider through the gateway
+            logger.info(f"{provider.value} SDK not available, using LLM gateway with model: {self.model}")
+
         else:
             self.provider = LLMProvider.MOCK
             logger.info("Using mock LLM provider")
 
+    @staticmethod
+    def _has_api_key(provider: LLMProvider) -> bool:
+        key_name = {
+            LLMProvider.OPENAI: "OPENAI_API_KEY",
+            LLMProvider.ANTHROPIC: "ANTHROPIC_API_KEY",
+            LLMProvider.GOOGLE: "GOOGLE_API_KEY",
+        }.get(provider)
+        return bool(key_name and getattr(settings, key_name, None))
+
     def assemble_context(
         self,
         parsed_query: ParsedQuery,
@@ -303,19 +334,8 @@ class LLMReasoning:
             total_sources=total_sources,
         )
 
-    def reason(
-        self,
-        context: ReasoningContext,
-    ) -> ReasoningResult:
-        """
-        Generate answer using LLM reasoning.
-
-        Args:
-            context: Assembled reasoning context
-
-        Returns:
-            ReasoningResult with answer
-        """
+    def _build_prompts(self, context: ReasoningContext) -> tuple[str, str]:
+        """Build system and user prompts for the query intent"""
         # Get system prompt for intent
         system_prompt = self.SYSTEM_PROMPTS.get(
             context.intent,
@@ -328,17 +348,14 @@ class LLMReasoning:
             context=context_text,
             query=context.query,
         )
+        return system_prompt, user_prompt
 
-        # Generate answer based on provider
-        if self.provider == LLMProvider.OPENAI:
-            answer, reasoning_steps = self._reason_openai(system_prompt, user_prompt)
-        elif self.provider == LLMProvider.ANTHROPIC:
-            answer, reasoning_steps = self._reason_anthropic(system_prompt, user_prompt)
-        elif self.provider == LLMProvider.GOOGLE:
-            answer, reasoning_steps = self._reason_gemini(system_prompt, user_prompt)
-        else:
-            answer, reasoning_steps = self._reason_mock(context)
-
+    def _build_result(
+        self,
+        context: ReasoningContext,
+        answer: str,
+        reasoning_steps: List[str],
+    ) -> ReasoningResult:
         # Extract sources
         sources = self._extract_sources(context)
 
@@ -359,6 +376,83 @@ class LLMReasoning:
 
         return result
 
+    def reason(
+        self,
+        context: ReasoningContext,
+    ) -> ReasoningResult:
+        """
+        Generate answer using LLM reasoning (blocking provider SDKs).
+
+        Prefer areason() from async code.
+
+        Args:
+            context: Assembled reasoning context
+
+        Returns:
+            ReasoningResult with answer
+        """
+        system_prompt, user_prompt = self._build_prompts(context)
+
+        # Generate answer based on provider
+        if self.provider == LLMProvider.OPENAI:
+            answer, reasoning_steps = self._reason_openai(system_prompt, user_prompt)
+        elif self.provider == LLMProvider.ANTHROPIC:
+            answer, reasoning_steps = self._reason_anthropic(system_prompt, user_prompt)
+        elif self.provider == LLMProvider.GOOGLE:
+            answer, reasoning_steps = self._reason_gemini(system_prompt, user_prompt)
+        else:
+            answer, reasoning_steps = self._reason_mock(context)
+
+        return self._build_result(context, answer, reasoning_steps)
+
+    async def areason(
+        self,
+        context: ReasoningContext,
+    ) -> ReasoningResult:
+        """
+        Generate answer using LLM reasoning through the shared LLM gateway.
+
+        Args:
+            context: Assembled reasoning context
+
+        Returns:
+            ReasoningResult with answer
+        """
+        system_prompt, user_prompt = self._build_prompts(context)
+
+        if self.provider in self.GATEWAY_PROVIDERS:
+            answer, reasoning_steps = await self._reason_gateway(system_prompt, user_prompt)
+        else:
+            answer, reasoning_steps = self._reason_mock(context)
+
+        return self._build_result(context, answer, reasoning_steps)
+
+    async def _reason_gateway(self, system_prompt: str, user_prompt: str) -> tuple[str, List[str]]:
+        """Generate answer through the LLM gateway"""
+        gateway_provider = self.GATEWAY_PROVIDERS[self.provider]
+        try:
+            response = await self.gateway.complete(LLMRequest(
+                provider=gateway_provider,
+                model=self.model,
+                system=system_prompt,
+                messages=[{"role": "user", "content": user_prompt}],
+                temperature=self.temperature,
+                max_tokens=2000,
+            ))
+        except LLMError as e:
+            logger.error(f"{gateway_provider} API error: {e}")
+            return self._reason_mock_fallback()
+
+        if not response.text:
+            logger.error(f"{gateway_provider} returned an empty answer")
+            return self._reason_mock_fallback()
+
+        logger.info(
+            f"✅ {gateway_provider} answer generated: {len(response.text)} characters, "
+            f"model={self.model}, {response.latency_ms:.0f}ms, ${response.cost_usd:.4f}"
+        )
+        return response.text, [f"{gateway_provider} ({self.model}) reasoning completed"]
+
     def _reason_openai(self, system_prompt: str, user_prompt: str) -> tuple[str, List[str]]:
         """Generate answer using OpenAI"""
         if not self.openai_client:
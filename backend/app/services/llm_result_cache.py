@@ -0,0 +1,268 @@
+"""
+LLM Result Cache
+
+LLM 추출 결과 영구 캐시 (SQLite).
+
+키 = 프롬프트 템플릿 이름@버전 + 모델 + 정규화된 입력 해시.
+문서 reset/재학습/재게시 시 같은 조항 텍스트에 LLM 비용을 다시 지불하지 않고,
+여러 보험사에 공통으로 들어가는 표준 조항은 한 번만 추출합니다.
+프롬프트나 출력 형식이 바뀌면 해당 템플릿 버전을 올려 자연스럽게 무효화합니다.
+
+- get_many: 문서 단위 일괄 조회 (조항 수와 무관하게 수백 개씩 한 번의 쿼리)
+- 제거 정책: 마지막 조회 후 max_age_days가 지난 항목 삭제, max_entries 초과분은 LRU 삭제
+- 여러 워커 프로세스가 같은 파일을 공유합니다 (WAL 모드)
+"""
+import asyncio
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from loguru import logger
+
+from app.core.config import settings
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# SQLite 바인딩 변수 제한(999) 아래로 나눠서 조회
+_QUERY_BATCH = 500
+
+
+def normalize_input(text: str) -> str:
+    """캐시 키용 입력 정규화 (유니코드 NFC + 공백 축약)"""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", text or "")).strip()
+
+
+def make_cache_key(template: str, model: str, *inputs: str) -> str:
+    """
+    캐시 키 생성
+
+    Args:
+        template: 프롬프트 템플릿 이름@버전 (예: "graphrag_entities@1")
+        model: 모델 이름
+        inputs: 프롬프트에 들어가는 가변 입력 (각각 정규화 후 해시)
+    """
+    hasher = hashlib.sha256()
+    for part in (template, model, *(normalize_input(value) for value in inputs)):
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\x00")
+    return hasher.hexdigest()
+
+
+class LLMResultCache:
+    """
+    SQLite 기반 LLM 결과 캐시
+
+    sqlite3 호출은 스레드에서 실행하므로 이벤트 루프를 막지 않습니다.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: Optional[int] = None,
+        max_age_days: Optional[int] = None,
+        prune_every: int = 500,
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본값: settings.LLM_CACHE_PATH)
+            max_entries: 최대 항목 수 (기본값: settings.LLM_CACHE_MAX_ENTRIES)
+            max_age_days: 마지막 조회 후 보관 기간 (기본값: settings.LLM_CACHE_MAX_AGE_DAYS)
+            prune_every: 이 횟수만큼 기록할 때마다 제거 정책 적용
+        """
+        self.path = Path(path or settings.LLM_CACHE_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries or settings.LLM_CACHE_MAX_ENTRIES
+        self.max_age_days = max_age_days or settings.LLM_CACHE_MAX_AGE_DAYS
+        self.prune_every = prune_every
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "evicted": 0}
+
+        self._lock = threading.Lock()
+        self._writes_since_prune = 0
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_results (
+                key TEXT PRIMARY KEY,
+                template TEXT NOT NULL,
+                model TEXT NOT NULL,
+                value BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_results_accessed_at ON llm_results (accessed_at)"
+        )
+        self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # sync (스레드에서 실행)
+    # ------------------------------------------------------------------
+
+    def _get_many_sync(self, keys: List[str]) -> Dict[str, Any]:
+        found: Dict[str, Any] = {}
+        now = time.time()
+        with self._lock:
+            for start in range(0, len(keys), _QUERY_BATCH):
+                batch = keys[start:start + _QUERY_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, value FROM llm_results WHERE key IN ({placeholders})", batch
+                ).fetchall()
+                for key, value in rows:
+                    try:
+                        found[key] = json.loads(zlib.decompress(value))
+                    except (zlib.error, ValueError) as e:
+                        logger.warning(f"Corrupt LLM cache entry {key[:12]}: {e}")
+                if rows:
+                    hit_keys = [key for key, _ in rows]
+                    self._conn.execute(
+                        f"UPDATE llm_results SET accessed_at = ?, hits = hits + 1 "
+                        f"WHERE key IN ({','.join('?' * len(hit_keys))})",
+                        [now, *hit_keys],
+                    )
+            self._conn.commit()
+        return found
+
+    def _set_many_sync(self, items: Dict[str, Any], template: str, model: str) -> None:
+        now = time.time()
+        rows = [
+            (
+                key,
+                template,
+                model,
+                zlib.compress(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"), 6),
+                now,
+                now,
+            )
+            for key, value in items.items()
+        ]
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT INTO llm_results (key, template, model, value, created_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    value = excluded.value,
+                    accessed_at = excluded.accessed_at
+                """,
+                rows,
+            )
+            self._conn.commit()
+            self._writes_since_prune += len(rows)
+            should_prune = self._writes_since_prune >= self.prune_every
+        if should_prune:
+            self._prune_sync()
+
+    def _prune_sync(self) -> int:
+        cutoff = time.time() - self.max_age_days * 86400
+        with self._lock:
+            self._writes_since_prune = 0
+            expired = self._conn.execute(
+                "DELETE FROM llm_results WHERE accessed_at < ?", (cutoff,)
+            ).rowcount
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM llm_results").fetchone()
+            overflow = 0
+            if count > self.max_entries:
+                overflow = self._conn.execute(
+                    """
+                    DELETE FROM llm_results WHERE key IN (
+                        SELECT key FROM llm_results ORDER BY accessed_at ASC LIMIT ?
+                    )
+                    """,
+                    (count - self.max_entries,),
+                ).rowcount
+            self._conn.commit()
+        removed = (expired or 0) + (overflow or 0)
+        if removed:
+            self.stats["evicted"] += removed
+            logger.info(f"LLM cache evicted {removed} entries ({expired} expired, {overflow} LRU)")
+        return removed
+
+    # ------------------------------------------------------------------
+    # async API
+    # ------------------------------------------------------------------
+
+    async def get(self, key: str) -> Optional[Any]:
+        """캐시된 결과 조회 (없으면 None)"""
+        return (await self.get_many([key])).get(key)
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        여러 키 일괄 조회 (문서 단위 prefetch)
+
+        Returns:
+            {키: 결과} (캐시에 있는 키만)
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        try:
+            found = await asyncio.to_thread(self._get_many_sync, keys)
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache lookup failed: {e}")
+            found = {}
+        self.stats["hits"] += len(found)
+        self.stats["misses"] += len(keys) - len(found)
+        return found
+
+    async def set(self, key: str, value: Any, template: str, model: str) -> None:
+        """결과 저장 (JSON 직렬화 가능한 값만)"""
+        await self.set_many({key: value}, template, model)
+
+    async def set_many(self, items: Dict[str, Any], template: str, model: str) -> None:
+        """여러 결과를 한 트랜잭션으로 저장"""
+        if not items:
+            return
+        try:
+            await asyncio.to_thread(self._set_many_sync, items, template, model)
+            self.stats["writes"] += len(items)
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+    async def prune(self) -> int:
+        """제거 정책 즉시 적용 (삭제된 항목 수)"""
+        return await asyncio.to_thread(self._prune_sync)
+
+    async def invalidate_template(self, template: str) -> int:
+        """특정 템플릿 버전의 결과 전체 삭제"""
+        def delete() -> int:
+            with self._lock:
+                removed = self._conn.execute(
+                    "DELETE FROM llm_results WHERE template = ?", (template,)
+                ).rowcount
+                self._conn.commit()
+            return removed or 0
+
+        return await asyncio.to_thread(delete)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_llm_result_cache: Optional[LLMResultCache] = None
+
+
+def get_llm_result_cache() -> Optional[LLMResultCache]:
+    """LLMResultCache 싱글톤 (비활성화 시 None)"""
+    global _llm_result_cache
+    if not settings.LLM_CACHE_ENABLED:
+        return None
+    if _llm_result_cache is None:
+        try:
+            _llm_result_cache = LLMResultCache()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"LLM result cache unavailable: {e}")
+            return None
+    return _llm_result_cache
@@ -36,6 +36,7 @@ from app.core.config import settings
 from app.services.legal_structure_parser import Article, Paragraph, Subclause
 from app.services.critical_data_extractor import ExtractionResult
 from app.services.embedding_generator import EmbeddingResult
+from app.services.graph_projection import bump_graph_version
 from loguru import logger
 
 
@@ -227,6 +228,8 @@ class Neo4jGraphBuilder:
             )
             stats.relationships += rel_count
 
+            bump_graph_version(session)
+
         logger.info(
             f"Graph built: {stats.total_nodes} nodes, {stats.relationships} relationships"
         )
@@ -410,6 +413,7 @@ class Neo4jGraphBuilder:
         """
         with self.driver.session() as session:
             result = session.run(query, policy_id=str(policy_id))
+            bump_graph_version(session)
             logger.info(f"Cleared policy {policy_id} from graph")
 
 
@@ -0,0 +1,85 @@
+"""
+Graph Cache Invalidation
+
+문서가 completed로 전이되거나(그래프에 반영) completed에서 벗어나면(재처리)
+오케스트레이터 응답 캐시를 무효화하는 구독자.
+
+그래프 업데이터 워커는 별도 프로세스이므로, 질의 API 프로세스마다
+문서 상태 이벤트(LISTEN/NOTIFY)를 받아 QueryOrchestrator.on_graph_updated()를 호출합니다
+(새 문서 → 전체 무효화, 빠진 문서 → 그 문서를 인용한 응답만 무효화).
+알림을 받을 수 없는 동안에는 캐시 TTL이 최대 지연을 제한합니다.
+"""
+import asyncio
+from typing import Callable, Optional
+
+from loguru import logger
+
+from app.services.document_events import DocumentEventListener
+
+
+class GraphCacheInvalidator:
+    """문서 이벤트 → 오케스트레이터 캐시 무효화"""
+
+    def __init__(
+        self,
+        get_orchestrator: Callable,
+        listener: Optional[DocumentEventListener] = None,
+        idle_timeout: float = 300.0,
+    ):
+        """
+        Args:
+            get_orchestrator: 오케스트레이터 싱글톤 getter (첫 이벤트 시 호출)
+            listener: 문서 이벤트 구독자 (기본값: completed 진입/이탈)
+            idle_timeout: 이벤트가 없을 때 대기 주기 (초)
+        """
+        self.get_orchestrator = get_orchestrator
+        self.listener = listener or DocumentEventListener(
+            statuses={"completed"}, include_previous=True
+        )
+        self.idle_timeout = idle_timeout
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+
+    async def start(self) -> None:
+        """구독 시작 (LISTEN 불가 시 아무 것도 하지 않음)"""
+        if self._task is not None:
+            return
+        if not await self.listener.start():
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        self._running = False
+        self.listener.wake()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        await self.listener.stop()
+
+    async def handle_events(self, events) -> None:
+        """
+        캐시 무효화
+
+        completed에 진입한 문서는 아직 어떤 응답에도 인용되지 않았으므로
+        (근거로 대상 항목을 고를 수 없음) 전체 무효화하고, completed에서
+        벗어난 문서만 있으면 그 문서를 근거로 한 항목만 제거합니다.
+        """
+        if not events:
+            return
+        orchestrator = self.get_orchestrator()
+        if any(event.status == "completed" for event in events):
+            await orchestrator.on_graph_updated()
+        else:
+            await orchestrator.on_graph_updated([event.document_id for event in events])
+
+    async def _run(self) -> None:
+        while self._running:
+            try:
+                events = await self.listener.wait(timeout=self.idle_timeout)
+                if not self._running:
+                    break
+                await self.handle_events(events)
+            except Exception as e:
+                logger.warning(f"Graph cache invalidation failed: {e}")
+                await asyncio.sleep(1.0)
@@ -0,0 +1,154 @@
+"""
+Execution Budget
+
+요청 단위 실행 예산.
+
+전략별 예산(StrategyBudget)을 요청마다 복사해 단계별로 전달합니다.
+공유 OrchestrationConfig를 변경하지 않으므로 동시 요청 간 간섭이 없습니다.
+현재 요청의 예산은 ContextVar로 노출되어 하위 클라이언트가 clamp_timeout()으로
+자체 타임아웃을 남은 시간에 맞춥니다 (벡터 검색/그래프 쿼리의 Neo4j 트랜잭션 타임아웃,
+LLMGateway 호출 마감). 단계 사이뿐 아니라 단계 안의 개별 호출도 마감 시각을 넘지 않습니다.
+"""
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from app.models.orchestration import (
+    ExecutionStage,
+    OrchestrationConfig,
+    OrchestrationRequest,
+    OrchestrationStrategy,
+    StrategyBudget,
+)
+
+
+_current_budget: ContextVar[Optional["ExecutionBudget"]] = ContextVar(
+    "orchestration_execution_budget", default=None
+)
+
+
+@dataclass
+class ExecutionBudget:
+    """
+    요청 실행 예산
+
+    deadline = 요청 시작 시각 + min(전략 예산, 요청 timeout_seconds)
+    각 단계 타임아웃은 min(단계 상한, 남은 예산)입니다.
+    """
+
+    strategy: OrchestrationStrategy
+    limits: StrategyBudget
+    total_seconds: float
+    max_search_results: int
+    started_at: float = field(default_factory=time.monotonic)
+    skipped_stages: List[ExecutionStage] = field(default_factory=list)
+
+    @classmethod
+    def for_request(
+        cls,
+        request: OrchestrationRequest,
+        config: OrchestrationConfig,
+        started_at: Optional[float] = None,
+    ) -> "ExecutionBudget":
+        """
+        요청 예산 생성
+
+        Args:
+            request: 오케스트레이션 요청
+            config: 오케스트레이션 설정
+            started_at: 시작 시각 (time.monotonic 기준, 기본값: 현재)
+        """
+        limits = config.budget_for(request.strategy)
+
+        total = limits.total_seconds
+        if request.timeout_seconds:
+            total = min(total, float(request.timeout_seconds))
+
+        max_results = request.max_search_results
+        if limits.max_search_results is not None:
+            max_results = min(max_results, limits.max_search_results)
+        if limits.min_search_results is not None:
+            max_results = max(max_results, limits.min_search_results)
+
+        return cls(
+            strategy=request.strategy,
+            limits=limits,
+            total_seconds=total,
+            max_search_results=max_results,
+            started_at=time.monotonic() if started_at is None else started_at,
+        )
+
+    @property
+    def deadline(self) -> float:
+        """마감 시각 (time.monotonic 기준)"""
+        return self.started_at + self.total_seconds
+
+    def remaining(self) -> float:
+        """남은 예산 (초, 음수 없음)"""
+        return max(0.0, self.deadline - time.monotonic())
+
+    def elapsed_ms(self) -> float:
+        return (time.monotonic() - self.started_at) * 1000
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def stage_timeout(self, stage: ExecutionStage) -> float:
+        """단계 타임아웃 = min(단계 상한, 남은 예산)"""
+        caps = {
+            ExecutionStage.QUERY_ANALYSIS: self.limits.query_analysis_timeout,
+            ExecutionStage.SEARCH: self.limits.search_timeout,
+            ExecutionStage.RESPONSE_GENERATION: self.limits.response_generation_timeout,
+        }
+        return min(caps.get(stage, self.total_seconds), self.remaining())
+
+    def should_skip(self, stage: ExecutionStage) -> bool:
+        """남은 예산이 단계 최소 예산보다 작으면 생략"""
+        minimums = {
+            ExecutionStage.QUERY_ANALYSIS: self.limits.min_analysis_seconds,
+            ExecutionStage.SEARCH: self.limits.min_search_seconds,
+            ExecutionStage.RESPONSE_GENERATION: self.limits.min_generation_seconds,
+        }
+        return self.remaining() < minimums.get(stage, 0.0)
+
+    def mark_skipped(self, stage: ExecutionStage) -> None:
+        self.skipped_stages.append(stage)
+
+    def activate(self):
+        """현재 컨텍스트의 예산으로 설정 (반환된 토큰으로 reset)"""
+        return _current_budget.set(self)
+
+    @staticmethod
+    def reset(token) -> None:
+        _current_budget.reset(token)
+
+
+def get_current_budget() -> Optional[ExecutionBudget]:
+    """현재 요청의 실행 예산 (오케스트레이터 밖에서는 None)"""
+    return _current_budget.get()
+
+
+def remaining_seconds(default: Optional[float] = None) -> Optional[float]:
+    """
+    현재 요청의 남은 예산 (초)
+
+    하위 클라이언트는 clamp_timeout(자체 타임아웃)으로 마감 시각을 넘지 않게 호출합니다.
+    """
+    budget = _current_budget.get()
+    if budget is None:
+        return default
+    return budget.remaining()
+
+
+def clamp_timeout(timeout: Optional[float] = None) -> Optional[float]:
+    """
+    min(timeout, 남은 예산)
+
+    오케스트레이터 밖(예산 없음)에서는 timeout을 그대로 반환합니다.
+    None이면 타임아웃 없음을 뜻합니다.
+    """
+    remaining = remaining_seconds()
+    if remaining is None:
+        return timeout
+    return remaining if timeout is None else min(timeout, remaining)
@@ -6,11 +6,14 @@ Story 2.1, 2.2, 2.3, 2.4를 통합합니다.
 """
 import time
 import hashlib
-from typing import Optional, Dict, Any
+import inspect
+from typing import Optional, Dict, Any, Iterable, List
 from datetime import datetime
 from loguru import logger
 import asyncio
+from collections import deque
 
+from app.core.config import settings
 from app.models.orchestration import (
     OrchestrationRequest,
     OrchestrationResponse,
@@ -24,9 +27,21 @@ from app.models.orchestration import (
     CacheEntry,
 )
 from app.models.response import GeneratedResponse, AnswerFormat, ResponseGenerationRequest
+from app.models.vector_search import EmbeddingRequest
 from app.services.query.query_analyzer import QueryAnalyzer
 from app.services.vector_search.hybrid_search_engine import HybridSearchEngine
+from app.services.vector_search.query_embedder import QueryEmbedder
 from app.services.response.response_generator import ResponseGenerator
+from app.services.orchestration.execution_budget import ExecutionBudget
+from app.services.orchestration.response_cache import (
+    LRUTTLCache,
+    RedisResponseCache,
+    SemanticResponseCache,
+    SingleFlight,
+    build_cache_key,
+    build_semantic_scope,
+    response_source_ids,
+)
 
 
 class QueryOrchestrator:
@@ -45,6 +60,7 @@ class QueryOrchestrator:
         hybrid_search: Optional[HybridSearchEngine] = None,
         response_generator: Optional[ResponseGenerator] = None,
         config: Optional[OrchestrationConfig] = None,
+        query_embedder: Optional[QueryEmbedder] = None,
     ):
         """
         Args:
@@ -52,15 +68,56 @@ class QueryOrchestrator:
             hybrid_search: 하이브리드 검색 엔진
             response_generator: 응답 생성기
             config: 오케스트레이션 설정
+            query_embedder: 시맨틱 캐시용 질문 임베더
+                (기본값: 벡터 검색 엔진의 임베더를 공유)
         """
         self.query_analyzer = query_analyzer or QueryAnalyzer()
         self.hybrid_search = hybrid_search or HybridSearchEngine()
         self.response_generator = response_generator or ResponseGenerator()
         self.config = config or OrchestrationConfig()
 
-        # 캐시
-        self._cache: Dict[str, CacheEntry] = {}
-        self._cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+        # 캐시 (L1: 프로세스 로컬 LRU, L2: 선택적 Redis 공유 캐시)
+        self._cache = LRUTTLCache(
+            max_size=self.config.cache_max_size,
+            ttl_seconds=self.config.cache_ttl_seconds,
+        )
+        self._shared_cache: Optional[RedisResponseCache] = (
+            RedisResponseCache(
+                redis_url=self.config.shared_cache_url,
+                ttl_seconds=self.config.cache_ttl_seconds,
+            )
+            if self.config.shared_cache_enabled
+            else None
+        )
+        self._single_flight = SingleFlight()
+
+        # 시맨틱 캐시 (의역된 질문 재사용)
+        self._semantic_cache: Optional[SemanticResponseCache] = None
+        self.query_embedder = query_embedder
+        if self.config.semantic_cache_enabled:
+            self._semantic_cache = SemanticResponseCache(
+                similarity_threshold=self.config.semantic_cache_threshold,
+                max_size=self.config.semantic_cache_max_size,
+                ttl_seconds=self.config.cache_ttl_seconds,
+            )
+            if self.query_embedder is None:
+                # 검색 단계와 같은 임베더를 써서 질문 임베딩을 한 번만 계산
+                vector_engine = getattr(self.hybrid_search, "vector_engine", None)
+                shared = getattr(vector_engine, "query_embedder", None)
+                self.query_embedder = (
+                    shared if isinstance(shared, QueryEmbedder) else QueryEmbedder()
+                )
+
+        self._cache_stats = {
+            "hits": 0,
+            "misses": 0,
+            "shared_hits": 0,
+            "semantic_hits": 0,
+            "coalesced": 0,
+        }
+
+        # 전략별 지연 SLO 통계 (파이프라인 실행 건만 집계)
+        self._slo_stats: Dict[str, Dict[str, Any]] = {}
 
     async def process(
         self, request: OrchestrationRequest
@@ -77,6 +134,9 @@ class QueryOrchestrator:
         start_time = time.time()
         request_id = self._generate_request_id(request)
 
+        # 요청 단위 실행 예산 (공유 설정은 변경하지 않음)
+        budget = ExecutionBudget.for_request(request, self.config)
+
         logger.info(
             f"[{request_id}] Starting orchestration: '{request.query}' "
             f"(strategy: {request.strategy})"
@@ -92,25 +152,78 @@ class QueryOrchestrator:
         metrics = OrchestrationMetrics(total_duration_ms=0.0, stages=[])
 
         try:
+            cache_key = None
+
             # 캐시 확인
             if request.use_cache and self.config.cache_enabled:
-                cached_response = self._get_from_cache(request)
+                cache_key = await self._build_cache_key(request, context, budget)
+                cached_response = await self._get_from_cache(cache_key)
                 if cached_response:
                     logger.info(f"[{request_id}] Cache hit!")
-                    cached_response.cache_hit = True
-                    cached_response.metrics.cache_hit = True
                     self._cache_stats["hits"] += 1
-                    return cached_response
+                    return self._as_cache_hit(cached_response)
+
+                semantic_response = await self._get_from_semantic_cache(
+                    request, context
+                )
+                if semantic_response:
+                    self._cache_stats["hits"] += 1
+                    self._cache_stats["semantic_hits"] += 1
+                    return self._as_cache_hit(semantic_response)
                 self._cache_stats["misses"] += 1
 
-            # 전략별 실행
+                # 동일 질문 동시 요청은 하나의 파이프라인 실행으로 병합
+                if self.config.single_flight_enabled:
+                    response, shared = await self._single_flight.do(
+                        cache_key,
+                        lambda: self._execute_strategy(
+                            request, context, metrics, start_time, cache_key, budget
+                        ),
+                    )
+                    if shared:
+                        logger.info(f"[{request_id}] Coalesced with in-flight identical query")
+                        self._cache_stats["coalesced"] += 1
+                        return self._as_cache_hit(response)
+                    return response
+
+            return await self._execute_strategy(
+                request, context, metrics, start_time, cache_key, budget
+            )
+
+        except Exception as e:
+            logger.error(f"[{request_id}] Orchestration failed: {e}")
+            context.add_error(str(e))
+
+            # 폴백 응답 생성
+            if self.config.enable_fallback:
+                return await self._create_fallback_response(
+                    request, context, metrics, str(e)
+                )
+            else:
+                raise
+
+    async def _execute_strategy(
+        self,
+        request: OrchestrationRequest,
+        context: OrchestrationContext,
+        metrics: OrchestrationMetrics,
+        start_time: float,
+        cache_key: Optional[str],
+        budget: Optional[ExecutionBudget] = None,
+    ) -> OrchestrationResponse:
+        """전략별 파이프라인 실행 및 캐시 저장"""
+        budget = budget or ExecutionBudget.for_request(request, self.config)
+
+        # 하위 검색/LLM 호출이 남은 예산을 조회할 수 있도록 컨텍스트에 설정
+        token = budget.activate()
+        try:
             if request.strategy == OrchestrationStrategy.FAST:
                 response = await self._execute_fast_strategy(
-                    request, context, metrics
+                    request, context, metrics, budget
                 )
             elif request.strategy == OrchestrationStrategy.COMPREHENSIVE:
                 response = await self._execute_comprehensive_strategy(
-                    request, context, metrics
+                    request, context, metrics, budget
                 )
             elif request.strategy == OrchestrationStrategy.FALLBACK:
                 response = await self._execute_fallback_strategy(
@@ -118,47 +231,51 @@ class QueryOrchestrator:
                 )
             else:  # STANDARD
                 response = await self._execute_standard_strategy(
-                    request, context, metrics
+                    request, context, metrics, budget
                 )
+        finally:
+            ExecutionBudget.reset(token)
 
-            # 전체 실행 시간
-            total_time = (time.time() - start_time) * 1000
-            response.metrics.total_duration_ms = total_time
+        # 전체 실행 시간
+        total_time = (time.time() - start_time) * 1000
+        response.metrics.total_duration_ms = total_time
 
-            # 캐시 저장
-            if request.use_cache and self.config.cache_enabled and response.success:
-                self._save_to_cache(request, response)
+        # 예산 / SLO 기록
+        response.metrics.strategy = request.strategy.value
+        response.metrics.budget_ms = budget.total_seconds * 1000
+        response.metrics.skipped_stages = list(budget.skipped_stages)
+        response.metrics.record_slo(budget.limits.slo_ms)
+        self._record_slo(request.strategy, response.metrics)
 
-            logger.info(
-                f"[{request_id}] Orchestration completed in {total_time:.2f}ms "
-                f"(success: {response.success})"
-            )
+        # 캐시 저장
+        if cache_key and response.success:
+            await self._save_to_cache(cache_key, request, response)
+            self._save_to_semantic_cache(cache_key, context, response)
 
-            return response
+        logger.info(
+            f"[{context.request_id}] Orchestration completed in {total_time:.2f}ms "
+            f"(success: {response.success})"
+        )
 
-        except Exception as e:
-            logger.error(f"[{request_id}] Orchestration failed: {e}")
-            context.add_error(str(e))
-
-            # 폴백 응답 생성
-            if self.config.enable_fallback:
-                return await self._create_fallback_response(
-                    request, context, metrics, str(e)
-                )
-            else:
-                raise
+        return response
 
     async def _execute_standard_strategy(
         self,
         request: OrchestrationRequest,
         context: OrchestrationContext,
         metrics: OrchestrationMetrics,
+        budget: Optional[ExecutionBudget] = None,
     ) -> OrchestrationResponse:
         """
         표준 전략 실행
 
         Analysis → Search → Generation
+
+        각 단계 타임아웃은 요청 예산의 남은 시간으로 제한되며,
+        남은 예산이 단계 최소 예산보다 작으면 해당 단계를 생략하고 폴백을 사용합니다.
         """
+        budget = budget or ExecutionBudget.for_request(request, self.config)
+
         # Stage 1: Query Analysis
         stage_metrics = StageMetrics(
             stage=ExecutionStage.QUERY_ANALYSIS,
@@ -167,19 +284,31 @@ class QueryOrchestrator:
         context.current_stage = ExecutionStage.QUERY_ANALYSIS
 
         try:
-            query_analysis = await self._run_with_timeout(
-                self.query_analyzer.analyze(request.query),
-                timeout=self.config.query_analysis_timeout,
-            )
+            # 캐시 키 생성 시 이미 분석했다면 재사용
+            precomputed = context.query_analysis is not None
+            skipped = False
+            if precomputed:
+                query_analysis = context.query_analysis
+            elif budget.should_skip(ExecutionStage.QUERY_ANALYSIS):
+                skipped = True
+                budget.mark_skipped(ExecutionStage.QUERY_ANALYSIS)
+                query_analysis = await self._create_fallback_analysis(request.query)
+            else:
+                query_analysis = await self._run_with_timeout(
+                    self.query_analyzer.analyze(request.query),
+                    timeout=budget.stage_timeout(ExecutionStage.QUERY_ANALYSIS),
+                )
             context.query_analysis = query_analysis
             stage_metrics.mark_completed(success=True)
             stage_metrics.metadata = {
                 "intent": query_analysis.intent,
-                "confidence": query_analysis.confidence,
+                "confidence": query_analysis.intent_confidence,
+                "precomputed": precomputed,
+                "skipped": skipped,
             }
             logger.debug(
                 f"[{context.request_id}] Query analysis: intent={query_analysis.intent}, "
-                f"confidence={query_analysis.confidence:.2f}"
+                f"confidence={query_analysis.intent_confidence:.2f}"
             )
 
         except Exception as e:
@@ -201,19 +330,27 @@ class QueryOrchestrator:
         context.current_stage = ExecutionStage.SEARCH
 
         try:
-            search_response = await self._run_with_timeout(
-                self.hybrid_search.search(
-                    query=request.query,
-                    analysis=query_analysis,
-                    top_k=request.max_search_results,
-                ),
-                timeout=self.config.search_timeout,
-            )
+            skipped = budget.should_skip(ExecutionStage.SEARCH)
+            if skipped:
+                budget.mark_skipped(ExecutionStage.SEARCH)
+                search_response = await self._create_fallback_search_response(
+                    request.query
+                )
+            else:
+                search_response = await self._run_with_timeout(
+                    self.hybrid_search.search(
+                        query=request.query,
+                        analysis=query_analysis,
+                        top_k=budget.max_search_results,
+                    ),
+                    timeout=budget.stage_timeout(ExecutionStage.SEARCH),
+                )
             context.search_response = search_response
             stage_metrics.mark_completed(success=True)
             stage_metrics.metadata = {
                 "result_count": search_response.total_count,
                 "strategy": search_response.strategy,
+                "skipped": skipped,
             }
             logger.debug(
                 f"[{context.request_id}] Search: found {search_response.total_count} results "
@@ -250,16 +387,24 @@ class QueryOrchestrator:
                 include_follow_ups=request.include_follow_ups,
             )
 
-            generated_response = await self._run_with_timeout(
-                self.response_generator.generate(generation_request),
-                timeout=self.config.response_generation_timeout,
-            )
+            skipped = budget.should_skip(ExecutionStage.RESPONSE_GENERATION)
+            if skipped:
+                budget.mark_skipped(ExecutionStage.RESPONSE_GENERATION)
+                generated_response = await self._create_fallback_generated_response(
+                    request.query
+                )
+            else:
+                generated_response = await self._run_with_timeout(
+                    self.response_generator.generate(generation_request),
+                    timeout=budget.stage_timeout(ExecutionStage.RESPONSE_GENERATION),
+                )
 
             stage_metrics.mark_completed(success=True)
             stage_metrics.metadata = {
                 "format": generated_response.format,
                 "confidence": generated_response.confidence_score,
                 "citation_count": len(generated_response.citations),
+                "skipped": skipped,
             }
             logger.debug(
                 f"[{context.request_id}] Response generated: "
@@ -298,56 +443,30 @@ class QueryOrchestrator:
         request: OrchestrationRequest,
         context: OrchestrationContext,
         metrics: OrchestrationMetrics,
+        budget: Optional[ExecutionBudget] = None,
     ) -> OrchestrationResponse:
         """
         빠른 전략 실행
 
-        캐시 우선, 간단한 분석, 제한된 검색
+        표준 파이프라인을 FAST 예산(짧은 단계 타임아웃, 제한된 검색 결과 수)으로 실행
         """
-        # 표준 전략과 동일하지만 타임아웃을 더 짧게 설정
-        original_timeouts = (
-            self.config.query_analysis_timeout,
-            self.config.search_timeout,
-            self.config.response_generation_timeout,
-        )
-
-        # 타임아웃 단축
-        self.config.query_analysis_timeout = 2
-        self.config.search_timeout = 5
-        self.config.response_generation_timeout = 3
-
-        try:
-            # 검색 결과 수도 제한
-            request.max_search_results = min(request.max_search_results, 5)
-            return await self._execute_standard_strategy(request, context, metrics)
-        finally:
-            # 타임아웃 복원
-            (
-                self.config.query_analysis_timeout,
-                self.config.search_timeout,
-                self.config.response_generation_timeout,
-            ) = original_timeouts
+        budget = budget or ExecutionBudget.for_request(request, self.config)
+        return await self._execute_standard_strategy(request, context, metrics, budget)
 
     async def _execute_comprehensive_strategy(
         self,
         request: OrchestrationRequest,
         context: OrchestrationContext,
         metrics: OrchestrationMetrics,
+        budget: Optional[ExecutionBudget] = None,
     ) -> OrchestrationResponse:
         """
         포괄적 전략 실행
 
-        모든 검색 전략 시도, 더 많은 결과, 더 긴 타임아웃
+        표준 파이프라인을 COMPREHENSIVE 예산(더 많은 결과, 더 긴 타임아웃)으로 실행
         """
-        # 검색 결과 수 증가
-        request.max_search_results = max(request.max_search_results, 20)
-
-        # 타임아웃 증가
-        self.config.query_analysis_timeout = 10
-        self.config.search_timeout = 30
-        self.config.response_generation_timeout = 15
-
-        return await self._execute_standard_strategy(request, context, metrics)
+        budget = budget or ExecutionBudget.for_request(request, self.config)
+        return await self._execute_standard_strategy(request, context, metrics, budget)
 
     async def _execute_fallback_strategy(
         self,
@@ -360,8 +479,11 @@ class QueryOrchestrator:
             request, context, metrics, "Fallback strategy requested"
         )
 
-    async def _run_with_timeout(self, coroutine, timeout: int):
+    async def _run_with_timeout(self, coroutine, timeout: float):
         """타임아웃과 함께 코루틴 실행"""
+        if timeout <= 0:
+            coroutine.close()
+            raise TimeoutError("Execution budget exhausted")
         try:
             return await asyncio.wait_for(coroutine, timeout=timeout)
         except asyncio.TimeoutError:
@@ -373,62 +495,150 @@ class QueryOrchestrator:
         data = f"{request.query}:{timestamp}:{request.user_id}"
         return hashlib.md5(data.encode()).hexdigest()[:12]
 
-    def _generate_cache_key(self, request: OrchestrationRequest) -> str:
-        """캐시 키 생성"""
-        # query + strategy로 캐시 키 생성
-        data = f"{request.query}:{request.strategy}:{request.max_search_results}"
-        return hashlib.md5(data.encode()).hexdigest()
-
-    def _get_from_cache(
-        self, request: OrchestrationRequest
-    ) -> Optional[OrchestrationResponse]:
-        """캐시에서 조회"""
-        cache_key = self._generate_cache_key(request)
+    async def _build_cache_key(
+        self,
+        request: OrchestrationRequest,
+        context: OrchestrationContext,
+        budget: Optional[ExecutionBudget] = None,
+    ) -> str:
+        """
+        정규화된 캐시 키 생성
 
-        if cache_key in self._cache:
-            entry = self._cache[cache_key]
+        질의 분석 결과(의도/엔티티)를 키에 반영하며, 분석 결과는
+        컨텍스트에 저장되어 Query Analysis 단계에서 재사용됩니다.
+        """
+        analysis = None
+        try:
+            analysis = self.query_analyzer.analyze(request.query)
+            if inspect.isawaitable(analysis):
+                timeout = (
+                    budget.stage_timeout(ExecutionStage.QUERY_ANALYSIS)
+                    if budget is not None
+                    else self.config.query_analysis_timeout
+                )
+                analysis = await self._run_with_timeout(analysis, timeout=timeout)
+            context.query_analysis = analysis
+        except Exception as e:
+            logger.debug(
+                f"[{context.request_id}] Analysis for cache key failed, "
+                f"using normalized text only: {e}"
+            )
+            analysis = None
 
-            # 만료 확인
-            if entry.is_expired(self.config.cache_ttl_seconds):
-                del self._cache[cache_key]
-                self._cache_stats["evictions"] += 1
-                return None
+        return build_cache_key(
+            query=request.query,
+            strategy=request.strategy.value,
+            max_search_results=request.max_search_results,
+            analysis=analysis,
+        )
 
-            # 히트 기록
-            entry.access()
-            logger.debug(f"Cache hit for query: '{request.query}' (hits: {entry.hits})")
+    async def _get_from_cache(
+        self, cache_key: str
+    ) -> Optional[OrchestrationResponse]:
+        """캐시에서 조회 (L1 → L2)"""
+        entry = self._cache.get(cache_key)
+        if entry is not None:
+            logger.debug(f"Cache hit for query: '{entry.query}' (hits: {entry.hits})")
             return entry.response
 
+        if self._shared_cache is not None:
+            response = await self._shared_cache.get(cache_key)
+            if response is not None:
+                self._cache_stats["shared_hits"] += 1
+                self._cache.set(
+                    cache_key,
+                    CacheEntry(key=cache_key, query=response.query, response=response),
+                )
+                return response
+
         return None
 
-    def _save_to_cache(
-        self, request: OrchestrationRequest, response: OrchestrationResponse
+    async def _save_to_cache(
+        self,
+        cache_key: str,
+        request: OrchestrationRequest,
+        response: OrchestrationResponse,
     ):
-        """캐시에 저장"""
-        cache_key = self._generate_cache_key(request)
-
-        # 캐시 크기 제한
-        if len(self._cache) >= self.config.cache_max_size:
-            # LRU: 가장 오래된 항목 제거
-            oldest_key = min(
-                self._cache.keys(),
-                key=lambda k: self._cache[k].last_accessed,
-            )
-            del self._cache[oldest_key]
-            self._cache_stats["evictions"] += 1
-
-        # 캐시 저장
-        self._cache[cache_key] = CacheEntry(
-            key=cache_key,
-            query=request.query,
-            response=response,
+        """캐시에 저장 (L1 + L2)"""
+        self._cache.set(
+            cache_key,
+            CacheEntry(
+                key=cache_key,
+                query=request.query,
+                response=response,
+            ),
         )
 
+        if self._shared_cache is not None:
+            await self._shared_cache.set(cache_key, response)
+
         logger.debug(
             f"Cached response for query: '{request.query}' "
             f"(cache size: {len(self._cache)})"
         )
 
+    async def _get_from_semantic_cache(
+        self, request: OrchestrationRequest, context: OrchestrationContext
+    ) -> Optional[OrchestrationResponse]:
+        """
+        시맨틱 캐시 조회
+
+        같은 의도/엔티티 스코프 안에서 임베딩 유사도가 임계값 이상인
+        기존 응답을 반환합니다. 임베딩 실패 시 캐시 미스로 처리합니다.
+        """
+        if self._semantic_cache is None:
+            return None
+
+        scope = build_semantic_scope(
+            strategy=request.strategy.value,
+            max_search_results=request.max_search_results,
+            analysis=context.query_analysis,
+        )
+        if scope is None:
+            return None
+
+        try:
+            embedding_response = await self.query_embedder.embed_query(
+                EmbeddingRequest(text=request.query, model=settings.QUERY_EMBEDDING_MODEL)
+            )
+        except Exception as e:
+            logger.debug(f"[{context.request_id}] Query embedding for semantic cache failed: {e}")
+            return None
+
+        context.metadata["semantic_scope"] = scope
+        context.metadata["query_embedding"] = embedding_response.embedding
+
+        match = self._semantic_cache.lookup(scope, embedding_response.embedding)
+        if match is None:
+            return None
+
+        response, similarity = match
+        logger.info(
+            f"[{context.request_id}] Semantic cache hit "
+            f"(similarity: {similarity:.3f}, cached query: '{response.query}')"
+        )
+        return response
+
+    def _save_to_semantic_cache(
+        self,
+        cache_key: str,
+        context: OrchestrationContext,
+        response: OrchestrationResponse,
+    ):
+        """시맨틱 캐시에 저장 (조회 시 계산한 임베딩 재사용)"""
+        if self._semantic_cache is None:
+            return
+        embedding = context.metadata.get("query_embedding")
+        scope = context.metadata.get("semantic_scope")
+        if embedding is None or scope is None:
+            return
+        self._semantic_cache.add(cache_key, scope, embedding, response)
+
+    def _as_cache_hit(self, response: OrchestrationResponse) -> OrchestrationResponse:
+        """캐시/병합 응답 복사본 (원본 캐시 엔트리는 변경하지 않음)"""
+        metrics = response.metrics.model_copy(update={"cache_hit": True})
+        return response.model_copy(update={"cache_hit": True, "metrics": metrics})
+
     def _convert_search_results(self, search_response) -> list:
         """검색 결과를 딕셔너리 리스트로 변환"""
         results = []
@@ -443,14 +653,14 @@ class QueryOrchestrator:
 
     async def _create_fallback_analysis(self, query: str):
         """폴백 질의 분석"""
-        from app.models.query import QueryAnalysisResult
+        from app.models.query import QueryAnalysisResult, QueryIntent, QueryType
 
         return QueryAnalysisResult(
-            query=query,
-            intent="general_info",
-            confidence=0.3,
+            original_query=query,
+            intent=QueryIntent.GENERAL_INFO,
+            intent_confidence=0.3,
             entities=[],
-            query_type="general",
+            query_type=QueryType.VECTOR_SEARCH,
             keywords=[],
         )
 
@@ -515,16 +725,143 @@ class QueryOrchestrator:
             "cache_size": len(self._cache),
             "hits": self._cache_stats["hits"],
             "misses": self._cache_stats["misses"],
-            "evictions": self._cache_stats["evictions"],
+            "evictions": self._cache.evictions,
             "hit_rate": hit_rate,
             "total_requests": total_requests,
+            "shared_hits": self._cache_stats["shared_hits"],
+            "semantic_hits": self._cache_stats["semantic_hits"],
+            "semantic_cache_size": (
+                len(self._semantic_cache) if self._semantic_cache is not None else 0
+            ),
+            "coalesced": self._cache_stats["coalesced"],
+            "inflight": self._single_flight.inflight_count,
+            "shared_cache_enabled": self._shared_cache is not None,
         }
 
+    def _record_slo(
+        self, strategy: OrchestrationStrategy, metrics: OrchestrationMetrics
+    ):
+        """전략별 지연 SLO 통계 누적"""
+        stats = self._slo_stats.get(strategy.value)
+        if stats is None:
+            stats = {
+                "count": 0,
+                "violations": 0,
+                "skipped_stages": 0,
+                "latencies_ms": deque(maxlen=1000),
+            }
+            self._slo_stats[strategy.value] = stats
+
+        stats["count"] += 1
+        stats["slo_target_ms"] = metrics.slo_target_ms
+        if metrics.slo_met is False:
+            stats["violations"] += 1
+        if metrics.skipped_stages:
+            stats["skipped_stages"] += 1
+        stats["latencies_ms"].append(metrics.total_duration_ms)
+
+    def get_slo_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        전략별 지연 SLO 통계 조회
+
+        Returns:
+            전략 → {count, violations, attainment, p50_ms, p95_ms, ...}
+        """
+        result = {}
+        for strategy, stats in self._slo_stats.items():
+            latencies = sorted(stats["latencies_ms"])
+            count = stats["count"]
+
+            def percentile(p: float) -> float:
+                if not latencies:
+                    return 0.0
+                index = min(len(latencies) - 1, int(round(p * (len(latencies) - 1))))
+                return latencies[index]
+
+            result[strategy] = {
+                "count": count,
+                "slo_target_ms": stats["slo_target_ms"],
+                "violations": stats["violations"],
+                "attainment": (count - stats["violations"]) / count if count else 1.0,
+                "degraded": stats["skipped_stages"],
+                "p50_ms": percentile(0.50),
+                "p95_ms": percentile(0.95),
+                "max_ms": latencies[-1] if latencies else 0.0,
+            }
+        return result
+
     def clear_cache(self):
-        """캐시 초기화"""
+        """캐시 초기화 (프로세스 로컬)"""
         self._cache.clear()
+        if self._semantic_cache is not None:
+            self._semantic_cache.clear()
         logger.info("Cache cleared")
 
+    async def invalidate_cache(self) -> int:
+        """
+        로컬 + 공유 캐시 전체 무효화
+
+        Returns:
+            공유 캐시에서 삭제된 키 수
+        """
+        self.clear_cache()
+        if self._shared_cache is not None:
+            return await self._shared_cache.clear()
+        return 0
+
+    async def on_graph_updated(
+        self, source_ids: Optional[Iterable[str]] = None
+    ) -> Dict[str, int]:
+        """
+        그래프/문서 갱신 시 캐시 무효화 훅
+
+        source_ids를 주면 그 노드/문서를 근거로 한 로컬/시맨틱 항목만 제거합니다.
+        이는 문서가 빠질 때만 충분합니다: 새로 추가되거나 바뀐 문서는 아직 어떤
+        응답에도 인용되지 않았으므로 source_ids 없이 호출해 전체 무효화해야 합니다.
+        공유 캐시(L2)는 근거 정보를 보관하지 않으므로 항상 전체 무효화합니다.
+
+        Args:
+            source_ids: 제거된 노드/문서 ID (None이면 전체 무효화)
+
+        Returns:
+            캐시 계층별 제거 항목 수
+        """
+        if source_ids is None:
+            removed_local = len(self._cache)
+            self._cache.clear()
+            removed_semantic = (
+                self._semantic_cache.invalidate() if self._semantic_cache is not None else 0
+            )
+        else:
+            changed = {str(i) for i in source_ids}
+            stale: List[str] = [
+                key
+                for key in list(self._cache.keys())
+                if response_source_ids(self._cache[key].response) & changed
+            ]
+            for key in stale:
+                self._cache.pop(key)
+            removed_local = len(stale)
+            removed_semantic = (
+                self._semantic_cache.invalidate(changed)
+                if self._semantic_cache is not None
+                else 0
+            )
+
+        removed_shared = 0
+        if self._shared_cache is not None:
+            removed_shared = await self._shared_cache.clear()
+
+        logger.info(
+            f"Cache invalidated on graph update: local={removed_local}, "
+            f"semantic={removed_semantic}, shared={removed_shared}"
+        )
+        return {
+            "local": removed_local,
+            "semantic": removed_semantic,
+            "shared": removed_shared,
+        }
+
     async def health_check(self) -> Dict[str, Any]:
         """헬스 체크"""
         return {
@@ -535,6 +872,7 @@ class QueryOrchestrator:
                 "response_generator": "ok",
             },
             "cache": self.get_cache_stats(),
+            "slo": self.get_slo_stats(),
             "config": {
                 "cache_enabled": self.config.cache_enabled,
                 "default_timeout": self.config.default_timeout_seconds,
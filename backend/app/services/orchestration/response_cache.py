@@ -0,0 +1,506 @@
+"""
+Response Cache
+
+QueryOrchestrator 응답 캐시.
+
+- LRUTTLCache: O(1) LRU + TTL 인메모리 캐시 (프로세스 로컬, L1)
+- RedisResponseCache: 워커/노드 간 공유 캐시 (선택, L2)
+- SemanticResponseCache: 질문 임베딩 코사인 유사도 기반 캐시 (의역 질문 재사용)
+- SingleFlight: 동일 키 동시 요청을 하나의 파이프라인 실행으로 병합
+- build_cache_key: 공백/구두점 정규화 + QueryAnalyzer 의도/엔티티 기반 키
+"""
+import asyncio
+import hashlib
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from loguru import logger
+
+from app.models.orchestration import CacheEntry, OrchestrationResponse
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# Redis 오류 후 공유 캐시를 건너뛰는 시간 (요청마다 연결 타임아웃을 기다리지 않도록)
+REDIS_RETRY_SECONDS = 30.0
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]", re.UNICODE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """
+    캐시 키용 질문 정규화
+
+    NFKC 정규화, 소문자화, 구두점 제거, 공백 축약.
+    예: "암 진단비는  얼마?" → "암 진단비는 얼마"
+    """
+    text = unicodedata.normalize("NFKC", query).lower()
+    text = _PUNCTUATION_RE.sub(" ", text)
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def _canonical_entities(analysis: Any) -> List[Tuple[str, str, str]]:
+    """(entity_type, 정규화된 표면형, 정규화된 값) 목록"""
+    canonical = []
+    for entity in getattr(analysis, "entities", None) or []:
+        surface = getattr(entity, "text", None)
+        if surface is None:
+            # 테스트/폴백 분석은 문자열 엔티티를 사용
+            surface = str(entity)
+        value = getattr(entity, "normalized_value", None) or surface
+        entity_type = str(getattr(entity, "entity_type", "") or "")
+        canonical.append((entity_type, normalize_query(surface), normalize_query(value)))
+    return canonical
+
+
+def build_semantic_scope(
+    strategy: str,
+    max_search_results: int,
+    analysis: Optional[Any],
+) -> Optional[str]:
+    """
+    시맨틱 캐시 스코프 (같은 의도 + 같은 엔티티 집합끼리만 비교)
+
+    분석 결과가 없으면 None (시맨틱 캐시 사용 안 함).
+    """
+    if analysis is None:
+        return None
+    intent = str(getattr(analysis, "intent", "") or "")
+    entities = ",".join(sorted({f"{t}={v}" for t, _, v in _canonical_entities(analysis)}))
+    return f"{intent}|{entities}|{strategy}|{max_search_results}"
+
+
+def response_source_ids(response: OrchestrationResponse) -> FrozenSet[str]:
+    """응답 근거가 된 노드/문서 ID 집합 (그래프 갱신 시 무효화 대상 판별용)"""
+    ids = set()
+    search_response = response.search_response
+    for result in (search_response.results if search_response else []):
+        ids.add(str(result.node_id))
+        for key in ("document_id", "policy_id", "product_id"):
+            value = result.properties.get(key)
+            if value is not None:
+                ids.add(str(value))
+    return frozenset(ids)
+
+
+def build_cache_key(
+    query: str,
+    strategy: str,
+    max_search_results: int,
+    analysis: Optional[Any] = None,
+) -> str:
+    """
+    정규화된 캐시 키 생성
+
+    분석 결과가 있으면 엔티티 표면형을 정규화 값으로 치환하고
+    의도와 정렬된 엔티티 집합을 키에 포함합니다. 한국어 띄어쓰기 차이
+    ("암진단비" vs "암 진단비")를 흡수하기 위해 공백은 키에서 제거합니다.
+
+    Args:
+        query: 원본 질문
+        strategy: 오케스트레이션 전략
+        max_search_results: 최대 검색 결과 수
+        analysis: QueryAnalysisResult (선택)
+
+    Returns:
+        SHA-256 캐시 키
+    """
+    text = normalize_query(query)
+    intent = ""
+    entities = ""
+
+    if analysis is not None:
+        intent = str(getattr(analysis, "intent", "") or "")
+        canonical = set()
+        for entity_type, surface, value in _canonical_entities(analysis):
+            if surface:
+                text = text.replace(surface, value)
+            canonical.add(f"{entity_type}={value}")
+        entities = ",".join(sorted(canonical))
+
+    compact = text.replace(" ", "")
+    data = f"{compact}|{intent}|{entities}|{strategy}|{max_search_results}"
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+class LRUTTLCache:
+    """
+    O(1) LRU 캐시 (TTL 지원)
+
+    OrderedDict 순서를 접근 순서로 사용합니다. 조회 시 move_to_end,
+    용량 초과 시 popitem(last=False)로 가장 오래 사용되지 않은 항목을 제거합니다.
+    """
+
+    def __init__(self, max_size: int = 1000, ttl_seconds: int = 3600):
+        """
+        Args:
+            max_size: 최대 항목 수
+            ttl_seconds: 항목 TTL (초)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.evictions = 0
+        self._data: "OrderedDict[str, CacheEntry]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """조회 (만료 항목은 제거)"""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        if entry.is_expired(self.ttl_seconds):
+            del self._data[key]
+            self.evictions += 1
+            return None
+
+        self._data.move_to_end(key)
+        entry.access()
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """저장 (용량 초과 시 LRU 제거)"""
+        if key in self._data:
+            self._data.move_to_end(key)
+        self._data[key] = entry
+
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: str) -> Optional[CacheEntry]:
+        return self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def keys(self):
+        return self._data.keys()
+
+    def values(self):
+        return self._data.values()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._data
+
+    def __getitem__(self, key: str) -> CacheEntry:
+        return self._data[key]
+
+    def __setitem__(self, key: str, entry: CacheEntry) -> None:
+        self.set(key, entry)
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+
+class RedisResponseCache:
+    """
+    Redis 공유 응답 캐시 (L2)
+
+    여러 uvicorn 워커/노드가 같은 응답을 공유합니다.
+    Redis 장애 시 경고만 남기고 캐시 미스로 처리하며,
+    REDIS_RETRY_SECONDS 동안은 Redis에 접속하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        ttl_seconds: int = 3600,
+        prefix: str = "orch:resp:",
+    ):
+        """
+        Args:
+            redis_url: Redis 연결 URL (None이면 settings.redis_url)
+            ttl_seconds: 항목 TTL (초)
+            prefix: 키 접두사
+        """
+        self.redis_url = redis_url
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+        self._client = None
+        self._down_until = 0.0
+
+    def _available(self) -> bool:
+        return time.monotonic() >= self._down_until
+
+    def _mark_down(self, operation: str, error: Exception) -> None:
+        self._down_until = time.monotonic() + REDIS_RETRY_SECONDS
+        logger.warning(f"Shared response cache {operation} failed: {error}")
+
+    async def _get_client(self):
+        if self._client is None:
+            import redis.asyncio as redis
+            from app.core.config import settings
+
+            self._client = redis.from_url(
+                self.redis_url or settings.redis_url,
+                decode_responses=True,
+            )
+        return self._client
+
+    async def get(self, key: str) -> Optional[OrchestrationResponse]:
+        if not self._available():
+            return None
+        try:
+            client = await self._get_client()
+            payload = await client.get(self.prefix + key)
+            if payload is None:
+                return None
+            return OrchestrationResponse.model_validate_json(payload)
+        except Exception as e:
+            self._mark_down("get", e)
+            return None
+
+    async def set(self, key: str, response: OrchestrationResponse) -> None:
+        if not self._available():
+            return
+        try:
+            client = await self._get_client()
+            await client.setex(self.prefix + key, self.ttl_seconds, response.model_dump_json())
+        except Exception as e:
+            self._mark_down("set", e)
+
+    async def clear(self) -> int:
+        """접두사 아래 모든 키 삭제"""
+        deleted = 0
+        try:
+            client = await self._get_client()
+            async for key in client.scan_iter(match=self.prefix + "*", count=500):
+                deleted += await client.delete(key)
+        except Exception as e:
+            logger.warning(f"Shared response cache clear failed: {e}")
+        return deleted
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+
+@dataclass
+class _SemanticEntry:
+    key: str
+    scope: str
+    vector: Any
+    response: OrchestrationResponse
+    source_ids: FrozenSet[str]
+    created_at: float
+
+
+class SemanticResponseCache:
+    """
+    시맨틱 응답 캐시
+
+    질문 임베딩을 응답과 함께 저장하고, 같은 스코프(의도 + 엔티티 집합) 안에서
+    코사인 유사도가 임계값 이상인 가장 가까운 질문의 응답을 재사용합니다.
+    예: "암 진단금 얼마야" ≈ "암 진단비가 얼마인가요"
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.92,
+        max_size: int = 1000,
+        ttl_seconds: int = 3600,
+    ):
+        """
+        Args:
+            similarity_threshold: 최소 코사인 유사도
+            max_size: 최대 항목 수 (LRU)
+            ttl_seconds: 항목 TTL (초)
+        """
+        self.similarity_threshold = similarity_threshold
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.evictions = 0
+        self._entries: "OrderedDict[str, _SemanticEntry]" = OrderedDict()
+        # scope -> (keys, matrix); matrix는 변경 시 무효화 후 지연 재생성
+        self._scopes: Dict[str, List[str]] = {}
+        self._matrices: Dict[str, Any] = {}
+
+    @staticmethod
+    def _normalize(embedding: List[float]):
+        if NUMPY_AVAILABLE:
+            vector = np.asarray(embedding, dtype=np.float32)
+            norm = float(np.linalg.norm(vector))
+            return vector / norm if norm else vector
+        norm = sum(x * x for x in embedding) ** 0.5
+        return [x / norm for x in embedding] if norm else list(embedding)
+
+    def _similarities(self, scope: str, vector) -> List[float]:
+        keys = self._scopes[scope]
+        if NUMPY_AVAILABLE:
+            matrix = self._matrices.get(scope)
+            if matrix is None:
+                matrix = np.vstack([self._entries[k].vector for k in keys])
+                self._matrices[scope] = matrix
+            if matrix.shape[1] != vector.shape[0]:
+                return [0.0] * len(keys)
+            return (matrix @ vector).tolist()
+        return [
+            sum(a * b for a, b in zip(self._entries[k].vector, vector))
+            for k in keys
+        ]
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        keys = self._scopes.get(entry.scope)
+        if keys is not None:
+            keys.remove(key)
+            if not keys:
+                del self._scopes[entry.scope]
+        self._matrices.pop(entry.scope, None)
+
+    def lookup(
+        self, scope: str, embedding: List[float]
+    ) -> Optional[Tuple[OrchestrationResponse, float]]:
+        """
+        가장 유사한 캐시 응답 조회
+
+        Returns:
+            (응답, 유사도) 또는 None
+        """
+        if scope not in self._scopes:
+            return None
+
+        vector = self._normalize(embedding)
+        similarities = self._similarities(scope, vector)
+        keys = list(self._scopes[scope])
+        ranked = sorted(zip(similarities, keys), reverse=True)
+
+        now = time.monotonic()
+        for similarity, key in ranked:
+            if similarity < self.similarity_threshold:
+                break
+            entry = self._entries[key]
+            if now - entry.created_at > self.ttl_seconds:
+                self._remove(key)
+                self.evictions += 1
+                continue
+            self._entries.move_to_end(key)
+            return entry.response, similarity
+
+        return None
+
+    def add(
+        self,
+        key: str,
+        scope: str,
+        embedding: List[float],
+        response: OrchestrationResponse,
+    ) -> None:
+        """응답 저장 (같은 키는 교체)"""
+        self._remove(key)
+        self._entries[key] = _SemanticEntry(
+            key=key,
+            scope=scope,
+            vector=self._normalize(embedding),
+            response=response,
+            source_ids=response_source_ids(response),
+            created_at=time.monotonic(),
+        )
+        self._scopes.setdefault(scope, []).append(key)
+        self._matrices.pop(scope, None)
+
+        while len(self._entries) > self.max_size:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def invalidate(self, source_ids: Optional[Iterable[str]] = None) -> int:
+        """
+        그래프 갱신 시 무효화
+
+        Args:
+            source_ids: 변경된 노드/문서 ID (None이면 전체)
+
+        Returns:
+            제거된 항목 수
+        """
+        if source_ids is None:
+            removed = len(self._entries)
+            self.clear()
+            return removed
+
+        changed = {str(i) for i in source_ids}
+        stale = [k for k, e in self._entries.items() if e.source_ids & changed]
+        for key in stale:
+            self._remove(key)
+        return len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._scopes.clear()
+        self._matrices.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SingleFlight:
+    """
+    동일 키 동시 실행 병합
+
+    같은 키로 진행 중인 실행이 있으면 새로 실행하지 않고 그 결과를 기다립니다.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    @property
+    def inflight_count(self) -> int:
+        return len(self._inflight)
+
+    async def do(
+        self, key: str, fn: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, bool]:
+        """
+        Args:
+            key: 병합 키
+            fn: 실제 실행 함수 (코루틴 팩토리)
+
+        Returns:
+            (결과, 다른 요청의 결과를 공유했는지 여부)
+        """
+        task = self._inflight.get(key)
+        shared = task is not None
+        if task is None:
+            # 실행은 별도 태스크: 선행 요청이 취소되어도(클라이언트 연결 끊김)
+            # 실행은 계속되고 대기자는 결과를 받음
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task), shared
+
+    def _forget(self, key: str, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # 대기자가 모두 취소된 경우 "exception was never retrieved" 경고 방지
+            task.exception()
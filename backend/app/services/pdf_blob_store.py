@@ -0,0 +1,352 @@
+"""
+PDF Blob Store
+
+PDF 다운로드 공용 서브시스템 (content-addressed 로컬 저장소).
+
+- 커넥션 풀을 공유하는 HTTP 클라이언트 (async / sync)
+- 스트리밍 다운로드 + 다운로드 중 SHA-256 계산 (본문 전체를 메모리에 올리지 않음)
+- ETag / Last-Modified 조건부 요청 (변경 없으면 304, 본문 전송 없음)
+- 추출기에는 읽기 전용 mmap 전달
+
+저장 구조:
+    {root}/blobs/ab/abcdef....pdf   # SHA-256 기준 (같은 내용은 한 번만 저장)
+    {root}/refs/<sha256(url)>.json  # URL → blob 해시, ETag, Last-Modified
+"""
+import asyncio
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+import httpx
+from loguru import logger
+
+from app.core.config import settings
+
+
+@dataclass
+class BlobRef:
+    """다운로드된 PDF blob 참조"""
+
+    url: str
+    sha256: str
+    path: Path
+    size: int
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: float = 0.0
+    from_cache: bool = False  # 304 또는 재검증 생략으로 네트워크 본문 전송 없음
+
+    @contextmanager
+    def open_mmap(self) -> Iterator[mmap.mmap]:
+        """
+        읽기 전용 mmap (pdfplumber/PyPDF2에 파일 객체로 전달 가능)
+
+        페이지 캐시를 공유하므로 여러 추출기가 같은 파일을 열어도 RAM 사본이 생기지 않습니다.
+        """
+        if self.size == 0:
+            raise ValueError(f"Empty blob: {self.url}")
+        with open(self.path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                yield mapped
+            finally:
+                mapped.close()
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data["path"] = str(self.path)
+        data.pop("from_cache")
+        return data
+
+
+class _BlobWriter:
+    """임시 파일에 스트리밍 기록하면서 SHA-256 계산"""
+
+    def __init__(self, tmp_dir: Path):
+        self._hasher = hashlib.sha256()
+        self._fd, self.tmp_path = tempfile.mkstemp(dir=tmp_dir, suffix=".part")
+        self._file = os.fdopen(self._fd, "wb")
+        self.size = 0
+
+    def write(self, chunk: bytes) -> None:
+        self._hasher.update(chunk)
+        self._file.write(chunk)
+        self.size += len(chunk)
+
+    def finish(self) -> str:
+        self._file.close()
+        return self._hasher.hexdigest()
+
+    def discard(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+        if os.path.exists(self.tmp_path):
+            os.unlink(self.tmp_path)
+
+
+class PDFBlobStore:
+    """
+    Content-addressed PDF 다운로드 저장소
+
+    동일 URL 재처리 시 조건부 요청으로 변경 여부만 확인하고,
+    다른 URL이라도 내용이 같으면 같은 blob을 공유합니다.
+    """
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        chunk_size: int = 1024 * 1024,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Args:
+            root: 저장소 경로 (기본값: settings.PDF_BLOB_CACHE_DIR)
+            chunk_size: 스트리밍 청크 크기 (기본 1MB)
+            timeout: HTTP 타임아웃 (기본값: settings.PDF_DOWNLOAD_TIMEOUT)
+        """
+        self.root = Path(root or settings.PDF_BLOB_CACHE_DIR)
+        self.chunk_size = chunk_size
+        self.timeout = timeout or settings.PDF_DOWNLOAD_TIMEOUT
+
+        self.blob_dir = self.root / "blobs"
+        self.ref_dir = self.root / "refs"
+        self.tmp_dir = self.root / "tmp"
+        for directory in (self.blob_dir, self.ref_dir, self.tmp_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_client_loop = None
+        self._sync_client: Optional[httpx.Client] = None
+
+        self.stats = {"downloads": 0, "not_modified": 0, "reused": 0, "bytes_downloaded": 0}
+
+    # ------------------------------------------------------------------
+    # HTTP clients (pooled)
+    # ------------------------------------------------------------------
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """공유 AsyncClient (이벤트 루프별로 하나)"""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            # asyncio.run()을 반복 호출하는 워커는 루프가 바뀌므로 새로 생성
+            self._async_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+            self._async_client_loop = loop
+        return self._async_client
+
+    @property
+    def sync_client(self) -> httpx.Client:
+        """공유 sync Client (Celery 태스크용)"""
+        if self._sync_client is None:
+            self._sync_client = httpx.Client(
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            )
+        return self._sync_client
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        if self._sync_client is not None:
+            self._sync_client.close()
+            self._sync_client = None
+
+    # ------------------------------------------------------------------
+    # Refs
+    # ------------------------------------------------------------------
+
+    def blob_path(self, sha256: str) -> Path:
+        return self.blob_dir / sha256[:2] / f"{sha256}.pdf"
+
+    def _ref_path(self, url: str) -> Path:
+        return self.ref_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def lookup(self, url: str) -> Optional[BlobRef]:
+        """URL의 캐시된 blob 조회 (blob 파일이 없으면 None)"""
+        ref_path = self._ref_path(url)
+        if not ref_path.exists():
+            return None
+        try:
+            data = json.loads(ref_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        ref = BlobRef(**{**data, "path": Path(data["path"])})
+        if not ref.path.exists():
+            return None
+        return ref
+
+    def _save_ref(self, ref: BlobRef) -> None:
+        ref_path = self._ref_path(ref.url)
+        fd, tmp = tempfile.mkstemp(dir=self.tmp_dir, suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(ref.to_dict(), f)
+        os.replace(tmp, ref_path)
+
+    @staticmethod
+    def _conditional_headers(ref: Optional[BlobRef]) -> Dict[str, str]:
+        headers = {}
+        if ref is not None:
+            if ref.etag:
+                headers["If-None-Match"] = ref.etag
+            if ref.last_modified:
+                headers["If-Modified-Since"] = ref.last_modified
+        return headers
+
+    def _not_modified(self, ref: BlobRef) -> BlobRef:
+        self.stats["not_modified"] += 1
+        ref.fetched_at = time.time()
+        ref.from_cache = True
+        self._save_ref(ref)
+        # 최근 사용 시각 갱신 (prune 기준)
+        os.utime(ref.path)
+        return ref
+
+    def _commit(self, url: str, writer: _BlobWriter, headers: httpx.Headers) -> BlobRef:
+        """임시 파일을 content-addressed 경로로 이동하고 ref 저장"""
+        sha256 = writer.finish()
+        path = self.blob_path(sha256)
+        if path.exists():
+            # 다른 URL에서 이미 받은 동일 내용
+            writer.discard()
+            os.utime(path)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(writer.tmp_path, path)
+
+        self.stats["downloads"] += 1
+        self.stats["bytes_downloaded"] += writer.size
+
+        ref = BlobRef(
+            url=url,
+            sha256=sha256,
+            path=path,
+            size=writer.size,
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+            fetched_at=time.time(),
+        )
+        self._save_ref(ref)
+        logger.info(f"Downloaded PDF blob {sha256[:12]} ({writer.size:,} bytes) from {url[:80]}")
+        return ref
+
+    # ------------------------------------------------------------------
+    # Fetch
+    # ------------------------------------------------------------------
+
+    async def fetch(self, url: str, revalidate: bool = True) -> BlobRef:
+        """
+        PDF를 저장소로 가져오기 (async)
+
+        Args:
+            url: PDF URL
+            revalidate: False이면 캐시된 blob이 있을 때 네트워크 요청 생략
+
+        Returns:
+            BlobRef
+        """
+        cached = self.lookup(url)
+        if cached is not None and not revalidate:
+            self.stats["reused"] += 1
+            cached.from_cache = True
+            return cached
+
+        async with self.client.stream(
+            "GET", url, headers=self._conditional_headers(cached)
+        ) as response:
+            if response.status_code == 304 and cached is not None:
+                return self._not_modified(cached)
+            response.raise_for_status()
+
+            writer = _BlobWriter(self.tmp_dir)
+            try:
+                async for chunk in response.aiter_bytes(chunk_size=self.chunk_size):
+                    writer.write(chunk)
+            except BaseException:
+                writer.discard()
+                raise
+            return self._commit(url, writer, response.headers)
+
+    def fetch_sync(self, url: str, revalidate: bool = True) -> BlobRef:
+        """PDF를 저장소로 가져오기 (sync, Celery 태스크용)"""
+        cached = self.lookup(url)
+        if cached is not None and not revalidate:
+            self.stats["reused"] += 1
+            cached.from_cache = True
+            return cached
+
+        with self.sync_client.stream(
+            "GET", url, headers=self._conditional_headers(cached)
+        ) as response:
+            if response.status_code == 304 and cached is not None:
+                return self._not_modified(cached)
+            response.raise_for_status()
+
+            writer = _BlobWriter(self.tmp_dir)
+            try:
+                for chunk in response.iter_bytes(chunk_size=self.chunk_size):
+                    writer.write(chunk)
+            except BaseException:
+                writer.discard()
+                raise
+            return self._commit(url, writer, response.headers)
+
+    async def get_size(self, url: str) -> int:
+        """파일 크기 (캐시된 blob이 있으면 네트워크 없이 반환, 없으면 HEAD)"""
+        cached = self.lookup(url)
+        if cached is not None:
+            return cached.size
+        response = await self.client.head(url)
+        return int(response.headers.get("content-length", 0))
+
+    def prune(self, max_age_days: Optional[int] = None) -> Dict[str, float]:
+        """
+        오래 사용되지 않은 blob/ref 정리
+
+        Args:
+            max_age_days: 마지막 사용 후 경과 일수 (기본값: settings.PDF_BLOB_CACHE_MAX_AGE_DAYS)
+        """
+        max_age_days = max_age_days or settings.PDF_BLOB_CACHE_MAX_AGE_DAYS
+        cutoff = time.time() - max_age_days * 86400
+        deleted = 0
+        freed = 0
+
+        for path in self.blob_dir.glob("*/*.pdf"):
+            stat = path.stat()
+            if stat.st_mtime < cutoff:
+                freed += stat.st_size
+                path.unlink()
+                deleted += 1
+
+        for ref_path in self.ref_dir.glob("*.json"):
+            try:
+                data = json.loads(ref_path.read_text(encoding="utf-8"))
+                if not Path(data["path"]).exists():
+                    ref_path.unlink()
+            except (OSError, ValueError, KeyError):
+                ref_path.unlink(missing_ok=True)
+
+        return {"deleted_count": deleted, "freed_mb": freed / 1024 / 1024}
+
+
+_pdf_blob_store: Optional[PDFBlobStore] = None
+
+
+def get_pdf_blob_store() -> PDFBlobStore:
+    """PDFBlobStore 싱글톤"""
+    global _pdf_blob_store
+    if _pdf_blob_store is None:
+        _pdf_blob_store = PDFBlobStore()
+    return _pdf_blob_store
@@ -3,6 +3,9 @@ PDF Processing Service
 
 pdfplumber를 사용하여 PDF 문서에서 텍스트를 추출하고,
 Claude API를 사용하여 엔티티를 추출합니다.
+
+조항별 Claude 응답은 LLM 결과 캐시에 저장하고, 문서 처리 시 전체 조항을 한 번에
+미리 조회해서 캐시에 없는 조항만 호출합니다.
 """
 import re
 import json
@@ -10,11 +13,18 @@ from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from dataclasses import dataclass
 
-import pdfplumber
-from anthropic import Anthropic
 from loguru import logger
 
-from app.core.config import settings
+from app.services.llm_gateway import LLMGateway, LLMRequest, get_llm_gateway
+from app.services.llm_result_cache import (
+    LLMResultCache,
+    get_llm_result_cache,
+    make_cache_key,
+)
+
+
+# 프롬프트가 바뀌면 버전을 올려 캐시를 무효화
+ENTITY_EXTRACTION_TEMPLATE = "pdf_article_entities@1"
 
 
 @dataclass
@@ -51,10 +61,60 @@ class PDFProcessingResult:
 class PDFProcessor:
     """PDF 처리 서비스"""
 
-    def __init__(self):
-        """Initialize PDF processor with Claude client"""
-        self.client = Anthropic(api_key=settings.ANTHROPIC_API_KEY)
+    def __init__(
+        self,
+        gateway: Optional[LLMGateway] = None,
+        cache: Optional[LLMResultCache] = None,
+    ):
+        """
+        Args:
+            gateway: LLM 게이트웨이 (기본값: get_llm_gateway())
+            cache: LLM 결과 캐시 (기본값: get_llm_result_cache())
+        """
+        self._gateway = gateway
+        self._cache = cache
         self.model = "claude-3-5-sonnet-20241022"
+        # process_pdf에서 미리 조회한 응답 (캐시 키 → 응답 텍스트)
+        self._prefetched: Dict[str, str] = {}
+
+    # 모듈 싱글톤이 import 시점에 게이트웨이/캐시를 만들지 않도록 처음 사용할 때 가져옴
+    @property
+    def gateway(self) -> LLMGateway:
+        if self._gateway is None:
+            self._gateway = get_llm_gateway()
+        return self._gateway
+
+    @property
+    def cache(self) -> Optional[LLMResultCache]:
+        if self._cache is None:
+            self._cache = get_llm_result_cache()
+        return self._cache
+
+    def _cache_key(self, article: Article) -> str:
+        """
+        조항 캐시 키
+
+        조항 번호/페이지는 제외 (응답 파싱 시 다시 붙임) → 같은 조항이 다른 번호나
+        다른 문서로 다시 들어와도 재사용
+        """
+        return make_cache_key(
+            ENTITY_EXTRACTION_TEMPLATE, self.model, article.title, article.content[:4000]
+        )
+
+    async def prefetch(self, articles: List[Article]) -> int:
+        """
+        문서의 전체 조항 캐시 일괄 조회
+
+        Returns:
+            캐시에 있던 조항 수
+        """
+        if self.cache is None or not articles:
+            return 0
+        found = await self.cache.get_many(self._cache_key(article) for article in articles)
+        self._prefetched.update(
+            {key: value["text"] for key, value in found.items() if "text" in value}
+        )
+        return len(found)
 
     async def process_pdf(self, pdf_path: str) -> PDFProcessingResult:
         """
@@ -76,7 +136,10 @@ class PDFProcessor:
         articles = await self.parse_articles(raw_text)
         logger.info(f"Parsed {len(articles)} articles")
 
-        # 3. Claude API로 엔티티 추출 (각 조항마다)
+        # 3. Claude API로 엔티티 추출 (각 조항마다, 캐시된 조항은 호출 없이)
+        cached_count = await self.prefetch(articles)
+        if cached_count:
+            logger.info(f"{cached_count}/{len(articles)} articles found in LLM result cache")
         all_entities = []
         for article in articles:
             entities = await self.extract_entities_from_article(article)
@@ -109,6 +172,8 @@ class PDFProcessor:
         full_text = []
         total_pages = 0
 
+        import pdfplumber
+
         try:
             with pdfplumber.open(pdf_path) as pdf:
                 total_pages = len(pdf.pages)
@@ -212,25 +277,41 @@ class PDFProcessor:
             List[ExtractedEntity]: 추출된 엔티티 목록
         """
         try:
-            # Claude API 프롬프트
-            prompt = self._build_entity_extraction_prompt(article)
-
-            # Claude API 호출
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=4096,
-                temperature=0.0,  # 일관성을 위해 0으로 설정
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            )
-
-            # 응답 파싱
-            response_text = message.content[0].text
-            entities = self._parse_entity_response(response_text, article.article_num)
+            cache_key = self._cache_key(article)
+            response_text = self._prefetched.pop(cache_key, None)
+            if response_text is None and self.cache is not None:
+                cached = await self.cache.get(cache_key)
+                response_text = cached.get("text") if cached else None
+
+            if response_text is None:
+                # Claude API 프롬프트
+                prompt = self._build_entity_extraction_prompt(article)
+
+                # Claude API 호출
+                response = await self.gateway.complete(
+                    LLMRequest(
+                        provider="anthropic",
+                        model=self.model,
+                        max_tokens=4096,
+                        temperature=0.0,  # 일관성을 위해 0으로 설정
+                        messages=[
+                            {
+                                "role": "user",
+                                "content": prompt
+                            }
+                        ]
+                    )
+                )
+                response_text = response.text
+                entities = self._parse_entity_response(response_text, article.article_num)
+
+                # 파싱에 실패한 응답은 저장하지 않음 (다음 처리 때 다시 호출)
+                if entities and self.cache is not None:
+                    await self.cache.set(
+                        cache_key, {"text": response_text}, ENTITY_EXTRACTION_TEMPLATE, self.model
+                    )
+            else:
+                entities = self._parse_entity_response(response_text, article.article_num)
 
             logger.debug(f"Extracted {len(entities)} entities from {article.article_num}")
             return entities
@@ -5,9 +5,15 @@ PyMuPDF를 사용하여 PDF 파일에서 텍스트를 추출하는 서비스
 """
 from typing import List, Dict, Optional
 from pathlib import Path
-import fitz  # PyMuPDF
 from loguru import logger
 
+from app.services.extraction_artifact_cache import (
+    ExtractionArtifactCache,
+    compute_page_offsets,
+    get_extraction_cache,
+    sha256_file,
+)
+
 
 class PDFPage:
     """단일 PDF 페이지 정보"""
@@ -64,13 +70,35 @@ class PDFExtractionResult:
             "metadata": self.metadata,
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PDFExtractionResult":
+        """딕셔너리에서 복원 (full_text가 없으면 페이지 텍스트로 재구성)"""
+        pages = [PDFPage(**page) for page in data["pages"]]
+        full_text = data.get("full_text")
+        if full_text is None:
+            full_text = "\n\n".join(page.text for page in pages)
+        return cls(
+            total_pages=data["total_pages"],
+            total_chars=data["total_chars"],
+            pages=pages,
+            full_text=full_text,
+            metadata=data.get("metadata", {}),
+        )
+
 
 class PDFTextExtractor:
     """PyMuPDF를 사용한 PDF 텍스트 추출기"""
 
-    def __init__(self):
-        """Initialize extractor"""
-        pass
+    # 추출 로직 변경 시 올려서 캐시 무효화
+    EXTRACTOR_NAME = "pymupdf"
+    EXTRACTOR_VERSION = "1"
+
+    def __init__(self, cache: Optional[ExtractionArtifactCache] = None):
+        """
+        Args:
+            cache: 추출 결과 캐시 (None이면 캐시 사용 안 함)
+        """
+        self.cache = cache
 
     def extract_text_from_file(
         self,
@@ -92,8 +120,20 @@ class PDFTextExtractor:
         if not pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
+        content_sha256 = None
+        cache_options = {"max_pages": max_pages}
+        if self.cache is not None:
+            content_sha256 = sha256_file(str(pdf_path))
+            artifact = self.cache.get(
+                content_sha256, self.EXTRACTOR_NAME, self.EXTRACTOR_VERSION, cache_options
+            )
+            if artifact is not None:
+                return PDFExtractionResult.from_dict(artifact)
+
         logger.info(f"Extracting text from PDF: {pdf_path.name}")
 
+        import fitz  # PyMuPDF
+
         try:
             doc = fitz.open(pdf_path)
 
@@ -156,6 +196,19 @@ class PDFTextExtractor:
                 f"Extracted {total_chars} characters from {pages_to_process}/{total_pages} pages"
             )
 
+            if self.cache is not None:
+                artifact = result.to_dict()
+                # full_text는 페이지 텍스트로 재구성 가능하므로 저장하지 않음
+                artifact.pop("full_text")
+                artifact["page_offsets"] = compute_page_offsets(full_text_parts, "\n\n")
+                self.cache.put(
+                    content_sha256,
+                    self.EXTRACTOR_NAME,
+                    self.EXTRACTOR_VERSION,
+                    artifact,
+                    cache_options,
+                )
+
             return result
 
         except Exception as e:
@@ -170,5 +223,5 @@ def get_pdf_extractor():
     """PDF 추출기 싱글톤 인스턴스 가져오기"""
     global _pdf_extractor
     if _pdf_extractor is None:
-        _pdf_extractor = PDFTextExtractor()
+        _pdf_extractor = PDFTextExtractor(cache=get_extraction_cache())
     return _pdf_extractor
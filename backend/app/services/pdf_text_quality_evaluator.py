@@ -4,13 +4,19 @@ PDF Text Extraction Quality Evaluator
 여러 PDF 텍스트 추출 라이브러리를 시도하고 품질을 평가하여 최적의 결과를 선택합니다.
 """
 import re
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 from loguru import logger
 
+from app.services.extraction_artifact_cache import get_extraction_cache
+
 
 class PDFTextQualityEvaluator:
     """PDF 텍스트 추출 품질 평가기"""
 
+    # 알고리즘 목록/품질 평가 변경 시 올려서 캐시 무효화
+    EXTRACTOR_NAME = "best_quality"
+    EXTRACTOR_VERSION = "1"
+
     @staticmethod
     def calculate_quality_score(text: str, total_pages: int) -> Dict[str, any]:
         """
@@ -194,10 +200,14 @@ class PDFTextQualityEvaluator:
             return "", 0
 
     @classmethod
-    def extract_best_quality(cls, pdf_path: str) -> Dict[str, any]:
+    def extract_best_quality(
+        cls, pdf_path: str, content_sha256: Optional[str] = None
+    ) -> Dict[str, any]:
         """
         여러 알고리즘을 시도하고 가장 품질이 좋은 결과를 반환합니다.
 
+        content_sha256이 주어지면 추출 결과 캐시를 먼저 조회하고, 성공 결과를 저장합니다.
+
         Returns:
             Dict with:
                 - text: 추출된 텍스트
@@ -206,6 +216,13 @@ class PDFTextQualityEvaluator:
                 - quality: 품질 평가 결과
                 - all_attempts: 모든 시도 결과 (디버깅용)
         """
+        cache = get_extraction_cache() if content_sha256 else None
+        if cache is not None:
+            cached = cache.get(content_sha256, cls.EXTRACTOR_NAME, cls.EXTRACTOR_VERSION)
+            if cached is not None:
+                cached["cached"] = True
+                return cached
+
         algorithms = [
             ("PyPDF2", cls.extract_with_pypdf2),
             ("pdfplumber", cls.extract_with_pdfplumber),
@@ -263,6 +280,8 @@ class PDFTextQualityEvaluator:
         if best_result:
             best_result["all_attempts"] = all_attempts
             logger.info(f"Best algorithm: {best_result['algorithm']} with score {best_result['quality']['score']}")
+            if cache is not None:
+                cache.put(content_sha256, cls.EXTRACTOR_NAME, cls.EXTRACTOR_VERSION, best_result)
             return best_result
         else:
             logger.error("All extraction algorithms failed")
@@ -5,17 +5,19 @@ Playwright를 사용한 실제 웹 크롤링 서비스
 """
 import os
 import asyncio
-from typing import Dict, Optional, Tuple
+import importlib.util
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
 from loguru import logger
 
-try:
-    from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeout
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Page
+
+# 설치 여부만 확인 (playwright는 브라우저를 띄우는 시점에 import)
+PLAYWRIGHT_AVAILABLE = importlib.util.find_spec("playwright") is not None
+if not PLAYWRIGHT_AVAILABLE:
     logger.warning("Playwright is not installed. Test crawling will be limited.")
 
 
@@ -50,8 +52,8 @@ class PlaywrightCrawler:
             "Chrome/120.0.0.0 Safari/537.36"
         )
 
-        self.browser: Optional[Browser] = None
-        self.page: Optional[Page] = None
+        self.browser: Optional["Browser"] = None
+        self.page: Optional["Page"] = None
 
     async def __aenter__(self):
         """컨텍스트 매니저 진입"""
@@ -64,6 +66,8 @@ class PlaywrightCrawler:
 
     async def initialize(self):
         """브라우저 초기화"""
+        from playwright.async_api import async_playwright
+
         logger.info("Initializing Playwright browser...")
 
         self.playwright = await async_playwright().start()
@@ -121,6 +125,8 @@ class PlaywrightCrawler:
         if not self.page:
             raise RuntimeError("Browser not initialized. Call initialize() first.")
 
+        from playwright.async_api import TimeoutError as PlaywrightTimeout
+
         logger.info(f"Crawling: {url}")
 
         # Set custom headers if provided
@@ -9,6 +9,7 @@ from loguru import logger
 
 from app.models.query import EntityType, ExtractedEntity
 from app.services.knowledge.disease_kb import DiseaseKnowledgeBase
+from app.services.llm_gateway import DEFAULT_CHAT_CLIENT, resolve_chat_client
 
 
 class EntityExtractor:
@@ -407,20 +408,21 @@ class LLMEntityExtractor(EntityExtractor):
 
     def __init__(
         self,
-        llm_client=None,
+        llm_client=DEFAULT_CHAT_CLIENT,
         disease_kb: Optional[DiseaseKnowledgeBase] = None,
         min_confidence: float = 0.5,
         use_llm_fallback: bool = True,
     ):
         """
         Args:
-            llm_client: LLM 클라이언트
+            llm_client: chat_completion()을 제공하는 LLM 클라이언트
+                (기본값: LLM 게이트웨이 GatewayChatClient, None이면 LLM 사용 안 함)
             disease_kb: 질병 지식 베이스
             min_confidence: 최소 신뢰도
             use_llm_fallback: LLM 폴백 사용 여부
         """
         super().__init__(disease_kb, min_confidence)
-        self.llm_client = llm_client
+        self.llm_client = resolve_chat_client(llm_client)
         self.use_llm_fallback = use_llm_fallback
 
     async def extract_with_llm(self, query: str) -> List[ExtractedEntity]:
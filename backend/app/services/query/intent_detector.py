@@ -12,6 +12,7 @@ from app.models.query import (
     IntentPattern,
     INTENT_PATTERNS,
 )
+from app.services.llm_gateway import DEFAULT_CHAT_CLIENT, resolve_chat_client
 
 
 class IntentDetector:
@@ -228,20 +229,21 @@ class LLMIntentDetector(IntentDetector):
 
     def __init__(
         self,
-        llm_client=None,
+        llm_client=DEFAULT_CHAT_CLIENT,
         patterns: Optional[List[IntentPattern]] = None,
         min_confidence_threshold: float = 0.3,
         use_llm_for_complex: bool = True,
     ):
         """
         Args:
-            llm_client: LLM 클라이언트 (OpenAI, Upstage 등)
+            llm_client: chat_completion()을 제공하는 LLM 클라이언트
+                (기본값: LLM 게이트웨이 GatewayChatClient, None이면 LLM 사용 안 함)
             patterns: 사용할 의도 패턴 목록
             min_confidence_threshold: 최소 신뢰도 임계값
             use_llm_for_complex: 복잡한 질문에 LLM 사용 여부
         """
         super().__init__(patterns, min_confidence_threshold)
-        self.llm_client = llm_client
+        self.llm_client = resolve_chat_client(llm_client)
         self.use_llm_for_complex = use_llm_for_complex
 
     async def detect_with_llm(self, query: str) -> Tuple[QueryIntent, float]:
@@ -9,7 +9,6 @@ import json
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 from loguru import logger
-import pdfplumber
 
 
 class SmartInsuranceChunker:
@@ -84,6 +83,8 @@ class SmartInsuranceChunker:
                 - page: 페이지 번호
                 - metadata: 추가 정보
         """
+        import pdfplumber
+
         elements = []
 
         with pdfplumber.open(pdf_path) as pdf:
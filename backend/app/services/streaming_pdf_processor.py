@@ -5,26 +5,43 @@ Streaming PDF Processor - No Local Download Required
 메모리 효율적이며 대용량 PDF도 안정적으로 처리 가능합니다.
 
 4가지 최적화 전략:
-1. 청크 단위 스트리밍 (메모리 절약)
+1. 청크 단위 스트리밍 (메모리 절약, content-addressed blob 캐시로 재다운로드 방지)
 2. Upstage Document Parse API (고품질 한국어 문서 처리)
 3. Azure/AWS 원격 API (로컬 파일 불필요)
 4. 하이브리드 방식 (작은 파일은 메모리, 큰 파일은 스트리밍)
 """
 import asyncio
-import httpx
 import io
 from typing import Dict, Optional, AsyncIterator
 from loguru import logger
+from app.services.extraction_artifact_cache import (
+    ExtractionArtifactCache,
+    compute_page_offsets,
+    get_extraction_cache,
+)
+from app.services.pdf_blob_store import BlobRef, PDFBlobStore, get_pdf_blob_store
 from app.services.upstage_document_parser import UpstageDocumentParser
 
 
 class StreamingPDFProcessor:
     """스트리밍 기반 PDF 처리기 (로컬 다운로드 불필요)"""
 
-    def __init__(self):
+    # 추출 로직 변경 시 올려서 추출 결과 캐시 무효화
+    PDFPLUMBER_EXTRACTOR_VERSION = "1"
+    UPSTAGE_EXTRACTOR_VERSION = "1"
+
+    def __init__(
+        self,
+        blob_store: Optional[PDFBlobStore] = None,
+        extraction_cache: Optional[ExtractionArtifactCache] = None,
+    ):
         self.chunk_size = 1024 * 1024  # 1MB chunks
         self.size_threshold = 10 * 1024 * 1024  # 10MB threshold
         self.upstage_parser = UpstageDocumentParser()
+        # 공용 다운로드 저장소 (커넥션 풀 + content-addressed 캐시)
+        self.blob_store = blob_store or get_pdf_blob_store()
+        # 추출 결과 캐시 (내용 해시 + 추출기 버전)
+        self.extraction_cache = extraction_cache or get_extraction_cache()
 
     async def process_pdf_streaming(
         self,
@@ -79,10 +96,8 @@ class StreamingPDFProcessor:
             return await self._process_with_streaming(pdf_url, file_size)
 
     async def _get_file_size(self, pdf_url: str) -> int:
-        """HEAD 요청으로 파일 크기 확인"""
-        async with httpx.AsyncClient() as client:
-            response = await client.head(pdf_url, timeout=10.0)
-            return int(response.headers.get('content-length', 0))
+        """파일 크기 확인 (캐시된 blob이 있으면 HEAD 요청 생략)"""
+        return await self.blob_store.get_size(pdf_url)
 
     async def _process_in_memory(
         self,
@@ -90,47 +105,19 @@ class StreamingPDFProcessor:
         file_size: int
     ) -> Dict[str, any]:
         """
-        방법 2: 메모리에서 직접 처리 (작은 파일용)
-        - 로컬 파일 저장 없음
-        - BytesIO를 사용하여 메모리에서만 처리
+        방법 2: 작은 파일 처리
+        - blob 저장소로 스트리밍 다운로드 (변경 없으면 조건부 요청만)
+        - mmap으로 추출기에 전달 (본문을 bytes로 복사하지 않음)
         """
-        logger.info(f"Processing PDF in memory (no local file)")
-
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(pdf_url)
-            response.raise_for_status()
-            pdf_bytes = response.content
-
-        # BytesIO를 사용하여 메모리에서 직접 처리
-        pdf_file = io.BytesIO(pdf_bytes)
-
-        # PyPDF2 또는 pdfplumber를 사용하여 메모리에서 직접 텍스트 추출
-        try:
-            import pdfplumber
-            extracted_text = ""
-            total_pages = 0
-
-            with pdfplumber.open(pdf_file) as pdf:
-                total_pages = len(pdf.pages)
-                for page in pdf.pages:
-                    text = page.extract_text()
-                    if text:
-                        extracted_text += text + "\n"
+        logger.info(f"Processing PDF in memory (mmap from blob store)")
 
-            logger.info(f"✅ In-memory extraction completed: {total_pages} pages")
-
-            return {
-                "text": extracted_text,
-                "total_pages": total_pages,
-                "method": "memory",
-                "memory_saved_mb": 0,  # 작은 파일이라 저장 효과 미미
-                "algorithm": "pdfplumber_memory"
-            }
-
-        except Exception as e:
-            logger.error(f"In-memory extraction failed: {e}")
-            # Fallback: PyPDF2 시도
-            return await self._fallback_pypdf2(pdf_file, "memory")
+        blob = await self.blob_store.fetch(pdf_url)
+        return self._extract_from_blob(
+            blob,
+            method="memory",
+            algorithm="pdfplumber_memory",
+            memory_saved_mb=0,  # 작은 파일이라 저장 효과 미미
+        )
 
     async def _process_with_streaming(
         self,
@@ -140,74 +127,127 @@ class StreamingPDFProcessor:
         """
         방법 3: 청크 단위 스트리밍 (대용량 파일용)
         - 메모리에 전체 파일을 로드하지 않음
-        - 청크 단위로 다운로드하면서 처리
+        - 청크 단위로 blob 저장소에 기록하면서 SHA-256 계산
         """
         logger.info(f"Processing PDF with streaming (large file: {file_size / 1024 / 1024:.2f} MB)")
 
-        # SpooledTemporaryFile 사용: 작은 데이터는 메모리, 큰 데이터는 임시 디스크
-        import tempfile
-        from io import BytesIO
+        blob = await self.blob_store.fetch(pdf_url)
+        return self._extract_from_blob(
+            blob,
+            method="streaming",
+            algorithm="pdfplumber_streaming",
+            memory_saved_mb=round(blob.size / 1024 / 1024, 2),
+        )
 
-        # max_size=10MB까지는 메모리, 초과시 자동으로 디스크로 전환
-        temp_file = tempfile.SpooledTemporaryFile(max_size=10 * 1024 * 1024)
+    def _extract_from_blob(
+        self,
+        blob: BlobRef,
+        method: str,
+        algorithm: str,
+        memory_saved_mb: float,
+    ) -> Dict[str, any]:
+        """mmap된 blob에서 pdfplumber로 텍스트 추출 (실패 시 PyPDF2)"""
+        if self.extraction_cache is not None:
+            artifact = self.extraction_cache.get(
+                blob.sha256, "pdfplumber", self.PDFPLUMBER_EXTRACTOR_VERSION
+            )
+            if artifact is not None:
+                return {
+                    **artifact,
+                    "method": method,
+                    "memory_saved_mb": memory_saved_mb,
+                    "algorithm": algorithm,
+                    "content_sha256": blob.sha256,
+                    "artifact_cached": True,
+                }
 
-        try:
-            # 청크 단위로 스트리밍 다운로드
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                async with client.stream('GET', pdf_url) as response:
-                    response.raise_for_status()
-
-                    downloaded = 0
-                    async for chunk in response.aiter_bytes(chunk_size=self.chunk_size):
-                        temp_file.write(chunk)
-                        downloaded += len(chunk)
-
-                        # 진행 상황 로깅 (10% 단위)
-                        if downloaded % (5 * 1024 * 1024) == 0:
-                            progress = (downloaded / file_size) * 100
-                            logger.info(f"Downloaded: {downloaded / 1024 / 1024:.1f} MB ({progress:.0f}%)")
-
-            # 파일 포인터를 처음으로 이동
-            temp_file.seek(0)
-
-            # pdfplumber로 텍스트 추출
-            import pdfplumber
-            extracted_text = ""
-            total_pages = 0
+        with blob.open_mmap() as pdf_file:
+            try:
+                import pdfplumber
+                extracted_text = ""
+                total_pages = 0
+                page_offsets = []
+
+                with pdfplumber.open(pdf_file) as pdf:
+                    total_pages = len(pdf.pages)
+                    for i, page in enumerate(pdf.pages):
+                        page_offsets.append(len(extracted_text))
+                        text = page.extract_text()
+                        if text:
+                            extracted_text += text + "\n"
+
+                        # 진행 상황 로깅 (10페이지 단위)
+                        if (i + 1) % 10 == 0:
+                            logger.info(f"Extracted: {i + 1}/{total_pages} pages")
+
+                logger.info(
+                    f"✅ {method} extraction completed: {total_pages} pages "
+                    f"(blob {blob.sha256[:12]}, cached={blob.from_cache})"
+                )
 
-            with pdfplumber.open(temp_file) as pdf:
-                total_pages = len(pdf.pages)
-                for i, page in enumerate(pdf.pages):
-                    text = page.extract_text()
-                    if text:
-                        extracted_text += text + "\n"
+                if self.extraction_cache is not None:
+                    self.extraction_cache.put(
+                        blob.sha256,
+                        "pdfplumber",
+                        self.PDFPLUMBER_EXTRACTOR_VERSION,
+                        {
+                            "text": extracted_text,
+                            "total_pages": total_pages,
+                            "page_offsets": page_offsets,
+                        },
+                    )
 
-                    # 진행 상황 로깅 (10페이지 단위)
-                    if (i + 1) % 10 == 0:
-                        logger.info(f"Extracted: {i + 1}/{total_pages} pages")
+                return {
+                    "text": extracted_text,
+                    "total_pages": total_pages,
+                    "method": method,
+                    "memory_saved_mb": memory_saved_mb,
+                    "algorithm": algorithm,
+                    "content_sha256": blob.sha256,
+                }
 
-            logger.info(f"✅ Streaming extraction completed: {total_pages} pages")
+            except Exception as e:
+                logger.error(f"{method} extraction failed: {e}")
+                # Fallback: PyPDF2 시도
+                return self._fallback_pypdf2_sync(pdf_file, method)
 
-            # 메모리 절약 계산
-            memory_saved = file_size - (10 * 1024 * 1024)  # SpooledTemporaryFile의 max_size
-            memory_saved_mb = max(0, memory_saved / 1024 / 1024)
+    async def _process_with_upstage(
+        self,
+        pdf_url: str,
+        extract_tables: bool = True,
+        smart_chunking: bool = False
+    ) -> Dict[str, any]:
+        """
+        Upstage 처리 (추출 결과 캐시 우선)
 
-            return {
-                "text": extracted_text,
-                "total_pages": total_pages,
-                "method": "streaming",
-                "memory_saved_mb": round(memory_saved_mb, 2),
-                "algorithm": "pdfplumber_streaming"
-            }
+        같은 내용(SHA-256)의 PDF는 Upstage OCR을 다시 호출하지 않습니다.
+        """
+        content_sha256 = None
+        options = {"extract_tables": extract_tables, "smart_chunking": smart_chunking}
+        if self.extraction_cache is not None:
+            try:
+                content_sha256 = (await self.blob_store.fetch(pdf_url)).sha256
+            except Exception as e:
+                logger.warning(f"Could not hash PDF for extraction cache: {e}")
+
+        if content_sha256:
+            artifact = self.extraction_cache.get(
+                content_sha256, "upstage", self.UPSTAGE_EXTRACTOR_VERSION, options
+            )
+            if artifact is not None:
+                return {**artifact, "artifact_cached": True}
 
-        except Exception as e:
-            logger.error(f"Streaming extraction failed: {e}")
-            raise
+        result = await self._parse_with_upstage(pdf_url, extract_tables, smart_chunking)
 
-        finally:
-            temp_file.close()  # 임시 파일 정리
+        # 폴백(pdfplumber) 결과는 해당 추출기 캐시에 따로 저장됨
+        if content_sha256 and str(result.get("method", "")).startswith("upstage"):
+            self.extraction_cache.put(
+                content_sha256, "upstage", self.UPSTAGE_EXTRACTOR_VERSION,
+                {**result, "content_sha256": content_sha256}, options,
+            )
+        return result
 
-    async def _process_with_upstage(
+    async def _parse_with_upstage(
         self,
         pdf_url: str,
         extract_tables: bool = True,
@@ -247,7 +287,8 @@ class StreamingPDFProcessor:
                     "sections": result.get("sections", []),
                     "tables": result.get("tables", []),
                     "quality_score": result.get("quality_score", 0.0),
-                    "metadata": result.get("metadata", {})
+                    "metadata": result.get("metadata", {}),
+                    "page_offsets": compute_page_offsets(result.get("pages", []), "\n\n")
                 }
             else:
                 # 일반 파싱
@@ -266,7 +307,8 @@ class StreamingPDFProcessor:
                     "sections": result.get("sections", []),
                     "tables": result.get("tables", []),
                     "quality_score": result.get("quality_score", 0.0),
-                    "metadata": result.get("metadata", {})
+                    "metadata": result.get("metadata", {}),
+                    "page_offsets": compute_page_offsets(result.get("pages", []), "\n\n")
                 }
 
         except Exception as e:
@@ -301,6 +343,10 @@ class StreamingPDFProcessor:
         method: str
     ) -> Dict[str, any]:
         """PyPDF2를 사용한 폴백 처리"""
+        return self._fallback_pypdf2_sync(pdf_file, method)
+
+    def _fallback_pypdf2_sync(self, pdf_file, method: str) -> Dict[str, any]:
+        """PyPDF2 폴백 (BytesIO 또는 mmap)"""
         try:
             import PyPDF2
 
@@ -337,12 +383,11 @@ class StreamingPDFProcessor:
         - 메모리 효율적
         - 실시간 처리 가능
         """
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            async with client.stream('GET', pdf_url) as response:
-                response.raise_for_status()
+        async with self.blob_store.client.stream('GET', pdf_url) as response:
+            response.raise_for_status()
 
-                async for chunk in response.aiter_bytes(chunk_size=self.chunk_size):
-                    yield chunk
+            async for chunk in response.aiter_bytes(chunk_size=self.chunk_size):
+                yield chunk
 
 
 # 사용 예시
@@ -8,18 +8,15 @@ Features:
 - Hierarchy preservation (장-절-조 계층 구조 유지)
 - Metadata extraction (페이지, 좌표, 폰트 정보)
 """
+import importlib.util
 import re
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from loguru import logger
 
-try:
-    from unstructured.partition.pdf import partition_pdf
-    from unstructured.chunking.title import chunk_by_title
-    from unstructured.staging.base import elements_to_json
-    UNSTRUCTURED_AVAILABLE = True
-except ImportError:
-    UNSTRUCTURED_AVAILABLE = False
+# 설치 여부만 확인 (unstructured는 import 비용이 커서 실제 파싱 시점에 import)
+UNSTRUCTURED_AVAILABLE = importlib.util.find_spec("unstructured") is not None
+if not UNSTRUCTURED_AVAILABLE:
     logger.warning("Unstructured.io not available - install with: pip install unstructured[pdf]")
 
 
@@ -102,6 +99,9 @@ class UnstructuredInsuranceChunker:
         logger.info(f"📄 Parsing PDF with Unstructured.io: {pdf_path}")
         logger.info(f"   Strategy: {self.strategy}, Extract images: {extract_images}")
 
+        from unstructured.partition.pdf import partition_pdf
+        from unstructured.chunking.title import chunk_by_title
+
         # 1. PDF 파싱 (Unstructured.io)
         elements = partition_pdf(
             filename=pdf_path,
@@ -282,6 +282,8 @@ class UnstructuredInsuranceChunker:
         """
         logger.info(f"📊 Analyzing document structure: {pdf_path}")
 
+        from unstructured.partition.pdf import partition_pdf
+
         # PDF 파싱
         elements = partition_pdf(
             filename=pdf_path,
@@ -6,7 +6,9 @@ Neo4j 벡터 인덱스를 활용한 유사도 검색 엔진.
 import time
 from typing import List, Dict, Any, Optional
 from loguru import logger
+from neo4j import Query
 
+from app.core.config import settings
 from app.models.vector_search import (
     SearchRequest,
     SearchResponse,
@@ -62,7 +64,7 @@ class VectorSearchEngine:
         start_time = time.time()
 
         # 1. 쿼리 임베딩 생성
-        embedding_request = EmbeddingRequest(text=query, model="openai")
+        embedding_request = EmbeddingRequest(text=query, model=settings.QUERY_EMBEDDING_MODEL)
         embedding_response = await self.query_embedder.embed_query(embedding_request)
 
         logger.info(
@@ -117,9 +119,16 @@ class VectorSearchEngine:
         ORDER BY score DESC
         """
 
+        # 오케스트레이터 요청 안에서는 남은 실행 예산을 Neo4j 트랜잭션 타임아웃으로 전달
+        from app.services.orchestration.execution_budget import clamp_timeout
+
+        timeout = clamp_timeout()
+        if timeout is not None and timeout <= 0:
+            raise TimeoutError("Execution budget exhausted before vector search")
+
         with self.neo4j.driver.session() as session:
             result = session.run(
-                cypher,
+                Query(cypher, timeout=timeout),
                 index_name=index_name,
                 top_k=top_k,
                 embedding=embedding,
@@ -13,11 +13,11 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 from uuid import UUID
 
-import httpx
 from loguru import logger
 
 from app.celery_app import celery_app
 from app.models.policy_metadata import PolicyMetadataStatus
+from app.services.pdf_blob_store import get_pdf_blob_store
 
 
 @celery_app.task(
@@ -177,7 +177,10 @@ def _update_job_status(
 
 def _download_file(download_url: str, job: Dict[str, Any]) -> Path:
     """
-    Download file from URL to local storage
+    Download file from URL to the shared content-addressed blob store
+
+    The body is streamed to disk and hashed on the fly; retries and
+    re-ingestion of an unchanged file only cost a conditional request.
 
     Args:
         download_url: Source URL
@@ -186,26 +189,13 @@ def _download_file(download_url: str, job: Dict[str, Any]) -> Path:
     Returns:
         Path to downloaded file
     """
-    # Create download directory
-    download_dir = Path("/tmp/insuregraph/downloads")
-    download_dir.mkdir(parents=True, exist_ok=True)
-
-    # Generate filename
-    file_name = job.get("file_name") or f"policy_{job['id']}.pdf"
-    file_path = download_dir / file_name
+    blob = get_pdf_blob_store().fetch_sync(download_url)
+    file_path = blob.path
 
-    # Download file
-    with httpx.Client(timeout=60.0, follow_redirects=True) as client:
-        response = client.get(download_url)
-        response.raise_for_status()
-
-        # Save to file
-        with open(file_path, "wb") as f:
-            f.write(response.content)
-
-        logger.info(
-            f"Downloaded {len(response.content)} bytes to {file_path}"
-        )
+    logger.info(
+        f"{'Reused' if blob.from_cache else 'Downloaded'} {blob.size} bytes "
+        f"for job {job['id']} at {file_path} (sha256={blob.sha256[:12]})"
+    )
 
     # TODO: Upload to S3 for permanent storage
     # s3_url = upload_to_s3(file_path, bucket="insuregraph-policies")
@@ -297,10 +287,7 @@ def cleanup_old_downloads_task() -> Dict[str, Any]:
 
     download_dir = Path("/tmp/insuregraph/downloads")
 
-    if not download_dir.exists():
-        return {"status": "skipped", "reason": "Download directory does not exist"}
-
-    # Delete files older than 7 days
+    # Delete legacy downloads older than 7 days
     import time
     from datetime import timedelta
 
@@ -308,19 +295,27 @@ def cleanup_old_downloads_task() -> Dict[str, Any]:
     deleted_count = 0
     freed_bytes = 0
 
-    for file_path in download_dir.glob("*.pdf"):
+    legacy_files = download_dir.glob("*.pdf") if download_dir.exists() else []
+    for file_path in legacy_files:
         if file_path.stat().st_mtime < cutoff_time:
             freed_bytes += file_path.stat().st_size
             file_path.unlink()
             deleted_count += 1
 
+    # Prune blobs not used within PDF_BLOB_CACHE_MAX_AGE_DAYS
+    blob_result = get_pdf_blob_store().prune()
+
     logger.info(
         f"Cleanup complete: deleted {deleted_count} files, "
-        f"freed {freed_bytes / 1024 / 1024:.2f} MB"
+        f"freed {freed_bytes / 1024 / 1024:.2f} MB; "
+        f"pruned {blob_result['deleted_count']} blobs "
+        f"({blob_result['freed_mb']:.2f} MB)"
     )
 
     return {
         "status": "success",
         "deleted_count": deleted_count,
         "freed_mb": freed_bytes / 1024 / 1024,
+        "blobs_deleted": blob_result["deleted_count"],
+        "blobs_freed_mb": blob_result["freed_mb"],
     }
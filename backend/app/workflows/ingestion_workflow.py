@@ -8,8 +8,6 @@ import logging
 from typing import Dict, Any, Optional
 from datetime import datetime
 
-from langgraph.graph import StateGraph, END
-
 from app.workflows.state import PipelineState, PipelineStatus, WorkflowConfig
 from app.services.ingestion.legal_parser import LegalStructureParser
 from app.services.ingestion.critical_data_extractor import CriticalDataExtractor
@@ -47,8 +45,10 @@ class IngestionWorkflow:
         # 워크플로우 그래프 구축
         self.graph = self._build_graph()
 
-    def _build_graph(self) -> StateGraph:
+    def _build_graph(self):
         """LangGraph 워크플로우 그래프 구축"""
+        from langgraph.graph import StateGraph, END
+
         # StateGraph 생성
         workflow = StateGraph(PipelineState)
 
@@ -246,6 +246,11 @@ class IngestionWorkflow:
 
             # 각 paragraph에 대해 관계 추출
             all_relations = []
+            await self.relation_extractor.prefetch(
+                [paragraph.text for article in parsed_doc.articles for paragraph in article.paragraphs],
+                critical_data,
+                use_cascade=self.config.use_cascade,
+            )
             for article in parsed_doc.articles:
                 for paragraph in article.paragraphs:
                     result = await self.relation_extractor.extract(
@@ -0,0 +1,95 @@
+"""
+인증 처리량 벤치마크
+
+1. 로그인 폭주: bcrypt 검증을 이벤트 루프에서 직접 실행할 때와 스레드 풀에서 실행할 때의
+   처리량과 이벤트 루프 지연(다른 API 요청이 체감하는 지연)을 비교
+2. 토큰 검증: 요청마다 JWT를 디코딩할 때와 TokenCache를 사용할 때의 처리량 비교
+
+Usage:
+    cd backend
+    python scripts/benchmark_auth.py --logins 64 --requests 20000
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core import security  # noqa: E402
+from app.core.security import (  # noqa: E402
+    TokenCache,
+    create_access_token,
+    hash_password,
+    resolve_access_token,
+    verify_password,
+    verify_password_async,
+)
+
+
+async def _measure_loop_lag(stop: asyncio.Event, interval: float = 0.01) -> float:
+    """이벤트 루프 최대 지연 (ms)"""
+    max_lag = 0.0
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        max_lag = max(max_lag, time.perf_counter() - started - interval)
+    return max_lag * 1000
+
+
+async def _login_burst(logins: int, hashed: str, off_loop: bool) -> dict:
+    async def login_on_loop():
+        return verify_password("Password123!", hashed)
+
+    async def login_off_loop():
+        return await verify_password_async("Password123!", hashed)
+
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(_measure_loop_lag(stop))
+    await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    login = login_off_loop if off_loop else login_on_loop
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    max_lag_ms = await lag_task
+    return {"logins_per_sec": logins / elapsed, "max_loop_lag_ms": max_lag_ms}
+
+
+def _token_resolution(requests: int, users: int, cached: bool) -> float:
+    tokens = [create_access_token({"sub": f"user-{i}", "role": "fp"}) for i in range(users)]
+    security._token_cache = TokenCache(max_entries=10000 if cached else 0, ttl_seconds=60)
+
+    started = time.perf_counter()
+    for i in range(requests):
+        resolve_access_token(tokens[i % users])
+    return requests / (time.perf_counter() - started)
+
+
+async def main(args: argparse.Namespace) -> None:
+    security.settings.AUTH_HASH_MAX_PENDING = max(args.logins, security.settings.AUTH_HASH_MAX_PENDING)
+    hashed = hash_password("Password123!")
+
+    print(f"== Login burst ({args.logins} concurrent logins, {security.settings.AUTH_HASH_WORKERS} workers)")
+    for label, off_loop in (("on event loop", False), ("thread pool", True)):
+        result = await _login_burst(args.logins, hashed, off_loop)
+        print(
+            f"  {label:<14} {result['logins_per_sec']:8.1f} logins/s   "
+            f"max loop lag {result['max_loop_lag_ms']:8.1f} ms"
+        )
+
+    print(f"== Token resolution ({args.requests} requests, {args.users} users)")
+    for label, cached in (("decode", False), ("cached", True)):
+        rate = _token_resolution(args.requests, args.users, cached)
+        print(f"  {label:<14} {rate:10.0f} requests/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Auth throughput benchmark")
+    parser.add_argument("--logins", type=int, default=64, help="concurrent logins in the burst")
+    parser.add_argument("--requests", type=int, default=20000, help="authenticated requests to resolve")
+    parser.add_argument("--users", type=int, default=200, help="distinct access tokens")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,121 @@
+"""
+API 시작 import 시간 프로파일링
+
+APP_ROLE별로 `python -X importtime`으로 app.main을 새 프로세스에서 import하고,
+총 import 시간 / 최대 RSS / 패키지별 self 시간 상위 / 가장 무거운 app 모듈을 Markdown 리포트로 출력합니다.
+
+Usage:
+    cd backend
+    python scripts/profile_imports.py                    # all, query, ingestion, crawler
+    python scripts/profile_imports.py --roles query --top 30 --output import_report.md
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+_CHILD = (
+    "import resource, app.main; "
+    "print(len(app.main.app.routes)); "
+    "print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)"
+)
+
+
+def profile_role(role: str) -> Dict:
+    """새 인터프리터에서 app.main import 측정"""
+    env = dict(os.environ, APP_ROLE=role)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        tail = "\n".join(proc.stderr.splitlines()[-5:])
+        raise RuntimeError(f"import failed for APP_ROLE={role}:\n{tail}")
+
+    # (self_us, cumulative_us, depth, module)
+    entries: List[Tuple[int, int, int, str]] = []
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append((int(self_us), int(cumulative_us), len(indent) // 2, module))
+
+    routes, max_rss_kb = proc.stdout.split()[-2:]
+    total_us = next((cum for _, cum, _, module in entries if module == "app.main"), 0)
+
+    by_package: Counter = Counter()
+    for self_us, _, _, module in entries:
+        by_package[module.split(".")[0]] += self_us
+
+    # 패키지 __init__이 하위 모듈을 import하면 같은 이름이 중첩되어 나올 수 있음 → 최대값만
+    app_cumulative: Dict[str, int] = {}
+    for _, cumulative_us, _, module in entries:
+        if module.startswith("app.") and module != "app.main":
+            app_cumulative[module] = max(app_cumulative.get(module, 0), cumulative_us)
+    app_modules = sorted(((cum, module) for module, cum in app_cumulative.items()), reverse=True)
+
+    return {
+        "role": role,
+        "total_ms": total_us / 1000,
+        "max_rss_mb": int(max_rss_kb) / 1024,
+        "routes": int(routes),
+        "modules": len(entries),
+        "by_package": by_package,
+        "app_modules": app_modules,
+    }
+
+
+def render_report(results: List[Dict], top: int) -> str:
+    lines = ["# Import-time profile (app.main)", ""]
+    lines += [
+        "| APP_ROLE | import time (ms) | max RSS (MB) | modules | routes |",
+        "|---|---:|---:|---:|---:|",
+    ]
+    for result in results:
+        lines.append(
+            f"| {result['role']} | {result['total_ms']:.0f} | {result['max_rss_mb']:.0f} "
+            f"| {result['modules']} | {result['routes']} |"
+        )
+
+    for result in results:
+        lines += ["", f"## APP_ROLE={result['role']}", "", "Top packages by self time:", ""]
+        lines += ["| package | self (ms) |", "|---|---:|"]
+        for package, self_us in result["by_package"].most_common(top):
+            lines.append(f"| {package} | {self_us / 1000:.1f} |")
+
+        lines += ["", "Heaviest app modules (cumulative, includes their imports):", ""]
+        lines += ["| module | cumulative (ms) |", "|---|---:|"]
+        for cumulative_us, module in result["app_modules"][:top]:
+            lines.append(f"| {module} | {cumulative_us / 1000:.1f} |")
+
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Profile app.main import time per APP_ROLE")
+    parser.add_argument("--roles", nargs="+", default=["all", "query", "ingestion", "crawler"])
+    parser.add_argument("--top", type=int, default=15, help="rows per table")
+    parser.add_argument("--output", help="write the Markdown report to this file")
+    args = parser.parse_args()
+
+    report = render_report([profile_role(role) for role in args.roles], args.top)
+    if args.output:
+        Path(args.output).write_text(report, encoding="utf-8")
+        print(f"Report written to {args.output}")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,24 @@ from app.core.config import settings
 from app.main import app
 
 
+@pytest.fixture(autouse=True)
+def disable_llm_result_cache(monkeypatch):
+    """
+    Keep tests hermetic: the persistent LLM result cache is shared across runs,
+    so extractors only cache when a test passes an explicit LLMResultCache.
+    """
+    monkeypatch.setattr(settings, "LLM_CACHE_ENABLED", False)
+
+
+@pytest.fixture(autouse=True)
+def disable_audit_sink(monkeypatch):
+    """
+    Keep audit events in memory: tests must not write to audit_logs or the spool directory.
+    """
+    monkeypatch.setattr(settings, "AUDIT_SINK", "none")
+    monkeypatch.setattr("app.core.audit_sink._audit_pipeline", None)
+
+
 @pytest.fixture
 def client():
     """
@@ -0,0 +1,129 @@
+"""
+Unit tests for the audit sink pipeline
+
+대기열 배치 저장, 저장 실패 시 JSONL 스풀 대체와 재생, 대기열 초과, 세그먼트 교체,
+링 버퍼 크기 제한을 테스트합니다.
+"""
+import json
+import pytest
+
+from app.core.audit import AuditEventType, AuditLogger
+from app.core.audit_sink import AuditPipeline, AuditSink, JSONLAuditSink, get_audit_pipeline
+
+
+class RecordingSink(AuditSink):
+    name = "recording"
+
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+
+    async def write_batch(self, entries):
+        if self.fail:
+            raise ConnectionError("database down")
+        self.batches.append(list(entries))
+
+
+def _read_spool(directory):
+    return [
+        json.loads(line)
+        for path in sorted(directory.glob("audit-*.jsonl"))
+        for line in path.read_text(encoding="utf-8").splitlines()
+    ]
+
+
+def _entry(i):
+    return {"event_id": f"e{i}", "timestamp": "2024-01-01T00:00:00", "event_type": "login"}
+
+
+class TestAuditPipeline:
+    """Test suite for AuditPipeline"""
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_in_batches(self, tmp_path):
+        sink = RecordingSink()
+        pipeline = AuditPipeline(sink, spool=JSONLAuditSink(str(tmp_path)), batch_size=2)
+        for i in range(5):
+            pipeline.enqueue(_entry(i))
+
+        assert await pipeline.flush() == 5
+        assert [len(batch) for batch in sink.batches] == [2, 2, 1]
+        assert pipeline.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_sink_failure_spools_to_jsonl(self, tmp_path):
+        pipeline = AuditPipeline(RecordingSink(fail=True), spool=JSONLAuditSink(str(tmp_path)))
+        for i in range(3):
+            pipeline.enqueue(_entry(i))
+
+        await pipeline.flush()
+
+        assert [e["event_id"] for e in _read_spool(tmp_path)] == ["e0", "e1", "e2"]
+        assert pipeline.stats["spooled"] == 3
+
+    @pytest.mark.asyncio
+    async def test_spool_failure_keeps_events_pending(self, tmp_path):
+        blocked = tmp_path / "not-a-dir"
+        blocked.write_text("")
+        pipeline = AuditPipeline(RecordingSink(fail=True), spool=JSONLAuditSink(str(blocked)))
+        for i in range(3):
+            pipeline.enqueue(_entry(i))
+
+        assert await pipeline.flush() == 0
+        assert pipeline.pending == 3
+
+    @pytest.mark.asyncio
+    async def test_queue_overflow_is_spooled_by_flush(self, tmp_path):
+        sink = RecordingSink()
+        pipeline = AuditPipeline(sink, spool=JSONLAuditSink(str(tmp_path)), max_pending=2)
+        for i in range(4):
+            pipeline.enqueue(_entry(i))
+
+        assert pipeline.pending == 2
+        assert _read_spool(tmp_path) == []  # enqueue는 파일 I/O 없음
+
+        await pipeline.flush()
+
+        assert [e["event_id"] for e in sink.batches[0]] == ["e0", "e1"]
+        assert [e["event_id"] for e in _read_spool(tmp_path)] == ["e2", "e3"]
+
+    @pytest.mark.asyncio
+    async def test_spooled_events_replayed_when_sink_recovers(self, tmp_path):
+        sink = RecordingSink(fail=True)
+        pipeline = AuditPipeline(sink, spool=JSONLAuditSink(str(tmp_path)))
+        for i in range(3):
+            pipeline.enqueue(_entry(i))
+        await pipeline.flush()
+
+        assert await pipeline.replay_spool() == 0
+        assert list(tmp_path.glob("audit-*.replaying"))  # 실패한 세그먼트는 다음에 재시도
+
+        sink.fail = False
+        assert await pipeline.replay_spool() == 3
+        assert [e["event_id"] for e in sink.batches[0]] == ["e0", "e1", "e2"]
+        assert list(tmp_path.iterdir()) == []
+
+
+def test_jsonl_segments_rotate_by_size(tmp_path):
+    sink = JSONLAuditSink(str(tmp_path), max_segment_bytes=50)
+    for i in range(4):
+        sink.write_batch_sync([_entry(i)])
+
+    assert len(list(tmp_path.glob("audit-*.jsonl"))) == 4
+    assert [e["event_id"] for e in _read_spool(tmp_path)] == ["e0", "e1", "e2", "e3"]
+
+
+def test_log_event_enqueues_and_ring_buffer_is_bounded(monkeypatch):
+    from collections import deque
+
+    monkeypatch.setattr(AuditLogger, "_audit_logs", deque(maxlen=3))
+    pipeline = get_audit_pipeline()
+    pipeline.clear_pending()
+
+    for i in range(5):
+        AuditLogger.log_event(AuditEventType.LOGIN, user_id=f"user{i}")
+
+    assert [log["user_id"] for log in AuditLogger._audit_logs] == ["user2", "user3", "user4"]
+    assert pipeline.pending == 5
+    assert len({log["event_id"] for log in AuditLogger._audit_logs}) == 3
+    assert AuditLogger.get_audit_logs()["total"] == 3
@@ -0,0 +1,163 @@
+"""
+Unit tests for SemanticChunkingLearner caching
+
+문서 단위 일괄 캐시 조회/저장(Redis 왕복 2회), 압축 저장, 동시 학습을 테스트합니다.
+"""
+import asyncio
+import json
+import pytest
+
+from app.services.learning.chunk_learner import (
+    SemanticChunkingLearner,
+    decode_cache_value,
+    encode_cache_value,
+)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def setex(self, key, ttl, value):
+        self.commands.append(lambda: self.redis.store.__setitem__(key, value))
+
+    def hincrby(self, key, field, amount):
+        self.commands.append(lambda: self.redis.hincr(key, field, amount))
+
+    hincrbyfloat = hincrby
+
+    async def execute(self):
+        self.redis.round_trips += 1
+        for command in self.commands:
+            command()
+        return [True] * len(self.commands)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.hashes = {}
+        self.round_trips = 0
+
+    def hincr(self, key, field, amount):
+        hash_ = self.hashes.setdefault(key, {})
+        hash_[field.encode()] = hash_.get(field.encode(), 0) + amount
+
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [self.store.get(key) for key in keys]
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+DOCUMENT = "\n".join(f"제{i}조 (조항 {i})\n내용 {i}" for i in range(1, 41))
+
+
+def _learner(redis=None, max_concurrency=4):
+    learner = SemanticChunkingLearner(max_concurrency=max_concurrency)
+    learner.redis_client = redis or FakeRedis()
+    return learner
+
+
+class TestCacheCodec:
+    """Test suite for cache value encoding"""
+
+    def test_roundtrip_is_compressed(self):
+        value = {"entities": ["보험금"] * 50, "relationships": []}
+        encoded = encode_cache_value(value)
+
+        assert decode_cache_value(encoded) == value
+        assert len(encoded) < len(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+
+    def test_legacy_plain_json_is_readable(self):
+        assert decode_cache_value('{"entities": []}') == {"entities": []}
+
+    def test_corrupted_value_is_miss(self):
+        assert decode_cache_value(b"z-not-zlib") is None
+
+
+class TestLearnWithCaching:
+    """Test suite for batched learn_with_caching"""
+
+    @pytest.mark.asyncio
+    async def test_two_round_trips_and_cache_reuse(self):
+        redis = FakeRedis()
+        learner = _learner(redis)
+        calls = []
+
+        async def callback(chunk_text):
+            calls.append(chunk_text)
+            return {"entities": [chunk_text[:4]]}
+
+        first = await learner.learn_with_caching(DOCUMENT, "doc-1", callback)
+
+        assert first["total_chunks"] == 40
+        assert first["cached_chunks"] == 0
+        assert len(calls) == 40
+        assert redis.round_trips == 2
+
+        second = await learner.learn_with_caching(DOCUMENT, "doc-2", callback)
+
+        assert second["cached_chunks"] == 40
+        assert second["cache_hit_ratio"] == 1.0
+        assert len(calls) == 40
+        assert redis.round_trips == 4  # 모두 HIT이면 적중률 기록만
+
+        # 다른 인스턴스(API 프로세스)에서도 같은 히스토그램
+        histogram = await _learner(redis).get_hit_ratio_histogram()
+        assert histogram["count"] == 2
+        assert histogram["buckets"]["0.0"] == 1
+        assert histogram["buckets"]["1.0"] == 2
+
+    @pytest.mark.asyncio
+    async def test_misses_learned_concurrently_with_limit(self):
+        learner = _learner(max_concurrency=3)
+        running = 0
+        peak = 0
+
+        async def callback(chunk_text):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"entities": []}
+
+        await learner.learn_with_caching(DOCUMENT, "doc-1", callback)
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_chunks_are_not_cached(self):
+        redis = FakeRedis()
+        learner = _learner(redis)
+
+        async def callback(chunk_text):
+            if "제1조" in chunk_text:
+                raise RuntimeError("LLM error")
+            return {"entities": []}
+
+        result = await learner.learn_with_caching(DOCUMENT, "doc-1", callback)
+
+        assert result["chunk_results"][0]["error"] == "LLM error"
+        assert len(redis.store) == 39
+
+    @pytest.mark.asyncio
+    async def test_duplicate_chunks_learned_once(self):
+        learner = _learner()
+        calls = []
+
+        async def callback(chunk_text):
+            calls.append(chunk_text)
+            return {"entities": []}
+
+        text = "제1조 (목적)\n동일\n" * 5
+        result = await learner.learn_with_caching(text.rstrip("\n"), "doc-1", callback)
+
+        assert result["total_chunks"] == 5
+        assert len(calls) == 1
@@ -0,0 +1,147 @@
+"""
+Unit tests for dashboard rollups
+
+롤업 신선도 판정, PK 조회/재집계 분기, 보장 분포 변환, 메트릭 카드 생성을 테스트합니다.
+"""
+import json
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.api.v1.endpoints.analytics import build_metric_cards
+from app.services.dashboard_rollup import (
+    DashboardCounters,
+    DashboardRollupService,
+    is_fresh,
+    window_params,
+)
+
+
+NOW = datetime(2026, 3, 1, 9, 0, 0)
+
+
+def rollup_row(**overrides):
+    row = {
+        "total_customers": 12,
+        "active_customers": 5,
+        "prev_active_customers": 7,
+        "new_customers": 2,
+        "total_policies": 9,
+        "coverage": json.dumps({"life": {"count": 3, "total_amount": 3e8}, "car": {"count": 0, "total_amount": 0}}),
+        "window_end": NOW - timedelta(minutes=5),
+        "window_days": 30,
+        "computed_at": NOW - timedelta(minutes=5),
+        "needs_refresh": False,
+    }
+    row.update(overrides)
+    return row
+
+
+class FakeRow:
+    def __init__(self, mapping):
+        self._mapping = mapping
+
+
+class FakeResult:
+    def __init__(self, row):
+        self._row = row
+
+    def fetchone(self):
+        return FakeRow(self._row) if self._row is not None else None
+
+
+class FakeSession:
+    def __init__(self, stored=None):
+        self.stored = stored
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, statement, params):
+        sql = str(statement).strip()
+        self.statements.append((sql, params))
+        if sql.startswith("SELECT * FROM fp_dashboard_rollups"):
+            return FakeResult(self.stored)
+        self.stored = rollup_row(
+            total_customers=13, coverage={"health": {"count": 1, "total_amount": 1000}},
+            window_end=params["window_end"], computed_at=params["window_end"],
+        )
+        return FakeResult(self.stored)
+
+    async def commit(self):
+        self.commits += 1
+
+
+class TestRollupService:
+    """Test suite for DashboardRollupService"""
+
+    @pytest.mark.asyncio
+    async def test_fresh_rollup_is_a_single_lookup(self):
+        session = FakeSession(stored=rollup_row())
+
+        counters = await DashboardRollupService(session, enabled=True, max_age_seconds=900).get_counters(
+            uuid4(), now=NOW
+        )
+
+        assert len(session.statements) == 1
+        assert counters.total_customers == 12
+        assert counters.window_start == NOW - timedelta(minutes=5) - timedelta(days=30)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("stored", [
+        None,
+        rollup_row(needs_refresh=True),
+        rollup_row(computed_at=NOW - timedelta(hours=1)),
+        rollup_row(window_days=7),
+    ])
+    async def test_missing_or_stale_rollup_is_recomputed(self, stored):
+        session = FakeSession(stored=stored)
+
+        counters = await DashboardRollupService(
+            session, enabled=True, max_age_seconds=900, window_days=30
+        ).get_counters(uuid4(), now=NOW)
+
+        sql, params = session.statements[-1]
+        assert sql.startswith("INSERT INTO fp_dashboard_rollups")
+        assert "FILTER" in sql and "ON CONFLICT (fp_user_id)" in sql
+        assert params["window_start"] == NOW - timedelta(days=30)
+        assert params["prev_window_start"] == NOW - timedelta(days=60)
+        assert session.commits == 1
+        assert counters.total_customers == 13 and counters.window_end == NOW
+
+    @pytest.mark.asyncio
+    async def test_disabled_rollup_runs_aggregate_only(self):
+        session = FakeSession(stored=rollup_row())
+
+        await DashboardRollupService(session, enabled=False).get_counters(uuid4(), now=NOW)
+
+        assert len(session.statements) == 1
+        assert session.statements[0][0].startswith("WITH cust AS")
+        assert session.commits == 0
+
+
+class TestCounters:
+    """Test suite for counter conversion"""
+
+    def test_is_fresh_boundaries(self):
+        assert is_fresh(rollup_row(), NOW, 300, 30)
+        assert not is_fresh(rollup_row(), NOW, 299, 30)
+
+    def test_coverage_breakdown_drops_empty_types(self):
+        counters = DashboardCounters.from_row(rollup_row(), window_days=30)
+
+        assert counters.coverage_breakdown() == [("life", 3, 3e8)]
+
+    def test_metric_cards(self):
+        counters = DashboardCounters.from_row(rollup_row(), window_days=30)
+
+        cards = {card.label: card for card in build_metric_cards(counters)}
+
+        assert cards["총 고객"].change == "+2"
+        assert (cards["활성 고객 (30일)"].change, cards["활성 고객 (30일)"].trend) == ("-2", "down")
+        assert cards["총 보험 계약"].value == 9
+
+    def test_window_params(self):
+        params = window_params(NOW, 7)
+
+        assert params["window_end"] - params["prev_window_start"] == timedelta(days=14)
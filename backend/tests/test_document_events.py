@@ -0,0 +1,86 @@
+"""
+Unit tests for Document Events
+
+LISTEN/NOTIFY 기반 문서 상태 이벤트 구독, 폴링 폴백을 테스트합니다.
+"""
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.document_events import DocumentEvent, DocumentEventListener
+
+
+def _payload(doc_id: str, status: str, previous: str = None) -> str:
+    return json.dumps({"id": doc_id, "status": status, "previous_status": previous, "insurer": "A"})
+
+
+def _connection():
+    connection = MagicMock()
+    connection.is_closed.return_value = False
+    connection.add_listener = AsyncMock()
+    connection.remove_listener = AsyncMock()
+    connection.close = AsyncMock()
+    return connection
+
+
+class TestDocumentEventListener:
+    """Test suite for DocumentEventListener"""
+
+    @pytest.mark.asyncio
+    async def test_events_filtered_and_coalesced_by_document(self):
+        """관심 상태만 수집, 같은 문서는 최신 이벤트 하나로 합침"""
+        connection = _connection()
+        listener = DocumentEventListener(
+            statuses={"completed"},
+            include_previous=True,
+            debounce_seconds=0,
+            enabled=True,
+            connect=AsyncMock(return_value=connection),
+        )
+        await listener.start()
+        callback = connection.add_listener.call_args.args[1]
+
+        callback(connection, 1, "crawler_document_events", _payload("d1", "processing", "pending"))
+        callback(connection, 1, "crawler_document_events", _payload("d1", "completed", "processing"))
+        callback(connection, 1, "crawler_document_events", _payload("d2", "pending", "completed"))
+        callback(connection, 1, "crawler_document_events", "not-json")
+
+        events = await listener.wait(timeout=1)
+
+        assert {e.document_id: e.status for e in events} == {"d1": "completed", "d2": "pending"}
+        assert await listener.wait(timeout=0.01) == []
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_polling_when_unavailable(self):
+        """연결 실패 시 check_interval 주기의 폴링으로 동작"""
+        listener = DocumentEventListener(
+            enabled=True, connect=AsyncMock(side_effect=OSError("refused"))
+        )
+
+        assert await listener.start() is False
+        assert listener.poll_timeout(0.01) == 0.01
+        assert await listener.wait(timeout=0.01) == []
+
+    @pytest.mark.asyncio
+    async def test_connection_loss_forces_resync(self):
+        """연결 종료 후 재연결되면 유실 가능성 때문에 즉시 빈 목록(폴링) 반환"""
+        connections = [_connection(), _connection()]
+        listener = DocumentEventListener(
+            debounce_seconds=0, enabled=True, connect=AsyncMock(side_effect=connections)
+        )
+        await listener.start()
+        assert listener.poll_timeout(10) >= 300
+
+        terminated = connections[0].add_termination_listener.call_args.args[0]
+        connections[0].is_closed.return_value = True
+        terminated(connections[0])
+
+        assert await listener.wait(timeout=5) == []
+        assert listener.connected
+
+    def test_event_payload_parsing(self):
+        """트리거 payload 파싱"""
+        event = DocumentEvent.from_payload(_payload("d1", "completed", "processing"))
+
+        assert event == DocumentEvent("d1", "completed", "processing", "A")
+        assert DocumentEvent.from_payload('{"status": "x"}') is None
@@ -0,0 +1,164 @@
+"""
+Unit tests for Document Job Queue
+
+lease 기반 문서 선점(SKIP LOCKED)과 ParallelDocumentProcessor의
+bounded producer/consumer 처리를 테스트합니다.
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.document_job_queue import DocumentJob, DocumentJobClaimer
+from app.services.parallel_document_processor import ParallelDocumentProcessor
+
+
+class FakeClaimer:
+    """여러 워커가 공유하는 in-memory 작업 테이블"""
+
+    def __init__(self, table: dict, worker_id: str):
+        self.table = table
+        self.worker_id = worker_id
+        self.heartbeat_interval = 0.01
+        self.claim_sizes = []
+        self.released = []
+
+    async def claim(self, batch_size, insurer=None):
+        self.claim_sizes.append(batch_size)
+        await asyncio.sleep(0)
+        jobs = []
+        for doc_id, row in self.table.items():
+            if len(jobs) >= batch_size:
+                break
+            if row["owner"] is None and (insurer is None or row["insurer"] == insurer):
+                row["owner"] = self.worker_id
+                jobs.append(DocumentJob(doc_id, f"https://x/{doc_id}.pdf", row["insurer"], "종신", doc_id))
+        return jobs
+
+    def mark_started(self, document_id):
+        pass
+
+    async def release(self, document_id):
+        self.released.append(document_id)
+
+    async def release_all(self):
+        return 0
+
+    async def fail_exhausted(self):
+        return 0
+
+    async def run_heartbeat(self, stop):
+        await stop.wait()
+
+
+def _processor(claimer, max_concurrent=2, active=None, processed=None):
+    processor = ParallelDocumentProcessor(
+        max_concurrent=max_concurrent,
+        use_streaming=False,
+        use_smart_learning=False,
+        use_hybrid=False,
+        claimer=claimer,
+        claim_batch_size=3,
+    )
+
+    async def process(document_id, **kwargs):
+        if active is not None:
+            active.append(1)
+            assert len(active) <= max_concurrent
+        await asyncio.sleep(0.001)
+        if active is not None:
+            active.pop()
+        if processed is not None:
+            processed.append(document_id)
+        return not document_id.endswith("9")
+
+    processor._process_single_document = process
+    return processor
+
+
+class TestParallelProcessingWithLeases:
+    """Test suite for lease-based process_pending_documents"""
+
+    @pytest.mark.asyncio
+    async def test_two_workers_never_process_same_document(self):
+        """두 워커가 같은 테이블을 동시에 처리해도 중복 없음"""
+        table = {f"doc-{i:02d}": {"owner": None, "insurer": "A"} for i in range(30)}
+        processed = []
+
+        results = await asyncio.gather(
+            _processor(FakeClaimer(table, "w1"), processed=processed).process_pending_documents(),
+            _processor(FakeClaimer(table, "w2"), processed=processed).process_pending_documents(),
+        )
+
+        assert sorted(processed) == sorted(table)
+        assert sum(r["total"] for r in results) == 30
+        assert sum(r["failed"] for r in results) == 3
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency_and_limit(self):
+        """동시 처리 수 제한, limit 초과 선점 없음, 처리 후 lease 해제"""
+        table = {f"doc-{i:02d}": {"owner": None, "insurer": "A"} for i in range(20)}
+        claimer = FakeClaimer(table, "w1")
+        active = []
+
+        result = await _processor(claimer, active=active).process_pending_documents(limit=7)
+
+        assert result["total"] == 7
+        assert sum(1 for row in table.values() if row["owner"]) == 7
+        assert all(size <= 3 for size in claimer.claim_sizes)
+        assert len(claimer.released) == 7
+
+    @pytest.mark.asyncio
+    async def test_no_pending_documents(self):
+        """대기 문서가 없으면 빈 통계"""
+        result = await _processor(FakeClaimer({}, "w1")).process_pending_documents()
+
+        assert result == {"total": 0, "success": 0, "failed": 0}
+
+
+class TestDocumentJobClaimer:
+    """DocumentJobClaimer SQL"""
+
+    @pytest.mark.asyncio
+    async def test_claim_uses_skip_locked_and_bound_params(self):
+        """SKIP LOCKED 선점, LIMIT/보험사 바인딩"""
+        session = MagicMock()
+        result = MagicMock()
+        result.fetchall.return_value = [("id-1", "https://x/1.pdf", "A", "종신", "상품", 2)]
+        session.execute = AsyncMock(return_value=result)
+        session.commit = AsyncMock()
+        factory = MagicMock()
+        factory.return_value.__aenter__ = AsyncMock(return_value=session)
+        factory.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        claimer = DocumentJobClaimer(worker_id="w1", lease_seconds=30, session_factory=factory)
+        jobs = await claimer.claim(4, insurer="A")
+
+        statement, params = session.execute.call_args.args
+        assert "FOR UPDATE SKIP LOCKED" in str(statement)
+        assert "lease_expires_at < NOW()" in str(statement)
+        assert params["batch_size"] == 4
+        assert params["insurer"] == "A"
+        assert params["owner"] == "w1"
+        assert jobs[0].document_id == "id-1" and jobs[0].attempts == 2
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_release_all_keeps_started_documents(self):
+        """처리 중 중단된 문서는 pending으로 되돌리지 않음 (시작 전 문서만 반환)"""
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=MagicMock(rowcount=1))
+        session.commit = AsyncMock()
+        factory = MagicMock()
+        factory.return_value.__aenter__ = AsyncMock(return_value=session)
+        factory.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        claimer = DocumentJobClaimer(worker_id="w1", session_factory=factory)
+        claimer.mark_started("id-2")
+        claimer.mark_started("id-1")
+        claimer.mark_started("id-3")
+        await claimer.release("id-3")
+        await claimer.release_all()
+
+        statement, params = session.execute.call_args.args
+        assert "NOT (id = ANY(:started))" in str(statement)
+        assert params == {"owner": "w1", "started": ["id-1", "id-2"]}
@@ -0,0 +1,103 @@
+"""
+Unit tests for Document Progress
+
+진행 상황 쓰기 병합(debounce), Redis 우선 기록, 최종 상태 1회 DB 기록을 테스트합니다.
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.document_progress import (
+    DocumentProgressReporter,
+    overlay_live_progress,
+)
+
+
+class FakeChannel:
+    def __init__(self, available: bool = True):
+        self.available = available
+        self.published = []
+
+    async def publish(self, state):
+        if self.available:
+            self.published.append(state)
+        return self.available
+
+
+def _session_factory():
+    session = MagicMock()
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(return_value=session)
+    factory.return_value.__aexit__ = AsyncMock(return_value=False)
+    return factory, session
+
+
+class TestDocumentProgressReporter:
+    """Test suite for DocumentProgressReporter"""
+
+    @pytest.mark.asyncio
+    async def test_updates_coalesced_within_interval(self):
+        """최소 간격 안의 연속 업데이트는 첫 값 + 마지막 값만 기록"""
+        channel = FakeChannel()
+        factory, session = _session_factory()
+        reporter = DocumentProgressReporter(
+            "doc-1", channel=channel, min_interval_ms=50, session_factory=factory
+        )
+
+        for progress in range(1, 21):
+            await reporter.update("extracting_text", progress)
+        await asyncio.sleep(0.1)
+
+        assert [s["processing_progress"] for s in channel.published] == [1, 20]
+        session.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_finish_writes_postgres_once(self):
+        """최종 상태는 대기 중인 값을 대체하고 DB에 한 번 기록"""
+        channel = FakeChannel()
+        factory, session = _session_factory()
+        reporter = DocumentProgressReporter(
+            "doc-1", channel=channel, min_interval_ms=1000, session_factory=factory
+        )
+
+        await reporter.update("extracting_text", 10)
+        await reporter.update("building_graph", 90)
+        await reporter.finish("failed", error="boom")
+        assert reporter._flush_task.cancelled()
+
+        assert session.execute.await_count == 1
+        params = session.execute.call_args.args[1]
+        assert params["status"] == "failed"
+        assert params["step"] == "building_graph"
+        assert params["progress"] == 90
+        assert params["error"] == "boom"
+        assert channel.published[-1]["status"] == "failed"
+        assert reporter.writes == 2
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_postgres_without_redis(self):
+        """Redis 장애 시 진행 상태를 DB에 기록 (병합 유지)"""
+        factory, session = _session_factory()
+        reporter = DocumentProgressReporter(
+            "doc-1", channel=FakeChannel(available=False), min_interval_ms=1000,
+            session_factory=factory
+        )
+
+        await reporter.update("downloading_pdf", 1)
+        await reporter.update("extracting_text", 10)
+
+        assert session.execute.await_count == 1
+        assert "status" not in session.execute.call_args.args[1]
+
+    def test_overlay_only_processing_rows(self):
+        """처리 중인 행에만 실시간 상태 적용"""
+        live = {"processing_step": "building_graph", "processing_progress": 90, "processing_detail": None}
+
+        assert overlay_live_progress({"status": "processing", "processing_progress": 10}, live)[
+            "processing_progress"
+        ] == 90
+        assert overlay_live_progress({"status": "completed", "processing_progress": 100}, live)[
+            "processing_progress"
+        ] == 100
@@ -0,0 +1,168 @@
+"""
+Unit tests for DocumentRepository search
+
+Korean bigram tokenization and tsquery building, the single-query total
+(COUNT(*) OVER ()), and the normalized-filter result cache.
+"""
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from app.repositories.document_repository import (
+    DocumentFilter,
+    DocumentRepository,
+    SearchResultCache,
+    build_bigram_tsquery,
+    korean_bigrams,
+)
+
+
+class FakeCursor:
+    def __init__(self, manager):
+        self.manager = manager
+        self.rowcount = 1
+
+    def execute(self, query, params=None):
+        self.manager.executed.append((" ".join(query.split()), params))
+
+    def fetchall(self):
+        return [] if self.manager.offset_past_end else self.manager.rows[:1]
+
+    def fetchone(self):
+        return (self.manager.count,)
+
+
+class FakeConnection:
+    def __init__(self, manager):
+        self.manager = manager
+
+    def cursor(self, cursor_factory=None):
+        return FakeCursor(self.manager)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+class FakeManager:
+    """psycopg2 pool stand-in recording executed SQL"""
+
+    def __init__(self):
+        self.executed = []
+        self.rows = [{
+            "id": uuid4(), "policy_name": "무배당 암보험", "insurer": "KB손해보험",
+            "created_at": datetime(2026, 1, 1), "relevance": 0.5, "total_count": 42,
+        }]
+        self.offset_past_end = False
+        self.count = 42
+
+    def get_connection(self):
+        return FakeConnection(self)
+
+    def return_connection(self, conn):
+        pass
+
+
+@pytest.fixture
+def manager():
+    return FakeManager()
+
+
+class TestBigramTokenizer:
+    """Test suite for korean_bigrams / build_bigram_tsquery"""
+
+    def test_compound_noun_matches_spaced_form(self):
+        assert korean_bigrams("암진단비") == ["암진", "진단", "단비"]
+        assert korean_bigrams("암 진단비") == korean_bigrams("암진단비")
+
+    def test_mixed_scripts(self):
+        assert korean_bigrams("KB 암보험 2형, C00") == ["kb", "암보", "보험", "2", "형", "c00"]
+
+    def test_tsquery_requires_all_bigrams_per_word(self):
+        assert build_bigram_tsquery("암진단비 진단") == "'암진' & '진단' & '단비'"
+        assert build_bigram_tsquery("암 진단비") == "'암':* & '진단' & '단비'"
+
+    def test_single_syllable_is_prefix_and_empty_is_none(self):
+        assert build_bigram_tsquery("암") == "'암':*"
+        assert build_bigram_tsquery("?!") is None
+
+
+class TestSearchWithTotal:
+    """Test suite for single-query search + cache"""
+
+    def test_total_comes_from_window_count(self, manager):
+        repo = DocumentRepository(manager, search_mode="bigram")
+
+        results, total = repo.search_with_total(DocumentFilter(query="암진단비", limit=20))
+
+        assert total == 42
+        assert "total_count" not in results[0]
+        assert len(manager.executed) == 1
+        sql, params = manager.executed[0]
+        assert "COUNT(*) OVER () AS total_count" in sql
+        assert "search_bigrams @@ %(tsquery)s::tsquery" in sql
+        assert params["tsquery"] == "'암진' & '진단' & '단비'"
+
+    def test_query_without_tokens_matches_nothing(self, manager):
+        repo = DocumentRepository(manager, search_mode="bigram")
+
+        assert repo.search_with_total(DocumentFilter(query="?!")) == ([], 0)
+        assert manager.executed == []
+
+        repo.count(DocumentFilter(query="?!"))
+        assert manager.executed[0][0] == "SELECT COUNT(*) FROM documents WHERE FALSE"
+
+    def test_page_past_end_counts_separately(self, manager):
+        manager.offset_past_end = True
+        repo = DocumentRepository(manager, search_mode="simple")
+
+        results, total = repo.search_with_total(DocumentFilter(query="암", limit=20, offset=100))
+
+        assert (results, total) == ([], 42)
+        assert manager.executed[1][0].startswith("SELECT COUNT(*) FROM documents WHERE search_vector @@")
+
+    def test_equivalent_filters_share_cache_entry(self, manager):
+        repo = DocumentRepository(manager, search_mode="bigram")
+
+        first, _ = repo.search_with_total(DocumentFilter(query="암진단비", insurer="KB손해보험 "))
+        first[0]["policy_name"] = "changed"
+        second, total = repo.search_with_total(DocumentFilter(query=" 암진단비  ", insurer="KB손해보험"))
+
+        assert len(manager.executed) == 1
+        assert second[0]["policy_name"] == "무배당 암보험" and total == 42
+
+    def test_insurer_is_normalized_for_query_and_key(self, manager):
+        repo = DocumentRepository(manager, search_mode="bigram")
+
+        repo.search_with_total(DocumentFilter(query="암", insurer=" 삼성생명"))
+        repo.search_with_total(DocumentFilter(query="암", insurer="삼성생명"))
+
+        assert len(manager.executed) == 1
+        assert manager.executed[0][1]["insurer"] == "삼성생명"
+
+    def test_writes_clear_cache(self, manager):
+        repo = DocumentRepository(manager, search_mode="bigram")
+        repo.search_with_total(DocumentFilter(query="암"))
+
+        repo.delete(uuid4())
+        repo.search_with_total(DocumentFilter(query="암"))
+
+        assert sum(sql.startswith("SELECT id, policy_name") for sql, _ in manager.executed) == 2
+
+    def test_unknown_mode_is_rejected(self, manager):
+        with pytest.raises(ValueError, match="DOCUMENT_SEARCH_MODE"):
+            DocumentRepository(manager, search_mode="fuzzy")
+
+
+def test_cache_entries_expire():
+    now = [0.0]
+    cache = SearchResultCache(max_entries=2, ttl_seconds=10, clock=lambda: now[0])
+    cache.set(("a",), 1)
+
+    now[0] = 9.9
+    assert cache.get(("a",)) == 1
+    now[0] = 10.0
+    assert cache.get(("a",)) is None
@@ -0,0 +1,175 @@
+"""
+Unit tests for Execution Budget
+
+요청 단위 실행 예산, 적응형 단계 생략, 전략별 SLO 집계를 테스트합니다.
+"""
+import asyncio
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from app.models.orchestration import (
+    ExecutionStage,
+    OrchestrationConfig,
+    OrchestrationMetrics,
+    OrchestrationRequest,
+    OrchestrationStrategy,
+)
+from app.models.query import QueryAnalysisResult, QueryIntent, QueryType
+from app.models.response import AnswerFormat, GeneratedResponse
+from app.models.vector_search import SearchResponse, SearchStrategy
+from app.services.orchestration.execution_budget import (
+    ExecutionBudget,
+    remaining_seconds,
+)
+from app.services.orchestration.query_orchestrator import QueryOrchestrator
+
+
+def _analysis(query: str) -> QueryAnalysisResult:
+    return QueryAnalysisResult(
+        original_query=query,
+        intent=QueryIntent.COVERAGE_AMOUNT,
+        intent_confidence=0.9,
+        query_type=QueryType.VECTOR_SEARCH,
+    )
+
+
+def _orchestrator(search_delay: float = 0.0, seen: list = None) -> QueryOrchestrator:
+    analyzer = Mock()
+    analyzer.analyze = Mock(side_effect=_analysis)
+
+    async def search(**kwargs):
+        if seen is not None:
+            seen.append((kwargs["top_k"], remaining_seconds()))
+        await asyncio.sleep(search_delay)
+        return SearchResponse(
+            original_query=kwargs["query"],
+            strategy=SearchStrategy.HYBRID,
+            results=[],
+            total_count=0,
+            search_time_ms=1.0,
+        )
+
+    hybrid = Mock()
+    hybrid.search = AsyncMock(side_effect=search)
+    generator = Mock()
+    generator.generate = AsyncMock(
+        return_value=GeneratedResponse(
+            answer="5천만원",
+            format=AnswerFormat.TEXT,
+            confidence_score=0.9,
+            generation_time_ms=1.0,
+        )
+    )
+    return QueryOrchestrator(
+        query_analyzer=analyzer,
+        hybrid_search=hybrid,
+        response_generator=generator,
+        config=OrchestrationConfig(cache_enabled=False),
+    )
+
+
+class TestExecutionBudget:
+    """Test suite for ExecutionBudget"""
+
+    def test_strategy_limits_applied_per_request(self):
+        """전략 예산이 요청 사본에만 적용"""
+        config = OrchestrationConfig()
+        fast = ExecutionBudget.for_request(
+            OrchestrationRequest(query="q", strategy=OrchestrationStrategy.FAST), config
+        )
+        comprehensive = ExecutionBudget.for_request(
+            OrchestrationRequest(
+                query="q", strategy=OrchestrationStrategy.COMPREHENSIVE, max_search_results=5
+            ),
+            config,
+        )
+        standard = ExecutionBudget.for_request(OrchestrationRequest(query="q"), config)
+
+        assert fast.max_search_results == 5
+        assert fast.stage_timeout(ExecutionStage.SEARCH) <= 5
+        assert comprehensive.max_search_results == 20
+        assert standard.stage_timeout(ExecutionStage.SEARCH) <= config.search_timeout
+        assert config.search_timeout == 15
+
+    def test_request_timeout_shortens_deadline(self):
+        """요청 timeout_seconds가 전략 예산보다 짧으면 우선"""
+        budget = ExecutionBudget.for_request(
+            OrchestrationRequest(query="q", timeout_seconds=1), OrchestrationConfig()
+        )
+
+        assert budget.total_seconds == 1
+        assert budget.stage_timeout(ExecutionStage.SEARCH) <= 1
+
+    def test_should_skip_when_remaining_too_small(self):
+        """남은 예산이 최소 예산보다 작으면 단계 생략"""
+        budget = ExecutionBudget.for_request(
+            OrchestrationRequest(query="q", strategy=OrchestrationStrategy.FAST),
+            OrchestrationConfig(),
+        )
+        assert not budget.should_skip(ExecutionStage.SEARCH)
+
+        budget.started_at -= budget.total_seconds
+        assert budget.should_skip(ExecutionStage.SEARCH)
+        assert budget.stage_timeout(ExecutionStage.SEARCH) == 0.0
+
+
+class TestOrchestratorBudgets:
+    """QueryOrchestrator 예산 통합"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_strategies_do_not_interfere(self):
+        """FAST/STANDARD 동시 실행 시 공유 설정 불변, 요청별 결과 수 유지"""
+        seen = []
+        orchestrator = _orchestrator(search_delay=0.01, seen=seen)
+
+        await asyncio.gather(
+            orchestrator.process(
+                OrchestrationRequest(query="a", strategy=OrchestrationStrategy.FAST)
+            ),
+            orchestrator.process(OrchestrationRequest(query="b")),
+        )
+
+        assert sorted(top_k for top_k, _ in seen) == [5, 10]
+        assert all(remaining is not None for _, remaining in seen)
+        assert orchestrator.config.search_timeout == 15
+        assert orchestrator.config.response_generation_timeout == 10
+
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_skips_generation(self):
+        """검색이 예산을 소진하면 응답 생성 단계 생략"""
+        orchestrator = _orchestrator(search_delay=0.3)
+        orchestrator.config.strategy_budgets["fast"] = orchestrator.config.strategy_budgets[
+            "fast"
+        ].model_copy(
+            update={"total_seconds": 0.4, "min_search_seconds": 0.1, "min_generation_seconds": 0.2}
+        )
+
+        response = await orchestrator.process(
+            OrchestrationRequest(query="a", strategy=OrchestrationStrategy.FAST)
+        )
+
+        assert response.metrics.skipped_stages == [ExecutionStage.RESPONSE_GENERATION]
+        orchestrator.response_generator.generate.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_slo_stats_per_strategy(self):
+        """전략별 SLO 통계"""
+        orchestrator = _orchestrator()
+
+        response = await orchestrator.process(
+            OrchestrationRequest(query="a", strategy=OrchestrationStrategy.FAST)
+        )
+        await orchestrator.process(OrchestrationRequest(query="b"))
+
+        assert response.metrics.slo_target_ms == 3000
+        assert response.metrics.slo_met is True
+        stats = orchestrator.get_slo_stats()
+        assert stats["fast"]["count"] == 1
+        assert stats["standard"]["attainment"] == 1.0
+
+    def test_metrics_record_slo(self):
+        """OrchestrationMetrics SLO 판정"""
+        metrics = OrchestrationMetrics(total_duration_ms=4000.0)
+        metrics.record_slo(3000)
+
+        assert metrics.slo_met is False
@@ -0,0 +1,70 @@
+"""
+Unit tests for Extraction Artifact Cache
+
+내용 해시 + 추출기 버전 기반 추출/파싱 결과 캐시를 테스트합니다.
+"""
+import pytest
+
+from app.services.extraction_artifact_cache import (
+    ExtractionArtifactCache,
+    compute_page_offsets,
+    sha256_text,
+)
+from app.services.legal_structure_parser import LegalStructureParser
+
+
+SAMPLE_TEXT = """제1조 [목적]
+① 이 약관은 보험금 지급에 관한 사항을 정합니다.
+1. 암 진단비
+2. 입원비
+
+제2조 [용어의 정의]
+① 암이란 한국표준질병사인분류에 따른 질병을 말합니다.
+"""
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ExtractionArtifactCache(root=str(tmp_path))
+
+
+class TestExtractionArtifactCache:
+    """Test suite for ExtractionArtifactCache"""
+
+    def test_roundtrip_keyed_by_version_and_options(self, cache):
+        """추출기 버전/옵션이 다르면 미스"""
+        sha = "ab" * 32
+        cache.put(sha, "upstage", "1", {"text": "암 진단비", "total_pages": 1}, {"tables": True})
+
+        assert cache.get(sha, "upstage", "1", {"tables": True})["text"] == "암 진단비"
+        assert cache.get(sha, "upstage", "2", {"tables": True}) is None
+        assert cache.get(sha, "upstage", "1", {"tables": False}) is None
+        assert cache.stats == {"hits": 1, "misses": 2, "writes": 1}
+
+        assert cache.invalidate(sha, "upstage") == 1
+        assert cache.get(sha, "upstage", "1", {"tables": True}) is None
+
+    def test_page_offsets(self):
+        """페이지 시작 오프셋"""
+        pages = ["가나다", "라마", "바"]
+        text = "\n\n".join(pages)
+        offsets = compute_page_offsets(pages, "\n\n")
+
+        assert offsets == [0, 5, 9]
+        assert [text[o:o + len(p)] for o, p in zip(offsets, pages)] == pages
+
+
+class TestLegalParserCache:
+    """LegalStructureParser 파싱 결과 캐시"""
+
+    def test_parsed_document_served_from_cache(self, cache):
+        """두 번째 파싱은 캐시에서 동일 구조 복원"""
+        parser = LegalStructureParser(cache=cache)
+
+        first = parser.parse_text(SAMPLE_TEXT)
+        second = parser.parse_text(SAMPLE_TEXT)
+
+        assert cache.stats["hits"] == 1
+        assert second.to_dict() == first.to_dict()
+        assert second.total_articles == 2
+        assert cache.get(sha256_text(SAMPLE_TEXT), "legal_structure", "1") is not None
@@ -0,0 +1,122 @@
+"""
+Unit tests for FPCustomerLoader
+
+페이지당 고정 쿼리 수, 고객별 상세 묶음, keyset 커서, 경량 모드를 테스트합니다.
+"""
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.services.fp_customer_loader import (
+    CustomerFilter,
+    FPCustomerLoader,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+class FakeRow:
+    def __init__(self, mapping):
+        self._mapping = mapping
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def fetchall(self):
+        return [FakeRow(row) for row in self._rows]
+
+
+class FakeSession:
+    """SQL 앞부분으로 테이블을 판별해 미리 준비한 행을 돌려주는 세션"""
+
+    def __init__(self, customers, consultations, products):
+        self.tables = {
+            "fp_customers": customers,
+            "fp_consultations": consultations,
+            "fp_customer_products": products,
+        }
+        self.calls = []
+
+    async def execute(self, statement, params):
+        sql = str(statement)
+        self.calls.append((sql, params))
+        if "FROM fp_customers c" in sql:
+            rows = self.tables["fp_customers"]
+            return FakeResult(rows[: params["limit"]] if "limit" in params else rows)
+        table = "fp_consultations" if "FROM fp_consultations" in sql else "fp_customer_products"
+        return FakeResult([r for r in self.tables[table] if r["customer_id"] in params["ids"]])
+
+
+@pytest.fixture
+def session():
+    now = datetime(2026, 1, 1, 12, 0, 0)
+    customers = [
+        {"id": uuid4(), "name": f"고객{i}", "created_at": now - timedelta(days=i),
+         "consultation_count": 0, "product_count": 0, "last_contact_date": None}
+        for i in range(5)
+    ]
+    consultations = [
+        {"id": uuid4(), "customer_id": customers[0]["id"], "subject": "a"},
+        {"id": uuid4(), "customer_id": customers[0]["id"], "subject": "b"},
+        {"id": uuid4(), "customer_id": customers[2]["id"], "subject": "c"},
+    ]
+    products = [{"id": uuid4(), "customer_id": customers[1]["id"], "product_name": "종신"}]
+    return FakeSession(customers, consultations, products)
+
+
+class TestFPCustomerLoader:
+    """Test suite for FPCustomerLoader"""
+
+    @pytest.mark.asyncio
+    async def test_details_load_in_constant_queries(self, session):
+        page = await FPCustomerLoader(session).load_page("user_1")
+
+        assert len(session.calls) == 3
+        assert len(session.calls[1][1]["ids"]) == 5
+        assert [c["subject"] for c in page.customers[0]["consultations"]] == ["a", "b"]
+        assert page.customers[1]["products"][0]["product_name"] == "종신"
+        assert page.customers[3]["consultations"] == [] and page.customers[3]["products"] == []
+        assert page.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_lightweight_mode_skips_detail_queries(self, session):
+        page = await FPCustomerLoader(session).load_page("user_1", include_details=False)
+
+        assert len(session.calls) == 1
+        assert all(c["consultations"] == [] and c["products"] == [] for c in page.customers)
+
+    @pytest.mark.asyncio
+    async def test_limit_returns_cursor_of_last_row(self, session):
+        page = await FPCustomerLoader(session).load_page("user_1", limit=2)
+
+        assert session.calls[0][1]["limit"] == 3
+        assert len(page.customers) == 2
+        assert decode_cursor(page.next_cursor) == (
+            page.customers[1]["created_at"], page.customers[1]["id"]
+        )
+        assert session.calls[1][1]["ids"] == [c["id"] for c in page.customers]
+
+
+class TestPageQuery:
+    """Test suite for page query building and cursors"""
+
+    def test_cursor_adds_keyset_condition(self):
+        created_at, customer_id = datetime(2026, 1, 1, 9, 30), uuid4()
+        cursor = encode_cursor(created_at, customer_id)
+
+        query, params = FPCustomerLoader.build_page_query(
+            "user_1", CustomerFilter(status="active", tags=["VIP"]), limit=20, cursor=cursor
+        )
+
+        assert "(c.created_at, c.id) < (:cursor_created_at, :cursor_id)" in query
+        assert "ORDER BY c.created_at DESC, c.id DESC" in query
+        assert params["cursor_created_at"] == created_at and params["cursor_id"] == customer_id
+        assert params["status"] == "active" and params["tags"] == ["VIP"]
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor(datetime(2026, 1, 1), "x")])
+    def test_invalid_cursor_is_rejected(self, cursor):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            FPCustomerLoader.build_page_query("user_1", CustomerFilter(), cursor=cursor)
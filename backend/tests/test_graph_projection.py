@@ -0,0 +1,139 @@
+"""
+Unit tests for Graph Projection
+
+CSR 그래프 투영의 BFS / k-hop / 최단 경로 및 증분 갱신을 테스트합니다.
+"""
+import pytest
+from unittest.mock import Mock, MagicMock
+
+from app.services.graph_projection import GraphProjection
+from app.services.graph_traversal import GraphTraversal
+
+
+@pytest.fixture
+def projection():
+    """Small policy graph with a document hub node"""
+    proj = GraphProjection(degree_cap=100, compact_threshold=3)
+    proj.build(
+        edges=[
+            ("a1", "p1", "HAS_PARAGRAPH"),
+            ("p1", "amt", "MENTIONS"),
+            ("a2", "p2", "HAS_PARAGRAPH"),
+            ("p2", "amt", "MENTIONS"),
+            ("a3", "p3", "HAS_PARAGRAPH"),
+            ("hub", "a1", "in_same_document"),
+            ("hub", "a2", "in_same_document"),
+            ("hub", "a3", "in_same_document"),
+        ],
+        node_labels={
+            "a1": "Article", "a2": "Article", "a3": "Article",
+            "p1": "Paragraph", "p2": "Paragraph", "p3": "Paragraph",
+            "amt": "Amount", "hub": "Document",
+        },
+        source="memory",
+    )
+    return proj
+
+
+class TestGraphProjection:
+    """Test suite for GraphProjection"""
+
+    def test_shortest_path(self, projection):
+        """최단 경로 탐색"""
+        path = projection.shortest_path("a1", "a2", max_depth=4, rel_types=["HAS_PARAGRAPH", "MENTIONS"])
+
+        assert path.node_ids == ["a1", "p1", "amt", "p2", "a2"]
+        assert path.relationships == ["HAS_PARAGRAPH", "MENTIONS", "MENTIONS", "HAS_PARAGRAPH"]
+        assert path.length == 4
+
+    def test_shortest_path_respects_max_depth(self, projection):
+        """max_depth 초과 시 None"""
+        assert projection.shortest_path("p1", "p3", max_depth=1) is None
+        assert projection.shortest_path("a1", "unknown") is None
+
+    def test_k_hop_direction_and_label(self, projection):
+        """k-hop 이웃 (방향, 라벨 필터)"""
+        assert projection.k_hop(["a1"], 1, direction="out") == {"p1": 1}
+        assert projection.k_hop(["amt"], 2, direction="in", label="Article") == {"a1": 2, "a2": 2}
+
+    def test_degree_cap_limits_hub_expansion(self, projection):
+        """허브 노드는 degree cap 만큼만 확장"""
+        capped = projection.k_hop(["hub"], 1, direction="out", degree_cap=2)
+        uncapped = projection.k_hop(["hub"], 1, direction="out", degree_cap=0)
+
+        assert len(capped) == 2
+        assert len(uncapped) == 3
+
+    def test_bfs_paths_to_articles(self, projection):
+        """BFS 트리 경로 (Article 대상)"""
+        paths = projection.bfs_paths("amt", max_depth=2, direction="in", target_label="Article")
+
+        assert sorted(p.node_ids[-1] for p in paths) == ["a1", "a2"]
+        assert all(p.node_ids[0] == "amt" for p in paths)
+
+    def test_incremental_add_and_compaction(self, projection):
+        """증분 간선 추가 후 delta compaction"""
+        projection.add_edges([("p3", "amt", "MENTIONS")], node_labels={})
+        stats = projection.get_stats()
+        assert stats.delta_edges == 1
+        assert projection.shortest_path("a3", "amt").node_ids == ["a3", "p3", "amt"]
+
+        projection.add_edges([("a4", "p4", "MENTIONS"), ("p4", "x", "MENTIONS")], node_labels={"a4": "Article"})
+        stats = projection.get_stats()
+        assert stats.delta_edges == 0
+        assert stats.edges_by_type["MENTIONS"] == 5
+        assert projection.node_label("a4") == "Article"
+        assert projection.k_hop(["a4"], 2) == {"p4": 1, "x": 2}
+
+    @staticmethod
+    def _marker_driver(marker):
+        """Neo4j stand-in answering the change-marker queries"""
+        def run(query, **params):
+            result = MagicMock()
+            if "GraphVersion" in query:
+                result.single.return_value = {"version": marker["version"]}
+            else:
+                result.single.return_value = {"c": marker["count"]}
+            return result
+
+        driver = MagicMock()
+        driver.session.return_value.__enter__.return_value.run.side_effect = run
+        return driver
+
+    def test_refresh_if_stale_rebuilds_in_background_on_version_change(self, projection):
+        """TTL 경과 후 그래프 버전이 바뀌면 (관계 수가 같아도) 백그라운드에서 재빌드"""
+        marker = {"version": 3, "count": 9}
+        driver = self._marker_driver(marker)
+        projection.watermark = (3, 9)
+        projection.load_from_neo4j = Mock()
+
+        assert not projection.refresh_if_stale(driver, max_age_seconds=60)
+        projection.last_refresh_at -= 61
+        assert projection.refresh_if_stale(driver, max_age_seconds=60)
+        projection._refresh_thread.join()
+        projection.load_from_neo4j.assert_not_called()
+
+        marker["version"] = 4  # edges deleted and recreated, same count
+        projection.last_refresh_at -= 61
+        assert projection.refresh_if_stale(driver, max_age_seconds=60)
+        projection._refresh_thread.join()
+        projection.load_from_neo4j.assert_called_once_with(driver, 50_000)
+
+
+class TestGraphTraversalWithProjection:
+    """GraphTraversal이 투영을 사용하는지 테스트"""
+
+    def test_find_related_articles_uses_projection(self, projection):
+        """투영 경로 + 단일 hydrate 쿼리"""
+        projection.source = "neo4j"
+        traversal = GraphTraversal.__new__(GraphTraversal)
+        traversal.projection = projection
+        traversal.driver = MagicMock()
+        session = traversal.driver.session.return_value.__enter__.return_value
+        session.run.return_value = []
+
+        result = traversal.find_related_articles("a1", relation_types=["HAS_PARAGRAPH", "MENTIONS"], max_hops=4)
+
+        assert result.metadata["source"] == "projection"
+        assert [n.node_id for n in result.paths[0].nodes] == ["a1", "p1", "amt", "p2", "a2"]
+        assert session.run.call_count == 0  # no element ids to hydrate in a memory-built projection
@@ -0,0 +1,197 @@
+"""
+Unit tests for Graph Snapshot
+
+증분 그래프 스냅샷(문서별 소유권, delta 로그, compaction, ETag 엔드포인트)을 테스트합니다.
+"""
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1.endpoints import graph as graph_endpoint
+from app.services.graph_snapshot import (
+    GraphDelta,
+    GraphSnapshotBuilder,
+    GraphSnapshotStore,
+)
+
+
+def _doc(doc_id, insurer="삼성생명", product_type="종신보험", status="completed"):
+    return {
+        "id": doc_id,
+        "insurer": insurer,
+        "product_type": product_type,
+        "title": f"문서 {doc_id}",
+        "status": status,
+        "updated_at": datetime(2025, 1, 1),
+    }
+
+
+def _entity(entity_id, document_id):
+    return {
+        "entity_id": entity_id,
+        "label": "암 진단비",
+        "type": "coverage_item",
+        "description": None,
+        "source_text": None,
+        "document_id": document_id,
+        "insurer": "삼성생명",
+        "product_type": "종신보험",
+    }
+
+
+class FakeSession:
+    """쿼리 종류별로 미리 정한 행을 돌려주는 AsyncSession 대역"""
+
+    def __init__(self, tables):
+        self.tables = tables
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        result = MagicMock()
+        if "SELECT NOW()" in sql:
+            result.scalar.return_value = datetime(2025, 1, 2)
+            return result
+        if "SELECT EXISTS" in sql:
+            result.scalar.return_value = self.tables.get("global_changed", False)
+            return result
+        if "FROM knowledge_entities" in sql and "crawler_documents" not in sql:
+            rows = self.tables["entities"]
+        elif "FROM knowledge_relationships" in sql and "crawler_documents" not in sql:
+            rows = self.tables["relationships"]
+        else:
+            rows = self.tables["documents"]
+        result.fetchall.return_value = [MagicMock(_mapping=row) for row in rows]
+        return result
+
+
+@pytest.fixture
+def store(tmp_path):
+    return GraphSnapshotStore(root=str(tmp_path), compact_every=3)
+
+
+class TestGraphSnapshotBuilder:
+    """Test suite for GraphSnapshotBuilder"""
+
+    @pytest.mark.asyncio
+    async def test_refresh_applies_only_changed_documents(self, store):
+        """두 번째 갱신은 변경 문서의 차이만 delta로 기록"""
+        tables = {
+            "documents": [_doc("d1"), _doc("d2")],
+            "entities": [_entity("e1", "d1")],
+            "relationships": [],
+        }
+        builder = GraphSnapshotBuilder(store=store, session_factory=lambda: FakeSession(tables))
+
+        await builder.build_full()
+        assert {"insurer_삼성생명", "doc_d1", "doc_d2", "e1"} <= set(builder.snapshot.nodes)
+
+        # d2가 재처리로 completed에서 벗어남, d3 새로 완료
+        tables["documents"] = [_doc("d2", status="pending"), _doc("d3", product_type="정기보험")]
+        tables["entities"] = []
+        delta = await builder.refresh(document_ids=["d3"])
+
+        assert delta.seq == 1
+        assert delta.remove_nodes == ["doc_d2"]
+        assert {n["id"] for n in delta.upsert_nodes} == {
+            "type_삼성생명_정기보험", "doc_d3"
+        }
+        # 공유 노드(보험사)는 유지, 변경 없는 d1은 delta에 없음
+        assert "insurer_삼성생명" in builder.snapshot.nodes
+        assert "e1" in builder.snapshot.nodes
+        assert builder.snapshot.metadata["total_documents"] == 2
+
+        assert (await builder.refresh()).is_empty()
+
+    @pytest.mark.asyncio
+    async def test_refresh_applies_changed_global_entities(self, store):
+        """문서 없는 엔티티가 바뀌면 GLOBAL_OWNER 기여분을 교체"""
+        tables = {
+            "documents": [_doc("d1")],
+            "entities": [_entity("g1", None)],
+            "relationships": [],
+        }
+        builder = GraphSnapshotBuilder(store=store, session_factory=lambda: FakeSession(tables))
+        await builder.build_full()
+
+        tables["documents"] = []
+        tables["entities"] = [_entity("g2", None)]
+        tables["global_changed"] = True
+        delta = await builder.refresh()
+
+        assert [n["id"] for n in delta.upsert_nodes] == ["g2"]
+        assert delta.remove_nodes == ["g1"]
+        assert "doc_d1" in builder.snapshot.nodes
+
+    def test_shared_node_removed_with_last_owner(self):
+        """공유 노드는 마지막 소유 문서가 빠질 때만 제거"""
+        builder = GraphSnapshotBuilder(store=MagicMock(), session_factory=MagicMock())
+
+        for doc_id in ("d1", "d2"):
+            nodes, edges = builder.document_contribution(_doc(doc_id), [], [])
+            builder.apply_owner(doc_id, nodes, edges, GraphDelta())
+
+        first = GraphDelta()
+        builder.apply_owner("d1", None, None, first)
+        assert "type_삼성생명_종신보험" not in first.remove_nodes
+
+        second = GraphDelta()
+        builder.apply_owner("d2", None, None, second)
+        assert "type_삼성생명_종신보험" in second.remove_nodes
+        assert builder.snapshot.nodes == {}
+
+
+class TestGraphSnapshotStore:
+    """base + delta 로그 저장/재생"""
+
+    @pytest.mark.asyncio
+    async def test_reader_replays_deltas_and_compacts(self, store, tmp_path):
+        """reader는 새 delta만 재생, compaction 후에도 같은 결과"""
+        tables = {"documents": [_doc("d1")], "entities": [], "relationships": []}
+        builder = GraphSnapshotBuilder(store=store, session_factory=lambda: FakeSession(tables))
+        await builder.build_full()
+
+        reader = GraphSnapshotStore(root=str(tmp_path))
+        assert set(reader.load().nodes) == set(builder.snapshot.nodes)
+
+        for i in range(2, 6):
+            tables["documents"] = [_doc(f"d{i}")]
+            await builder.refresh()
+            loaded = reader.load()
+            assert set(loaded.nodes) == set(builder.snapshot.nodes)
+            assert loaded.etag == builder.snapshot.etag
+
+        # compact_every=3 → 네 번째 delta 전에 base 재작성
+        assert store.delta_path.read_text().count("\n") < 4
+
+
+class TestGraphSnapshotEndpoint:
+    """GET /graph/snapshot ETag"""
+
+    @pytest.mark.asyncio
+    async def test_etag_not_modified(self, store, monkeypatch):
+        tables = {"documents": [_doc("d1")], "entities": [], "relationships": []}
+        await GraphSnapshotBuilder(
+            store=store, session_factory=lambda: FakeSession(tables)
+        ).build_full()
+        monkeypatch.setattr(graph_endpoint, "get_graph_snapshot_store", lambda: store)
+
+        app = FastAPI()
+        app.include_router(graph_endpoint.router)
+        client = TestClient(app)
+
+        first = client.get("/graph/snapshot")
+        assert first.status_code == 200
+        assert len(first.json()["nodes"]) == 3
+
+        second = client.get("/graph/snapshot", headers={"If-None-Match": first.headers["etag"]})
+        assert second.status_code == 304
+        assert second.content == b""
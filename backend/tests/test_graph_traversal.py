@@ -0,0 +1,117 @@
+"""
+Unit tests for GraphTraversal batch APIs
+
+다중 시작 노드 배치 탐색이 단건 탐색과 같은 경로를 시작 노드별로 묶는지,
+중복/공유 경로(역방향 포함)를 제거하는지 테스트합니다.
+"""
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.graph_traversal import GraphTraversal
+
+
+class FakeNode(dict):
+    def __init__(self, node_id, label):
+        super().__init__(id=node_id, text=node_id)
+        self.labels = {label}
+
+
+def _path(*steps):
+    """_path(("a1", "Article"), "HAS_PARAGRAPH", ("p1", "Paragraph"), ...)"""
+    return SimpleNamespace(
+        nodes=[FakeNode(*step) for step in steps[::2]],
+        relationships=[SimpleNamespace(type=rel) for rel in steps[1::2]],
+    )
+
+
+A1, A2, A3 = ("a1", "Article"), ("a2", "Article"), ("a3", "Article")
+P1, P2 = ("p1", "Paragraph"), ("p2", "Paragraph")
+AMT = ("amt", "Amount")
+
+# Paths Neo4j returns per start node (same for single and batch queries)
+PATHS = {
+    "a1": [_path(A1, "HAS_PARAGRAPH", P1), _path(A1, "MENTIONS", AMT, "MENTIONS", A2)],
+    "a2": [_path(A2, "HAS_PARAGRAPH", P2), _path(A2, "MENTIONS", AMT, "MENTIONS", A1)],
+    "a3": [],
+    "p1": [],
+}
+
+
+class FakeSession:
+    def __init__(self, queries):
+        self.queries = queries
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def run(self, query, **params):
+        self.queries.append((" ".join(query.split()), params))
+        if "start_ids" in params:
+            return [
+                {"start_id": start_id, "path": path}
+                for start_id in params["start_ids"]
+                for path in PATHS[start_id]
+            ]
+        start_id = params.get("start_id") or params.get("article_id")
+        return [{"path": path} for path in PATHS[start_id]]
+
+
+@pytest.fixture
+def traversal():
+    instance = GraphTraversal.__new__(GraphTraversal)
+    instance.max_depth = 3
+    instance.projection = None
+    instance.queries = []
+    instance.driver = MagicMock()
+    instance.driver.session.side_effect = lambda: FakeSession(instance.queries)
+    return instance
+
+
+def _signatures(result):
+    return [[node.node_id for node in path.nodes] for path in result.paths]
+
+
+class TestBatchTraversal:
+    """Test suite for traverse_hierarchical_batch / find_related_articles_batch"""
+
+    def test_hierarchical_batch_matches_single_queries(self, traversal):
+        ids = ["a1", "a3", "a1"]
+
+        batch = traversal.traverse_hierarchical_batch(ids, dedupe_shared=False)
+
+        assert batch.start_node_ids == ["a1", "a3"]
+        for start_id in ("a1", "a3"):
+            single = traversal.traverse_hierarchical(start_id)
+            assert _signatures(batch.results[start_id]) == _signatures(single)
+        assert batch.total_paths == 2
+
+    def test_batch_uses_one_labelled_query(self, traversal):
+        traversal.traverse_hierarchical_batch(["a1", "p1"])
+
+        assert len(traversal.queries) == 1
+        sql, params = traversal.queries[0]
+        assert params["start_ids"] == ["a1", "p1"]
+        assert "MATCH (start {id" not in sql
+        for label in ("Article", "Paragraph", "Subclause"):
+            assert f"MATCH (start:{label} {{id: start_id}})" in sql
+
+    def test_related_batch_drops_reversed_paths(self, traversal):
+        batch = traversal.find_related_articles_batch(["a1", "a2"], max_hops=2)
+
+        assert _signatures(batch.results["a1"]) == [["a1", "p1"], ["a1", "amt", "a2"]]
+        # a2 → amt → a1 is a1 → amt → a2 read backwards
+        assert _signatures(batch.results["a2"]) == [["a2", "p2"]]
+        assert batch.metadata["deduplicated_paths"] == 1
+
+    def test_related_batch_without_dedupe_matches_single_queries(self, traversal):
+        batch = traversal.find_related_articles_batch(["a1", "a2"], dedupe_shared=False)
+
+        for start_id in ("a1", "a2"):
+            single = traversal.find_related_articles(start_id)
+            assert _signatures(batch.results[start_id]) == _signatures(single)
+        assert [len(p.nodes) for p in batch.all_paths()] == [2, 3, 2, 3]
@@ -0,0 +1,177 @@
+"""
+Unit tests for concurrent GraphRAG entity extraction
+
+적응형 동시성 제한, 순서 보존 병합, 청크별 재시도, 짧은 청크 묶음 추출을 테스트합니다.
+"""
+import asyncio
+import json
+import re
+import pytest
+
+from app.services.learning.adaptive_concurrency import AdaptiveConcurrencyLimiter
+from app.services.learning.graphrag_entity_extractor import GraphRAGEntityExtractor
+from app.services.llm_gateway import LLMGateway, LLMRateLimitError, StubProvider
+
+
+DOCUMENT_INFO = {"insurer": "테스트생명", "product_type": "종신", "title": "테스트 약관"}
+
+
+def _single_payload(prompt):
+    label = re.search(r"CHUNK-(\d+)", prompt).group(0)
+    return {
+        "entities": [
+            {"id": "a", "label": label, "type": "coverage_item"},
+            {"id": "b", "label": "1억원", "type": "benefit_amount"},
+        ],
+        "relationships": [{"source_id": "a", "target_id": "b", "type": "has_amount"}],
+    }
+
+
+class FakeModel:
+    def __init__(self, delay=0.02, fail_first=0, drop_packed_index=None):
+        self.delay = delay
+        self.fail_first = fail_first
+        self.drop_packed_index = drop_packed_index
+        self.calls = 0
+        self.running = 0
+        self.peak = 0
+
+    async def __call__(self, request):
+        self.calls += 1
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail_first > 0:
+                self.fail_first -= 1
+                raise LLMRateLimitError("rate limited", "anthropic", 429)
+            prompt = request.prompt
+            if '<chunk id="' in prompt:
+                texts = re.findall(r'<chunk id="(\d+)">\n(.*?)\n</chunk>', prompt, re.S)
+                return json.dumps({
+                    "chunks": [
+                        {"chunk": int(index), **_single_payload(text)}
+                        for index, text in texts
+                        if int(index) != self.drop_packed_index
+                    ]
+                }, ensure_ascii=False)
+            return json.dumps(_single_payload(prompt), ensure_ascii=False)
+        finally:
+            self.running -= 1
+
+
+def _extractor(messages, **kwargs):
+    gateway = LLMGateway(
+        providers={"anthropic": StubProvider("anthropic", handler=messages)},
+        requests_per_second=0,
+    )
+    return GraphRAGEntityExtractor(gateway=gateway, **kwargs)
+
+
+def _chunks(count, size=200):
+    return [
+        {"id": f"c{i}", "text": f"CHUNK-{i} " + "보장 내용 " * (size // 6)}
+        for i in range(count)
+    ]
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test suite for AdaptiveConcurrencyLimiter"""
+
+    @pytest.mark.asyncio
+    async def test_throttle_halves_and_success_grows(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=8, max_limit=8, decrease_cooldown_seconds=0)
+
+        await limiter.acquire()
+        await limiter.release(0.1, throttled=True)
+        assert limiter.limit == 4
+
+        for _ in range(4):
+            await limiter.acquire()
+            await limiter.release(0.1)
+        assert limiter.limit == 5
+
+    @pytest.mark.asyncio
+    async def test_slow_responses_decrease_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(
+            initial=4, latency_target_seconds=1.0, decrease_cooldown_seconds=0
+        )
+
+        await limiter.acquire()
+        await limiter.release(2.0)
+
+        assert limiter.limit == 3
+
+
+class TestExtractFromChunks:
+    """Test suite for concurrent extract_from_chunks"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_and_ordered(self):
+        messages = FakeModel()
+        extractor = _extractor(messages, max_concurrency=4, pack_max_chars=0)
+
+        result = await extractor.extract_from_chunks(_chunks(12), DOCUMENT_INFO)
+
+        assert messages.calls == 12
+        assert 1 < messages.peak <= 4
+        labels = [e["label"] for e in result["entities"] if e["type"] == "coverage_item"]
+        assert labels == [f"CHUNK-{i}" for i in range(12)]
+        assert result["entity_type_counts"] == {"coverage_item": 12, "benefit_amount": 12}
+        assert result["relationship_type_counts"] == {"has_amount": 12}
+        assert result["total_tokens_used"] > 0
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_chunk_is_retried(self, monkeypatch):
+        monkeypatch.setattr(
+            "app.services.learning.graphrag_entity_extractor.random.random", lambda: 0.0
+        )
+        original_sleep = asyncio.sleep
+        monkeypatch.setattr(
+            "app.services.learning.graphrag_entity_extractor.asyncio.sleep",
+            lambda delay: original_sleep(0),
+        )
+        messages = FakeModel(fail_first=1)
+        extractor = _extractor(messages, max_concurrency=1, pack_max_chars=0)
+
+        result = await extractor.extract_from_chunks(_chunks(1), DOCUMENT_INFO)
+
+        assert messages.calls == 2
+        assert result["total_entity_count"] == 2
+        assert extractor.limiter.throttled_count == 1
+
+    @pytest.mark.asyncio
+    async def test_small_chunks_packed_and_split(self):
+        messages = FakeModel()
+        extractor = _extractor(messages, max_concurrency=4, pack_max_chars=2000)
+
+        result = await extractor.extract_from_chunks(_chunks(6, size=200), DOCUMENT_INFO)
+
+        assert result["requests_made"] < 6
+        assert messages.calls == result["requests_made"]
+        assert [e["chunk_id"] for e in result["entities"][::2]] == [f"c{i}" for i in range(6)]
+        assert result["relationships"][3]["chunk_id"] == "c3"
+
+    @pytest.mark.asyncio
+    async def test_chunk_missing_from_packed_response_is_reextracted(self):
+        messages = FakeModel(drop_packed_index=1)
+        extractor = _extractor(messages, max_concurrency=2, pack_max_chars=2000)
+
+        result = await extractor.extract_from_chunks(_chunks(3, size=200), DOCUMENT_INFO)
+
+        assert messages.calls == 2
+        labels = [e["label"] for e in result["entities"] if e["type"] == "coverage_item"]
+        assert labels == ["CHUNK-0", "CHUNK-1", "CHUNK-2"]
+
+    @pytest.mark.asyncio
+    async def test_short_chunks_skipped_without_request(self):
+        messages = FakeModel()
+        extractor = _extractor(messages)
+
+        result = await extractor.extract_from_chunks(
+            [{"id": "short", "text": "짧음"}], DOCUMENT_INFO
+        )
+
+        assert messages.calls == 0
+        assert result["chunks_processed"] == 1
+        assert result["total_entity_count"] == 0
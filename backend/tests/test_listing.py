@@ -0,0 +1,179 @@
+"""
+Unit tests for listing helpers
+
+검색 패턴 이스케이프, 커서 인코딩, keyset 조건, 건수 모드(exact/auto/none),
+query_history 목록의 커서 페이지네이션을 테스트합니다.
+"""
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.v1.endpoints.query_history import list_query_history
+from app.core.listing import (
+    SortKey,
+    count_rows,
+    cursor_for_row,
+    decode_cursor,
+    encode_cursor,
+    keyset_condition,
+    like_pattern,
+    order_by_clause,
+)
+
+
+SORT_KEYS = (
+    SortKey("c.last_contact_date", "last_contact_date", null_fill="'-infinity'::timestamp", value_type=datetime),
+    SortKey("c.id", "id", value_type=UUID),
+)
+
+
+class FakeResult:
+    def __init__(self, rows=None, scalar=None):
+        self._rows = rows or []
+        self._scalar = scalar
+
+    def scalar(self):
+        return self._scalar
+
+    def fetchall(self):
+        return [SimpleNamespace(_mapping=row) for row in self._rows]
+
+
+class FakeSession:
+    def __init__(self, estimate=0, count=0, rows=None):
+        self.estimate = estimate
+        self.count = count
+        self.rows = rows or []
+        self.statements = []
+
+    async def execute(self, statement, params=None):
+        sql = " ".join(str(statement).split())
+        self.statements.append((sql, params))
+        if sql.startswith("EXPLAIN"):
+            return FakeResult(scalar=json.dumps([{"Plan": {"Plan Rows": self.estimate}}]))
+        if sql.startswith("SELECT COUNT(*)"):
+            return FakeResult(scalar=self.count)
+        return FakeResult(rows=self.rows[: params["limit"]])
+
+
+class TestSearchAndCursor:
+    """Test suite for like_pattern and cursors"""
+
+    def test_like_pattern_escapes_wildcards(self):
+        assert like_pattern("100%_a\\b") == "%100\\%\\_a\\\\b%"
+
+    def test_cursor_round_trip_keeps_types(self):
+        values = [datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc), uuid4(), None, 7]
+
+        assert decode_cursor(encode_cursor(values)) == values
+
+    @pytest.mark.parametrize("cursor", [
+        "%%%",
+        encode_cursor([1]),
+        encode_cursor([{"x": 1}, 2]),
+        encode_cursor(["2026-01-01", uuid4()]),
+        encode_cursor([datetime(2026, 1, 1), "not-a-uuid"]),
+        encode_cursor([datetime(2026, 1, 1), None]),
+    ])
+    def test_invalid_cursor(self, cursor):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            keyset_condition(SORT_KEYS, cursor)
+
+    def test_keyset_condition_fills_nulls(self):
+        row = {"last_contact_date": None, "id": uuid4()}
+
+        condition, params = keyset_condition(SORT_KEYS, cursor_for_row(row, SORT_KEYS))
+
+        assert condition == (
+            "(COALESCE(c.last_contact_date, '-infinity'::timestamp), c.id) < "
+            "(COALESCE(:cursor_0, '-infinity'::timestamp), :cursor_1)"
+        )
+        assert params == {"cursor_0": None, "cursor_1": row["id"]}
+        assert order_by_clause(SORT_KEYS) == (
+            "ORDER BY COALESCE(c.last_contact_date, '-infinity'::timestamp) DESC, c.id DESC"
+        )
+
+
+class TestCountRows:
+    """Test suite for count modes"""
+
+    @pytest.mark.asyncio
+    async def test_auto_uses_estimate_for_large_results(self):
+        db = FakeSession(estimate=2_000_000)
+
+        assert await count_rows(db, "FROM t", {}, mode="auto", exact_threshold=10000) == (2_000_000, True)
+        assert len(db.statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_auto_counts_small_results_exactly(self):
+        db = FakeSession(estimate=40, count=37)
+
+        assert await count_rows(db, "FROM t", {}, mode="auto", exact_threshold=10000) == (37, False)
+
+    @pytest.mark.asyncio
+    async def test_exact_and_none(self):
+        db = FakeSession(estimate=2_000_000, count=5)
+
+        assert await count_rows(db, "FROM t", {}, mode="exact") == (5, False)
+        assert await count_rows(db, "FROM t", {}, mode="none") == (None, False)
+        assert [sql for sql, _ in db.statements] == ["SELECT COUNT(*) FROM t"]
+
+
+class TestQueryHistoryListing:
+    """Test suite for query_history keyset pages"""
+
+    @staticmethod
+    def _rows(n):
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        return [
+            {
+                "id": uuid4(), "query_text": f"q{i}", "intent": None, "answer_preview": None,
+                "confidence": None, "customer_id": None, "customer_name": None,
+                "execution_time_ms": 10, "created_at": start - timedelta(minutes=i),
+            }
+            for i in range(n)
+        ]
+
+    async def _list(self, db, **overrides):
+        kwargs = dict(
+            customer_id=None, intent=None, date_from=None, date_to=None, search=None,
+            page=1, page_size=2, cursor=None, count="none",
+            user=SimpleNamespace(id=uuid4()), db=db,
+        )
+        kwargs.update(overrides)
+        return await list_query_history(**kwargs)
+
+    @pytest.mark.asyncio
+    async def test_next_cursor_points_after_last_item(self):
+        db = FakeSession(rows=self._rows(5))
+
+        response = await self._list(db, search="암 진단")
+
+        sql, params = db.statements[-1]
+        assert "qh.query_text ILIKE :search" in sql and "OFFSET 0" in sql
+        assert params["search"] == "%암 진단%" and params["limit"] == 3
+        assert [item.query_text for item in response.items] == ["q0", "q1"]
+        assert response.has_more and response.total is None
+        assert decode_cursor(response.next_cursor) == [db.rows[1]["created_at"], db.rows[1]["id"]]
+
+    @pytest.mark.asyncio
+    async def test_cursor_page_uses_keyset_condition(self):
+        db = FakeSession(rows=self._rows(1))
+        cursor = encode_cursor([datetime(2026, 1, 1, tzinfo=timezone.utc), uuid4()])
+
+        response = await self._list(db, cursor=cursor, page=9)
+
+        sql, params = db.statements[-1]
+        assert "(qh.created_at, qh.id) < (:cursor_0, :cursor_1)" in sql and "OFFSET 0" in sql
+        assert not response.has_more and response.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_bad_cursor_is_400(self):
+        with pytest.raises(HTTPException) as exc_info:
+            await self._list(FakeSession(), cursor="garbage!")
+
+        assert exc_info.value.status_code == 400
@@ -0,0 +1,266 @@
+"""
+Unit tests for LLM Gateway
+
+stub 공급자, 재시도, hedging, 중복 제거, 속도 제한, 계측, HTTP 공급자 응답 변환을 테스트합니다.
+"""
+import asyncio
+import json
+import pytest
+
+import httpx
+
+from app.core.config import settings
+from app.models.orchestration import OrchestrationConfig, OrchestrationRequest
+from app.services.llm_gateway import (
+    GatewayChatClient,
+    LLMError,
+    LLMGateway,
+    LLMRateLimitError,
+    LLMRequest,
+    LLMRetryableError,
+    LLMTimeoutError,
+    OpenAICompatibleProvider,
+    StubProvider,
+    TokenBucket,
+    estimate_cost,
+)
+from app.services.orchestration.execution_budget import ExecutionBudget
+from app.services.query.intent_detector import LLMIntentDetector
+
+
+def _request(prompt="질문", model="gpt-4o"):
+    return LLMRequest(provider="openai", model=model, messages=[{"role": "user", "content": prompt}])
+
+
+def _gateway(handler=None, **kwargs):
+    provider = StubProvider("openai", handler=handler)
+    kwargs.setdefault("requests_per_second", 0)
+    kwargs.setdefault("hedge_after_seconds", 0)
+    return LLMGateway(providers={"openai": provider}, **kwargs), provider
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    original_sleep = asyncio.sleep
+    monkeypatch.setattr(
+        "app.services.llm_gateway.asyncio.sleep",
+        lambda delay: original_sleep(0),
+    )
+
+
+class TestStubProvider:
+    """Test suite for the deterministic stub provider"""
+
+    @pytest.mark.asyncio
+    async def test_same_request_same_answer(self):
+        gateway, _ = _gateway()
+
+        first = await gateway.complete(_request(), dedupe=False)
+        second = await gateway.complete(_request(), dedupe=False)
+        other = await gateway.complete(_request("다른 질문"), dedupe=False)
+
+        assert first.text == second.text
+        assert first.text != other.text
+        assert first.input_tokens > 0 and first.cost_usd > 0
+
+
+class TestRetriesAndHedging:
+    """Test suite for retry and hedge behaviour"""
+
+    @pytest.mark.asyncio
+    async def test_retryable_errors_are_retried(self, no_backoff):
+        failures = [LLMRateLimitError("429"), LLMRetryableError("503")]
+
+        def handler(request):
+            if failures:
+                raise failures.pop(0)
+            return "ok"
+
+        gateway, provider = _gateway(handler, max_retries=3)
+        response = await gateway.complete(_request())
+
+        assert response.text == "ok"
+        assert response.attempts == 3
+        stats = gateway.telemetry.snapshot()["openai/gpt-4o"]
+        assert stats["retries"] == 2
+        assert stats["throttled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_error_raised_immediately(self):
+        def handler(request):
+            raise LLMError("bad request", "openai", 400)
+
+        gateway, provider = _gateway(handler, max_retries=3)
+
+        with pytest.raises(LLMError):
+            await gateway.complete(_request())
+        assert len(provider.calls) == 1
+        assert gateway.telemetry.snapshot()["openai/gpt-4o"]["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_request_is_hedged(self):
+        delays = [0.5, 0.0]
+
+        async def handler(request):
+            await asyncio.sleep(delays.pop(0))
+            return "fast"
+
+        gateway, provider = _gateway(handler, hedge_after_seconds=0.05)
+        response = await asyncio.wait_for(gateway.complete(_request()), timeout=0.3)
+
+        assert response.text == "fast"
+        assert len(provider.calls) == 2
+        assert gateway.telemetry.snapshot()["openai/gpt-4o"]["hedges"] == 1
+
+    @pytest.mark.asyncio
+    async def test_request_timeout_bounds_call_and_retries(self):
+        async def handler(request):
+            await asyncio.sleep(1.0)
+            return "late"
+
+        gateway, provider = _gateway(handler, max_retries=3)
+        request = LLMRequest(
+            provider="openai", model="gpt-4o", messages=[{"role": "user", "content": "q"}], timeout=0.05
+        )
+
+        with pytest.raises(LLMTimeoutError):
+            await asyncio.wait_for(gateway.complete(request), timeout=0.5)
+        assert len(provider.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_execution_budget_clamps_timeout(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request.timeout)
+            return "ok"
+
+        gateway, _ = _gateway(handler)
+        budget = ExecutionBudget.for_request(
+            OrchestrationRequest(query="q", timeout_seconds=2), OrchestrationConfig()
+        )
+        token = budget.activate()
+        try:
+            await gateway.complete(_request())
+        finally:
+            ExecutionBudget.reset(token)
+        await gateway.complete(_request("예산 밖"))
+
+        assert 0 < seen[0] <= 2.0
+        assert seen[1] is None
+
+
+class TestDedupeAndRateLimit:
+    """Test suite for request dedupe and token bucket"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_call(self):
+        async def handler(request):
+            await asyncio.sleep(0.02)
+            return "shared"
+
+        gateway, provider = _gateway(handler)
+        responses = await asyncio.gather(*(gateway.complete(_request()) for _ in range(5)))
+
+        assert {r.text for r in responses} == {"shared"}
+        assert len(provider.calls) == 1
+        assert gateway.telemetry.snapshot()["openai/gpt-4o"]["deduplicated"] == 4
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_spaces_requests_after_burst(self):
+        now = [0.0]
+        bucket = TokenBucket(rate=10, capacity=2, clock=lambda: now[0])
+
+        waits = [await bucket.acquire() for _ in range(2)]
+        assert waits == [0.0, 0.0]
+
+        # 세 번째 요청은 토큰 1개가 보충될 때까지 (0.1초) 대기
+        started = asyncio.get_running_loop().time()
+        assert await bucket.acquire() == pytest.approx(0.1)
+        assert asyncio.get_running_loop().time() - started >= 0.09
+
+
+class TestTelemetryAndProviders:
+    """Test suite for telemetry output and HTTP provider mapping"""
+
+    @pytest.mark.asyncio
+    async def test_prometheus_histograms(self):
+        gateway, _ = _gateway(lambda request: "답변")
+        await gateway.complete(_request())
+
+        text = "\n".join(gateway.telemetry.prometheus_lines())
+
+        assert 'llm_request_duration_seconds_bucket{provider="openai",model="gpt-4o",le="+Inf"} 1' in text
+        assert 'llm_request_tokens_count{provider="openai",model="gpt-4o"} 1' in text
+        assert 'llm_requests_total{provider="openai",model="gpt-4o"} 1' in text
+
+    def test_cost_estimate(self):
+        assert estimate_cost("gpt-4o", 1_000_000, 0) == pytest.approx(2.5)
+        assert estimate_cost("unknown-model", 1000, 1000) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_openai_compatible_provider_parses_usage(self):
+        seen = {}
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            seen["url"] = str(request.url)
+            seen["body"] = json.loads(request.content)
+            return httpx.Response(200, json={
+                "choices": [{"message": {"content": "응답"}}],
+                "usage": {"prompt_tokens": 12, "completion_tokens": 3},
+            })
+
+        provider = OpenAICompatibleProvider(
+            "upstage", "https://api.upstage.ai/v1/solar", "key",
+            transport=httpx.MockTransport(respond),
+        )
+        request = LLMRequest(
+            provider="upstage", model="solar-pro", system="시스템",
+            messages=[{"role": "user", "content": "질문"}],
+        )
+        response = await provider.complete(request)
+        await provider.close()
+
+        assert seen["url"] == "https://api.upstage.ai/v1/solar/chat/completions"
+        assert seen["body"]["messages"][0] == {"role": "system", "content": "시스템"}
+        assert (response.text, response.input_tokens, response.output_tokens) == ("응답", 12, 3)
+
+    @pytest.mark.asyncio
+    async def test_request_api_key_overrides_provider_key(self):
+        seen = []
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers["Authorization"])
+            return httpx.Response(200, json={"choices": [{"message": {"content": "ok"}}]})
+
+        provider = OpenAICompatibleProvider(
+            "openai", "https://api.openai.com/v1", "default-key",
+            transport=httpx.MockTransport(respond),
+        )
+        await provider.complete(_request())
+        await provider.complete(LLMRequest(
+            provider="openai", model="gpt-4o", api_key="tenant-key",
+            messages=[{"role": "user", "content": "질문"}],
+        ))
+        await provider.close()
+
+        assert seen == ["Bearer default-key", "Bearer tenant-key"]
+        assert "tenant-key" not in repr(LLMRequest(provider="openai", model="m", messages=[], api_key="tenant-key"))
+
+    def test_query_components_default_to_gateway_client(self):
+        detector = LLMIntentDetector()
+
+        assert isinstance(detector.llm_client, GatewayChatClient)
+        assert detector.llm_client.provider == settings.QUERY_LLM_PROVIDER
+        assert LLMIntentDetector(llm_client=None).llm_client is None
+
+    @pytest.mark.asyncio
+    async def test_http_429_maps_to_rate_limit_error(self):
+        provider = OpenAICompatibleProvider(
+            "openai", "https://api.openai.com/v1", "key",
+            transport=httpx.MockTransport(lambda request: httpx.Response(429, text="slow down")),
+        )
+
+        with pytest.raises(LLMRateLimitError):
+            await provider.complete(_request())
+        await provider.close()
@@ -0,0 +1,117 @@
+"""
+Unit tests for LLM Result Cache
+
+키 정규화, 일괄 조회, 제거 정책, 추출기 캐시 적중(재추출 시 LLM 호출 없음)을 테스트합니다.
+"""
+import json
+import time
+import pytest
+
+from app.services.learning.graphrag_entity_extractor import GraphRAGEntityExtractor
+from app.services.llm_gateway import LLMGateway, StubProvider
+from app.services.llm_result_cache import LLMResultCache, make_cache_key
+from app.services.pdf_processor import Article, PDFProcessor
+
+
+@pytest.fixture
+def cache(tmp_path):
+    result_cache = LLMResultCache(path=str(tmp_path / "llm.sqlite3"), max_entries=100, max_age_days=30)
+    yield result_cache
+    result_cache.close()
+
+
+def _entities_payload(request):
+    return json.dumps({
+        "entities": [
+            {"id": "a", "label": "사망보험금", "type": "coverage_item"},
+            {"id": "b", "label": "1억원", "type": "benefit_amount"},
+        ],
+        "relationships": [{"source_id": "a", "target_id": "b", "type": "has_amount"}],
+    }, ensure_ascii=False)
+
+
+class TestLLMResultCache:
+    """Test suite for LLMResultCache"""
+
+    def test_key_normalizes_whitespace_and_versions(self):
+        key = make_cache_key("t@1", "model", "제1조  (목적)\n이 약관은")
+
+        assert key == make_cache_key("t@1", "model", " 제1조 (목적) 이 약관은 ")
+        assert key != make_cache_key("t@2", "model", "제1조 (목적) 이 약관은")
+        assert key != make_cache_key("t@1", "other-model", "제1조 (목적) 이 약관은")
+
+    @pytest.mark.asyncio
+    async def test_get_many_returns_only_hits(self, cache):
+        await cache.set_many({"k1": {"text": "가"}, "k2": {"text": "나"}}, "t@1", "model")
+
+        found = await cache.get_many(["k1", "k2", "missing"])
+
+        assert found == {"k1": {"text": "가"}, "k2": {"text": "나"}}
+        assert (cache.stats["hits"], cache.stats["misses"]) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_prune_evicts_expired_then_least_recently_used(self, cache):
+        cache.max_entries = 2
+        await cache.set_many({"old": 1, "a": 2, "b": 3, "c": 4}, "t@1", "model")
+        with cache._lock:
+            cache._conn.execute(
+                "UPDATE llm_results SET accessed_at = ? WHERE key = 'old'",
+                (time.time() - 31 * 86400,),
+            )
+            cache._conn.execute("UPDATE llm_results SET accessed_at = accessed_at - 10 WHERE key = 'a'")
+            cache._conn.commit()
+
+        removed = await cache.prune()
+
+        assert removed == 2
+        assert set(await cache.get_many(["old", "a", "b", "c"])) == {"b", "c"}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_template(self, cache):
+        await cache.set("k1", 1, "t@1", "model")
+        await cache.set("k2", 2, "t@2", "model")
+
+        assert await cache.invalidate_template("t@1") == 1
+        assert await cache.get("k1") is None
+        assert await cache.get("k2") == 2
+
+
+class TestExtractorCaching:
+    """Test suite for cache hits in extractors"""
+
+    @pytest.mark.asyncio
+    async def test_graphrag_reextraction_skips_llm(self, cache):
+        provider = StubProvider("anthropic", handler=_entities_payload)
+        gateway = LLMGateway(providers={"anthropic": provider}, requests_per_second=0)
+        extractor = GraphRAGEntityExtractor(gateway=gateway, cache=cache, pack_max_chars=0)
+        chunks = [
+            {"id": f"c{i}", "text": f"제{i}조 사망보험금은 1억원을 지급합니다. " * 5}
+            for i in range(3)
+        ]
+
+        first = await extractor.extract_from_chunks(chunks, {"insurer": "A생명"})
+        second = await extractor.extract_from_chunks(chunks, {"insurer": "B생명"})
+
+        assert len(provider.calls) == 3
+        assert (first["chunks_cached"], second["chunks_cached"]) == (0, 3)
+        assert second["requests_made"] == 0
+        assert second["total_tokens_used"] == 0
+        assert second["entities"][0]["document_info"] == {"insurer": "B생명"}
+        assert [e["chunk_id"] for e in second["entities"][::2]] == ["c0", "c1", "c2"]
+
+    @pytest.mark.asyncio
+    async def test_pdf_article_cache_ignores_article_number(self, cache):
+        provider = StubProvider("anthropic", handler=lambda request: json.dumps([
+            {"entity_type": "TERM", "entity_name": "피보험자", "description": "보험 대상자"}
+        ], ensure_ascii=False))
+        gateway = LLMGateway(providers={"anthropic": provider}, requests_per_second=0)
+        processor = PDFProcessor(gateway=gateway, cache=cache)
+        article = Article("제2조", "용어의 정의", "피보험자란 보험사고의 대상이 되는 사람", 1, [])
+        renumbered = Article("제3조", "용어의 정의", "피보험자란  보험사고의 대상이 되는 사람", 4, [])
+
+        await processor.extract_entities_from_article(article)
+        assert await processor.prefetch([renumbered]) == 1
+        entities = await processor.extract_entities_from_article(renumbered)
+
+        assert len(provider.calls) == 1
+        assert entities[0].source_article == "제3조"
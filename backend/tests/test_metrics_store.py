@@ -0,0 +1,128 @@
+"""
+Unit tests for MetricsStore
+
+고정 크기 히스토그램 백분위, Prometheus histogram 출력, 라우트 템플릿 레이블,
+다중 워커 스냅샷 합산을 테스트합니다.
+"""
+import json
+import os
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.logging import (
+    LatencyHistogram,
+    MetricsStore,
+    RequestLoggingMiddleware,
+    UNMATCHED_ROUTE,
+    get_metrics_store,
+    remove_stale_metrics_snapshots,
+)
+
+
+class TestLatencyHistogram:
+    """Test suite for LatencyHistogram"""
+
+    def test_percentiles_within_bucket_error(self):
+        histogram = LatencyHistogram()
+        for value in range(1, 1001):
+            histogram.observe(float(value))
+
+        assert histogram.percentile(0.50) == pytest.approx(500, rel=0.05)
+        assert histogram.percentile(0.95) == pytest.approx(950, rel=0.05)
+        assert histogram.percentile(0.99) == pytest.approx(990, rel=0.05)
+        assert len(histogram.fine) == len(LatencyHistogram().fine)
+
+    def test_cumulative_buckets(self):
+        histogram = LatencyHistogram()
+        for value in (3, 7, 7, 120, 90000):
+            histogram.observe(value)
+
+        buckets = dict(histogram.cumulative())
+
+        assert buckets["5"] == 1
+        assert buckets["10"] == 3
+        assert buckets["250"] == 4
+        assert buckets["60000"] == 4
+        assert buckets["+Inf"] == 5
+
+
+class TestMetricsStore:
+    """Test suite for MetricsStore"""
+
+    def test_stats_and_prometheus_histogram(self):
+        store = MetricsStore(multiproc_dir="")
+        for duration in (10, 20, 30):
+            store.record_request("GET", "/api/v1/items/{item_id}", 200, duration)
+        store.record_request("GET", "/api/v1/items/{item_id}", 404, 5)
+        store.record_error("GET", "/api/v1/items/{item_id}", "ValueError")
+
+        stats = store.get_stats()
+        text = store.get_prometheus_metrics()
+
+        assert stats["total_requests"] == 4
+        assert stats["status_codes"] == {200: 3, 404: 1}
+        assert stats["top_endpoints"] == {"GET /api/v1/items/{item_id}": 4}
+        labels = 'method="GET",path="/api/v1/items/{item_id}",status_code="200"'
+        assert f'http_request_duration_milliseconds_bucket{{{labels},le="25"}} 2' in text
+        assert f'http_request_duration_milliseconds_bucket{{{labels},le="+Inf"}} 3' in text
+        assert f"http_request_duration_milliseconds_count{{{labels}}} 3" in text
+        assert 'http_errors_total{error_type="ValueError"} 1' in text
+
+    def test_user_counts_are_bounded(self, monkeypatch):
+        monkeypatch.setattr("app.core.logging.MAX_TRACKED_USERS", 2)
+        store = MetricsStore(multiproc_dir="")
+
+        for user in ("a", "b", "c", "d", "a"):
+            store.record_request("GET", "/x", 200, 1, user_id=user)
+
+        assert store.requests_by_user == {"a": 2, "b": 1, "other": 2}
+
+    def test_worker_snapshots_are_merged(self, tmp_path):
+        worker = MetricsStore(multiproc_dir=str(tmp_path), flush_interval_seconds=0)
+        worker.record_request("GET", "/x", 200, 10)
+        # 다른 워커가 남긴 스냅샷
+        other = MetricsStore(multiproc_dir="")
+        other.record_request("GET", "/x", 200, 1000)
+        other.record_request("POST", "/y", 201, 20)
+        (tmp_path / f"metrics_{os.getppid()}.json").write_text(json.dumps(other.snapshot()))
+
+        stats = worker.get_stats()
+
+        assert stats["total_requests"] == 3
+        assert stats["top_endpoints"] == {"GET /x": 2, "POST /y": 1}
+        assert 'status_code="200"} 2' in worker.get_prometheus_metrics()
+
+    def test_dead_worker_snapshots_are_skipped_and_removed(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("app.core.logging._pid_alive", lambda pid: pid == os.getpid())
+        worker = MetricsStore(multiproc_dir=str(tmp_path), flush_interval_seconds=0)
+        worker.record_request("GET", "/x", 200, 10)
+        dead = MetricsStore(multiproc_dir="")
+        dead.record_request("GET", "/x", 200, 1000)
+        (tmp_path / "metrics_99999.json").write_text(json.dumps(dead.snapshot()))
+
+        assert worker.get_stats()["total_requests"] == 1
+        assert remove_stale_metrics_snapshots(str(tmp_path)) == 1
+        assert [p.name for p in tmp_path.glob("metrics_*.json")] == [f"metrics_{os.getpid()}.json"]
+
+
+def test_middleware_records_route_templates():
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: str):
+        return {"id": item_id}
+
+    app.add_middleware(RequestLoggingMiddleware)
+    client = TestClient(app)
+    store = get_metrics_store()
+    key = ("GET", "/items/{item_id}", 200)
+    before = store.series[key].count if key in store.series else 0
+
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/no-such-path/123")
+
+    assert store.series[key].count - before == 2
+    assert ("GET", UNMATCHED_ROUTE, 404) in store.series
+    assert not any(path == "/items/1" for _, path, _ in store.series)
@@ -0,0 +1,75 @@
+"""
+Unit tests for PDF Blob Store
+
+스트리밍 다운로드, content-addressed 저장, 조건부 요청(ETag)을 테스트합니다.
+"""
+import asyncio
+import hashlib
+
+import httpx
+import pytest
+
+from app.services.pdf_blob_store import PDFBlobStore
+
+
+PDF_BYTES = b"%PDF-1.4\n" + b"x" * 5000 + b"\n%%EOF"
+
+
+def _handler(calls: list):
+    def handle(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=PDF_BYTES, headers={"ETag": '"v1"'})
+    return handle
+
+
+@pytest.fixture
+def store(tmp_path):
+    return PDFBlobStore(root=str(tmp_path), chunk_size=1024)
+
+
+class TestPDFBlobStore:
+    """Test suite for PDFBlobStore"""
+
+    @pytest.mark.asyncio
+    async def test_fetch_streams_and_revalidates(self, store):
+        """첫 요청은 다운로드, 재요청은 ETag 조건부 요청(304)"""
+        calls = []
+        store._async_client = httpx.AsyncClient(transport=httpx.MockTransport(_handler(calls)))
+        store._async_client_loop = asyncio.get_running_loop()
+
+        first = await store.fetch("https://insurer.example/a.pdf")
+        second = await store.fetch("https://insurer.example/a.pdf")
+
+        assert first.sha256 == hashlib.sha256(PDF_BYTES).hexdigest()
+        assert first.path.read_bytes() == PDF_BYTES
+        assert not first.from_cache
+        assert second.from_cache and second.path == first.path
+        assert calls[1].headers["if-none-match"] == '"v1"'
+        assert store.stats["downloads"] == 1
+        assert store.stats["not_modified"] == 1
+        assert list(store.tmp_dir.glob("*.part")) == []
+
+    def test_same_content_shared_across_urls(self, store):
+        """다른 URL이라도 같은 내용은 하나의 blob 공유 (sync)"""
+        store._sync_client = httpx.Client(transport=httpx.MockTransport(_handler([])))
+
+        a = store.fetch_sync("https://insurer.example/a.pdf")
+        b = store.fetch_sync("https://mirror.example/a.pdf")
+
+        assert a.path == b.path
+        assert len(list(store.blob_dir.glob("*/*.pdf"))) == 1
+
+    def test_lookup_and_mmap(self, store):
+        """재검증 생략 시 네트워크 없이 mmap 제공"""
+        calls = []
+        store._sync_client = httpx.Client(transport=httpx.MockTransport(_handler(calls)))
+        store.fetch_sync("https://insurer.example/a.pdf")
+
+        ref = store.fetch_sync("https://insurer.example/a.pdf", revalidate=False)
+
+        assert len(calls) == 1
+        with ref.open_mmap() as mapped:
+            assert mapped[:8] == b"%PDF-1.4"
+            assert len(mapped) == len(PDF_BYTES)
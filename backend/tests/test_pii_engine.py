@@ -0,0 +1,89 @@
+"""
+Unit tests for PIIEngine
+
+단일 패스 마스킹/감지, 타입 우선순위, 결과 캐시, 중첩 데이터 마스킹,
+스트리밍 JSON 직렬화를 테스트합니다.
+"""
+import json
+
+from app.core.pii import PIIEngine, PIIHandler, PIIMasker, PIIType, get_pii_engine
+
+
+RECORDS = [
+    {
+        "name": "김철수",
+        "email": "user@example.com",
+        "contacts": {"phone": ["010-1234-5678", "01098765432"]},
+        "memo": "주민번호 900101-1234567, IP 192.168.1.100",
+        "age": 30,
+    },
+    {"name": "이영희", "email": "", "memo": None, "policies": [{"ip_address": "10.0.0.1"}]},
+]
+
+
+class TestPIIEngine:
+    """Test suite for PIIEngine"""
+
+    def test_mask_text_all_types_in_one_pass(self):
+        text = "메일 user@example.com, 전화 010-1234-5678, 주민 900101-1234567, 카드 1234-5678-9012-3456, IP 192.168.1.100"
+
+        masked = PIIMasker.mask_text(text)
+
+        assert masked == (
+            "메일 u**r@example.com, 전화 010-****-5678, 주민 900101-1******, "
+            "카드 ****-****-****-3456, IP 192.168.***.***"
+        )
+
+    def test_leftmost_match_wins_over_embedded_phone(self):
+        # 하이픈 없는 주민등록번호 안의 "0101123..."이 전화번호로 잘리지 않음
+        assert PIIMasker.mask_text("9001011234567") == "900101-1******"
+
+    def test_detect_prefers_specific_type_and_keeps_order(self):
+        detected = get_pii_engine(detection=True).detect("900101-1234567 / 123-456-789012 / a@b.co")
+
+        assert detected == {
+            PIIType.EMAIL: ["a@b.co"],
+            PIIType.SSN: ["900101-1234567"],
+            PIIType.BANK_ACCOUNT: ["123-456-789012"],
+        }
+
+    def test_mask_results_are_cached(self):
+        engine = PIIEngine()
+        for _ in range(3):
+            engine.mask_text("연락처 010-1234-5678")
+        engine.mask_text("PII 없음")  # 숫자/@ 없음 → 스캔 생략
+
+        info = engine._mask_cached.cache_info()
+        assert (info.hits, info.misses) == (2, 1)
+
+
+class TestNestedMasking:
+    """Test suite for nested sanitize and streaming"""
+
+    def test_sanitize_walks_nested_data_without_mutating(self):
+        original = json.loads(json.dumps(RECORDS, ensure_ascii=False))
+
+        masked = get_pii_engine().sanitize(RECORDS, fields_to_mask=["memo"])
+
+        assert masked[0]["name"] == "김**"
+        assert masked[0]["contacts"]["phone"] == ["010-****-5678", "010-****-5432"]
+        assert masked[0]["memo"] == "주민번호 900101-1******, IP 192.168.***.***"
+        assert masked[0]["age"] == 30
+        assert masked[1]["policies"][0]["ip_address"] == "10.0.***.***"
+        assert masked[1]["email"] == "" and masked[1]["memo"] is None
+        assert RECORDS == original
+
+    def test_sanitize_dict_keeps_top_level_semantics(self):
+        data = {"Email": "user@example.com", "description": "Contact: user@example.com"}
+
+        sanitized = PIIHandler.sanitize_dict(data, fields_to_mask=["description"])
+
+        assert sanitized == {"Email": "u**r@example.com", "description": "Contact: u**r@example.com"}
+
+    def test_iter_json_matches_sanitize(self):
+        engine = get_pii_engine()
+
+        chunks = list(engine.iter_json(RECORDS, fields_to_mask=["memo"], chunk_size=32))
+
+        assert len(chunks) > 1
+        assert json.loads("".join(chunks)) == engine.sanitize(RECORDS, fields_to_mask=["memo"])
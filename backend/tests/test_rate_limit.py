@@ -0,0 +1,156 @@
+"""
+Unit tests for GCRA rate limiting
+
+GCRA 허용/거부, 토큰 예약(lease)으로 원격 왕복 생략, 다중 정책 원자성,
+백엔드 장애 시 대체, 미들웨어 헤더/429 응답을 테스트합니다.
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.rate_limit import (
+    LocalGCRABackend,
+    RateLimitEngine,
+    RateLimitMiddleware,
+    RateLimitPolicy,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingBackend(LocalGCRABackend):
+    def __init__(self, clock):
+        super().__init__(clock=clock)
+        self.calls = 0
+
+    async def acquire(self, checks):
+        self.calls += 1
+        return await super().acquire(checks)
+
+
+class FailingBackend:
+    async def acquire(self, checks):
+        raise ConnectionError("redis down")
+
+
+def _engine(clock, backend=None):
+    return RateLimitEngine(backend=backend or LocalGCRABackend(clock=clock), lease_seconds=1.0, clock=clock)
+
+
+class TestGCRA:
+    """Test suite for the GCRA algorithm"""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_steady_rate(self):
+        clock = FakeClock()
+        engine = _engine(clock)
+        policy = RateLimitPolicy("p", limit=3, period_seconds=3)
+
+        decisions = [await engine.hit([("k", policy)]) for _ in range(4)]
+
+        assert [d.allowed for d in decisions] == [True, True, True, False]
+        assert [d.remaining for d in decisions[:3]] == [2, 1, 0]
+        assert decisions[3].retry_after == pytest.approx(1.0)
+
+        # 토큰 하나는 1초마다 회복
+        clock.now += 1.0
+        assert (await engine.hit([("k", policy)])).allowed
+        assert not (await engine.hit([("k", policy)])).allowed
+
+    @pytest.mark.asyncio
+    async def test_denied_policy_does_not_consume_others(self):
+        clock = FakeClock()
+        engine = _engine(clock)
+        wide = RateLimitPolicy("wide", limit=5, period_seconds=60)
+        strict = RateLimitPolicy("strict", limit=1, period_seconds=60)
+
+        assert (await engine.hit([("w", wide), ("s", strict)])).allowed
+        denied = await engine.hit([("w", wide), ("s", strict)])
+
+        assert not denied.allowed
+        assert denied.limit == 1
+        assert (await engine.hit([("w", wide)])).remaining == 3
+
+
+class TestLeases:
+    """Test suite for in-process token leases"""
+
+    @pytest.mark.asyncio
+    async def test_under_limit_client_skips_round_trips(self):
+        clock = FakeClock()
+        backend = CountingBackend(clock)
+        engine = _engine(clock, backend)
+        policy = RateLimitPolicy("p", limit=100, period_seconds=60)
+
+        decisions = [await engine.hit([("k", policy)]) for _ in range(10)]
+
+        assert all(d.allowed for d in decisions)
+        assert backend.calls == 1
+        assert [d.remaining for d in decisions] == list(range(99, 89, -1))
+
+    @pytest.mark.asyncio
+    async def test_lease_expires_and_never_exceeds_limit(self):
+        clock = FakeClock()
+        backend = CountingBackend(clock)
+        engine = _engine(clock, backend)
+        policy = RateLimitPolicy("p", limit=20, period_seconds=60)
+
+        await engine.hit([("k", policy)])
+        clock.now += 1.5
+        await engine.hit([("k", policy)])
+        assert backend.calls == 2
+
+        allowed = 2 + sum([(await engine.hit([("k", policy)])).allowed for _ in range(40)])
+        assert allowed <= 20
+
+
+class TestFallbackAndMiddleware:
+    """Test suite for backend fallback and middleware responses"""
+
+    @pytest.mark.asyncio
+    async def test_backend_failure_falls_back_to_local(self):
+        clock = FakeClock()
+        engine = RateLimitEngine(backend=FailingBackend(), clock=clock)
+        policy = RateLimitPolicy("p", limit=1, period_seconds=60)
+
+        assert (await engine.hit([("k", policy)])).allowed
+        assert not (await engine.hit([("k", policy)])).allowed
+        assert engine.stats["fallback"] == 2
+
+    def test_route_policy_returns_429(self, monkeypatch):
+        monkeypatch.setattr("app.core.rate_limit.settings.RATE_LIMIT_ENABLED", True)
+        app = FastAPI()
+
+        @app.post("/api/v1/auth/login")
+        async def login():
+            return {"ok": True}
+
+        @app.post("/api/v1/auth/login-history")
+        async def history():
+            return {"ok": True}
+
+        app.add_middleware(
+            RateLimitMiddleware,
+            max_requests=100,
+            window_seconds=60,
+            policies=(RateLimitPolicy(
+                "login", limit=2, period_seconds=300,
+                path_prefix="/api/v1/auth/login", methods=("POST",),
+            ),),
+            engine=_engine(FakeClock()),
+        )
+        client = TestClient(app)
+
+        responses = [client.post("/api/v1/auth/login") for _ in range(3)]
+
+        assert [r.status_code for r in responses] == [200, 200, 429]
+        assert responses[0].headers["X-RateLimit-Limit"] == "2"
+        assert responses[2].json()["detail"]["error_code"] == "RATE_LIMIT_EXCEEDED"
+        assert int(responses[2].headers["Retry-After"]) == 150
+        assert client.post("/api/v1/auth/login-history").status_code == 200
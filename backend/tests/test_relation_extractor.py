@@ -243,6 +243,26 @@ Here is the JSON:
             assert len(result.validation_errors) > 0
             assert "parse" in result.validation_errors[0].lower()
 
+    @pytest.mark.asyncio
+    async def test_unparseable_response_is_not_cached(self, sample_critical_data, mock_llm_response_valid):
+        """Parse failures must not be replayed from the LLM result cache"""
+        cache = MagicMock()
+        cache.get = AsyncMock(return_value=None)
+        cache.set = AsyncMock()
+        extractor = RelationExtractor(cache=cache)
+
+        with patch.object(extractor.upstage_client, 'generate', new_callable=AsyncMock) as mock_generate:
+            mock_generate.return_value = {"text": '{"items": []}', "model": "solar-pro", "confidence": 0.9}
+            result = await extractor.extract("Test", sample_critical_data, use_cascade=False)
+
+            assert not result.validation_passed
+            cache.set.assert_not_awaited()
+
+            mock_generate.return_value = mock_llm_response_valid
+            await extractor.extract("Test", sample_critical_data, use_cascade=False)
+
+            cache.set.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_no_relations_found(self, extractor, sample_critical_data):
         """Test when LLM returns no relations"""
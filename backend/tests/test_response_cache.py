@@ -0,0 +1,475 @@
+"""
+Unit tests for Orchestration Response Cache
+
+LRU/TTL 캐시, 캐시 키 정규화, 시맨틱 캐시, single-flight 병합을 테스트합니다.
+"""
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock, AsyncMock
+
+from app.models.orchestration import (
+    CacheEntry,
+    OrchestrationConfig,
+    OrchestrationMetrics,
+    OrchestrationRequest,
+    OrchestrationResponse,
+    OrchestrationStrategy,
+)
+from app.models.query import (
+    EntityType,
+    ExtractedEntity,
+    QueryAnalysisResult,
+    QueryIntent,
+    QueryType,
+)
+from app.models.response import AnswerFormat, GeneratedResponse
+from app.models.vector_search import (
+    EmbeddingResponse,
+    SearchResponse,
+    SearchStrategy,
+    VectorSearchResult,
+)
+from app.services.document_events import DocumentEvent
+from app.services.orchestration.cache_invalidation import GraphCacheInvalidator
+from app.services.orchestration.query_orchestrator import QueryOrchestrator
+from app.services.orchestration.response_cache import (
+    LRUTTLCache,
+    SemanticResponseCache,
+    SingleFlight,
+    build_cache_key,
+    build_semantic_scope,
+    normalize_query,
+)
+
+
+def _response(query: str = "암 진단비는?") -> OrchestrationResponse:
+    return OrchestrationResponse(
+        request_id="req",
+        query=query,
+        response=GeneratedResponse(
+            answer="5천만원",
+            format=AnswerFormat.TEXT,
+            confidence_score=0.9,
+            generation_time_ms=1.0,
+        ),
+        strategy=OrchestrationStrategy.STANDARD,
+        metrics=OrchestrationMetrics(total_duration_ms=1.0),
+    )
+
+
+def _entry(key: str) -> CacheEntry:
+    return CacheEntry(key=key, query=key, response=_response())
+
+
+def _analysis(query: str) -> QueryAnalysisResult:
+    return QueryAnalysisResult(
+        original_query=query,
+        intent=QueryIntent.COVERAGE_AMOUNT,
+        intent_confidence=0.9,
+        query_type=QueryType.VECTOR_SEARCH,
+        entities=[
+            ExtractedEntity(
+                text="암",
+                entity_type=EntityType.DISEASE,
+                normalized_value="암",
+                confidence=0.9,
+            )
+        ],
+    )
+
+
+class TestLRUTTLCache:
+    """Test suite for LRUTTLCache"""
+
+    def test_evicts_least_recently_used(self):
+        """용량 초과 시 가장 오래 사용되지 않은 항목 제거"""
+        cache = LRUTTLCache(max_size=2, ttl_seconds=60)
+        cache.set("a", _entry("a"))
+        cache.set("b", _entry("b"))
+        cache.get("a")
+        cache.set("c", _entry("c"))
+
+        assert list(cache.keys()) == ["a", "c"]
+        assert cache.evictions == 1
+
+    def test_expired_entry_removed_on_get(self):
+        """TTL 만료 항목은 조회 시 제거"""
+        cache = LRUTTLCache(max_size=10, ttl_seconds=60)
+        entry = _entry("a")
+        entry.created_at = datetime.now() - timedelta(seconds=120)
+        cache["a"] = entry
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+class TestCacheKey:
+    """Test suite for cache key normalization"""
+
+    def test_normalize_whitespace_and_punctuation(self):
+        """공백/구두점 정규화"""
+        assert normalize_query("  암 진단비는   얼마?! ") == "암 진단비는 얼마"
+
+    def test_equivalent_queries_share_key(self):
+        """띄어쓰기/구두점만 다른 질문은 같은 키"""
+        key1 = build_cache_key("암 진단비는 얼마?", "standard", 10, _analysis("암 진단비는 얼마?"))
+        key2 = build_cache_key("암진단비는  얼마", "standard", 10, _analysis("암진단비는  얼마"))
+        key3 = build_cache_key("암진단비는 얼마", "fast", 10, _analysis("암진단비는 얼마"))
+
+        assert key1 == key2
+        assert key1 != key3
+
+
+class TestSemanticResponseCache:
+    """Test suite for SemanticResponseCache"""
+
+    def test_nearest_neighbour_above_threshold(self):
+        """임계값 이상 유사 질문은 히트, 미만은 미스"""
+        cache = SemanticResponseCache(similarity_threshold=0.9)
+        scope = build_semantic_scope("standard", 10, _analysis("암 진단비"))
+        cache.add("k1", scope, [1.0, 0.0, 0.0], _response("암 진단비가 얼마인가요"))
+
+        hit = cache.lookup(scope, [0.95, 0.05, 0.0])
+        assert hit is not None
+        assert hit[0].query == "암 진단비가 얼마인가요"
+        assert hit[1] > 0.9
+
+        assert cache.lookup(scope, [0.5, 0.5, 0.0]) is None
+        assert cache.lookup("other-scope", [1.0, 0.0, 0.0]) is None
+
+    def test_invalidate_by_source_ids(self):
+        """근거 문서가 갱신되면 해당 항목만 제거"""
+        cache = SemanticResponseCache(similarity_threshold=0.9)
+        response = _response()
+        response.search_response = SearchResponse(
+            original_query="암 진단비",
+            strategy=SearchStrategy.HYBRID,
+            results=[
+                VectorSearchResult(
+                    node_id="clause-1",
+                    score=0.9,
+                    properties={"document_id": "doc-1"},
+                    clause_text="암 진단비 5천만원",
+                )
+            ],
+            total_count=1,
+            search_time_ms=1.0,
+        )
+        cache.add("k1", "s", [1.0, 0.0], response)
+        cache.add("k2", "s", [0.0, 1.0], _response())
+
+        assert cache.invalidate(["doc-2"]) == 0
+        assert cache.invalidate(["doc-1"]) == 1
+        assert len(cache) == 1
+        assert cache.lookup("s", [1.0, 0.0]) is None
+
+
+class TestSingleFlight:
+    """Test suite for SingleFlight"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_coalesced(self):
+        """동시 동일 키 호출은 한 번만 실행"""
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "done"
+
+        results = await asyncio.gather(*[flight.do("k", work) for _ in range(5)])
+
+        assert calls == 1
+        assert [r for r, _ in results] == ["done"] * 5
+        assert sum(1 for _, shared in results if shared) == 4
+        assert flight.inflight_count == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_waiters(self):
+        """선행 실행 에러는 대기자에게 전파"""
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.do("k", fail), flight.do("k", fail), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_fail_waiters(self):
+        """선행 요청이 취소되어도(연결 끊김) 대기자는 결과를 받음"""
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return "done"
+
+        leader = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("k", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == ("done", True)
+        assert leader.cancelled()
+        assert calls == 1
+        assert flight.inflight_count == 0
+
+
+class FakeRedis:
+    """redis.asyncio stand-in for the shared response cache"""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    async def scan_iter(self, match, count=None):
+        for key in list(self.data):
+            if key.startswith(match.rstrip("*")):
+                yield key
+
+    async def delete(self, key):
+        return 1 if self.data.pop(key, None) is not None else 0
+
+
+class TestSharedCache:
+    """Redis L2 공유 캐시"""
+
+    def test_get_orchestrator_enables_cache_tiers_from_settings(self, monkeypatch):
+        from app.api.v1.endpoints import query as query_endpoint
+
+        constructed = Mock()
+        monkeypatch.setattr(query_endpoint, "QueryOrchestrator", constructed)
+        monkeypatch.setattr(query_endpoint, "_orchestrator", None)
+        monkeypatch.setattr(query_endpoint.settings, "QUERY_CACHE_SHARED_ENABLED", True)
+
+        monkeypatch.setattr(query_endpoint.settings, "QUERY_CACHE_SEMANTIC_ENABLED", True)
+
+        query_endpoint.get_orchestrator()
+
+        config = constructed.call_args.kwargs["config"]
+        assert config.shared_cache_enabled is True
+        assert config.semantic_cache_enabled is True
+
+    @pytest.mark.asyncio
+    async def test_second_worker_served_from_shared_cache(self):
+        """다른 워커(프로세스 로컬 캐시가 빈 오케스트레이터)가 L2에서 응답"""
+        redis = FakeRedis()
+
+        def worker():
+            analyzer = Mock()
+            analyzer.analyze = Mock(side_effect=_analysis)
+            search = Mock()
+            search.search = AsyncMock(
+                return_value=SearchResponse(
+                    original_query="암",
+                    strategy=SearchStrategy.HYBRID,
+                    results=[],
+                    total_count=0,
+                    search_time_ms=1.0,
+                )
+            )
+            generator = Mock()
+            generator.generate = AsyncMock(return_value=_response().response)
+            orchestrator = QueryOrchestrator(
+                query_analyzer=analyzer,
+                hybrid_search=search,
+                response_generator=generator,
+                config=OrchestrationConfig(shared_cache_enabled=True),
+            )
+            orchestrator._shared_cache._client = redis
+            return orchestrator, search
+
+        first, first_search = worker()
+        second, second_search = worker()
+
+        await first.process(OrchestrationRequest(query="암 진단비는 얼마?"))
+        response = await second.process(OrchestrationRequest(query="암 진단비는 얼마?"))
+
+        assert response.cache_hit
+        assert first_search.search.await_count == 1
+        assert second_search.search.await_count == 0
+        assert second.get_cache_stats()["shared_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_skip_shared_cache_for_a_while(self):
+        from app.services.orchestration.response_cache import RedisResponseCache
+
+        cache = RedisResponseCache()
+        client = Mock()
+        client.get = AsyncMock(side_effect=ConnectionError("down"))
+        cache._client = client
+
+        assert await cache.get("k") is None
+        assert await cache.get("k") is None
+        assert client.get.await_count == 1
+
+
+class TestOrchestratorCoalescing:
+    """QueryOrchestrator 캐시 + single-flight 통합"""
+
+    @pytest.mark.asyncio
+    async def test_identical_burst_runs_pipeline_once(self):
+        """동일 질문 폭주 시 파이프라인 1회 실행"""
+        analyzer = Mock()
+        analyzer.analyze = Mock(side_effect=_analysis)
+
+        search = Mock()
+
+        async def slow_search(**kwargs):
+            await asyncio.sleep(0.02)
+            return SearchResponse(
+                original_query=kwargs["query"],
+                strategy=SearchStrategy.HYBRID,
+                results=[],
+                total_count=0,
+                search_time_ms=1.0,
+                reranked=False,
+            )
+
+        search.search = AsyncMock(side_effect=slow_search)
+        generator = Mock()
+        generator.generate = AsyncMock(return_value=_response().response)
+
+        orchestrator = QueryOrchestrator(
+            query_analyzer=analyzer,
+            hybrid_search=search,
+            response_generator=generator,
+            config=OrchestrationConfig(),
+        )
+        requests = [
+            OrchestrationRequest(query=q)
+            for q in ["암 진단비는 얼마?", "암진단비는 얼마", "암 진단비는  얼마!"]
+        ]
+
+        responses = await asyncio.gather(*[orchestrator.process(r) for r in requests])
+
+        assert search.search.await_count == 1
+        assert sum(1 for r in responses if r.cache_hit) == 2
+        assert orchestrator.get_cache_stats()["coalesced"] == 2
+
+    @pytest.mark.asyncio
+    async def test_paraphrase_served_from_semantic_cache(self):
+        """의역 질문은 시맨틱 캐시에서 응답"""
+        vectors = {
+            "암 진단금 얼마야": [1.0, 0.1, 0.0],
+            "암 진단비가 얼마인가요": [0.98, 0.12, 0.0],
+        }
+        embedder = Mock()
+        embedder.embed_query = AsyncMock(
+            side_effect=lambda req: EmbeddingResponse(
+                embedding=vectors[req.text],
+                dimension=3,
+                model="fake",
+                generation_time_ms=0.0,
+            )
+        )
+        analyzer = Mock()
+        analyzer.analyze = Mock(side_effect=_analysis)
+        search = Mock()
+        search.search = AsyncMock(
+            return_value=SearchResponse(
+                original_query="암",
+                strategy=SearchStrategy.HYBRID,
+                results=[],
+                total_count=0,
+                search_time_ms=1.0,
+            )
+        )
+        generator = Mock()
+        generator.generate = AsyncMock(return_value=_response().response)
+
+        orchestrator = QueryOrchestrator(
+            query_analyzer=analyzer,
+            hybrid_search=search,
+            response_generator=generator,
+            config=OrchestrationConfig(semantic_cache_enabled=True),
+            query_embedder=embedder,
+        )
+
+        first = await orchestrator.process(OrchestrationRequest(query="암 진단금 얼마야"))
+        second = await orchestrator.process(OrchestrationRequest(query="암 진단비가 얼마인가요"))
+
+        assert not first.cache_hit
+        assert second.cache_hit
+        assert search.search.await_count == 1
+        assert orchestrator.get_cache_stats()["semantic_hits"] == 1
+
+        removed = await orchestrator.on_graph_updated()
+        assert removed["semantic"] == 1
+        assert orchestrator.get_cache_stats()["semantic_cache_size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_document_events_invalidate_cache(self):
+        """completed 진입 → 전체 무효화, completed 이탈만 → 해당 문서만"""
+        orchestrator = Mock()
+        orchestrator.on_graph_updated = AsyncMock()
+        invalidator = GraphCacheInvalidator(lambda: orchestrator, listener=Mock())
+
+        await invalidator.handle_events([])
+        await invalidator.handle_events([
+            DocumentEvent(document_id="d1", status="completed", previous_status="processing"),
+            DocumentEvent(document_id="d2", status="pending", previous_status="completed"),
+        ])
+        orchestrator.on_graph_updated.assert_awaited_once_with()
+
+        await invalidator.handle_events([
+            DocumentEvent(document_id="d2", status="pending", previous_status="completed"),
+        ])
+        orchestrator.on_graph_updated.assert_awaited_with(["d2"])
+
+    @pytest.mark.asyncio
+    async def test_newly_completed_document_forces_miss(self):
+        """한 번도 인용되지 않은 새 문서도 기존 응답(로컬 + 시맨틱)을 무효화"""
+        embedder = Mock()
+        embedder.embed_query = AsyncMock(
+            return_value=EmbeddingResponse(
+                embedding=[1.0, 0.0], dimension=2, model="fake", generation_time_ms=0.0
+            )
+        )
+        analyzer = Mock()
+        analyzer.analyze = Mock(side_effect=_analysis)
+        search = Mock()
+        search.search = AsyncMock(
+            return_value=SearchResponse(
+                original_query="암",
+                strategy=SearchStrategy.HYBRID,
+                results=[],
+                total_count=0,
+                search_time_ms=1.0,
+            )
+        )
+        generator = Mock()
+        generator.generate = AsyncMock(return_value=_response().response)
+        orchestrator = QueryOrchestrator(
+            query_analyzer=analyzer,
+            hybrid_search=search,
+            response_generator=generator,
+            config=OrchestrationConfig(semantic_cache_enabled=True),
+            query_embedder=embedder,
+        )
+        invalidator = GraphCacheInvalidator(lambda: orchestrator, listener=Mock())
+
+        await orchestrator.process(OrchestrationRequest(query="암 진단비는 얼마?"))
+        await invalidator.handle_events([
+            DocumentEvent(document_id="new-doc", status="completed", previous_status="processing"),
+        ])
+        response = await orchestrator.process(OrchestrationRequest(query="암 진단비는 얼마?"))
+
+        assert not response.cache_hit
+        assert search.search.await_count == 2
@@ -0,0 +1,48 @@
+"""
+Unit tests for role-aware API router loading
+
+APP_ROLE별 라우터 선택, 알 수 없는 역할 거부, 역할별 mount 결과를 테스트합니다.
+"""
+import pytest
+
+from app.api.v1.router import (
+    APP_ROLES,
+    ROUTER_SPECS,
+    build_api_router,
+    router_specs_for_role,
+)
+
+
+def _paths(router):
+    return {route.path for route in router.routes}
+
+
+class TestRouterRoles:
+    """Test suite for APP_ROLE router selection"""
+
+    def test_all_role_mounts_every_router(self):
+        assert router_specs_for_role("all") == ROUTER_SPECS
+
+    def test_every_router_belongs_to_a_role(self):
+        covered = set()
+        for role in APP_ROLES[1:]:
+            covered.update(spec.module for spec in router_specs_for_role(role))
+
+        assert covered == {spec.module for spec in ROUTER_SPECS}
+
+    def test_query_role_excludes_ingestion_and_crawlers(self):
+        modules = {spec.module.rsplit(".", 1)[-1] for spec in router_specs_for_role("query")}
+
+        assert {"auth", "query", "customers", "search"} <= modules
+        assert not modules & {"ingestion", "ingest", "documents", "relearning", "insurer_crawlers", "test_crawler"}
+
+    def test_unknown_role_is_rejected(self):
+        with pytest.raises(ValueError, match="APP_ROLE"):
+            router_specs_for_role("worker")
+
+    def test_crawler_router_keeps_system_endpoints(self):
+        paths = _paths(build_api_router("crawler"))
+
+        assert {"/health", "/"} <= paths
+        assert any(path.startswith("/crawlers") for path in paths)
+        assert not any(path.startswith("/query") for path in paths)
@@ -0,0 +1,185 @@
+"""
+Unit tests for auth execution (core.security)
+
+스레드 풀 bcrypt (이벤트 루프 비차단, 대기 한도), 검증된 토큰 캐시의
+TTL/만료/폐기 처리와 Redis 폐기 전파를 테스트합니다.
+"""
+import asyncio
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.core import security
+from app.core.security import (
+    TokenCache,
+    TokenRevocationBus,
+    create_access_token,
+    create_refresh_token,
+    hash_password,
+    resolve_access_token,
+    resolve_access_token_async,
+    revoke_token,
+    revoke_token_everywhere,
+    verify_password_async,
+)
+
+
+class FakeRevocationRedis:
+    def __init__(self):
+        self.keys = {}
+        self.published = []
+
+    async def set(self, key, value, ex=None):
+        self.keys[key] = ex
+
+    async def publish(self, channel, data):
+        self.published.append((channel, data))
+
+    async def exists(self, key):
+        return int(key in self.keys)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = time.time()
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def token_cache(monkeypatch):
+    cache = TokenCache(max_entries=2, ttl_seconds=60)
+    monkeypatch.setattr(security, "_token_cache", cache)
+    return cache
+
+
+class TestPasswordExecution:
+    """Test suite for off-loop bcrypt"""
+
+    @pytest.mark.asyncio
+    async def test_verify_does_not_block_event_loop(self):
+        hashed = hash_password("Secret123!")
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        task = asyncio.create_task(heartbeat())
+        results = await asyncio.gather(*(verify_password_async("Secret123!", hashed) for _ in range(4)))
+        task.cancel()
+
+        assert results == [True] * 4
+        assert ticks > 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_too_many_pending(self, monkeypatch):
+        monkeypatch.setattr(security.settings, "AUTH_HASH_MAX_PENDING", 0)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await verify_password_async("x", hash_password("x"))
+
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.detail["error_code"] == "AUTH_BUSY"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_keeps_slot_until_thread_finishes(self):
+        release = threading.Event()
+        task = asyncio.create_task(security._run_password_op(release.wait, 5))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert security._password_pending == 1
+        release.set()
+        for _ in range(100):
+            if security._password_pending == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert security._password_pending == 0
+
+
+class TestTokenCache:
+    """Test suite for TokenCache and resolve_access_token"""
+
+    def test_resolve_decodes_once_and_returns_copies(self, token_cache, monkeypatch):
+        token = create_access_token({"sub": "u1", "role": "fp"})
+        calls = []
+        original = security.decode_token
+        monkeypatch.setattr(security, "decode_token", lambda t: calls.append(t) or original(t))
+
+        first = resolve_access_token(token)
+        first["role"] = "admin"
+        second = resolve_access_token(token)
+
+        assert len(calls) == 1
+        assert second["role"] == "fp"
+        assert token_cache.stats == {"hits": 1, "misses": 1}
+
+    def test_entry_never_outlives_token_exp(self):
+        clock = FakeClock()
+        cache = TokenCache(max_entries=10, ttl_seconds=60, clock=clock)
+        cache.set("t", {"sub": "u1", "exp": clock.now + 5})
+
+        clock.now += 4
+        assert cache.get("t") is not None
+        clock.now += 2
+        assert cache.get("t") is None
+
+    def test_lru_eviction(self, token_cache):
+        tokens = [create_access_token({"sub": f"u{i}"}) for i in range(3)]
+        for token in tokens:
+            resolve_access_token(token)
+
+        assert token_cache.get(tokens[0]) is None
+        assert token_cache.get(tokens[2])["sub"] == "u2"
+
+    def test_revoked_token_is_rejected_even_when_cached(self, token_cache):
+        token = create_access_token({"sub": "u1"})
+        other = create_access_token({"sub": "u1"})
+        resolve_access_token(token)
+
+        revoke_token(token)
+
+        with pytest.raises(HTTPException) as exc_info:
+            resolve_access_token(token)
+        assert exc_info.value.status_code == 401
+        assert resolve_access_token(other)["sub"] == "u1"
+
+    def test_expired_and_refresh_tokens_are_not_cached(self, token_cache):
+        expired = create_access_token({"sub": "u1"}, expires_delta=timedelta(seconds=-1))
+
+        with pytest.raises(HTTPException):
+            resolve_access_token(expired)
+        with pytest.raises(HTTPException):
+            resolve_access_token(create_refresh_token({"sub": "u1"}))
+        assert len(token_cache._entries) == 0
+
+    @pytest.mark.asyncio
+    async def test_revocation_is_shared_through_redis(self, token_cache, monkeypatch):
+        redis = FakeRevocationRedis()
+        bus = TokenRevocationBus(cache=token_cache)
+        bus._client = redis
+        monkeypatch.setattr(security.settings, "AUTH_REVOCATION_BACKEND", "redis")
+        monkeypatch.setattr(security, "_revocation_bus", bus)
+        token = create_access_token({"sub": "u1"})
+        other_worker = TokenCache(max_entries=10, ttl_seconds=60)
+        other_worker.set(token, {"sub": "u1", "exp": time.time() + 60})
+
+        await revoke_token_everywhere(token)
+
+        # 구독 중인 워커: 캐시에서 즉시 제거
+        TokenRevocationBus(cache=other_worker).handle_message(redis.published[0][1])
+        assert other_worker.get(token) is None and other_worker.is_revoked(token)
+        # 알림을 놓친 워커: 캐시 미스 시 Redis 폐기 키로 거부
+        token_cache.clear()
+        with pytest.raises(HTTPException) as exc_info:
+            await resolve_access_token_async(token)
+        assert exc_info.value.detail == "Token has been revoked"
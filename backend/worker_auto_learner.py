@@ -2,19 +2,17 @@
 자동 문서 학습 워커
 
 새로 크롤링된 문서(pending 상태)를 감지하여 자동으로 그래프 학습을 시작합니다.
-- 5개씩 배치로 처리
-- 처리 중인 문서가 없을 때만 새 배치 시작
-- 30초마다 체크
+- pending 전이 알림(LISTEN/NOTIFY)을 받으면 즉시 배치 처리
+- 대기 문서가 남아있는 동안 연속으로 배치 처리
+- 알림을 받을 수 없으면 check_interval마다 폴링
 """
 import asyncio
 import signal
 import sys
-from datetime import datetime
 from loguru import logger
 
+from app.services.document_events import DocumentEventListener
 from app.services.parallel_document_processor import ParallelDocumentProcessor
-from app.core.database import AsyncSessionLocal
-from sqlalchemy import text
 
 
 class AutoLearningWorker:
@@ -30,12 +28,13 @@ class AutoLearningWorker:
         Args:
             max_concurrent: 동시 처리할 문서 수
             batch_size: 한 번에 처리할 배치 크기
-            check_interval: 체크 간격 (초)
+            check_interval: 폴백 폴링 간격 (초, 알림을 받는 중에는 더 길게 대기)
         """
         self.max_concurrent = max_concurrent
         self.batch_size = batch_size
         self.check_interval = check_interval
         self.processor = ParallelDocumentProcessor(max_concurrent=max_concurrent)
+        self.listener = DocumentEventListener(statuses={"pending"})
         self.is_running = True
         self.total_processed = 0
 
@@ -47,30 +46,33 @@ class AutoLearningWorker:
         """종료 시그널 처리"""
         logger.info(f"Received signal {signum}. Shutting down gracefully...")
         self.is_running = False
+        self.listener.wake()
 
-    async def get_processing_count(self) -> int:
-        """현재 처리 중인 문서 수 조회"""
-        async with AsyncSessionLocal() as db:
-            query = text("""
-                SELECT COUNT(*) as count
-                FROM crawler_documents
-                WHERE status = 'processing'
-            """)
-            result = await db.execute(query)
-            row = result.fetchone()
-            return row[0] if row else 0
-
-    async def get_pending_count(self) -> int:
-        """대기 중인 문서 수 조회"""
-        async with AsyncSessionLocal() as db:
-            query = text("""
-                SELECT COUNT(*) as count
-                FROM crawler_documents
-                WHERE status = 'pending'
-            """)
-            result = await db.execute(query)
-            row = result.fetchone()
-            return row[0] if row else 0
+    async def process_available(self) -> None:
+        """
+        대기 문서가 없을 때까지 배치 처리
+
+        COUNT(*) 조회 없이 선점(claim) 결과로 남은 문서 여부를 판단합니다.
+        """
+        while self.is_running:
+            logger.info(f"🎯 Starting new batch: up to {self.batch_size} documents")
+
+            result = await self.processor.process_pending_documents(
+                limit=self.batch_size
+            )
+
+            self.total_processed += result["success"]
+
+            if result["total"] == 0:
+                logger.info("💤 No pending documents. Waiting for new documents...")
+                return
+
+            logger.info(f"✅ Batch completed: {result['success']} success, "
+                      f"{result['failed']} failed out of {result['total']} total")
+            logger.info(f"📊 Total processed so far: {self.total_processed}")
+
+            if result["total"] < self.batch_size:
+                return
 
     async def run(self):
         """워커 실행"""
@@ -81,42 +83,24 @@ class AutoLearningWorker:
         logger.info(f"  - Check Interval: {self.check_interval}s")
         logger.info("=" * 80)
 
-        while self.is_running:
-            try:
-                # 현재 처리 중인 문서 수 확인
-                processing_count = await self.get_processing_count()
-                pending_count = await self.get_pending_count()
-
-                logger.info(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
-                          f"Processing: {processing_count}, Pending: {pending_count}, "
-                          f"Total Processed: {self.total_processed}")
-
-                # 처리 중인 문서가 없고, 대기 중인 문서가 있으면 새 배치 시작
-                if processing_count == 0 and pending_count > 0:
-                    logger.info(f"🎯 Starting new batch: {self.batch_size} documents")
+        await self.listener.start()
+        try:
+            while self.is_running:
+                try:
+                    await self.process_available()
 
-                    result = await self.processor.process_pending_documents(
-                        limit=self.batch_size
+                    # 다음 pending 알림(또는 폴백 타임아웃)까지 대기
+                    events = await self.listener.wait(
+                        timeout=self.listener.poll_timeout(self.check_interval)
                     )
-
-                    self.total_processed += result["success"]
-
-                    logger.info(f"✅ Batch completed: {result['success']} success, "
-                              f"{result['failed']} failed out of {result['total']} total")
-                    logger.info(f"📊 Total processed so far: {self.total_processed}")
-
-                elif processing_count > 0:
-                    logger.info(f"⏳ Waiting for current batch to complete ({processing_count} documents processing)...")
-
-                else:
-                    logger.info("💤 No pending documents. Waiting for new documents...")
-
-                # 다음 체크까지 대기
-                await asyncio.sleep(self.check_interval)
-
-            except Exception as e:
-                logger.error(f"❌ Worker error: {e}", exc_info=True)
-                await asyncio.sleep(self.check_interval)
+                    if events:
+                        logger.info(f"🔔 {len(events)} new pending documents")
+
+                except Exception as e:
+                    logger.error(f"❌ Worker error: {e}", exc_info=True)
+                    await asyncio.sleep(self.check_interval)
+        finally:
+            await self.listener.stop()
 
         logger.info("=" * 80)
         logger.info(f"🛑 Auto Learning Worker Stopped. Total processed: {self.total_processed}")
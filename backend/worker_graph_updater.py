@@ -2,17 +2,71 @@
 실시간 그래프 업데이터
 
 완료된 문서를 감지하여 자동으로 그래프를 업데이트합니다.
+completed 전이 알림(LISTEN/NOTIFY)을 받으면 즉시 갱신하고,
+알림을 받을 수 없을 때만 check_interval마다 watermark 기준으로 변경 문서를 확인합니다.
+
+시작 시 한 번 전체 그래프를 만들고, 이후에는 변경된 문서의 노드/엣지만
+스냅샷 delta로 기록하고 Neo4j에 반영합니다.
 """
 import asyncio
 import signal
 import sys
 import json
-from datetime import datetime
+from collections import defaultdict
 from loguru import logger
-from sqlalchemy import text
 
 sys.path.append("/Users/gangseungsig/Documents/02_GitHub/12_InsureGraph Pro/backend")
-from app.core.database import AsyncSessionLocal
+from app.core.config import settings
+from app.services.document_events import DocumentEventListener
+from app.services.graph_projection import bump_graph_version
+from app.services.graph_snapshot import GraphDelta, GraphSnapshotBuilder
+
+
+# 타입별 Neo4j 라벨 매핑
+NEO4J_LABELS = {
+    "insurer": "Insurer",
+    "product_type": "ProductType",
+    "document": "Document",
+    "coverage_item": "CoverageItem",
+    "benefit_amount": "BenefitAmount",
+    "payment_condition": "PaymentCondition",
+    "exclusion": "Exclusion",
+    "deductible": "Deductible",
+    "rider": "Rider",
+    "eligibility": "Eligibility",
+    "article": "Article",
+    "term": "Term",
+    "period": "Period"
+}
+
+# 관계 타입별 Neo4j 라벨 매핑
+NEO4J_REL_TYPES = {
+    "provides": "PROVIDES",
+    "contains": "CONTAINS",
+    "has_amount": "HAS_AMOUNT",
+    "requires": "REQUIRES",
+    "excludes": "EXCLUDES",
+    "has_deductible": "HAS_DEDUCTIBLE",
+    "includes_rider": "INCLUDES_RIDER",
+    "defines": "DEFINES",
+    "specified_in": "SPECIFIED_IN",
+    "has_eligibility": "HAS_ELIGIBILITY",
+    "applies_to": "APPLIES_TO",
+    "from_document": "FROM_DOCUMENT"
+}
+
+# 이 워커가 만든 노드에만 붙는 라벨 (지식 그래프의 다른 노드와 구분, id 유일 제약)
+SNAPSHOT_LABEL = "Snapshot"
+SNAPSHOT_NODE_LABELS = sorted(set(NEO4J_LABELS.values()) | {"Entity"})
+SNAPSHOT_REL_TYPES = sorted(set(NEO4J_REL_TYPES.values()) | {"RELATES"})
+
+
+def _edge_lookup_subquery() -> str:
+    """id로 스냅샷 관계 찾기 (관계 타입별 id 인덱스를 쓰도록 타입마다 한 번씩 조회)"""
+    return "\n                    UNION\n".join(
+        f"                    WITH id MATCH (:{SNAPSHOT_LABEL})-[r:{rel_type} {{id: id}}]->() RETURN r"
+        for rel_type in SNAPSHOT_REL_TYPES
+    )
 
 
 class GraphUpdaterWorker:
@@ -21,12 +75,16 @@ class GraphUpdaterWorker:
     def __init__(self, check_interval: int = 10):
         """
         Args:
-            check_interval: 체크 간격 (초)
+            check_interval: 폴백 폴링 간격 (초, 알림을 받는 중에는 더 길게 대기)
         """
         self.check_interval = check_interval
         self.is_running = True
-        self.last_completed_count = 0
-        self.output_path = "/Users/gangseungsig/Documents/02_GitHub/12_InsureGraph Pro/backend/sample_graph.json"
+        # completed로 전이되거나 completed에서 벗어난(재처리) 문서 모두 그래프에 영향
+        self.listener = DocumentEventListener(statuses={"completed"}, include_previous=True)
+        self.builder = GraphSnapshotBuilder()
+        self._neo4j_driver = None
+        # Neo4j 반영 실패 시 스냅샷은 이미 앞서 있으므로 다음 주기에 스냅샷 전체로 다시 맞춤
+        self._needs_full_sync = False
 
         # Graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -36,404 +94,231 @@ class GraphUpdaterWorker:
         """종료 시그널 처리"""
         logger.info(f"Received signal {signum}. Shutting down gracefully...")
         self.is_running = False
-
-    async def get_completed_count(self) -> int:
-        """완료된 문서 수 조회"""
-        async with AsyncSessionLocal() as db:
-            query = text("""
-                SELECT COUNT(*) as count
-                FROM crawler_documents
-                WHERE status = 'completed'
-            """)
-            result = await db.execute(query)
-            row = result.fetchone()
-            return row[0] if row else 0
+        self.listener.wake()
 
     async def generate_graph(self):
-        """완료된 문서로 GraphRAG 스타일 지식 그래프 생성"""
-        async with AsyncSessionLocal() as db:
-            # 완료된 문서 조회
-            query = text("""
-                SELECT id, insurer, product_type, title, processing_detail, updated_at
-                FROM crawler_documents
-                WHERE status = 'completed'
-                ORDER BY updated_at DESC
-            """)
-
-            result = await db.execute(query)
-            completed_docs = result.fetchall()
-
-            if not completed_docs:
-                logger.warning("No completed documents found")
-                return
-
-            # 노드와 엣지 생성
-            nodes = []
-            edges = []
-
-            # 보험사 노드 생성 (중복 제거)
-            insurers = {}
-            product_types = {}
-
-            for doc in completed_docs:
-                insurer = doc[1]
-                product_type = doc[2]
-
-                # 보험사 노드
-                if insurer not in insurers:
-                    insurers[insurer] = {
-                        "id": f"insurer_{len(insurers)}",
-                        "label": insurer,
-                        "type": "insurer",
-                        "color": "#3b82f6",
-                        "size": 40
-                    }
-
-                # 상품 타입 노드
-                type_key = f"{insurer}_{product_type}"
-                if type_key not in product_types:
-                    product_types[type_key] = {
-                        "id": f"type_{len(product_types)}",
-                        "label": product_type,
-                        "type": "product_type",
-                        "color": "#8b5cf6",
-                        "size": 25,
-                        "insurer": insurer
-                    }
-
-            nodes.extend(insurers.values())
-            nodes.extend(product_types.values())
-
-            # 문서 노드 생성 및 연결
-            for i, doc in enumerate(completed_docs):
-                doc_id = doc[0]
-                insurer = doc[1]
-                product_type = doc[2]
-                title = doc[3][:50] if doc[3] else "Unknown"
-                updated_at = doc[5]
-
-                # 문서 노드
-                doc_node = {
-                    "id": f"doc_{doc_id}",
-                    "label": f"{product_type[:15]}\n{title[:30]}",
-                    "type": "document",
-                    "color": "#10b981",
-                    "size": 15,
-                    "metadata": {
-                        "insurer": insurer,
-                        "product_type": product_type,
-                        "title": title,
-                        "updated_at": updated_at.isoformat() if updated_at else None
-                    }
-                }
-                nodes.append(doc_node)
-
-                # 보험사 -> 상품타입 엣지
-                type_key = f"{insurer}_{product_type}"
-                insurer_to_type_id = f"edge_i2t_{insurer}_{product_type}"
-                if not any(e["id"] == insurer_to_type_id for e in edges):
-                    edges.append({
-                        "id": insurer_to_type_id,
-                        "source": insurers[insurer]["id"],
-                        "target": product_types[type_key]["id"],
-                        "label": "제공",
-                        "type": "provides"
-                    })
+        """완료된 문서로 GraphRAG 스타일 지식 그래프 전체 생성 (워커 시작 시)"""
+        delta = await self.builder.build_full()
+        if not self.builder.snapshot.nodes:
+            logger.warning("No completed documents found")
 
-                # 상품타입 -> 문서 엣지
-                edges.append({
-                    "id": f"edge_t2d_{i}",
-                    "source": product_types[type_key]["id"],
-                    "target": f"doc_{doc_id}",
-                    "label": "포함",
-                    "type": "contains"
-                })
-
-            # ========== 깊이 있는 엔티티 추가 (GraphRAG) ==========
-            # knowledge_entities 테이블에서 모든 엔티티 조회
-            entity_query = text("""
-                SELECT entity_id, label, type, description, source_text,
-                       document_id, insurer, product_type
-                FROM knowledge_entities
-                ORDER BY created_at DESC
-            """)
-            result = await db.execute(entity_query)
-            entities = result.fetchall()
-
-            # 엔티티 타입별 색상 정의
-            entity_colors = {
-                "coverage_item": "#ef4444",       # 빨강 (보장항목)
-                "benefit_amount": "#f59e0b",      # 주황 (보험금액)
-                "payment_condition": "#eab308",   # 노랑 (지급조건)
-                "exclusion": "#dc2626",           # 진한 빨강 (면책사항)
-                "deductible": "#fb923c",          # 연한 주황 (자기부담금)
-                "rider": "#a855f7",               # 보라 (특약)
-                "eligibility": "#06b6d4",         # 청록 (가입조건)
-                "article": "#64748b",             # 회색 (약관조항)
-                "term": "#475569",                # 진한 회색 (보험용어)
-                "period": "#0ea5e9"               # 파랑 (기간)
-            }
-
-            logger.info(f"📊 Found {len(entities)} entities from knowledge_entities table")
-
-            # 엔티티 노드 추가
-            for entity in entities:
-                entity_id = entity[0]
-                label = entity[1]
-                entity_type = entity[2]
-                description = entity[3]
-                source_text = entity[4]
-                document_id = entity[5]
-                ent_insurer = entity[6]
-                ent_product_type = entity[7]
-
-                entity_node = {
-                    "id": entity_id,
-                    "label": label[:30],  # 라벨 길이 제한
-                    "type": entity_type,
-                    "color": entity_colors.get(entity_type, "#64748b"),
-                    "size": 20,
-                    "metadata": {
-                        "description": description[:100] if description else None,
-                        "source_text": source_text[:100] if source_text else None,
-                        "insurer": ent_insurer,
-                        "product_type": ent_product_type,
-                        "document_id": document_id
-                    }
-                }
-                nodes.append(entity_node)
-
-                # 엔티티 -> 문서 연결
-                if document_id:
-                    edges.append({
-                        "id": f"edge_e2d_{entity_id}",
-                        "source": entity_id,
-                        "target": f"doc_{document_id}",
-                        "label": "출처",
-                        "type": "from_document"
-                    })
+        await asyncio.to_thread(self._sync_neo4j, delta, True)
+        self._log_summary()
+
+    async def update_graph(self, document_ids=None) -> bool:
+        """
+        변경된 문서만 그래프에 반영
+
+        Args:
+            document_ids: 이벤트로 받은 변경 문서 id
+
+        Returns:
+            변경 여부
+        """
+        delta = await self.builder.refresh(document_ids)
+        if self._needs_full_sync:
+            logger.info("🔁 Retrying Neo4j sync from the full snapshot")
+            await asyncio.to_thread(self._sync_neo4j, self._snapshot_delta(), True)
+            self._log_summary()
+            return True
+        if delta.is_empty():
+            return False
+
+        logger.info(
+            f"🔄 Graph delta #{delta.seq}: "
+            f"+{len(delta.upsert_nodes)} nodes, +{len(delta.upsert_edges)} edges, "
+            f"-{len(delta.remove_nodes)} nodes, -{len(delta.remove_edges)} edges"
+        )
+        await asyncio.to_thread(self._sync_neo4j, delta, False)
+        self._log_summary()
+        return True
+
+    def _snapshot_delta(self) -> GraphDelta:
+        """현재 스냅샷 전체를 upsert로 담은 delta (전체 재동기화용)"""
+        snapshot = self.builder.snapshot
+        return GraphDelta(
+            seq=snapshot.seq,
+            generation=snapshot.generation,
+            upsert_nodes=list(snapshot.nodes.values()),
+            upsert_edges=list(snapshot.edges.values()),
+        )
+
+    def _get_neo4j_driver(self):
+        if self._neo4j_driver is None:
+            from neo4j import GraphDatabase
+
+            self._neo4j_driver = GraphDatabase.driver(
+                settings.NEO4J_URI,
+                auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD)
+            )
+            self._ensure_schema(self._neo4j_driver)
+        return self._neo4j_driver
+
+    @staticmethod
+    def _ensure_schema(driver) -> None:
+        """스냅샷 노드 id 유일 제약 + 관계 타입별 id 인덱스"""
+        statements = [
+            f"CREATE CONSTRAINT snapshot_node_id IF NOT EXISTS "
+            f"FOR (n:{SNAPSHOT_LABEL}) REQUIRE n.id IS UNIQUE"
+        ] + [
+            f"CREATE INDEX snapshot_rel_{rel_type.lower()}_id IF NOT EXISTS "
+            f"FOR ()-[r:{rel_type}]-() ON (r.id)"
+            for rel_type in SNAPSHOT_REL_TYPES
+        ]
+        with driver.session() as session:
+            for statement in statements:
+                session.run(statement)
+
+    @staticmethod
+    def _delete_edges(session, edge_ids) -> None:
+        session.run(f"""
+            UNWIND $ids AS id
+            CALL {{
+{_edge_lookup_subquery()}
+            }}
+            DELETE r
+        """, {"ids": list(edge_ids)})
+
+    def _sync_neo4j(self, delta: GraphDelta, full: bool) -> None:
+        """
+        delta를 Neo4j에 반영 (라벨/관계 타입별 UNWIND 배치)
+
+        스냅샷 노드는 모두 Snapshot 라벨을 달고 있어, 전체 재생성은 그 노드만 지우고
+        다른 지식 그래프 데이터(Policy/Article 계층 등)는 건드리지 않습니다.
 
-            # knowledge_relationships 테이블에서 관계 조회
-            rel_query = text("""
-                SELECT source_entity_id, target_entity_id, type, description
-                FROM knowledge_relationships
-                ORDER BY created_at DESC
-            """)
-            result = await db.execute(rel_query)
-            relationships = result.fetchall()
-
-            logger.info(f"🔗 Found {len(relationships)} relationships from knowledge_relationships table")
-
-            # 관계 엣지 추가
-            for rel in relationships:
-                source_id = rel[0]
-                target_id = rel[1]
-                rel_type = rel[2]
-                rel_desc = rel[3]
-
-                # 한글 라벨 매핑
-                rel_labels = {
-                    "provides": "제공",
-                    "has_amount": "금액",
-                    "requires": "조건",
-                    "excludes": "면책",
-                    "has_deductible": "자기부담금",
-                    "includes_rider": "특약포함",
-                    "defines": "정의",
-                    "specified_in": "명시",
-                    "has_eligibility": "가입조건",
-                    "applies_to": "적용대상"
-                }
-
-                edges.append({
-                    "id": f"edge_rel_{source_id}_{target_id}",
-                    "source": source_id,
-                    "target": target_id,
-                    "label": rel_labels.get(rel_type, rel_type),
-                    "type": rel_type
-                })
-
-            # 그래프 데이터 생성
-            graph_data = {
-                "nodes": nodes,
-                "edges": edges,
-                "metadata": {
-                    "total_documents": len(completed_docs),
-                    "total_insurers": len(insurers),
-                    "total_product_types": len(product_types),
-                    "generated_at": datetime.utcnow().isoformat() + "Z",
-                    "last_update": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                }
-            }
-
-            # 파일로 저장
-            with open(self.output_path, "w", encoding="utf-8") as f:
-                json.dump(graph_data, f, ensure_ascii=False, indent=2)
-
-            # Neo4j에 저장
-            try:
-                from neo4j import GraphDatabase
-                from app.core.config import settings
-
-                driver = GraphDatabase.driver(
-                    settings.NEO4J_URI,
-                    auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD)
-                )
-
-                with driver.session() as session:
-                    # 기존 데이터 삭제 (전체 재생성)
-                    session.run("MATCH (n) DETACH DELETE n")
-
-                    # 노드 생성 (동적 라벨 사용)
-                    for node in nodes:
-                        node_type = node.get("type", "unknown")
-
-                        # 타입별 Neo4j 라벨 매핑
-                        label_mapping = {
-                            "insurer": "Insurer",
-                            "product_type": "ProductType",
-                            "document": "Document",
-                            "coverage_item": "CoverageItem",
-                            "benefit_amount": "BenefitAmount",
-                            "payment_condition": "PaymentCondition",
-                            "exclusion": "Exclusion",
-                            "deductible": "Deductible",
-                            "rider": "Rider",
-                            "eligibility": "Eligibility",
-                            "article": "Article",
-                            "term": "Term",
-                            "period": "Period"
-                        }
-
-                        neo4j_label = label_mapping.get(node_type, "Entity")
-
-                        # 동적으로 라벨을 지정하여 노드 생성
-                        query = f"""
-                            CREATE (n:{neo4j_label} {{
-                                id: $id,
-                                label: $label,
-                                type: $type,
-                                color: $color,
-                                size: $size,
-                                metadata: $metadata
-                            }})
-                        """
-
-                        session.run(query, {
-                            "id": node["id"],
-                            "label": node["label"],
-                            "type": node["type"],
-                            "color": node["color"],
-                            "size": node["size"],
-                            "metadata": json.dumps(node.get("metadata", {}))
-                        })
-
-                    # 엣지(관계) 생성 (동적 관계 타입 사용)
-                    for edge in edges:
-                        edge_type = edge.get("type", "RELATES")
-
-                        # 관계 타입별 Neo4j 라벨 매핑
-                        rel_type_mapping = {
-                            "provides": "PROVIDES",
-                            "contains": "CONTAINS",
-                            "has_amount": "HAS_AMOUNT",
-                            "requires": "REQUIRES",
-                            "excludes": "EXCLUDES",
-                            "has_deductible": "HAS_DEDUCTIBLE",
-                            "includes_rider": "INCLUDES_RIDER",
-                            "defines": "DEFINES",
-                            "specified_in": "SPECIFIED_IN",
-                            "has_eligibility": "HAS_ELIGIBILITY",
-                            "applies_to": "APPLIES_TO",
-                            "from_document": "FROM_DOCUMENT"
-                        }
-
-                        neo4j_rel_type = rel_type_mapping.get(edge_type, "RELATES")
-
-                        # ID로만 매칭 (라벨 무관)
-                        query = f"""
-                            MATCH (source {{id: $source_id}})
-                            MATCH (target {{id: $target_id}})
-                            CREATE (source)-[r:{neo4j_rel_type} {{
-                                id: $id,
-                                label: $label,
-                                type: $type
-                            }}]->(target)
-                        """
-
-                        session.run(query, {
-                            "source_id": edge["source"],
-                            "target_id": edge["target"],
-                            "id": edge["id"],
-                            "label": edge["label"],
-                            "type": edge["type"]
-                        })
-
-                driver.close()
-                logger.info(f"✅ Neo4j updated successfully")
-
-            except Exception as neo_error:
-                logger.error(f"❌ Failed to update Neo4j: {neo_error}")
-
-            # 엔티티 타입별 집계
-            entity_type_counts = {}
-            for node in nodes:
-                node_type = node.get("type", "unknown")
-                entity_type_counts[node_type] = entity_type_counts.get(node_type, 0) + 1
-
-            logger.info(f"✅ Graph updated:")
-            logger.info(f"  - Total Nodes: {len(nodes)}")
-            logger.info(f"    - Insurers: {len(insurers)}")
-            logger.info(f"    - Product Types: {len(product_types)}")
-            logger.info(f"    - Documents: {len(completed_docs)}")
-            logger.info(f"    - Entities (GraphRAG): {len(entities)}")
-            if entity_type_counts:
-                logger.info(f"    - Entity Breakdown:")
-                for etype, count in sorted(entity_type_counts.items()):
-                    if etype not in ["insurer", "product_type", "document"]:
-                        logger.info(f"      * {etype}: {count}")
-            logger.info(f"  - Total Edges: {len(edges)}")
-            logger.info(f"  - Last update: {graph_data['metadata']['last_update']}")
+        실패하면 _needs_full_sync를 세워 다음 주기에 스냅샷 전체로 다시 동기화합니다
+        (builder의 watermark/seq는 이미 진행되어 같은 delta를 다시 만들 수 없음).
+
+        Args:
+            delta: 반영할 변경분
+            full: True이면 기존 스냅샷 노드를 지우고 전체 생성
+        """
+        try:
+            driver = self._get_neo4j_driver()
+            with driver.session() as session:
+                if full:
+                    # 기존 스냅샷 노드 삭제 (전체 재생성)
+                    session.run(f"MATCH (n:{SNAPSHOT_LABEL}) DETACH DELETE n")
+
+                # 제거 + 갱신 대상 관계를 먼저 지움: 관계 타입이 바뀐 엣지는 같은 id로
+                # 새 타입을 만들어야 하므로 MERGE로는 이전 관계가 남음
+                stale_edges = set(delta.remove_edges)
+                if not full:
+                    stale_edges.update(edge["id"] for edge in delta.upsert_edges)
+                if stale_edges:
+                    self._delete_edges(session, stale_edges)
+                if delta.remove_nodes:
+                    session.run(
+                        f"UNWIND $ids AS id MATCH (n:{SNAPSHOT_LABEL} {{id: id}}) DETACH DELETE n",
+                        {"ids": delta.remove_nodes}
+                    )
+
+                nodes_by_label = defaultdict(list)
+                for node in delta.upsert_nodes:
+                    nodes_by_label[NEO4J_LABELS.get(node.get("type", "unknown"), "Entity")].append({
+                        "id": node["id"],
+                        "label": node["label"],
+                        "type": node["type"],
+                        "color": node["color"],
+                        "size": node["size"],
+                        "metadata": json.dumps(node.get("metadata", {}))
+                    })
+                # 타입이 바뀐 노드는 이전 라벨을 떼고 새 라벨을 붙임
+                other_labels = ":".join(SNAPSHOT_NODE_LABELS)
+                for neo4j_label, rows in nodes_by_label.items():
+                    session.run(f"""
+                        UNWIND $rows AS row
+                        MERGE (n:{SNAPSHOT_LABEL} {{id: row.id}})
+                        REMOVE n:{other_labels}
+                        SET n:{neo4j_label}, n += row
+                    """, {"rows": rows})
+
+                edges_by_type = defaultdict(list)
+                for edge in delta.upsert_edges:
+                    edges_by_type[NEO4J_REL_TYPES.get(edge.get("type", "RELATES"), "RELATES")].append({
+                        "id": edge["id"],
+                        "source_id": edge["source"],
+                        "target_id": edge["target"],
+                        "label": edge["label"],
+                        "type": edge["type"]
+                    })
+                for neo4j_rel_type, rows in edges_by_type.items():
+                    session.run(f"""
+                        UNWIND $rows AS row
+                        MATCH (source:{SNAPSHOT_LABEL} {{id: row.source_id}})
+                        MATCH (target:{SNAPSHOT_LABEL} {{id: row.target_id}})
+                        CREATE (source)-[r:{neo4j_rel_type} {{id: row.id}}]->(target)
+                        SET r.label = row.label, r.type = row.type
+                    """, {"rows": rows})
+
+                # 질의 API의 GraphProjection이 다음 refresh에서 재빌드하도록 표시
+                bump_graph_version(session)
+
+            logger.info(f"✅ Neo4j updated successfully")
+            if full:
+                self._needs_full_sync = False
+
+        except Exception as neo_error:
+            self._needs_full_sync = True
+            logger.error(f"❌ Failed to update Neo4j (full sync on next cycle): {neo_error}")
+
+    def _log_summary(self):
+        """엔티티 타입별 집계 로그"""
+        snapshot = self.builder.snapshot
+        entity_type_counts = {}
+        for node in snapshot.nodes.values():
+            node_type = node.get("type", "unknown")
+            entity_type_counts[node_type] = entity_type_counts.get(node_type, 0) + 1
+
+        logger.info(f"✅ Graph updated:")
+        logger.info(f"  - Total Nodes: {len(snapshot.nodes)}")
+        logger.info(f"    - Insurers: {snapshot.metadata.get('total_insurers', 0)}")
+        logger.info(f"    - Product Types: {snapshot.metadata.get('total_product_types', 0)}")
+        logger.info(f"    - Documents: {snapshot.metadata.get('total_documents', 0)}")
+        if entity_type_counts:
+            logger.info(f"    - Entity Breakdown:")
+            for etype, count in sorted(entity_type_counts.items()):
+                if etype not in ["insurer", "product_type", "document"]:
+                    logger.info(f"      * {etype}: {count}")
+        logger.info(f"  - Total Edges: {len(snapshot.edges)}")
+        logger.info(f"  - Snapshot: seq={snapshot.seq}, generation={snapshot.generation}")
 
     async def run(self):
         """워커 실행"""
         logger.info("=" * 80)
         logger.info("🔄 Graph Updater Worker Started")
         logger.info(f"  - Check Interval: {self.check_interval}s")
-        logger.info(f"  - Output Path: {self.output_path}")
+        logger.info(f"  - Snapshot Path: {self.builder.store.root}")
         logger.info("=" * 80)
 
         # 초기 그래프 생성
         await self.generate_graph()
-        self.last_completed_count = await self.get_completed_count()
-
-        while self.is_running:
-            try:
-                # 현재 완료 문서 수 확인
-                current_completed_count = await self.get_completed_count()
-
-                logger.info(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
-                          f"Completed documents: {current_completed_count} "
-                          f"(previous: {self.last_completed_count})")
-
-                # 완료 문서가 증가했으면 그래프 업데이트
-                if current_completed_count > self.last_completed_count:
-                    new_docs = current_completed_count - self.last_completed_count
-                    logger.info(f"🔄 Updating graph (+{new_docs} new documents)...")
-
-                    await self.generate_graph()
-                    self.last_completed_count = current_completed_count
-
-                    logger.info(f"✅ Graph updated successfully")
-                else:
-                    logger.info("⏸️  No new documents, skipping update")
-
-                # 다음 체크까지 대기
-                await asyncio.sleep(self.check_interval)
 
-            except Exception as e:
-                logger.error(f"❌ Worker error: {e}", exc_info=True)
-                await asyncio.sleep(self.check_interval)
+        await self.listener.start()
+        try:
+            while self.is_running:
+                try:
+                    # completed 알림(또는 폴백 타임아웃)까지 대기
+                    events = await self.listener.wait(
+                        timeout=self.listener.poll_timeout(self.check_interval)
+                    )
+                    if not self.is_running:
+                        break
+
+                    # 알림이 없거나 유실되었을 수 있는 경우에도 watermark 이후 변경분을 확인
+                    changed = await self.update_graph(
+                        document_ids=[event.document_id for event in events]
+                    )
+                    if not changed:
+                        logger.info("⏸️  No new documents, skipping update")
+
+                except Exception as e:
+                    logger.error(f"❌ Worker error: {e}", exc_info=True)
+                    await asyncio.sleep(self.check_interval)
+        finally:
+            await self.listener.stop()
+            if self._neo4j_driver is not None:
+                self._neo4j_driver.close()
 
         logger.info("=" * 80)
         logger.info("🛑 Graph Updater Worker Stopped")
@@ -12,12 +12,12 @@ from pathlib import Path
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import requests
 import pdfplumber
 from loguru import logger
 from sqlalchemy import text as sql_text
 
 from app.core.database import AsyncSessionLocal
+from app.services.pdf_blob_store import get_pdf_blob_store
 from app.services.llm_entity_extractor import LLMEntityExtractor
 
 # PDF 저장 경로
@@ -154,15 +154,12 @@ class HybridLLMExtractor:
 
             # PDF 다운로드
             logger.info(f"   ⬇️  Downloading PDF...")
-            response = requests.get(pdf_url, timeout=30)
-            response.raise_for_status()
+            # 공용 blob 저장소: 스트리밍 + SHA-256, 변경 없으면 조건부 요청만 (304)
+            blob = await get_pdf_blob_store().fetch(pdf_url)
 
-            # 파일 저장
-            with open(pdf_path, 'wb') as f:
-                f.write(response.content)
-
-            logger.info(f"   ✅ Downloaded: {len(response.content):,} bytes")
-            return pdf_path
+            status = "cached" if blob.from_cache else "Downloaded"
+            logger.info(f"   ✅ {status}: {blob.size:,} bytes (sha256={blob.sha256[:12]})")
+            return blob.path
 
         except Exception as e:
             logger.error(f"   ❌ Download failed: {e}")
@@ -1,6 +1,6 @@
 'use client'
 
-import { useEffect, useState } from 'react'
+import { useEffect, useRef, useState } from 'react'
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card'
 import { Progress } from '@/components/ui/progress'
 import { Badge } from '@/components/ui/badge'
@@ -39,11 +39,21 @@ interface Document {
   updated_at: string
 }
 
+interface ProgressEvent {
+  document_id: string
+  status: string
+  processing_step: string
+  processing_progress: number
+  processing_detail?: ProcessingDetail | null
+}
+
 interface DocumentProcessingViewerProps {
   documentId?: string
   autoSelectLatest?: boolean
 }
 
+const PROGRESS_STREAM_URL = 'http://localhost:8000/api/v1/crawler/documents/progress/stream'
+
 const PROCESSING_STEPS = [
   { key: 'downloading_pdf', label: 'PDF 다운로드', progress: 20, icon: '📥' },
   { key: 'extracting_text', label: '텍스트 추출', progress: 40, icon: '📝' },
@@ -67,18 +77,51 @@ export default function DocumentProcessingViewer({
     detail: string
   }>>([])
 
+  const documentRef = useRef<Document | null>(null)
+
+  useEffect(() => {
+    documentRef.current = document
+  }, [document])
+
   useEffect(() => {
+    if (!documentId && !autoSelectLatest) return
+
     if (documentId) {
       fetchDocumentById(documentId)
-      const interval = setInterval(() => fetchDocumentById(documentId), 2000) // 2초마다 업데이트
-      return () => clearInterval(interval)
-    } else if (autoSelectLatest) {
+    } else {
       fetchLatestProcessingDocument()
-      const interval = setInterval(fetchLatestProcessingDocument, 2000)
-      return () => clearInterval(interval)
     }
+
+    // 진행 상황은 SSE로 수신 (2초 폴링 대체)
+    const url = documentId
+      ? `${PROGRESS_STREAM_URL}?document_ids=${encodeURIComponent(documentId)}`
+      : PROGRESS_STREAM_URL
+    const source = new EventSource(url)
+    source.addEventListener('progress', (event) => {
+      applyProgress(JSON.parse((event as MessageEvent).data) as ProgressEvent)
+    })
+    return () => source.close()
   }, [documentId, autoSelectLatest])
 
+  const applyProgress = (state: ProgressEvent) => {
+    const current = documentRef.current
+    if (!current || current.id !== state.document_id) {
+      // 보고 있던 문서가 끝났으면 새로 처리 시작된 문서로 전환
+      if (!documentId && state.status === 'processing' &&
+          (!current || current.status !== 'processing')) {
+        fetchLatestProcessingDocument()
+      }
+      return
+    }
+    updateDocument({
+      ...current,
+      status: state.status,
+      processing_step: state.processing_step,
+      processing_progress: state.processing_progress,
+      processing_detail: state.processing_detail ?? current.processing_detail,
+    })
+  }
+
   const fetchDocumentById = async (id: string) => {
     try {
       const response = await fetch(`http://localhost:8000/api/v1/crawler/documents/${id}`)